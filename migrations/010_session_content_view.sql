@@ -0,0 +1,25 @@
+-- Migration 010: Session Content View
+-- Exposes every piece of content created in a session through one UNION ALL view,
+-- so the session data and timeline endpoints read a session in a single round-trip
+
+CREATE OR REPLACE VIEW session_content AS
+    SELECT 'plots'::text AS source_table, t.session_id, t.created_at, to_jsonb(t) AS record
+    FROM plots t
+UNION ALL
+    SELECT 'authors'::text, t.session_id, t.created_at, to_jsonb(t)
+    FROM authors t
+UNION ALL
+    SELECT 'world_building'::text, t.session_id, t.created_at, to_jsonb(t)
+    FROM world_building t
+UNION ALL
+    SELECT 'characters'::text, t.session_id, t.created_at, to_jsonb(t)
+    FROM characters t
+UNION ALL
+    SELECT 'orchestrator_decisions'::text, t.session_id, t.created_at, to_jsonb(t)
+    FROM orchestrator_decisions t;
+
+-- Each branch is filtered on session_id before the union is materialized
+CREATE INDEX IF NOT EXISTS idx_orchestrator_decisions_session_id ON orchestrator_decisions(session_id);
+CREATE INDEX IF NOT EXISTS idx_authors_session_id ON authors(session_id);
+
+COMMENT ON VIEW session_content IS 'All session content as (source_table, session_id, created_at, record) rows';
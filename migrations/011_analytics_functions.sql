@@ -0,0 +1,130 @@
+-- Migration 011: Analytics Functions
+-- Dashboard aggregations computed in Postgres and exposed as RPCs, so agent
+-- performance, error and score analytics never transfer payload columns
+
+-- Agent invocation analytics for a time window (optionally one agent)
+CREATE OR REPLACE FUNCTION agent_invocation_analytics(p_since TIMESTAMP, p_agent_name TEXT DEFAULT NULL)
+RETURNS JSONB
+LANGUAGE sql STABLE
+AS $$
+    WITH window_rows AS (
+        SELECT invocation_id, agent_name, start_time, success, error_message, tool_calls,
+               total_tokens, cost_estimate, NULLIF(duration_ms, 0) AS duration_ms
+        FROM agent_invocations
+        WHERE start_time >= p_since AND (p_agent_name IS NULL OR agent_name = p_agent_name)
+    )
+    SELECT jsonb_build_object(
+        'summary', (
+            SELECT jsonb_build_object(
+                'total', COUNT(*),
+                'successful', COUNT(*) FILTER (WHERE success),
+                'avg_duration_ms', AVG(duration_ms),
+                'max_duration_ms', MAX(duration_ms),
+                'min_duration_ms', MIN(duration_ms),
+                'p50_duration_ms', percentile_disc(0.50) WITHIN GROUP (ORDER BY duration_ms),
+                'p95_duration_ms', percentile_disc(0.95) WITHIN GROUP (ORDER BY duration_ms),
+                'p99_duration_ms', percentile_disc(0.99) WITHIN GROUP (ORDER BY duration_ms),
+                'total_tokens', COALESCE(SUM(total_tokens), 0),
+                'avg_tokens', AVG(NULLIF(total_tokens, 0)),
+                'total_cost', COALESCE(SUM(cost_estimate), 0)
+            )
+            FROM window_rows
+        ),
+        'by_agent', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(a) ORDER BY a.invocations DESC), '[]'::jsonb)
+            FROM (
+                SELECT agent_name,
+                       COUNT(*) AS invocations,
+                       COUNT(*) FILTER (WHERE success) AS successful,
+                       AVG(duration_ms) AS avg_duration_ms,
+                       percentile_disc(0.50) WITHIN GROUP (ORDER BY duration_ms) AS p50_duration_ms,
+                       percentile_disc(0.95) WITHIN GROUP (ORDER BY duration_ms) AS p95_duration_ms,
+                       percentile_disc(0.99) WITHIN GROUP (ORDER BY duration_ms) AS p99_duration_ms
+                FROM window_rows
+                GROUP BY agent_name
+            ) a
+        ),
+        'tool_usage', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(t) ORDER BY t.calls DESC), '[]'::jsonb)
+            FROM (
+                SELECT COALESCE(call ->> 'tool', 'unknown') AS tool, COUNT(*) AS calls
+                FROM window_rows,
+                     jsonb_array_elements(
+                         CASE WHEN jsonb_typeof(tool_calls) = 'array' THEN tool_calls ELSE '[]'::jsonb END
+                     ) AS call
+                GROUP BY 1
+            ) t
+        ),
+        'recent_errors', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(e) ORDER BY e.start_time DESC), '[]'::jsonb)
+            FROM (
+                SELECT invocation_id, agent_name, error_message, start_time
+                FROM window_rows
+                WHERE NOT COALESCE(success, false) AND error_message IS NOT NULL
+                ORDER BY start_time DESC
+                LIMIT 20
+            ) e
+        )
+    );
+$$;
+
+-- Failed agent invocations for a time window
+CREATE OR REPLACE FUNCTION agent_invocation_errors(p_since TIMESTAMP)
+RETURNS JSONB
+LANGUAGE sql STABLE
+AS $$
+    WITH failed AS (
+        SELECT invocation_id, agent_name, error_message, start_time, request_content
+        FROM agent_invocations
+        WHERE start_time >= p_since AND NOT COALESCE(success, false)
+    )
+    SELECT jsonb_build_object(
+        'total', (SELECT COUNT(*) FROM failed),
+        'patterns', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(p) ORDER BY p.count DESC), '[]'::jsonb)
+            FROM (
+                SELECT COALESCE(error_message, 'Unknown error') AS error_message, COUNT(*) AS count
+                FROM failed GROUP BY 1 ORDER BY count DESC LIMIT 10
+            ) p
+        ),
+        'by_agent', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(a) ORDER BY a.count DESC), '[]'::jsonb)
+            FROM (SELECT agent_name, COUNT(*) AS count FROM failed GROUP BY agent_name) a
+        ),
+        'recent', (
+            SELECT COALESCE(jsonb_agg(to_jsonb(r) ORDER BY r.start_time DESC), '[]'::jsonb)
+            FROM (
+                SELECT invocation_id, agent_name, error_message, start_time,
+                       CASE WHEN length(request_content) > 100
+                            THEN left(request_content, 100) || '...'
+                            ELSE request_content END AS request_preview
+                FROM failed ORDER BY start_time DESC LIMIT 20
+            ) r
+        )
+    );
+$$;
+
+-- Quality distribution of the most recent scores
+CREATE OR REPLACE FUNCTION score_distribution(p_limit INTEGER DEFAULT 50)
+RETURNS JSONB
+LANGUAGE sql STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'total', COUNT(*),
+        'average', AVG(overall_score),
+        'min', MIN(overall_score),
+        'max', MAX(overall_score),
+        'high', COUNT(*) FILTER (WHERE overall_score >= 8.0),
+        'medium', COUNT(*) FILTER (WHERE overall_score >= 6.0 AND overall_score < 8.0),
+        'low', COUNT(*) FILTER (WHERE overall_score < 6.0)
+    )
+    FROM (SELECT overall_score FROM scores ORDER BY created_at DESC LIMIT p_limit) recent;
+$$;
+
+-- Time-window scans read these indexes instead of the payload-heavy table
+CREATE INDEX IF NOT EXISTS idx_agent_invocations_window ON agent_invocations(start_time, agent_name);
+CREATE INDEX IF NOT EXISTS idx_scores_created_at ON scores(created_at);
+
+COMMENT ON FUNCTION agent_invocation_analytics IS 'Counts, success rate, duration percentiles, tool usage and recent errors since p_since';
+COMMENT ON FUNCTION agent_invocation_errors IS 'Error patterns, errors by agent and recent failures since p_since';
+COMMENT ON FUNCTION score_distribution IS 'Average, range and quality bands of the latest p_limit scores';
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark nested agent invocation: run_async_safe thread + loop per call vs async invoke_agent.
+
+Each workflow is the orchestrator chain author -> plot -> world -> characters,
+driven through invoke_agent against stub agents whose LLM runner is an
+asyncio.sleep of --latency ms. The legacy path replicates the previous sync
+tool: ADK called it inline on the loop and it ran the nested agent through
+run_async_safe (dedicated thread and event loop, caller blocked). The current
+path awaits invoke_agent on the caller's loop. --workflows concurrent
+workflows are run on one loop and end-to-end latency is reported.
+
+Usage:
+    python scripts/benchmarks/bench_agent_invocation.py [--workflows 1 10 50] [--latency 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.core.container import ServiceContainer
+from src.core.interfaces import AgentResponse, ContentType
+from src.core.safe_async_runner import run_async_safe
+from src.tools import agent_tools
+
+WORKFLOW = ["author_generator", "plot_generator", "world_building", "characters"]
+
+
+class StubLLMAgent:
+    """Agent whose LLM runner is a fixed-latency sleep"""
+
+    def __init__(self, name, latency):
+        self.name = name
+        self.latency = latency
+
+    async def process_request(self, request):
+        await asyncio.sleep(self.latency)
+        return AgentResponse(
+            agent_name=self.name,
+            content=f"{self.name} output",
+            content_type=ContentType.PLOT,
+            metadata={f"{self.name}_id": str(uuid.uuid4())}
+        )
+
+
+def legacy_invoke_agent(agent_name, message, workflow_id):
+    """Replicates the old sync tool: nested agent on a dedicated thread and loop"""
+    return run_async_safe(agent_tools.invoke_agent(agent_name, message, workflow_id=workflow_id))
+
+
+async def legacy_workflow():
+    workflow_id = str(uuid.uuid4())
+    start = time.perf_counter()
+    for agent_name in WORKFLOW:
+        legacy_invoke_agent(agent_name, "Continue the book", workflow_id)
+        await asyncio.sleep(0)  # The orchestrator's LLM turn between tool calls
+    return time.perf_counter() - start
+
+
+async def async_workflow():
+    workflow_id = str(uuid.uuid4())
+    start = time.perf_counter()
+    for agent_name in WORKFLOW:
+        await agent_tools.invoke_agent(agent_name, "Continue the book", workflow_id=workflow_id)
+        await asyncio.sleep(0)
+    return time.perf_counter() - start
+
+
+async def run(workflow, count):
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(workflow() for _ in range(count)))
+    return time.perf_counter() - start, latencies
+
+
+def describe(label, total, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+    return (f"{label} {total * 1000:8.1f} ms total, p50 {statistics.median(latencies) * 1000:8.1f} ms, "
+            f"p95 {p95 * 1000:8.1f} ms")
+
+
+async def main(counts, latency):
+    container = ServiceContainer()
+    agents = {name: StubLLMAgent(name, latency) for name in WORKFLOW}
+    container.agent_factory = MagicMock()
+    container.agent_factory.return_value.get_agent.side_effect = agents.get
+
+    print(f"workflow={' -> '.join(WORKFLOW)} llm_latency={latency * 1000:.0f} ms")
+    with patch.object(agent_tools, "get_container", return_value=container):
+        for count in counts:
+            legacy = await run(legacy_workflow, count)
+            current = await run(async_workflow, count)
+            print(f"{count:>4} workflows | {describe('legacy', *legacy)} | "
+                  f"{describe('async', *current)} | {legacy[0] / current[0]:5.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workflows", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--latency", type=float, default=50, help="Stub LLM latency in ms")
+    args = parser.parse_args()
+    asyncio.run(main(args.workflows, args.latency / 1000))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQLite bulk updates: row-by-row update() vs batch_update executemany.
+
+The legacy path replicates the previous SQLiteDataOperations.batch_update: one
+awaited update() (and so one writer transaction) per record. The current path
+is batch_update, which runs one executemany per column set inside a single
+transaction. Both are run for uniform changes (every score gets the same
+fields) and per-record changes.
+
+Usage:
+    python scripts/benchmarks/bench_batch_update.py [--rows 1000 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.sqlite.adapter import SQLiteAdapter
+
+
+async def seed(adapter: SQLiteAdapter, rows: int) -> list:
+    """Insert a user and `rows` plots, returning plot IDs"""
+    user_id = await adapter.insert("users", {"name": "Benchmark User"})
+    records = [
+        {"id": str(uuid.uuid4()), "user_id": user_id, "title": f"Plot {i}", "plot_summary": "x" * 200}
+        for i in range(rows)
+    ]
+    for start in range(0, rows, 500):
+        await adapter.batch_insert("plots", records[start:start + 500])
+    return [record["id"] for record in records]
+
+
+async def legacy_batch_update(adapter: SQLiteAdapter, updates: list) -> int:
+    """Replicates the old row-by-row batch_update"""
+    updated = 0
+    for update in updates:
+        if await adapter.update("plots", update["id"], update["data"]):
+            updated += 1
+    return updated
+
+
+async def timed(label, coro_factory, adapter, rows):
+    batches_before = adapter.data_operations.executor.get_metrics()["write_batches"]
+    start = time.perf_counter()
+    updated = await coro_factory()
+    elapsed = time.perf_counter() - start
+    batches = adapter.data_operations.executor.get_metrics()["write_batches"] - batches_before
+    assert updated == rows, (label, updated)
+    print(f"  {label:<26} {elapsed * 1000:9.1f} ms  ({batches} writer transactions)")
+    return elapsed
+
+
+async def main(sizes):
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            adapter = SQLiteAdapter(os.path.join(tmp_dir, "bench.db"))
+            ids = await seed(adapter, rows)
+            uniform = [{"id": plot_id, "data": {"genre": "Rescored"}} for plot_id in ids]
+            per_record = [{"id": plot_id, "data": {"title": f"Edited {i}"}} for i, plot_id in enumerate(ids)]
+
+            print(f"rows={rows}")
+            for name, updates in (("uniform", uniform), ("per-record", per_record)):
+                legacy = await timed(f"{name} row-by-row", lambda: legacy_batch_update(adapter, updates), adapter, rows)
+                bulk = await timed(f"{name} batch_update", lambda: adapter.batch_update("plots", updates), adapter, rows)
+                print(f"  {name} speedup: {legacy / bulk:.1f}x")
+
+            await adapter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
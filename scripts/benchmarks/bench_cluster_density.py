@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark cluster density analysis: pairwise matrix + per-cluster silhouette vs closed form.
+
+The legacy path replicates the previous LoreClusteringService behaviour: a full
+cosine_distances matrix per cluster summed with a double Python loop, plus the
+global silhouette_score recomputed once per cluster. The current path is
+_calculate_avg_pairwise_distance (closed form) and a single, sampled
+_calculate_silhouette per clustering.
+
+Usage:
+    python scripts/benchmarks/bench_cluster_density.py [--sizes 1000 5000 20000] [--clusters 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.agents.loregen_modules.clustering_service import LoreClusteringService
+from sklearn.metrics import silhouette_score
+from sklearn.metrics.pairwise import cosine_distances
+
+
+def legacy_pairwise(embeddings):
+    """Replicates the old matrix + double loop average"""
+    distances = cosine_distances(embeddings)
+    n = len(embeddings)
+    total, count = 0.0, 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            total += distances[i, j]
+            count += 1
+    return total / count
+
+
+def synthetic(size, dim, clusters, rng):
+    """Normalized gaussian blobs with their labels"""
+    centers = rng.normal(size=(clusters, dim))
+    labels = rng.integers(0, clusters, size=size)
+    X = centers[labels] + rng.normal(scale=0.8, size=(size, dim))
+    X /= np.linalg.norm(X, axis=1, keepdims=True)
+    return X, labels
+
+
+def run(service, size, dim, clusters, legacy_max):
+    rng = np.random.default_rng(42)
+    X, labels = synthetic(size, dim, clusters, rng)
+    members = [X[labels == c] for c in range(clusters)]
+
+    start = time.perf_counter()
+    new_distances = [service._calculate_avg_pairwise_distance(m) for m in members]
+    new_density_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    service._calculate_silhouette(X, labels)
+    new_silhouette_ms = (time.perf_counter() - start) * 1000
+
+    line = (f"{size:>6} chunks | closed-form density {new_density_ms:8.1f} ms | "
+            f"silhouette once{' (sampled)' if size > service._silhouette_sample_size else ''} "
+            f"{new_silhouette_ms:8.1f} ms")
+
+    if size <= legacy_max:
+        start = time.perf_counter()
+        old_distances = [legacy_pairwise(m) for m in members]
+        old_density_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        silhouette_score(X, labels)
+        one_silhouette_ms = (time.perf_counter() - start) * 1000
+        old_silhouette_ms = one_silhouette_ms * clusters  # Recomputed once per cluster
+
+        assert np.allclose(old_distances, new_distances, atol=1e-6)
+        old_total = old_density_ms + old_silhouette_ms
+        new_total = new_density_ms + new_silhouette_ms
+        line += (f" | legacy density {old_density_ms:9.1f} ms, silhouette x{clusters} "
+                 f"{old_silhouette_ms:9.1f} ms | {old_total / new_total:6.1f}x")
+    else:
+        line += " | legacy skipped (--legacy-max)"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 20000])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--clusters", type=int, default=5)
+    parser.add_argument("--legacy-max", type=int, default=5000,
+                        help="Largest size to run the quadratic legacy path on")
+    args = parser.parse_args()
+
+    service = LoreClusteringService()
+    print(f"dim={args.dim} clusters={args.clusters} "
+          f"silhouette_sample_size={service._silhouette_sample_size}")
+    for size in args.sizes:
+        run(service, size, args.dim, args.clusters, args.legacy_max)
+
+
+if __name__ == "__main__":
+    main()
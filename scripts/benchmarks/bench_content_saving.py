@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark ContentSavingService plot saves: sync tools with nested event loops vs the async API.
+
+Each of --sessions concurrent sessions saves --saves plots through
+ContentSavingService.save_agent_response on a temporary SQLite database. The
+legacy path replicates the previous _save_plot_via_tool, which called the
+synchronous save_plot tool from the event loop: run_async_safe for
+ensure_session_exists, then asyncio.run failing inside the running loop and
+falling back to a fresh ThreadPoolExecutor and event loop for
+repository.create. The current path awaits save_plot_async on the service's
+repositories. Saves/s and the longest event-loop stall are reported.
+
+Usage:
+    python scripts/benchmarks/bench_content_saving.py [--sessions 1 10 50] [--saves 10]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.core.safe_async_runner import run_async_safe
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.models.entities import Plot
+from src.repositories.author_repository import AuthorRepository
+from src.repositories.characters_repository import CharactersRepository
+from src.repositories.iterative_repository import IterativeRepository
+from src.repositories.plot_repository import PlotRepository
+from src.repositories.session_repository import SessionRepository
+from src.repositories.world_building_repository import WorldBuildingRepository
+from src.services.content_saving_service import ContentSavingService
+
+
+def legacy_save_plot(service, title, plot_summary, session_id, user_id):
+    """Replicates the old sync save_plot tool body"""
+    run_async_safe(service.session_repository.ensure_session_exists(session_id, user_id), timeout=10.0)
+    plot_entity = Plot(session_id=session_id, user_id=user_id, title=title, plot_summary=plot_summary)
+
+    def threaded_create():
+        new_loop = asyncio.new_event_loop()
+        try:
+            asyncio.set_event_loop(new_loop)
+            return new_loop.run_until_complete(service.plot_repository.create(plot_entity))
+        finally:
+            new_loop.close()
+            asyncio.set_event_loop(None)
+
+    try:
+        coro = service.plot_repository.create(plot_entity)
+        try:
+            plot_id = asyncio.run(coro)
+        finally:
+            coro.close()
+    except RuntimeError:
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            plot_id = executor.submit(threaded_create).result(timeout=10)
+    return {"success": True, "plot_id": plot_id}
+
+
+async def legacy_save(service, response_data, session_id, user_id):
+    """The old async-looking service method around the blocking tool"""
+    return legacy_save_plot(service, response_data["title"], response_data["plot_summary"], session_id, user_id)
+
+
+async def current_save(service, response_data, session_id, user_id):
+    return await service.save_agent_response("plot_generator", response_data, session_id, user_id)
+
+
+async def loop_monitor(stop, interval=0.001):
+    """Longest delay of a 1 ms timer, i.e. how long the loop was blocked"""
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+async def run(save, service, sessions, saves):
+    identities = [(str(uuid.uuid4()), str(uuid.uuid4())) for _ in range(sessions)]
+
+    async def session_saves(session_index):
+        session_id, user_id = identities[session_index]
+        for i in range(saves):
+            result = await save(service, {"title": f"Plot {session_index}-{i}", "plot_summary": "A summary"},
+                                session_id, user_id)
+            assert result["success"], result
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(loop_monitor(stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(session_saves(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return sessions * saves / elapsed, await monitor
+
+
+async def main(session_counts, saves):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        adapter = SQLiteAdapter(os.path.join(tmp_dir, "bench.db"))
+        service = ContentSavingService(
+            PlotRepository(adapter), AuthorRepository(adapter), WorldBuildingRepository(adapter),
+            CharactersRepository(adapter), SessionRepository(adapter), IterativeRepository(adapter)
+        )
+        await run(current_save, service, 1, 2)  # warm up schema and connections
+
+        for sessions in session_counts:
+            print(f"sessions={sessions} saves/session={saves}")
+            for label, save in (("legacy sync tool", legacy_save), ("async API       ", current_save)):
+                rate, stall = await run(save, service, sessions, saves)
+                print(f"  {label}  {rate:8.1f} saves/s  max loop stall {stall * 1000:7.1f} ms")
+
+        await adapter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--saves", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.saves))
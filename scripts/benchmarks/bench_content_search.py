@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark content search: full Python scan vs FTS5 bm25 search with SQL LIMIT.
+
+The scan path replicates the previous search_content behaviour: load every row
+for the user with select() and substring-match in Python. The FTS path is the
+current SQLiteDataOperations.search_content.
+
+Usage:
+    python scripts/benchmarks/bench_content_search.py [--sizes 10000 100000] [--queries 20]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.sqlite.adapter import SQLiteAdapter
+
+WORDS = (
+    "dragon empire storm coast village forest shadow crown river mountain "
+    "betrayal alliance prophecy exile harbor winter ember tide relic oath"
+).split()
+
+
+async def legacy_search(adapter: SQLiteAdapter, query: str, user_id: str, limit: int) -> list:
+    """Replicates the old select-everything-then-filter search"""
+    rows = await adapter.select("plots", {"user_id": user_id})
+    matches = [
+        row for row in rows
+        if query in str(row.get("title", "")).lower() or query in str(row.get("plot_summary", "")).lower()
+    ]
+    return matches[:limit]
+
+
+async def seed(adapter: SQLiteAdapter, rows: int) -> str:
+    """Insert a user with `rows` plots of random text"""
+    rng = random.Random(42)
+    user_id = await adapter.insert("users", {"name": "Benchmark User"})
+    for start in range(0, rows, 500):
+        batch = [
+            {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "title": " ".join(rng.choices(WORDS, k=3)),
+                "plot_summary": " ".join(rng.choices(WORDS, k=40)),
+            }
+            for _ in range(min(500, rows - start))
+        ]
+        await adapter.batch_insert("plots", batch)
+    return user_id
+
+
+async def time_queries(search, queries: list) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        await search(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+async def main(sizes: list, query_count: int, limit: int):
+    queries = [random.Random(i).choice(WORDS) for i in range(query_count)]
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            adapter = SQLiteAdapter(os.path.join(tmp_dir, "bench.db"))
+            user_id = await seed(adapter, size)
+
+            legacy = await time_queries(lambda q: legacy_search(adapter, q, user_id, limit), queries)
+            fts = await time_queries(lambda q: adapter.search_content(q, "plots", user_id, limit), queries)
+
+            print(f"rows/user={size} limit={limit} queries={query_count}")
+            print(f"  python scan : {legacy * 1000:10.2f} ms/query")
+            print(f"  fts5 + bm25 : {fts * 1000:10.2f} ms/query")
+            print(f"  speedup     : {legacy / fts:10.1f}x")
+
+            await adapter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.queries, args.limit))
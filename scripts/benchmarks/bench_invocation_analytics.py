@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark agent performance analytics: full-row select plus Python loops vs SQL-side aggregation.
+
+The legacy path replicates the previous get_performance_analytics: select the
+1000 most recent full rows (prompts and raw responses included), filter the
+time window with datetime.fromisoformat and count in Python. It only ever sees
+those 1000 rows, so it is also run uncapped over the whole table for a
+like-for-like comparison. The current path is AgentInvocationRepository, which
+aggregates the whole window in SQL and reads only the columns it needs.
+
+Usage:
+    python scripts/benchmarks/bench_invocation_analytics.py [--rows 10000 100000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.repositories.agent_invocation_repository import AgentInvocationRepository
+
+AGENTS = ["plot_generator", "author_generator", "world_building", "characters", "critique"]
+TOOLS = ["save_plot", "save_author", "invoke_agent", "search_lore"]
+
+
+async def seed(adapter: SQLiteAdapter, rows: int):
+    """Insert `rows` invocations spread over the last 48 hours, with 2 KB payloads"""
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    payload = "x" * 1000
+    for start in range(0, rows, 1000):
+        await adapter.batch_insert("agent_invocations", [
+            {
+                "invocation_id": f"inv-{i}",
+                "agent_name": rng.choice(AGENTS),
+                "request_content": payload,
+                "start_time": (now - timedelta(seconds=rng.uniform(0, 48 * 3600))).isoformat(),
+                "duration_ms": rng.lognormvariate(6, 0.5),
+                "total_tokens": rng.randint(100, 4000),
+                "cost_estimate": rng.uniform(0, 0.05),
+                "success": rng.random() > 0.05,
+                "error_message": None,
+                "tool_calls": [{"tool": rng.choice(TOOLS)}],
+                "final_prompt": payload,
+                "raw_response": payload,
+            }
+            for i in range(start, min(rows, start + 1000))
+        ])
+
+
+async def legacy_performance_analytics(adapter: SQLiteAdapter, hours: int, limit=1000) -> dict:
+    """Replicates the old Python-side analytics (the core of it)"""
+    since_time = datetime.utcnow() - timedelta(hours=hours)
+    results = await adapter.select("agent_invocations", filters={}, order_by="start_time", desc=True, limit=limit)
+    recent = [r for r in results if r.get("start_time") and datetime.fromisoformat(r["start_time"]) >= since_time]
+    agent_usage, tool_usage = {}, {}
+    for row in recent:
+        agent_usage[row["agent_name"]] = agent_usage.get(row["agent_name"], 0) + 1
+        for call in row.get("tool_calls", []):
+            tool_usage[call.get("tool", "unknown")] = tool_usage.get(call.get("tool", "unknown"), 0) + 1
+    durations = [r["duration_ms"] for r in recent if r.get("duration_ms")]
+    return {"total_invocations": len(recent), "avg": sum(durations) / len(durations) if durations else 0,
+            "agent_usage_patterns": agent_usage, "tool_usage_patterns": tool_usage}
+
+
+async def best_of(coro_factory, repeats: int = 5):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+async def main(sizes):
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            adapter = SQLiteAdapter(os.path.join(tmp_dir, "bench.db"))
+            await seed(adapter, rows)
+            repository = AgentInvocationRepository(adapter)
+
+            legacy_time, legacy = await best_of(lambda: legacy_performance_analytics(adapter, 24))
+            full_time, full = await best_of(lambda: legacy_performance_analytics(adapter, 24, limit=None), repeats=1)
+            sql_time, current = await best_of(lambda: repository.get_performance_analytics(hours=24))
+            print(f"rows={rows}")
+            print(f"  legacy python   {legacy_time * 1000:8.1f} ms  (saw {legacy['total_invocations']} invocations)")
+            print(f"  legacy uncapped {full_time * 1000:8.1f} ms  (saw {full['total_invocations']} invocations)")
+            print(f"  sql aggregation {sql_time * 1000:8.1f} ms  (saw {current['total_invocations']} invocations, "
+                  f"p95 {current['performance']['p95_duration_ms']:.0f} ms)")
+            await adapter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
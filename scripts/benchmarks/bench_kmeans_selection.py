@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark k selection: sequential on-loop KMeans sweep + refit vs ClusteringEngine.
+
+The legacy path replicates the previous _determine_optimal_clusters followed by
+_perform_kmeans: KMeans(n_init=10) for k=2..10 on the event loop, then a fresh
+fit of the chosen k. The engine path is LoreClusteringService._select_clustering
+cold (parallel/MiniBatch sweep, winner reused) and warm (previous clustering of
+the same plot after a small edit). Max event-loop stall is reported for each.
+
+Usage:
+    python scripts/benchmarks/bench_kmeans_selection.py [--sizes 200 1000 5000] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.agents.loregen_modules.clustering_engine import ClusteringEngine
+from src.agents.loregen_modules.clustering_service import LoreClusteringService
+from sklearn.cluster import KMeans
+
+
+async def measure(coro_factory):
+    """Run a coroutine while sampling event-loop lag; return (seconds, max stall ms)"""
+    stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal stall
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(0.005)
+            stall = max(stall, time.perf_counter() - before - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)  # Let the ticker start its first sleep
+    start = time.perf_counter()
+    await coro_factory()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    return elapsed, stall * 1000
+
+
+async def legacy_select(service, X):
+    """Replicates the old sequential sweep plus refit, on the loop"""
+    ks, inertias = [], []
+    for k in range(2, min(10, len(X) // 2) + 1):
+        inertias.append(KMeans(n_clusters=k, random_state=42, n_init=10).fit(X).inertia_)
+        ks.append(k)
+    best = service._find_elbow_point(ks, inertias)
+    return KMeans(n_clusters=best, random_state=42, n_init=10).fit(X)
+
+
+async def run(size, dim, workers):
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(6, dim))
+    X = centers[rng.integers(0, 6, size=size)] + rng.normal(scale=0.8, size=(size, dim))
+    X /= np.linalg.norm(X, axis=1, keepdims=True)
+
+    engine = ClusteringEngine(max_workers=workers)
+    service = LoreClusteringService(engine)
+    try:
+        legacy_s, legacy_stall = await measure(lambda: legacy_select(service, X))
+
+        async def cold():
+            fit = await service._select_clustering(X, "bench-plot")
+            engine.remember("bench-plot", fit)
+        cold_s, cold_stall = await measure(cold)
+
+        X[0] += 0.01  # A small edit to one chunk
+        warm_s, warm_stall = await measure(lambda: service._select_clustering(X, "bench-plot"))
+    finally:
+        engine.shutdown()
+
+    mode = "minibatch" if size >= engine.mini_batch_threshold else f"{workers} worker(s)"
+    print(f"{size:>6} chunks | legacy {legacy_s:7.2f} s (loop stall {legacy_stall:8.1f} ms) | "
+          f"engine cold [{mode}] {cold_s:6.2f} s (stall {cold_stall:5.1f} ms) | "
+          f"warm {warm_s:6.2f} s | {legacy_s / cold_s:5.1f}x cold, {legacy_s / warm_s:6.1f}x warm")
+
+
+async def main(sizes, dim, workers):
+    print(f"dim={dim} cpus={os.cpu_count()}")
+    for size in sizes:
+        await run(size, dim, workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.dim, args.workers))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark performance metric recording: timestamped dict lists vs streaming aggregates.
+
+The legacy path replicates the previous ADKObservabilityManager: every
+record_performance_metric call builds a dict with an ISO timestamp, appends
+it to a per-metric list and re-slices the list past 1000 entries, and
+get_performance_summary rescans every list. The current path is
+ADKObservabilityManager backed by MetricSeries (ring buffer, log histogram
+and tag counters), which also reports p50/p95/p99.
+
+Usage:
+    python scripts/benchmarks/bench_metric_recording.py [--records 10000 100000] [--summaries 100]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.core.observability import ADKObservabilityManager, ObservabilityConfig
+
+METRICS = ["agent_duration_ms", "llm_latency_ms", "llm_tokens_total", "tool_usage_count"]
+AGENTS = ["plot_generator", "author_generator", "world_building", "characters"]
+
+
+class LegacyMetrics:
+    """Replicates the old list-of-dicts recording and summary"""
+
+    def __init__(self):
+        self.performance_metrics = {}
+
+    def record_performance_metric(self, metric_name, value, tags=None):
+        if metric_name not in self.performance_metrics:
+            self.performance_metrics[metric_name] = []
+        self.performance_metrics[metric_name].append({
+            "timestamp": datetime.utcnow().isoformat(), "value": value, "tags": tags or {}
+        })
+        if len(self.performance_metrics[metric_name]) > 1000:
+            self.performance_metrics[metric_name] = self.performance_metrics[metric_name][-1000:]
+
+    def get_performance_summary(self):
+        summary = {}
+        for metric_name, entries in self.performance_metrics.items():
+            values = [entry["value"] for entry in entries]
+            summary[metric_name] = {"count": len(values), "avg": sum(values) / len(values),
+                                    "min": min(values), "max": max(values), "recent": values[-10:]}
+        return summary
+
+
+def run(target, events, summaries):
+    start = time.perf_counter()
+    for metric_name, value, tags in events:
+        target.record_performance_metric(metric_name, value, tags)
+    record_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(summaries):
+        target.get_performance_summary()
+    return record_time, time.perf_counter() - start
+
+
+def main(sizes, summaries):
+    rng = random.Random(11)
+    for records in sizes:
+        events = [
+            (rng.choice(METRICS), rng.lognormvariate(5, 1), {"agent": rng.choice(AGENTS), "model": "gemini"})
+            for _ in range(records)
+        ]
+        legacy_record, legacy_summary = run(LegacyMetrics(), events, summaries)
+        current_record, current_summary = run(ADKObservabilityManager(ObservabilityConfig()), events, summaries)
+
+        print(f"records={records}")
+        print(f"  legacy     record {legacy_record / records * 1e6:6.2f} us/op   "
+              f"summary {legacy_summary / summaries * 1000:7.2f} ms")
+        print(f"  streaming  record {current_record / records * 1e6:6.2f} us/op   "
+              f"summary {current_summary / summaries * 1000:7.2f} ms  (with p50/p95/p99)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--summaries", type=int, default=100)
+    args = parser.parse_args()
+    main(args.records, args.summaries)
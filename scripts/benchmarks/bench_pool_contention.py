@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQLiteConnectionPool checkout under contention: thread-parked waits vs FIFO waiters.
+
+--acquirers coroutines check out a connection at once from a pool of
+--max-connections, run one query and hold it for --hold ms. The legacy path
+replicates the previous get_connection: a 10 ms sleep, then a blocking
+Queue.get parked on a default-executor thread, with a health-check query on
+both checkout and return. The current path is SQLiteConnectionPool, where
+waiters queue on futures and health results are cached. Reported: wall time,
+checkout wait p50/p99, health-check queries and peak thread count.
+
+Usage:
+    python scripts/benchmarks/bench_pool_contention.py [--acquirers 500] [--max-connections 10] [--hold 1]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager
+from queue import Empty, Full
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.connection_pool import ConnectionPoolConfig, SQLiteConnectionPool, SQLitePooledConnection
+
+
+class LegacySQLiteConnectionPool(SQLiteConnectionPool):
+    """Replicates the old checkout: sleep, then park an executor thread on Queue.get"""
+
+    @asynccontextmanager
+    async def get_connection(self, timeout=None):
+        connection = None
+        try:
+            try:
+                connection = self._pool.get_nowait()
+            except Empty:
+                with self._lock:
+                    under_limit = self._metrics.total_connections < self.config.max_connections
+                    if under_limit:
+                        connection = self._create_connection()
+                        if connection:
+                            self._all_connections.append(connection)
+                if not under_limit:
+                    await asyncio.sleep(0.01)
+                    connection = await asyncio.get_event_loop().run_in_executor(
+                        None, self._pool.get, True, self.config.connection_timeout
+                    )
+
+            if not connection.is_healthy():
+                raise Exception("Could not create healthy database connection")
+
+            yield connection
+
+        finally:
+            if connection:
+                try:
+                    if connection.is_healthy() and not connection.is_idle_expired:
+                        self._pool.put_nowait(connection)
+                    else:
+                        self._remove_connection(connection)
+                except Full:
+                    self._remove_connection(connection)
+
+
+class PeakThreads:
+    """Samples the live thread count from a daemon thread"""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, threading.active_count())
+            time.sleep(0.001)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+async def run(pool, acquirers, hold):
+    waits = []
+
+    async def acquire():
+        start = time.perf_counter()
+        async with pool.get_connection() as connection:
+            waits.append(time.perf_counter() - start)
+            connection.execute("SELECT 1").close()
+            await asyncio.sleep(hold)
+
+    health_checks = 0
+    original_is_healthy = SQLitePooledConnection.is_healthy
+
+    def counted_is_healthy(connection):
+        nonlocal health_checks
+        health_checks += 1
+        return original_is_healthy(connection)
+
+    SQLitePooledConnection.is_healthy = counted_is_healthy
+    try:
+        with PeakThreads() as threads:
+            start = time.perf_counter()
+            await asyncio.gather(*(acquire() for _ in range(acquirers)))
+            elapsed = time.perf_counter() - start
+    finally:
+        SQLitePooledConnection.is_healthy = original_is_healthy
+
+    waits.sort()
+    return elapsed, waits[len(waits) // 2], waits[int(len(waits) * 0.99) - 1], health_checks, threads.peak
+
+
+async def main(acquirers, max_connections, hold_ms):
+    pool_config = ConnectionPoolConfig(
+        min_connections=max_connections, max_connections=max_connections, connection_timeout=30
+    )
+    print(f"acquirers={acquirers} max_connections={max_connections} hold={hold_ms}ms")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        for label, pool_class in (("legacy executor wait", LegacySQLiteConnectionPool),
+                                  ("FIFO waiters        ", SQLiteConnectionPool)):
+            pool = pool_class(db_path, pool_config)
+            elapsed, p50, p99, health_checks, peak_threads = await run(pool, acquirers, hold_ms / 1000)
+            print(f"  {label}  {elapsed * 1000:8.1f} ms  wait p50 {p50 * 1000:7.2f} ms  p99 {p99 * 1000:7.2f} ms  "
+                  f"{health_checks:5d} health checks  peak threads {peak_threads}")
+            if pool_class is SQLiteConnectionPool:
+                histogram = pool.get_metrics().wait_time_histogram()
+                print("  wait histogram (s): " + "  ".join(f"<={bound}: {count}" for bound, count in histogram.items()))
+            await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--acquirers", type=int, default=500)
+    parser.add_argument("--max-connections", type=int, default=10)
+    parser.add_argument("--hold", type=float, default=1.0, help="milliseconds each acquirer holds its connection")
+    args = parser.parse_args()
+    asyncio.run(main(args.acquirers, args.max_connections, args.hold))
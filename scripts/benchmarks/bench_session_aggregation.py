@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark SessionRepository aggregation: per-table and per-plot searches vs the aggregated query path.
+
+The legacy path replicates the previous get_session_data: five sequential
+session searches, then three sequential iteration searches per plot, and
+get_session_timeline rebuilding all of it. The current path is
+SessionRepository, which reads the session tables with one UNION ALL query
+and the iteration tables with one batched IN query each. Sessions are seeded
+in SQLite; --latency adds a simulated network round-trip to every database
+call to model a remote database such as Supabase.
+
+Usage:
+    python scripts/benchmarks/bench_session_aggregation.py [--items 10 100 1000] [--latency 0 5]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.repositories.session_repository import SessionRepository
+
+
+class RoundTripAdapter:
+    """Wraps an adapter, adding a fixed delay and a counter to every database call"""
+
+    def __init__(self, adapter: SQLiteAdapter, latency: float):
+        self._adapter = adapter
+        self._latency = latency
+        self.round_trips = 0
+
+    def __getattr__(self, name):
+        attribute = getattr(self._adapter, name)
+        if not callable(attribute):
+            return attribute
+
+        async def call(*args, **kwargs):
+            self.round_trips += 1
+            if self._latency:
+                await asyncio.sleep(self._latency)
+            return await attribute(*args, **kwargs)
+        return call
+
+
+async def seed(adapter: SQLiteAdapter, items: int) -> str:
+    """Create a session with `items` content rows; 40% are plots, each with a critique and score"""
+    user_id = await adapter.insert("users", {"name": "Benchmark User"})
+    session_id = await adapter.insert("sessions", {"user_id": user_id})
+    plots = max(1, items * 2 // 5)
+    others = items - plots
+
+    plot_records = [
+        {"session_id": session_id, "title": f"Plot {i}", "plot_summary": "x" * 200}
+        for i in range(plots)
+    ]
+    plot_ids = await adapter.batch_insert("plots", plot_records)
+    await adapter.batch_insert("authors", [
+        {"session_id": session_id, "author_name": f"Author {i}"} for i in range(others // 3)
+    ] or [{"session_id": session_id, "author_name": "Author"}])
+    await adapter.batch_insert("world_building", [
+        {"session_id": session_id, "world_name": f"World {i}", "plot_id": plot_ids[i % plots]}
+        for i in range(others // 3)
+    ] or [{"session_id": session_id, "world_name": "World"}])
+    await adapter.batch_insert("characters", [
+        {"session_id": session_id, "character_count": 3, "world_context_integration": "x", "characters": "[]"}
+        for _ in range(others - 2 * (others // 3))
+    ] or [{"session_id": session_id, "character_count": 3, "world_context_integration": "x", "characters": "[]"}])
+
+    iteration_ids = [f"plot_{plot_id}" for plot_id in plot_ids]
+    await adapter.batch_insert("iterations", [
+        {"id": iteration_id, "iteration_number": 1, "content": "Draft"} for iteration_id in iteration_ids
+    ])
+    await adapter.batch_insert("critiques", [
+        {"iteration_id": iteration_id, "critique_json": "{}", "agent_response": "ok"} for iteration_id in iteration_ids
+    ])
+    await adapter.batch_insert("scores", [
+        {"iteration_id": iteration_id, "overall_score": 8.0, "category_scores": "{}",
+         "score_rationale": "ok", "improvement_trajectory": "[]"}
+        for iteration_id in iteration_ids
+    ])
+    return session_id
+
+
+async def legacy_get_session_data(database, session_id: str, limit: int) -> dict:
+    """Replicates the old get_session_data (limit raised so both paths return every row)"""
+    data = {}
+    for table in ("plots", "authors", "world_building", "characters", "orchestrator_decisions"):
+        data[table] = await database.search(table, {"session_id": session_id}, limit)
+    for table in ("critiques", "enhancements", "scores"):
+        data[table] = []
+    for plot in data["plots"]:
+        for table in ("critiques", "enhancements", "scores"):
+            data[table].extend(await database.search(table, {"iteration_id": f"plot_{plot['id']}"}, limit))
+    return data
+
+
+async def legacy_get_session_timeline(database, session_id: str, limit: int) -> list:
+    """Replicates the old get_session_timeline: the full aggregation, then a sort"""
+    data = await legacy_get_session_data(database, session_id, limit)
+    timeline = [
+        {"timestamp": record.get("created_at"), "id": record.get("id")}
+        for table in ("plots", "authors", "world_building", "characters") for record in data[table]
+    ]
+    timeline.sort(key=lambda event: event.get("timestamp", ""))
+    return timeline
+
+
+async def timed(database: RoundTripAdapter, coro_factory, repeats: int = 3):
+    """Best-of wall time and round-trips for one call"""
+    best = float("inf")
+    for _ in range(repeats):
+        database.round_trips = 0
+        start = time.perf_counter()
+        result = await coro_factory()
+        best = min(best, time.perf_counter() - start)
+    return best, database.round_trips, result
+
+
+async def main(sizes, latencies):
+    for items in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            adapter = SQLiteAdapter(os.path.join(tmp_dir, "bench.db"))
+            session_id = await seed(adapter, items)
+
+            for latency in latencies:
+                database = RoundTripAdapter(adapter, latency / 1000)
+                repository = SessionRepository(database)
+                print(f"items={items} latency={latency:g} ms")
+
+                legacy_data = await timed(database, lambda: legacy_get_session_data(database, session_id, items))
+                data = await timed(database, lambda: repository.get_session_data(session_id))
+                assert len(legacy_data[2]["plots"]) == len(data[2]["plots"])
+                assert len(legacy_data[2]["scores"]) == len(data[2]["scores"])
+
+                legacy_timeline = await timed(database, lambda: legacy_get_session_timeline(database, session_id, items))
+                timeline = await timed(database, lambda: repository.get_session_timeline(session_id))
+                assert len(legacy_timeline[2]) == len(timeline[2])
+
+                for label, legacy, current in (("session_data", legacy_data, data),
+                                               ("timeline", legacy_timeline, timeline)):
+                    print(f"  {label:<13} legacy {legacy[0] * 1000:9.1f} ms ({legacy[1]:5d} round-trips) | "
+                          f"aggregated {current[0] * 1000:8.1f} ms ({current[1]} round-trips) | "
+                          f"{legacy[0] / current[0]:.1f}x")
+
+            await adapter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency", type=float, nargs="+", default=[0, 5],
+                        help="Simulated round-trip time per database call in ms")
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.latency))
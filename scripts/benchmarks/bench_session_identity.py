@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark SessionRepository.ensure_session_exists: search-then-insert vs cached upserts.
+
+--sessions sessions each persist --saves artifacts, resolving their session
+before every save as the writing tools do, on a temporary SQLite database.
+The legacy path replicates the previous ensure_session_exists: search
+sessions, then search users, then insert whichever is missing, on every
+call. The current path is SessionRepository.ensure_session_exists with its
+identity cache, which upserts the user and session once per TTL. Reported:
+database round-trips per save and mean resolution latency.
+
+Usage:
+    python scripts/benchmarks/bench_session_identity.py [--sessions 10 100] [--saves 20]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.repositories.session_repository import SessionRepository
+
+
+class CountingAdapter:
+    """Wraps an adapter, counting awaited database calls"""
+
+    def __init__(self, adapter):
+        self._adapter = adapter
+        self.calls = 0
+
+    def __getattr__(self, name):
+        attribute = getattr(self._adapter, name)
+        if not callable(attribute):
+            return attribute
+
+        async def counted(*args, **kwargs):
+            self.calls += 1
+            return await attribute(*args, **kwargs)
+        return counted
+
+
+async def legacy_ensure_session_exists(database, session_id, user_id):
+    """Replicates the old uncached search-then-insert resolution"""
+    existing_sessions = await database.search("sessions", criteria={"id": session_id})
+    if existing_sessions:
+        return existing_sessions[0]
+
+    existing_users = await database.search("users", criteria={"id": user_id})
+    if not existing_users:
+        await database.insert("users", {"id": user_id})
+
+    session_data = {"id": session_id, "user_id": user_id}
+    await database.insert("sessions", session_data)
+    return session_data
+
+
+async def run(resolve, database, sessions, saves):
+    identities = [(str(uuid.uuid4()), str(uuid.uuid4())) for _ in range(sessions)]
+
+    async def session_saves(session_id, user_id):
+        for _ in range(saves):
+            await resolve(session_id, user_id)
+
+    database.calls = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(session_saves(*identity) for identity in identities))
+    elapsed = time.perf_counter() - start
+    resolutions = sessions * saves
+    return database.calls / resolutions, elapsed / resolutions
+
+
+async def main(session_counts, saves):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        adapter = SQLiteAdapter(os.path.join(tmp_dir, "bench.db"))
+        database = CountingAdapter(adapter)
+
+        async def legacy(session_id, user_id):
+            await legacy_ensure_session_exists(database, session_id, user_id)
+
+        for sessions in session_counts:
+            repository = SessionRepository(database)
+            print(f"sessions={sessions} saves/session={saves}")
+            for label, resolve in (("legacy search/insert", legacy),
+                                   ("identity cache      ", repository.ensure_session_exists)):
+                round_trips, latency = await run(resolve, database, sessions, saves)
+                print(f"  {label}  {round_trips:5.2f} round-trips/save  mean {latency * 1e6:8.1f} us/save")
+            print(f"  cache hit rate {repository.get_identity_cache_stats()['hit_rate']:.1%}")
+
+        await adapter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--saves", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.saves))
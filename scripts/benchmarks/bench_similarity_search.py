@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark embedding similarity search: per-candidate loop vs vectorized top-k.
+
+The loop path replicates the previous get_similar_embeddings behaviour: one
+cosine similarity per candidate (fresh np.arrays and norms each time) followed
+by a full sort. The vectorized path is EmbeddingIndex.search, timed both with
+the index built per call and with a prebuilt index reused across queries.
+
+Usage:
+    python scripts/benchmarks/bench_similarity_search.py [--sizes 1000 10000 100000] [--dim 768]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.agents.loregen_modules.embedding_manager import EmbeddingIndex
+
+
+def legacy_similar(query, candidates, top_k):
+    """Replicates the old per-candidate cosine similarity loop"""
+    similarities = []
+    for i, candidate in enumerate(candidates):
+        a = np.array(query)
+        b = np.array(candidate)
+        norm_a = np.linalg.norm(a)
+        norm_b = np.linalg.norm(b)
+        similarity = 0.0 if norm_a == 0 or norm_b == 0 else float(np.dot(a, b) / (norm_a * norm_b))
+        similarities.append((i, similarity))
+    similarities.sort(key=lambda x: x[1], reverse=True)
+    return similarities[:top_k]
+
+
+def timed(func, repeat):
+    """Average wall time of func() in milliseconds"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def run(size, dim, queries, top_k):
+    rng = np.random.default_rng(42)
+    candidates = rng.normal(size=(size, dim)).astype(np.float32).tolist()
+    query_batch = rng.normal(size=(queries, dim)).astype(np.float32).tolist()
+
+    legacy_repeat = 1 if size >= 10000 else 3
+    legacy_ms, legacy_result = timed(
+        lambda: legacy_similar(query_batch[0], candidates, top_k), legacy_repeat
+    )
+
+    build_ms, index = timed(lambda: EmbeddingIndex(candidates), 1)
+    single_ms, single_result = timed(lambda: index.search(query_batch[0], top_k)[0], 10)
+    batch_ms, _ = timed(lambda: index.search(query_batch, top_k), 3)
+
+    assert [i for i, _ in single_result] == [i for i, _ in legacy_result]
+
+    print(f"{size:>8} candidates | loop {legacy_ms:9.1f} ms/query | "
+          f"index build {build_ms:8.1f} ms | indexed {single_ms:7.2f} ms/query "
+          f"({legacy_ms / single_ms:6.0f}x) | batch of {queries}: "
+          f"{batch_ms / queries:6.3f} ms/query")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=32)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"dim={args.dim} top_k={args.top_k}")
+    for size in args.sizes:
+        run(size, args.dim, args.queries, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQLite query throughput: connect-per-query vs cached per-thread connections.
+
+The legacy path opens a fresh sqlite3 connection and re-runs the PRAGMA setup for
+every statement (the previous SQLiteConnectionManager behaviour). The cached path
+goes through SQLiteDataOperations, which now reuses one connection per executor thread.
+
+Usage:
+    python scripts/benchmarks/bench_sqlite_connections.py [--rows 1000] [--queries 5000]
+"""
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.sqlite.adapter import SQLiteAdapter
+
+
+def legacy_select(db_path: str, query: str, params: list) -> list:
+    """Replicates the old connect-per-query execute_select"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        return [dict(row) for row in conn.execute(query, params).fetchall()]
+    finally:
+        conn.close()
+
+
+async def seed(adapter: SQLiteAdapter, rows: int) -> list:
+    """Insert a user and `rows` plots, returning plot IDs"""
+    user_id = await adapter.insert("users", {"name": "Benchmark User"})
+    records = [
+        {"id": str(uuid.uuid4()), "user_id": user_id, "title": f"Plot {i}", "plot_summary": "x" * 200}
+        for i in range(rows)
+    ]
+    for start in range(0, rows, 500):
+        await adapter.batch_insert("plots", records[start:start + 500])
+    return [record["id"] for record in records]
+
+
+async def run_legacy(db_path: str, plot_ids: list, queries: int, concurrency: int) -> float:
+    loop = asyncio.get_event_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            await loop.run_in_executor(
+                None, legacy_select, db_path,
+                "SELECT * FROM plots WHERE id = ? LIMIT 1", [plot_ids[i % len(plot_ids)]]
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(queries)))
+    return time.perf_counter() - start
+
+
+async def run_cached(adapter: SQLiteAdapter, plot_ids: list, queries: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            await adapter.get_by_id("plots", plot_ids[i % len(plot_ids)])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(queries)))
+    return time.perf_counter() - start
+
+
+async def main(rows: int, queries: int, concurrency: int):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        adapter = SQLiteAdapter(db_path)
+        plot_ids = await seed(adapter, rows)
+
+        legacy_time = await run_legacy(db_path, plot_ids, queries, concurrency)
+        cached_time = await run_cached(adapter, plot_ids, queries, concurrency)
+
+        print(f"rows={rows} queries={queries} concurrency={concurrency}")
+        print(f"  connect-per-query : {queries / legacy_time:10.0f} qps ({legacy_time:.2f}s)")
+        print(f"  cached connections: {queries / cached_time:10.0f} qps ({cached_time:.2f}s)")
+        print(f"  speedup           : {legacy_time / cached_time:10.2f}x")
+
+        await adapter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.queries, args.concurrency))
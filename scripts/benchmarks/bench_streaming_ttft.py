@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark OpenAI-compatible streaming: buffered pseudo-streaming vs true token streaming.
+
+A BaseAgent runs against the ADK runner mock in tests/mocks/google_adk.py,
+which, under the SSE run config the agent requests, streams --tokens partial
+events --token-delay ms apart followed by the aggregated final event. The legacy path
+replicates the previous create_streaming_response: await the whole
+process_request, then split the text into 20-word SSE chunks with a 50 ms
+sleep between them. The current path is create_streaming_response, which
+forwards process_request_streaming chunks as they arrive. Time to first
+token (first content SSE event), total time and tokens/s are reported.
+
+Usage:
+    python scripts/benchmarks/bench_streaming_ttft.py [--tokens 50 200] [--token-delay 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from tests.mocks.google_adk import MockInMemoryRunner
+from src.core.configuration import config
+from src.core.agent_tracker import AgentTracker
+from src.core.interfaces import AgentRequest
+from src.routers.openai_compat import ChatCompletionChunk, ChatCompletionRequest, ChatMessage, create_streaming_response
+
+
+def build_agent(runner, tracker):
+    """BaseAgent wired to the mock runner, with no conversation history"""
+    factory = MagicMock()
+    factory.create_runner.return_value = runner
+    conversation_manager = AsyncMock()
+    conversation_manager.get_conversation_context.return_value = {
+        "has_conversation_history": False, "context_summary": "", "user_preferences": {}
+    }
+    with patch('src.core.agent_modules.agent_config_manager.get_adk_service_factory', return_value=factory), \
+         patch('src.core.agent_modules.agent_config_manager.get_agent_tracker', return_value=tracker):
+        from src.core.base_agent import BaseAgent
+        agent = BaseAgent("plot_generator", "Plot generator", "Write plots", config)
+    agent._message_handler.conversation_manager = conversation_manager
+    # Pre-created ADK session (the mock session service is synchronous)
+    agent._sessions["bench-session"] = MagicMock(session_id="bench-session")
+    return agent
+
+
+def legacy_streaming_response(agent, agent_request, request):
+    """Replicates the old generate(): full response first, then 20-word chunks"""
+    async def generate():
+        response = await agent.process_request(agent_request)
+        words = response.content.split()
+        for i in range(0, len(words), 20):
+            chunk_content = (" " if i > 0 else "") + " ".join(words[i:i + 20])
+            chunk = ChatCompletionChunk(id="legacy", created=0, model=request.model, choices=[{
+                "index": 0, "delta": {"role": "assistant" if i == 0 else None, "content": chunk_content},
+                "finish_reason": None
+            }])
+            yield f"data: {chunk.json()}\n\n"
+            await asyncio.sleep(0.05)
+        yield "data: [DONE]\n\n"
+    return generate()
+
+
+async def consume(body):
+    """Time to the first content event and total time of an SSE body"""
+    start = time.perf_counter()
+    first = None
+    async for event in body:
+        if first is None and event.startswith("data: {"):
+            if json.loads(event[len("data: "):])["choices"][0]["delta"].get("content"):
+                first = time.perf_counter() - start
+    return first, time.perf_counter() - start
+
+
+async def main(token_counts, token_delay):
+    request = ChatCompletionRequest(model="books-writer-plot", messages=[ChatMessage(role="user", content="A plot")])
+    agent_request = AgentRequest(content="A plot", user_id="bench-user", session_id="bench-session")
+
+    for tokens in token_counts:
+        runner = MockInMemoryRunner(None, response_tokens=[f"word{i} " for i in range(tokens)],
+                                    token_delay=token_delay / 1000)
+        agent = build_agent(runner, AgentTracker())
+
+        legacy = await consume(legacy_streaming_response(agent, agent_request, request))
+        response = await create_streaming_response(agent, agent_request, request)
+        current = await consume(response.body_iterator)
+
+        print(f"tokens={tokens} token_delay={token_delay}ms")
+        for label, (ttft, total) in (("legacy buffered", legacy), ("token streaming", current)):
+            print(f"  {label}  ttft {ttft * 1000:8.1f} ms  total {total * 1000:8.1f} ms  "
+                  f"{tokens / total:7.1f} tokens/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--token-delay", type=float, default=20.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.tokens, args.token_delay))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark SupabaseAdapter under concurrency: blocking execute() on the loop vs the I/O executor.
+
+A local PostgREST stand-in (threaded HTTP server answering every request
+after --latency ms) replaces Supabase. The legacy path replicates the previous
+adapter: a pooled client's .execute() called directly inside the coroutine.
+The current path is SupabaseAdapter.get_by_id. --concurrency requests are
+issued at once while a 5 ms ticker samples event-loop lag.
+
+Usage:
+    python scripts/benchmarks/bench_supabase_concurrency.py [--concurrency 100] [--latency 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.database.supabase_adapter import SupabaseAdapter
+
+
+def start_postgrest_stand_in(latency):
+    """Serve PostgREST-shaped JSON for any GET after a fixed delay"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like PostgREST
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = json.dumps([{"id": "plot-1", "title": "Stand-in"}]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def measure(coro_factory):
+    """Run a coroutine while sampling loop lag; return (seconds, p50 ms, p99 ms, max ms)"""
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            before = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append((time.perf_counter() - before - 0.005) * 1000)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)  # Let the ticker start its first sleep
+    start = time.perf_counter()
+    await coro_factory()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+
+    lags.sort()
+    return elapsed, lags[len(lags) // 2], lags[int(len(lags) * 0.99) - 1 if len(lags) > 1 else 0], lags[-1]
+
+
+async def legacy_get_by_id(adapter, entity_id):
+    """Replicates the old adapter: blocking execute() inside the coroutine"""
+    async with adapter.connection_pool.get_connection() as conn:
+        response = conn.client.table("plots").select("*").eq("id", entity_id).execute()
+        return response.data[0] if response.data else None
+
+
+async def main(concurrency, latency):
+    server = start_postgrest_stand_in(latency)
+    adapter = SupabaseAdapter(url=f"http://127.0.0.1:{server.server_port}", key="bench-anon-key")
+    # Warm the keep-alive connections of every pooled client
+    await asyncio.gather(*(adapter.get_by_id("plots", str(i)) for i in range(adapter.pool_config.max_connections)))
+
+    print(f"concurrency={concurrency} postgrest_latency={latency * 1000:.0f} ms "
+          f"pool={adapter.pool_config.max_connections}")
+    try:
+        for label, fetch in (("legacy on-loop", lambda i: legacy_get_by_id(adapter, str(i))),
+                             ("executor", lambda i: adapter.get_by_id("plots", str(i)))):
+            async def burst():
+                results = await asyncio.gather(*(fetch(i) for i in range(concurrency)))
+                assert all(results)
+            elapsed, p50, p99, worst = await measure(burst)
+            print(f"{label:>15} | {elapsed * 1000:8.1f} ms total | loop lag p50 {p50:7.1f} ms, "
+                  f"p99 {p99:7.1f} ms, max {worst:7.1f} ms")
+    finally:
+        await adapter.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=20, help="Stand-in response time in ms")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.latency / 1000))
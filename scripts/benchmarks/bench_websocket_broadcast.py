@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark WebSocket broadcast: sequential per-client send_json vs encode-once fan-out.
+
+--viewers in-memory sockets are connected; --slow-fraction of them take
+--slow-ms per frame and one stalled viewer takes --stalled-ms per frame. A
+workflow emits --updates progress messages of --payload-bytes, one every
+--interval-ms. The legacy path replicates the previous broadcast_json, which
+awaited websocket.send_json (one JSON encode per client) for each client in
+turn. The current path is ConnectionManager.broadcast_json, which encodes
+once and queues the frame for every client's send task. Reported: delivery
+latency to the fast viewers (p50/p99), time the workflow spent blocked in
+broadcasts and JSON encodes.
+
+Usage:
+    python scripts/benchmarks/bench_websocket_broadcast.py [--viewers 100 500] [--updates 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.configuration import config  # noqa: F401 - initialise packages in app import order
+from src.websocket import connection_manager as connection_manager_module
+from src.websocket.connection_manager import ConnectionManager
+
+
+class Viewer:
+    """In-memory socket with a fixed per-frame send delay"""
+
+    encodes = 0
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.arrivals = {}
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        # What WebSocket.send_json does: encode for this client, then send
+        Viewer.encodes += 1
+        await self.send_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    async def send_text(self, text):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.arrivals[json.loads(text)["step"]] = time.perf_counter()
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+
+async def legacy_broadcast_json(manager, data):
+    """Replicates the old sequential broadcast"""
+    for client_id, websocket in list(manager.active_connections.items()):
+        try:
+            await websocket.send_json(data)
+        except Exception:
+            manager.disconnect(client_id)
+
+
+def make_viewers(count, slow_fraction, slow_ms, stalled_ms):
+    rng = random.Random(5)
+    delays = [slow_ms / 1000 if rng.random() < slow_fraction else 0.0 for _ in range(count - 1)]
+    delays.insert(rng.randrange(count), stalled_ms / 1000)
+    return [Viewer(delay) for delay in delays]
+
+
+async def run(broadcast, viewers, updates, interval, payload):
+    manager = ConnectionManager()
+    for i, viewer in enumerate(viewers):
+        await manager.connect(viewer, f"viewer{i}")
+
+    sent_at = []
+    blocked = 0.0
+    for step in range(updates):
+        sent_at.append(time.perf_counter())
+        await broadcast(manager, {"type": "progress", "step": step, "content": payload})
+        blocked += time.perf_counter() - sent_at[-1]
+        await asyncio.sleep(interval)
+    await manager.flush(timeout=60)
+    manager.shutdown()
+
+    latencies = sorted(
+        viewer.arrivals[step] - sent_at[step]
+        for viewer in viewers if viewer.delay == 0
+        for step in range(updates)
+    )
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)], blocked
+
+
+async def main(viewer_counts, updates, interval_ms, payload_bytes, slow_fraction, slow_ms, stalled_ms):
+    payload = "x" * payload_bytes
+    encode_json = connection_manager_module.encode_json
+
+    def counting_encode(data):
+        Viewer.encodes += 1
+        return encode_json(data)
+
+    connection_manager_module.encode_json = counting_encode
+
+    async def current_broadcast(manager, data):
+        await manager.broadcast_json(data)
+
+    for count in viewer_counts:
+        print(f"viewers={count} updates={updates} slow={slow_fraction:.0%}@{slow_ms:.0f}ms "
+              f"stalled=1@{stalled_ms:.0f}ms payload={payload_bytes}B")
+        for label, broadcast in (("legacy sequential", legacy_broadcast_json), ("fan-out          ", current_broadcast)):
+            Viewer.encodes = 0
+            viewers = make_viewers(count, slow_fraction, slow_ms, stalled_ms)
+            p50, p99, blocked = await run(broadcast, viewers, updates, interval_ms / 1000, payload)
+            print(f"  {label}  fast-viewer latency p50 {p50 * 1000:8.1f} ms  p99 {p99 * 1000:8.1f} ms  "
+                  f"workflow blocked {blocked * 1000:8.1f} ms  encodes {Viewer.encodes:6d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--viewers", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--updates", type=int, default=10)
+    parser.add_argument("--interval-ms", type=float, default=50.0)
+    parser.add_argument("--payload-bytes", type=int, default=2000)
+    parser.add_argument("--slow-fraction", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=float, default=20.0)
+    parser.add_argument("--stalled-ms", type=float, default=500.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.viewers, args.updates, args.interval_ms, args.payload_bytes,
+                     args.slow_fraction, args.slow_ms, args.stalled_ms))
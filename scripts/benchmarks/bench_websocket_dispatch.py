@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Load test WebSocket message handling: inline processing vs the per-connection dispatcher.
+
+Hundreds of simulated clients connect to a WebSocketHandler whose agent
+factory returns a stub orchestrator that sleeps --agent-ms per request. Each
+client starts an agent message, then sends a search while the agent runs,
+then a burst of further agent messages. The legacy path replicates the
+previous _message_loop, which awaited every message inline, so the search
+waits behind the workflow and the burst queues without bound in the socket.
+The current path runs agent messages in a MessageDispatcher with a bounded
+inbox. Reported: search reply latency (p50/p99), wall time, agent messages
+run and busy rejections.
+
+Usage:
+    python scripts/benchmarks/bench_websocket_dispatch.py [--clients 100 500] [--agent-ms 500] [--burst 4]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from fastapi.websockets import WebSocketDisconnect
+
+from src.core.configuration import config
+from src.core.interfaces import AgentResponse, ContentType
+from src.websocket.connection_manager import ConnectionManager
+from src.websocket.websocket_handler import WebSocketHandler
+
+
+class StubAgentFactory:
+    """Agent factory whose orchestrator sleeps instead of calling a model"""
+
+    def __init__(self, agent_delay):
+        self.agent_delay = agent_delay
+        self.requests = 0
+
+    def get_available_agents(self):
+        return ["orchestrator"]
+
+    def create_agent(self, agent_name):
+        factory = self
+
+        class StubOrchestrator:
+            async def process_request(self, request):
+                factory.requests += 1
+                await asyncio.sleep(factory.agent_delay)
+                return AgentResponse(agent_name="orchestrator", content="done", content_type=ContentType.PLOT)
+
+        return StubOrchestrator()
+
+
+class SimulatedClient:
+    """In-memory socket recording when each reply type first arrives"""
+
+    def __init__(self):
+        self.incoming = asyncio.Queue()
+        self.arrivals = {}
+        self.counts = {}
+        self.changed = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        data = await self.incoming.get()
+        if data is None:
+            raise WebSocketDisconnect()
+        return data
+
+    async def send_text(self, text):
+        data = json.loads(text)
+        self.arrivals.setdefault(data["type"], time.perf_counter())
+        self.counts[data.get("code", data["type"])] = self.counts.get(data.get("code", data["type"]), 0) + 1
+        self.changed.set()
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+    def send(self, **message):
+        self.incoming.put_nowait(json.dumps(message))
+
+    async def wait_until(self, predicate):
+        while not predicate():
+            self.changed.clear()
+            await self.changed.wait()
+
+
+class LegacyWebSocketHandler(WebSocketHandler):
+    """Replicates the old loop that awaited every message inline"""
+
+    async def _message_loop(self, client_id, session_id):
+        while self.connection_manager.is_connected(client_id):
+            try:
+                websocket = self.connection_manager.active_connections.get(client_id)
+                if not websocket:
+                    break
+                message_data = json.loads(await websocket.receive_text())
+                await self._process_message(client_id, session_id, message_data)
+            except WebSocketDisconnect:
+                break
+        self.connection_manager.disconnect(client_id)
+
+
+async def run_client(handler, index, burst):
+    client = SimulatedClient()
+    connection = asyncio.create_task(handler.handle_connection(client, f"bench{index}"))
+    await client.wait_until(lambda: "connection_established" in client.arrivals)
+
+    # First agent message is running once its header arrives
+    client.send(type="message", content="Write a plot", user_id="user1")
+    await client.wait_until(lambda: "stream_chunk" in client.arrivals)
+
+    sent = time.perf_counter()
+    client.send(type="search", content="dragons", user_id="user1")
+    for _ in range(burst):
+        client.send(type="message", content="Write another plot", user_id="user1")
+
+    await client.wait_until(lambda: "stream_end" in client.arrivals)
+    search_latency = client.arrivals["stream_end"] - sent
+
+    # Every accepted agent message completes, rejected ones are answered as busy
+    await client.wait_until(
+        lambda: client.counts.get("workflow_complete", 0) + client.counts.get("busy", 0) == burst + 1
+    )
+    client.incoming.put_nowait(None)
+    await connection
+    return search_latency, client.counts.get("busy", 0)
+
+
+async def run(handler_class, clients, agent_delay, burst):
+    agent_factory = StubAgentFactory(agent_delay)
+    connection_manager = ConnectionManager()
+    handler = handler_class(connection_manager, agent_factory, config,
+                            content_saving_service=AsyncMock(), session_repository=AsyncMock(),
+                            max_queued_messages=2)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_client(handler, i, burst) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    connection_manager.shutdown()
+
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "elapsed": elapsed,
+        "agent_runs": agent_factory.requests,
+        "busy": sum(busy for _, busy in results),
+    }
+
+
+async def main(client_counts, agent_ms, burst):
+    for clients in client_counts:
+        print(f"clients={clients} agent={agent_ms:.0f}ms burst={burst}")
+        for label, handler_class in (("legacy inline", LegacyWebSocketHandler),
+                                     ("dispatcher   ", WebSocketHandler)):
+            stats = await run(handler_class, clients, agent_ms / 1000, burst)
+            print(f"  {label}  search p50 {stats['p50'] * 1000:8.1f} ms  p99 {stats['p99'] * 1000:8.1f} ms  "
+                  f"wall {stats['elapsed']:6.2f} s  agent runs {stats['agent_runs']:5d}  busy {stats['busy']:5d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, nargs="+", default=[100, 500])
+    parser.add_argument("--agent-ms", type=float, default=500.0)
+    parser.add_argument("--burst", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.agent_ms, args.burst))
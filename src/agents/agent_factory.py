@@ -67,6 +67,14 @@ class AgentFactory(IAgentFactory):
         """Clear the agent cache"""
         self._agent_cache.clear()
     
+    def shutdown(self) -> None:
+        """Release resources held by cached agents (e.g. worker processes) and clear the cache"""
+        for agent in self._agent_cache.values():
+            shutdown = getattr(agent, "shutdown", None)
+            if callable(shutdown):
+                shutdown()
+        self._agent_cache.clear()
+    
     def get_agent_info(self) -> Dict[str, Dict[str, str]]:
         """Get information about all available agents"""
         agent_info = {}
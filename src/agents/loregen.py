@@ -10,10 +10,11 @@ improved modularity, maintainability, and testability.
 import asyncio
 import time
 import logging
-from typing import Dict, Any, List, Optional
+import uuid
+from typing import AsyncGenerator, Callable, Dict, Any, List, Optional
 
 from ..core.base_agent import BaseAgent
-from ..core.interfaces import AgentRequest, AgentResponse, ContentType
+from ..core.interfaces import AgentRequest, AgentResponse, StreamChunk, ContentType
 from ..core.configuration import Configuration
 
 # Import modular services
@@ -28,6 +29,13 @@ class LoreGenAgent(BaseAgent):
     Refactored LoreGen agent using modular architecture.
     Maintains full API compatibility with the original implementation.
     """
+
+    # Expansion LLM calls in flight at once
+    MAX_CONCURRENT_EXPANSIONS = 3
+    # Seconds a single expansion may take before it is dropped from the result
+    EXPANSION_TIMEOUT_SECONDS = 60.0
+    # ADK user that owns LoreGen's internal generation sessions
+    SYSTEM_USER_ID = "loregen_system"
     
     def __init__(self, config: Configuration):
         """Initialize LoreGen agent with modular services"""
@@ -92,7 +100,62 @@ class LoreGenAgent(BaseAgent):
         Process LoreGen request to expand world building.
         Main entry point for the expansion workflow.
         """
+        return await self._expand_world(request)
+
+    async def process_request_streaming(self, request: AgentRequest) -> AsyncGenerator[StreamChunk, None]:
+        """
+        Process LoreGen request, streaming each expansion as it completes.
+
+        Every finished expansion is yielded as a text chunk with its concept
+        area in metadata, in completion order. The final chunk has
+        is_complete=True and carries the complete AgentResponse in
+        metadata['response']; its text is the error message if the request failed.
+        """
+        finished: asyncio.Queue = asyncio.Queue()
+        workflow = asyncio.create_task(self._expand_world(request, on_expansion=finished.put_nowait))
+
+        try:
+            while True:
+                next_expansion = asyncio.ensure_future(finished.get())
+                await asyncio.wait({next_expansion, workflow}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_expansion.done():
+                    next_expansion.cancel()
+                    break
+
+                yield self._expansion_chunk(next_expansion.result())
+
+            # Expansions that finished alongside the workflow
+            while not finished.empty():
+                yield self._expansion_chunk(finished.get_nowait())
+
+            response = workflow.result()
+            yield StreamChunk(
+                chunk="" if response.success else (response.error or ""),
+                agent_name=self.name,
+                is_complete=True,
+                metadata={'response': response}
+            )
+        finally:
+            # Stop generating if the consumer goes away early
+            if not workflow.done():
+                workflow.cancel()
+
+    def _expansion_chunk(self, expansion: Dict[str, Any]) -> StreamChunk:
+        """Stream chunk presenting one finished expansion"""
+        return StreamChunk(
+            chunk=f"## {expansion['concept_area']}\n\n{expansion['expanded_content']}\n\n",
+            agent_name=self.name,
+            metadata={'concept_area': expansion['concept_area']}
+        )
+
+    async def _expand_world(
+        self,
+        request: AgentRequest,
+        on_expansion: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> AgentResponse:
+        """Run the expansion workflow, reporting each finished expansion to on_expansion"""
         start_time = time.time()
+        stage_timings: Dict[str, Any] = {}
         
         try:
             # Validate request
@@ -107,7 +170,9 @@ class LoreGenAgent(BaseAgent):
                 )
             
             # Get world building data
+            stage_start = time.perf_counter()
             world_data = await self._get_world_building(plot_id)
+            stage_timings['world_lookup_seconds'] = round(time.perf_counter() - stage_start, 3)
             if not world_data:
                 return AgentResponse(
                     agent_name=self.name,
@@ -118,16 +183,24 @@ class LoreGenAgent(BaseAgent):
                 )
             
             # Detect sparse areas using modular services
+            stage_start = time.perf_counter()
             sparse_areas = await self._detect_sparse_areas(world_data['world_content'], plot_id)
+            stage_timings['sparse_detection_seconds'] = round(time.perf_counter() - stage_start, 3)
             
             # Generate expansions for sparse areas
-            expansions = await self._generate_expansions(sparse_areas)
+            stage_start = time.perf_counter()
+            expansions = await self._generate_expansions(
+                sparse_areas, on_expansion=on_expansion, stage_metrics=stage_timings
+            )
+            stage_timings['expansion_seconds'] = round(time.perf_counter() - stage_start, 3)
             
             # Integrate expansions with original content
+            stage_start = time.perf_counter()
             expanded_content = await self._integrate_expansions(
                 world_data['world_content'],
                 expansions
             )
+            stage_timings['integration_seconds'] = round(time.perf_counter() - stage_start, 3)
             
             # Calculate processing time
             processing_time = time.time() - start_time
@@ -137,7 +210,8 @@ class LoreGenAgent(BaseAgent):
             expansion_metrics = self._calculate_expansion_metrics(
                 original_content, 
                 expanded_content, 
-                expansions
+                expansions,
+                stage_timings
             )
             
             # Create response in Option B format (complete expanded world)
@@ -221,7 +295,8 @@ class LoreGenAgent(BaseAgent):
             # Use clustering service to perform k-means clustering
             clusters = await self._clustering_service.perform_kmeans_clustering(
                 embeddings=embeddings,
-                chunks=chunks
+                chunks=chunks,
+                cache_key=plot_id
             )
             
             # Use clustering service to detect sparse areas
@@ -287,27 +362,80 @@ class LoreGenAgent(BaseAgent):
             self.logger.warning(f"Failed to save chunks to database/Vertex AI: {e}")
             # Continue processing even if save fails
     
-    async def _generate_expansions(self, sparse_areas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _generate_expansions(
+        self,
+        sparse_areas: List[Dict[str, Any]],
+        on_expansion: Optional[Callable[[Dict[str, Any]], None]] = None,
+        stage_metrics: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Generate detailed expansions for identified sparse areas.
         Each expansion should be creative and substantial.
+
+        Areas are expanded concurrently (MAX_CONCURRENT_EXPANSIONS at a time),
+        each within EXPANSION_TIMEOUT_SECONDS. Areas that fail or time out are
+        left out, so the result may be partial; it keeps sparse_areas order.
+
+        Args:
+            sparse_areas: Areas from _detect_sparse_areas
+            on_expansion: Called with each expansion as soon as it completes
+            stage_metrics: Receives counts of requested, timed-out and failed areas
         """
-        expansions = []
-        
-        for area in sparse_areas:
-            try:
-                expansion = await self._generate_single_expansion(area)
-                if expansion:
-                    expansions.append(expansion)
-            except Exception as e:
-                self.logger.error(f"Failed to generate expansion for {area.get('concept_area', 'unknown')}: {e}")
-                continue
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_EXPANSIONS)
+        outcomes: List[str] = []
+
+        # Sessions unique to this call, so concurrent requests never share history
+        run_id = uuid.uuid4().hex
+
+        async def expand(index: int, area: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            concept_area = area.get('concept_area', 'unknown')
+            session_id = f"loregen_{run_id}_{index}"
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    expansion = await asyncio.wait_for(
+                        self._generate_single_expansion(area, session_id=session_id),
+                        timeout=self.EXPANSION_TIMEOUT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    self.logger.warning(
+                        f"Expansion for {concept_area} timed out after {self.EXPANSION_TIMEOUT_SECONDS}s"
+                    )
+                    outcomes.append('timed_out')
+                    return None
+                except Exception as e:
+                    self.logger.error(f"Failed to generate expansion for {concept_area}: {e}")
+                    outcomes.append('failed')
+                    return None
+                finally:
+                    await self._discard_session(self.SYSTEM_USER_ID, session_id)
+
+            if not expansion:
+                outcomes.append('failed')
+                return None
+
+            expansion['generation_seconds'] = round(time.perf_counter() - start, 3)
+            if on_expansion:
+                on_expansion(expansion)
+            return expansion
+
+        results = await asyncio.gather(*(expand(i, area) for i, area in enumerate(sparse_areas)))
+        expansions = [expansion for expansion in results if expansion]
+
+        if stage_metrics is not None:
+            stage_metrics['areas_requested'] = len(sparse_areas)
+            stage_metrics['areas_timed_out'] = outcomes.count('timed_out')
+            stage_metrics['areas_failed'] = outcomes.count('failed')
         
         self.logger.info(f"Generated {len(expansions)} expansions")
         return expansions
     
-    async def _generate_single_expansion(self, sparse_area: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Generate expansion for a single sparse area"""
+    async def _generate_single_expansion(
+        self,
+        sparse_area: Dict[str, Any],
+        session_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Generate expansion for a single sparse area, optionally in a dedicated ADK session"""
         concept_area = sparse_area['concept_area']
         current_chunks = sparse_area.get('chunks', [])
         current_content = " ".join([chunk.get('text', '') for chunk in current_chunks])
@@ -331,7 +459,7 @@ class LoreGenAgent(BaseAgent):
         
         try:
             # Use the base agent's LLM to generate expansion
-            expansion_response = await self._generate_content(expansion_prompt)
+            expansion_response = await self._generate_content(expansion_prompt, session_id=session_id)
             
             if expansion_response and len(expansion_response) > 100:
                 return {
@@ -344,6 +472,20 @@ class LoreGenAgent(BaseAgent):
             
         return None
     
+    async def _discard_session(self, user_id: str, session_id: str) -> None:
+        """Delete an ADK session created for a single expansion"""
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        try:
+            await self._runner.session_service.delete_session(
+                app_name=f"{self.name}_app",
+                user_id=user_id,
+                session_id=getattr(session, 'id', session_id)
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to delete expansion session {session_id}: {e}")
+    
     async def _integrate_expansions(
         self,
         original_content: str,
@@ -438,7 +580,7 @@ class LoreGenAgent(BaseAgent):
             from google.genai import types
             
             # Use provided session or create default
-            actual_user_id = user_id or "loregen_system"
+            actual_user_id = user_id or self.SYSTEM_USER_ID
             actual_session_id = session_id or "loregen_generation"
             
             # Ensure session exists first
@@ -510,7 +652,8 @@ class LoreGenAgent(BaseAgent):
         self, 
         original_content: str, 
         expanded_content: str, 
-        expansions: List[Dict[str, Any]]
+        expansions: List[Dict[str, Any]],
+        stage_timings: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Calculate detailed expansion metrics for user visualization"""
         
@@ -546,7 +689,8 @@ class LoreGenAgent(BaseAgent):
                 'concept_area': concept_area,
                 'words_added': expansion_words,
                 'original_snippet_words': original_snippet_words,
-                'expansion_preview': expanded_text[:150] + '...' if len(expanded_text) > 150 else expanded_text
+                'expansion_preview': expanded_text[:150] + '...' if len(expanded_text) > 150 else expanded_text,
+                'generation_seconds': expansion.get('generation_seconds')
             })
         
         return {
@@ -568,7 +712,8 @@ class LoreGenAgent(BaseAgent):
                 'reading_time_increase_minutes': round(expanded_reading_time - original_reading_time, 1),
                 'total_new_content_words': total_expansion_words
             },
-            'expansion_details': expansion_details
+            'expansion_details': expansion_details,
+            'stage_timings': stage_timings or {}
         }
     
     # Service access methods for advanced usage
@@ -587,4 +732,9 @@ class LoreGenAgent(BaseAgent):
     
     def get_embedding_manager(self) -> LoreEmbeddingManager:
         """Get the embedding manager instance"""
-        return self._embedding_manager
\ No newline at end of file
+        return self._embedding_manager
+    
+    def shutdown(self):
+        """Release the clustering worker processes and the persistent embedding cache"""
+        self._clustering_service.shutdown()
+        self._embedding_manager.close()
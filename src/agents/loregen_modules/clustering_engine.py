@@ -0,0 +1,250 @@
+"""
+ClusteringEngine Module
+Runs the CPU-heavy k-means work for LoreClusteringService off the event loop.
+Sweeps candidate cluster counts in parallel worker processes (MiniBatchKMeans
+for large inputs), hands back every fitted model so the winner is reused
+instead of refitted, and can warm-start from the previous clustering of the
+same plot so re-analysis after a small edit is a single incremental fit.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+except ImportError as e:
+    logging.error(f"scikit-learn not available: {e}")
+    KMeans = None
+    MiniBatchKMeans = None
+
+
+@dataclass
+class KMeansFit:
+    """A fitted k-means model reduced to what cluster analysis needs"""
+    n_clusters: int
+    inertia: float
+    labels: np.ndarray
+    centers: np.ndarray
+    n_samples: int
+
+
+def fit_kmeans(
+    embeddings: np.ndarray,
+    n_clusters: int,
+    random_state: int = 42,
+    n_init: int = 10,
+    init: Optional[np.ndarray] = None,
+    mini_batch: bool = False
+) -> KMeansFit:
+    """
+    Fit k-means once (module-level so worker processes can run it).
+
+    Args:
+        embeddings: Normalized embedding matrix
+        n_clusters: Number of clusters
+        random_state: Seed for reproducible results
+        n_init: Number of k-means++ restarts (ignored when init is given)
+        init: Starting centers for a warm start
+        mini_batch: Use MiniBatchKMeans instead of full-batch KMeans
+    """
+    model_class = MiniBatchKMeans if mini_batch else KMeans
+    if init is not None:
+        model = model_class(n_clusters=n_clusters, init=init, n_init=1, random_state=random_state)
+    else:
+        model = model_class(n_clusters=n_clusters, random_state=random_state, n_init=n_init)
+
+    labels = model.fit_predict(embeddings)
+    return KMeansFit(
+        n_clusters=n_clusters,
+        inertia=float(model.inertia_),
+        labels=labels,
+        centers=model.cluster_centers_,
+        n_samples=len(embeddings)
+    )
+
+
+class ClusteringEngine:
+    """Executes k-means fits and sweeps without blocking the asyncio loop"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        mini_batch_threshold: int = 2000,
+        warm_start_tolerance: float = 1.1,
+        random_state: int = 42,
+        n_init: int = 10,
+        warm_start_max_size: int = 256,
+        warm_start_ttl: float = 3600.0
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            max_workers: Worker processes for k sweeps (defaults to the CPU count;
+                1 runs the sweep sequentially in a background thread)
+            mini_batch_threshold: Sample count from which MiniBatchKMeans is used
+            warm_start_tolerance: Accept a warm-started fit if its inertia per sample
+                is within this factor of the previous clustering's
+            random_state: Seed for reproducible results
+            n_init: k-means++ restarts for cold fits
+            warm_start_max_size: Clusterings kept for warm starts (least recently used are dropped)
+            warm_start_ttl: Seconds a remembered clustering stays usable
+        """
+        if not KMeans:
+            raise ImportError("scikit-learn not installed. Run: pip install scikit-learn")
+
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.mini_batch_threshold = mini_batch_threshold
+        self.warm_start_tolerance = warm_start_tolerance
+        self.random_state = random_state
+        self.n_init = n_init
+        self.warm_start_max_size = warm_start_max_size
+        self.warm_start_ttl = warm_start_ttl
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # LRU of (stored_at, fit) per key; one entry per analysed plot
+        self._previous: "OrderedDict[str, Tuple[float, KMeansFit]]" = OrderedDict()
+
+    def _use_mini_batch(self, embeddings: np.ndarray) -> bool:
+        """Large inputs use MiniBatchKMeans"""
+        return len(embeddings) >= self.mini_batch_threshold
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the worker process pool, creating it on first use"""
+        if self._pool is None:
+            # Forking a threaded server copies its locks mid-use; spawn starts clean workers
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    async def fit(
+        self,
+        embeddings: np.ndarray,
+        n_clusters: int,
+        init: Optional[np.ndarray] = None
+    ) -> KMeansFit:
+        """Fit one k-means model in a background thread"""
+        return await asyncio.to_thread(
+            fit_kmeans, embeddings, n_clusters, self.random_state, self.n_init,
+            init, self._use_mini_batch(embeddings)
+        )
+
+    async def sweep(self, embeddings: np.ndarray, k_values: Sequence[int]) -> List[KMeansFit]:
+        """
+        Fit k-means for every candidate k.
+
+        Small inputs are fitted concurrently in worker processes; large inputs
+        (or a single worker) run sequentially in a background thread. Failed fits
+        are logged and left out of the result, which is ordered by k.
+        """
+        k_values = list(k_values)
+        if not k_values:
+            return []
+
+        mini_batch = self._use_mini_batch(embeddings)
+        args = (self.random_state, self.n_init, None, mini_batch)
+
+        # Shipping a large matrix to every worker costs more than it saves
+        if self.max_workers > 1 and len(k_values) > 1 and not mini_batch:
+            try:
+                return await self._sweep_in_processes(embeddings, k_values, args)
+            except (BrokenProcessPool, OSError) as e:
+                self.logger.warning(f"Process pool unavailable, sweeping in a thread: {e}")
+                self._pool = None
+
+        def sweep_sequentially() -> List[KMeansFit]:
+            fits = []
+            for k in k_values:
+                try:
+                    fits.append(fit_kmeans(embeddings, k, *args))
+                except Exception as e:
+                    self.logger.warning(f"Failed to fit k-means with k={k}: {e}")
+            return fits
+
+        return await asyncio.to_thread(sweep_sequentially)
+
+    async def _sweep_in_processes(self, embeddings: np.ndarray, k_values: List[int], args) -> List[KMeansFit]:
+        """Fit each candidate k in the worker process pool"""
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(pool, fit_kmeans, embeddings, k, *args)
+            for k in k_values
+        ], return_exceptions=True)
+
+        fits = []
+        for k, result in zip(k_values, results):
+            if isinstance(result, BrokenProcessPool):
+                raise result
+            if isinstance(result, Exception):
+                self.logger.warning(f"Failed to fit k-means with k={k}: {result}")
+                continue
+            fits.append(result)
+        return fits
+
+    async def warm_start(self, embeddings: np.ndarray, key: str) -> Optional[KMeansFit]:
+        """
+        Refit the previous clustering for key, starting from its centers.
+
+        Returns None when there is no usable previous clustering or the content
+        changed enough that the warm-started fit is noticeably worse.
+        """
+        previous = self._get_previous(key)
+        if previous is None:
+            return None
+        if previous.centers.shape[1] != embeddings.shape[1] or previous.n_clusters > len(embeddings):
+            return None
+
+        fit = await self.fit(embeddings, previous.n_clusters, init=previous.centers)
+        previous_per_sample = previous.inertia / max(1, previous.n_samples)
+        current_per_sample = fit.inertia / max(1, fit.n_samples)
+        if current_per_sample > previous_per_sample * self.warm_start_tolerance:
+            self.logger.info(f"Warm start for {key} rejected; running a full k sweep")
+            return None
+        return fit
+
+    def _get_previous(self, key: str) -> Optional[KMeansFit]:
+        """Get the remembered clustering for key if present and not expired"""
+        entry = self._previous.get(key)
+        if entry is None:
+            return None
+
+        stored_at, fit = entry
+        if time.monotonic() - stored_at > self.warm_start_ttl:
+            del self._previous[key]
+            return None
+
+        self._previous.move_to_end(key)
+        return fit
+
+    def remember(self, key: str, fit: KMeansFit):
+        """Keep a clustering as the warm-start point for key, evicting the least recently used"""
+        self._previous[key] = (time.monotonic(), fit)
+        self._previous.move_to_end(key)
+        while len(self._previous) > self.warm_start_max_size:
+            self._previous.popitem(last=False)
+
+    def forget(self, key: Optional[str] = None):
+        """Drop the warm-start point for key, or all of them"""
+        if key is None:
+            self._previous.clear()
+        else:
+            self._previous.pop(key, None)
+
+    def shutdown(self):
+        """Stop the worker process pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -6,7 +6,7 @@ Analyzes embeddings to identify sparse lore areas needing expansion.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import numpy as np
 
@@ -20,6 +20,8 @@ except ImportError as e:
     KMeans = None
     cosine_distances = None
 
+from .clustering_engine import ClusteringEngine, KMeansFit
+
 
 @dataclass
 class ClusterAnalysis:
@@ -51,21 +53,26 @@ class LoreClusteringService:
     Analyzes embeddings to identify areas needing lore expansion.
     """
     
-    def __init__(self):
+    def __init__(self, engine: Optional[ClusteringEngine] = None):
         """Initialize clustering service"""
         if not KMeans:
             raise ImportError("scikit-learn not installed. Run: pip install scikit-learn")
             
         self.logger = logging.getLogger(__name__)
+        # Runs k-means fits off the event loop and remembers clusterings for warm starts
+        self._engine = engine or ClusteringEngine()
         self._kmeans_clusters = 5  # Default cluster count
         self._min_cluster_size = 2
         self._distance_threshold = 0.7
+        # Silhouette is O(n²); above this many points it is estimated on a sample (0 = exact)
+        self._silhouette_sample_size = 5000
     
     async def perform_kmeans_clustering(
         self,
         embeddings: List[List[float]],
         chunks: List[Dict[str, Any]],
-        n_clusters: Optional[int] = None
+        n_clusters: Optional[int] = None,
+        cache_key: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Perform k-means clustering on embeddings.
@@ -74,6 +81,8 @@ class LoreClusteringService:
             embeddings: List of embedding vectors
             chunks: Corresponding chunk data
             n_clusters: Number of clusters (auto-determined if None)
+            cache_key: Identifies the document (e.g. plot_id); its last clustering
+                is used to warm-start the next one
             
         Returns:
             List of cluster information
@@ -89,11 +98,17 @@ class LoreClusteringService:
             # Normalize embeddings
             X_normalized = self._normalize_embeddings(X)
             
-            # Determine optimal cluster count
-            optimal_clusters = n_clusters or await self._determine_optimal_clusters(X_normalized)
+            # Fit the requested k, or pick k (reusing the winning model from the sweep)
+            if n_clusters:
+                fit = await self._engine.fit(X_normalized, n_clusters)
+            else:
+                fit = await self._select_clustering(X_normalized, cache_key)
+            
+            if cache_key:
+                self._engine.remember(cache_key, fit)
             
-            # Perform k-means clustering
-            clusters = await self._perform_kmeans(X_normalized, chunks, optimal_clusters)
+            # Analyze the clusters of the fitted model
+            clusters = await self._build_clusters(X_normalized, chunks, fit)
             
             self.logger.info(f"Created {len(clusters)} clusters from {len(embeddings)} embeddings")
             return clusters
@@ -109,38 +124,47 @@ class LoreClusteringService:
         norms[norms == 0] = 1  # Avoid division by zero
         return embeddings / norms
     
-    async def _determine_optimal_clusters(self, embeddings: np.ndarray) -> int:
-        """Determine optimal number of clusters using elbow method"""
-        n_samples = len(embeddings)
-        
+    def _candidate_cluster_counts(self, n_samples: int) -> List[int]:
+        """Cluster counts to try for the elbow method"""
         # Limit cluster range based on data size
         max_clusters = min(10, n_samples // 2)
         min_clusters = min(2, n_samples)
         
         if max_clusters <= min_clusters:
-            return min_clusters
-        
-        # Test different cluster counts
-        inertias = []
-        cluster_range = range(min_clusters, max_clusters + 1)
+            return [min_clusters]
+        return list(range(min_clusters, max_clusters + 1))
+    
+    async def _sweep_clusters(self, embeddings: np.ndarray) -> List[KMeansFit]:
+        """Fit every candidate cluster count"""
+        k_values = self._candidate_cluster_counts(len(embeddings))
+        if len(k_values) == 1:
+            return [await self._engine.fit(embeddings, k_values[0])]
+        return await self._engine.sweep(embeddings, k_values)
+    
+    async def _select_clustering(self, embeddings: np.ndarray, cache_key: Optional[str] = None) -> KMeansFit:
+        """Choose the clustering to use: a warm start if acceptable, else the elbow of a k sweep"""
+        if cache_key:
+            fit = await self._engine.warm_start(embeddings, cache_key)
+            if fit is not None:
+                self.logger.info(f"Reused previous clustering of {cache_key} (k={fit.n_clusters})")
+                return fit
         
-        for k in cluster_range:
-            try:
-                kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-                kmeans.fit(embeddings)
-                inertias.append(kmeans.inertia_)
-            except Exception as e:
-                self.logger.warning(f"Failed to fit k-means with k={k}: {e}")
-                continue
+        fits = await self._sweep_clusters(embeddings)
+        if not fits:
+            return await self._engine.fit(embeddings, min(self._kmeans_clusters, len(embeddings)))
         
-        if not inertias:
+        optimal_k = self._find_elbow_point([f.n_clusters for f in fits], [f.inertia for f in fits])
+        return next(f for f in fits if f.n_clusters == optimal_k)
+    
+    async def _determine_optimal_clusters(self, embeddings: np.ndarray) -> int:
+        """Determine optimal number of clusters using elbow method"""
+        fits = await self._sweep_clusters(embeddings)
+        if not fits:
             return self._kmeans_clusters
         
-        # Find elbow point
-        optimal_k = self._find_elbow_point(cluster_range, inertias)
-        return optimal_k
+        return self._find_elbow_point([f.n_clusters for f in fits], [f.inertia for f in fits])
     
-    def _find_elbow_point(self, k_range: range, inertias: List[float]) -> int:
+    def _find_elbow_point(self, k_range: Sequence[int], inertias: List[float]) -> int:
         """Find elbow point in inertia curve"""
         if len(inertias) < 2:
             return k_range[0]
@@ -168,22 +192,38 @@ class LoreClusteringService:
     ) -> List[Dict[str, Any]]:
         """Perform k-means clustering and analyze results"""
         try:
-            # Fit k-means
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-            cluster_labels = kmeans.fit_predict(embeddings)
+            fit = await self._engine.fit(embeddings, n_clusters)
+            return await self._build_clusters(embeddings, chunks, fit)
             
-            # Calculate silhouette score
-            overall_silhouette = silhouette_score(embeddings, cluster_labels) if len(set(cluster_labels)) > 1 else 0
+        except Exception as e:
+            self.logger.error(f"K-means execution failed: {e}")
+            return []
+    
+    async def _build_clusters(
+        self,
+        embeddings: np.ndarray,
+        chunks: List[Dict[str, Any]],
+        fit: KMeansFit
+    ) -> List[Dict[str, Any]]:
+        """Analyze the clusters of a fitted k-means model"""
+        try:
+            cluster_labels = fit.labels
+            
+            # Calculate silhouette score once for the whole clustering
+            overall_silhouette = await asyncio.to_thread(
+                self._calculate_silhouette, embeddings, cluster_labels
+            )
             
             # Analyze each cluster
             clusters = []
-            for cluster_id in range(n_clusters):
+            for cluster_id in range(fit.n_clusters):
                 cluster_analysis = await self._analyze_cluster(
                     cluster_id,
                     embeddings,
                     chunks,
                     cluster_labels,
-                    kmeans.cluster_centers_[cluster_id]
+                    fit.centers[cluster_id],
+                    overall_silhouette
                 )
                 
                 if cluster_analysis:
@@ -211,7 +251,8 @@ class LoreClusteringService:
         embeddings: np.ndarray,
         chunks: List[Dict[str, Any]],
         cluster_labels: np.ndarray,
-        centroid: np.ndarray
+        centroid: np.ndarray,
+        cluster_silhouette: float = 0.0
     ) -> Optional[ClusterAnalysis]:
         """Analyze a single cluster in detail"""
         try:
@@ -227,12 +268,6 @@ class LoreClusteringService:
             # Calculate average pairwise distance
             avg_distance = self._calculate_avg_pairwise_distance(cluster_embeddings)
             
-            # Calculate silhouette score for cluster
-            if len(set(cluster_labels)) > 1:
-                cluster_silhouette = silhouette_score(embeddings, cluster_labels)
-            else:
-                cluster_silhouette = 0
-            
             # Determine concept area from chunks
             concept_area = await self._determine_cluster_concept_area(
                 [chunks[i] for i in cluster_indices]
@@ -255,26 +290,37 @@ class LoreClusteringService:
             self.logger.error(f"Cluster analysis failed for cluster {cluster_id}: {e}")
             return None
     
+    def _calculate_silhouette(self, embeddings: np.ndarray, cluster_labels: np.ndarray) -> float:
+        """Calculate the silhouette score of a clustering, sampled for large inputs"""
+        n_labels = len(set(cluster_labels))
+        if n_labels < 2 or n_labels >= len(embeddings):
+            return 0.0
+        
+        sample_size = self._silhouette_sample_size
+        if sample_size and len(embeddings) > sample_size:
+            return float(silhouette_score(
+                embeddings, cluster_labels, sample_size=sample_size, random_state=42
+            ))
+        return float(silhouette_score(embeddings, cluster_labels))
+    
     def _calculate_avg_pairwise_distance(self, embeddings: np.ndarray) -> float:
-        """Calculate average pairwise cosine distance within cluster"""
-        if len(embeddings) < 2:
+        """
+        Calculate average pairwise cosine distance within cluster.
+        
+        For unit vectors the sum of x_i·x_j over all pairs i != j is |Σx|² - Σ|x_i|²,
+        so the mean is computed in O(n·d) without building the n×n distance matrix.
+        """
+        n = len(embeddings)
+        if n < 2:
             return 0.0
         
         try:
-            # Calculate cosine distances
-            distances = cosine_distances(embeddings)
-            
-            # Get upper triangular matrix (excluding diagonal)
-            n = len(embeddings)
-            total_distance = 0
-            count = 0
-            
-            for i in range(n):
-                for j in range(i + 1, n):
-                    total_distance += distances[i, j]
-                    count += 1
-            
-            return total_distance / count if count > 0 else 0.0
+            unit = self._normalize_embeddings(np.asarray(embeddings, dtype=np.float64))
+            total = unit.sum(axis=0)
+            # Zero vectors stay zero and count as distance 1, as with cosine_distances
+            self_similarity = float(np.einsum('ij,ij->', unit, unit))
+            mean_similarity = (float(total @ total) - self_similarity) / (n * (n - 1))
+            return max(0.0, 1.0 - mean_similarity)
             
         except Exception as e:
             self.logger.error(f"Distance calculation failed: {e}")
@@ -441,7 +487,8 @@ class LoreClusteringService:
         self,
         distance_threshold: float = None,
         min_cluster_size: int = None,
-        default_clusters: int = None
+        default_clusters: int = None,
+        silhouette_sample_size: int = None
     ):
         """Update clustering parameters"""
         if distance_threshold is not None:
@@ -450,8 +497,14 @@ class LoreClusteringService:
             self._min_cluster_size = min_cluster_size
         if default_clusters is not None:
             self._kmeans_clusters = default_clusters
+        if silhouette_sample_size is not None:
+            self._silhouette_sample_size = silhouette_sample_size
         
         self.logger.info(
             f"Updated clustering parameters: threshold={self._distance_threshold}, "
             f"min_size={self._min_cluster_size}, default_clusters={self._kmeans_clusters}"
-        )
\ No newline at end of file
+        )
+    
+    def shutdown(self):
+        """Stop the clustering engine's worker processes"""
+        self._engine.shutdown()
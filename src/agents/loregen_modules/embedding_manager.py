@@ -7,11 +7,15 @@ Provides optimized embedding operations for semantic analysis.
 import asyncio
 import hashlib
 import logging
+import os
 import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 import json
 
+import numpy as np
+
 try:
     import vertexai
     from vertexai.language_models import TextEmbeddingModel, TextEmbeddingInput
@@ -22,13 +26,14 @@ except ImportError as e:
     TextEmbeddingModel = None
 
 from ...core.configuration import Configuration
+from .embedding_store import EmbeddingStore
 
 
 @dataclass
 class EmbeddingCache:
     """Cache entry for embeddings"""
     text_hash: str
-    embedding: List[float]
+    embedding: np.ndarray  # float32
     model_name: str
     timestamp: float
     access_count: int = 0
@@ -46,19 +51,92 @@ class EmbeddingBatch:
     cache_misses: int
 
 
+class EmbeddingIndex:
+    """
+    Candidate embeddings stored as a row-normalized float32 matrix.
+    
+    Cosine similarity against every candidate is a single matrix product, so an
+    index built once can be searched repeatedly without re-normalizing.
+    """
+    
+    def __init__(self, embeddings):
+        """Build the index from a list of vectors or a 2-D array"""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.size == 0:
+            matrix = matrix.reshape(0, 0)
+        elif matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        self.matrix = _normalize_rows(matrix)
+    
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+    
+    def search(self, query_embeddings, top_k: int = 5) -> List[List[Tuple[int, float]]]:
+        """
+        Find the top_k most similar candidates for each query.
+        
+        Args:
+            query_embeddings: One query vector or a batch of query vectors
+            top_k: Number of results per query
+            
+        Returns:
+            Per query, a list of (candidate_index, cosine_similarity) sorted best first
+        """
+        queries = _normalize_rows(np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32)))
+        count = len(self)
+        k = min(top_k, count)
+        if k <= 0:
+            return [[] for _ in range(queries.shape[0])]
+        
+        scores = queries @ self.matrix.T
+        
+        if k < count:
+            # Unordered top-k per row in O(n), then order just those k
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            candidates.sort(axis=1)  # Ties resolve to the lower index
+        else:
+            candidates = np.broadcast_to(np.arange(count), (queries.shape[0], count))
+        
+        top_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top_indices = np.take_along_axis(candidates, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        
+        return [
+            list(zip(indices.tolist(), row_scores.tolist()))
+            for indices, row_scores in zip(top_indices, top_scores)
+        ]
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length; all-zero rows stay zero (similarity 0)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
 class LoreEmbeddingManager:
     """
     Service for managing embeddings specifically for LoreGen agent.
     Handles generation, caching, and optimization of text embeddings.
     """
     
-    def __init__(self, config: Optional[Configuration] = None):
-        """Initialize embedding manager with configuration"""
+    def __init__(self, config: Optional[Configuration] = None, cache_path: Optional[str] = None):
+        """
+        Initialize embedding manager with configuration.
+        
+        Args:
+            config: Application configuration
+            cache_path: SQLite file for the persistent embedding cache. Defaults to
+                EMBEDDING_CACHE_PATH (or embedding_cache.db); ':memory:' disables persistence
+        """
         if not vertexai:
             raise ImportError("Vertex AI dependencies not installed. Run: pip install google-cloud-aiplatform")
             
         self.config = config or Configuration()
         self.logger = logging.getLogger(__name__)
+        self._embedding_model_name = "text-embedding-004"
+        self._embedding_dimension = 768
         
         # Initialize Vertex AI
         try:
@@ -68,9 +146,7 @@ class LoreEmbeddingManager:
             )
             
             # Initialize embedding model
-            self._embedding_model_name = "text-embedding-004"
             self._embedding_model = TextEmbeddingModel.from_pretrained(self._embedding_model_name)
-            self._embedding_dimension = 768
             
             self.logger.info(f"Embedding model initialized: {self._embedding_model_name}")
             
@@ -78,10 +154,17 @@ class LoreEmbeddingManager:
             self.logger.error(f"Failed to initialize Vertex AI embedding model: {e}")
             self._embedding_model = None
         
-        # Initialize cache
-        self._embedding_cache: Dict[str, EmbeddingCache] = {}
+        # In-memory LRU (most recently used last) in front of the persistent store
+        self._embedding_cache: "OrderedDict[Tuple[str, str], EmbeddingCache]" = OrderedDict()
         self._cache_max_size = 1000
-        self._cache_ttl = 3600  # 1 hour
+        self._cache_ttl = 3600  # 1 hour, in-memory tier only
+        
+        cache_path = cache_path or os.getenv("EMBEDDING_CACHE_PATH", "embedding_cache.db")
+        try:
+            self._store: Optional[EmbeddingStore] = EmbeddingStore(cache_path)
+        except Exception as e:
+            self.logger.warning(f"Persistent embedding cache unavailable at {cache_path}: {e}")
+            self._store = None
         
         # Batch processing settings
         self._batch_size = 32
@@ -92,6 +175,9 @@ class LoreEmbeddingManager:
             'total_requests': 0,
             'cache_hits': 0,
             'cache_misses': 0,
+            'memory_hits': 0,
+            'persistent_hits': 0,
+            'cache_evictions': 0,
             'total_processing_time': 0.0,
             'average_embedding_time': 0.0
         }
@@ -160,36 +246,48 @@ class LoreEmbeddingManager:
     
     async def _process_single_batch(self, texts: List[str]) -> List[List[float]]:
         """Process a single batch of texts"""
-        # Check cache first
-        embeddings = []
-        uncached_texts = []
-        uncached_indices = []
+        hashes = [self._hash_text(text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
         
-        for i, text in enumerate(texts):
-            cached_embedding = await self._get_from_cache(text)
+        # Tier 1: in-memory LRU
+        for text_hash in dict.fromkeys(hashes):
+            cached_embedding = self._get_from_cache(text_hash)
             if cached_embedding is not None:
-                embeddings.append((i, cached_embedding))
-                self._metrics['cache_hits'] += 1
-            else:
-                uncached_texts.append(text)
-                uncached_indices.append(i)
-                self._metrics['cache_misses'] += 1
+                found[text_hash] = cached_embedding
+        self._metrics['memory_hits'] += sum(1 for h in hashes if h in found)
+        
+        # Tier 2: persistent store
+        missing = [h for h in dict.fromkeys(hashes) if h not in found]
+        if missing and self._store is not None:
+            stored = await self._load_from_store(missing)
+            for text_hash, embedding in stored.items():
+                self._add_to_cache(text_hash, embedding)
+                found[text_hash] = embedding
+            self._metrics['persistent_hits'] += sum(1 for h in hashes if h in stored)
+        
+        hits = sum(1 for h in hashes if h in found)
+        self._metrics['cache_hits'] += hits
+        self._metrics['cache_misses'] += len(hashes) - hits
         
-        # Generate embeddings for uncached texts
-        if uncached_texts:
+        # Generate embeddings for texts found in neither tier
+        uncached = {h: text for h, text in zip(hashes, texts) if h not in found}
+        if uncached:
+            uncached_texts = list(uncached.values())
             new_embeddings = await self._generate_vertex_embeddings(uncached_texts)
             
-            # Cache new embeddings
-            for text, embedding in zip(uncached_texts, new_embeddings):
-                await self._add_to_cache(text, embedding)
+            generated: Dict[str, np.ndarray] = {}
+            for text_hash, embedding in zip(uncached, new_embeddings):
+                vector = np.asarray(embedding, dtype=np.float32)
+                found[text_hash] = vector
+                # Zero vectors are the failure fallback; don't cache them
+                if vector.any():
+                    generated[text_hash] = vector
+                    self._add_to_cache(text_hash, vector)
             
-            # Add to results
-            for idx, embedding in zip(uncached_indices, new_embeddings):
-                embeddings.append((idx, embedding))
+            if generated and self._store is not None:
+                await self._save_to_store(generated)
         
-        # Sort by original index and extract embeddings
-        embeddings.sort(key=lambda x: x[0])
-        return [emb for _, emb in embeddings]
+        return [found[text_hash].tolist() for text_hash in hashes]
     
     async def _generate_vertex_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings using Vertex AI"""
@@ -222,61 +320,66 @@ class LoreEmbeddingManager:
             # Return zero embeddings as fallback
             return [[0.0] * self._embedding_dimension for _ in texts]
     
-    async def _get_from_cache(self, text: str) -> Optional[List[float]]:
-        """Get embedding from cache if available and not expired"""
-        text_hash = self._hash_text(text)
-        
-        if text_hash not in self._embedding_cache:
+    def _get_from_cache(self, text_hash: str) -> Optional[np.ndarray]:
+        """Get embedding from the in-memory LRU if present and not expired"""
+        key = (self._embedding_model_name, text_hash)
+        cache_entry = self._embedding_cache.get(key)
+        if cache_entry is None:
             return None
         
-        cache_entry = self._embedding_cache[text_hash]
-        
         # Check if expired
         if time.time() - cache_entry.timestamp > self._cache_ttl:
-            del self._embedding_cache[text_hash]
+            del self._embedding_cache[key]
             return None
         
-        # Update access info
+        # Update access info and mark as most recently used
         cache_entry.access_count += 1
         cache_entry.last_accessed = time.time()
+        self._embedding_cache.move_to_end(key)
         
         return cache_entry.embedding
     
-    async def _add_to_cache(self, text: str, embedding: List[float]):
-        """Add embedding to cache"""
-        text_hash = self._hash_text(text)
-        
-        # Check cache size limit
-        if len(self._embedding_cache) >= self._cache_max_size:
-            await self._evict_cache_entries()
-        
-        # Add to cache
-        cache_entry = EmbeddingCache(
+    def _add_to_cache(self, text_hash: str, embedding: np.ndarray):
+        """Add embedding to the in-memory LRU, evicting the least recently used"""
+        key = (self._embedding_model_name, text_hash)
+        self._embedding_cache[key] = EmbeddingCache(
             text_hash=text_hash,
             embedding=embedding,
             model_name=self._embedding_model_name,
             timestamp=time.time()
         )
-        
-        self._embedding_cache[text_hash] = cache_entry
+        self._embedding_cache.move_to_end(key)
+        self._evict_cache_entries()
+    
+    def _evict_cache_entries(self):
+        """Drop least recently used entries until the cache fits its size limit"""
+        while len(self._embedding_cache) > self._cache_max_size:
+            self._embedding_cache.popitem(last=False)
+            self._metrics['cache_evictions'] += 1
+    
+    async def _load_from_store(self, text_hashes: List[str]) -> Dict[str, np.ndarray]:
+        """Load embeddings from the persistent store off the event loop"""
+        try:
+            return await asyncio.to_thread(
+                self._store.get_many, self._embedding_model_name, text_hashes
+            )
+        except Exception as e:
+            self.logger.warning(f"Persistent embedding cache read failed: {e}")
+            return {}
+    
+    async def _save_to_store(self, embeddings: Dict[str, np.ndarray]):
+        """Write embeddings to the persistent store off the event loop"""
+        try:
+            await asyncio.to_thread(
+                self._store.put_many, self._embedding_model_name, embeddings
+            )
+        except Exception as e:
+            self.logger.warning(f"Persistent embedding cache write failed: {e}")
     
     def _hash_text(self, text: str) -> str:
         """Generate hash for text to use as cache key"""
         return hashlib.sha256(text.encode('utf-8')).hexdigest()
     
-    async def _evict_cache_entries(self):
-        """Evict old cache entries when cache is full"""
-        # Sort by last accessed time and remove oldest 25%
-        cache_items = list(self._embedding_cache.items())
-        cache_items.sort(key=lambda x: x[1].last_accessed)
-        
-        num_to_remove = len(cache_items) // 4
-        for i in range(num_to_remove):
-            text_hash, _ = cache_items[i]
-            del self._embedding_cache[text_hash]
-        
-        self.logger.info(f"Evicted {num_to_remove} cache entries")
-    
     def _update_metrics(self, num_texts: int, processing_time: float):
         """Update performance metrics"""
         self._metrics['total_requests'] += num_texts
@@ -325,10 +428,14 @@ class LoreEmbeddingManager:
             if batch_size:
                 self._batch_size = original_batch_size
     
+    def build_similarity_index(self, candidate_embeddings) -> EmbeddingIndex:
+        """Build a reusable similarity index over candidate embeddings"""
+        return EmbeddingIndex(candidate_embeddings)
+    
     async def get_similar_embeddings(
         self,
         query_embedding: List[float],
-        candidate_embeddings: List[List[float]],
+        candidate_embeddings,
         top_k: int = 5
     ) -> List[Tuple[int, float]]:
         """
@@ -336,57 +443,50 @@ class LoreEmbeddingManager:
         
         Args:
             query_embedding: Query embedding vector
-            candidate_embeddings: List of candidate embeddings
+            candidate_embeddings: List of candidate embeddings or a prebuilt EmbeddingIndex
             top_k: Number of top results to return
             
         Returns:
             List of (index, similarity_score) tuples
         """
-        try:
-            similarities = []
-            
-            for i, candidate in enumerate(candidate_embeddings):
-                similarity = await self._calculate_cosine_similarity(
-                    query_embedding, candidate
-                )
-                similarities.append((i, similarity))
-            
-            # Sort by similarity (descending)
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            
-            return similarities[:top_k]
-            
-        except Exception as e:
-            self.logger.error(f"Similarity calculation failed: {e}")
-            return []
+        results = await self.get_similar_embeddings_batch(
+            [query_embedding], candidate_embeddings, top_k
+        )
+        return results[0] if results else []
     
-    async def _calculate_cosine_similarity(
+    async def get_similar_embeddings_batch(
         self,
-        vec1: List[float],
-        vec2: List[float]
-    ) -> float:
-        """Calculate cosine similarity between two vectors"""
-        try:
-            # Convert to numpy arrays for efficiency
-            import numpy as np
-            
-            a = np.array(vec1)
-            b = np.array(vec2)
+        query_embeddings: List[List[float]],
+        candidate_embeddings,
+        top_k: int = 5
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Find the most similar candidates for a batch of queries in one pass.
+        
+        Args:
+            query_embeddings: Query embedding vectors
+            candidate_embeddings: List of candidate embeddings or a prebuilt EmbeddingIndex
+            top_k: Number of top results per query
             
-            # Calculate cosine similarity
-            dot_product = np.dot(a, b)
-            norm_a = np.linalg.norm(a)
-            norm_b = np.linalg.norm(b)
+        Returns:
+            Per query, a list of (index, similarity_score) tuples
+        """
+        try:
+            if len(query_embeddings) == 0:
+                return []
             
-            if norm_a == 0 or norm_b == 0:
-                return 0.0
+            def search() -> List[List[Tuple[int, float]]]:
+                index = candidate_embeddings
+                if not isinstance(index, EmbeddingIndex):
+                    index = EmbeddingIndex(candidate_embeddings)
+                return index.search(query_embeddings, top_k)
             
-            similarity = dot_product / (norm_a * norm_b)
-            return float(similarity)
+            # Large candidate sets take milliseconds; keep them off the event loop
+            return await asyncio.to_thread(search)
             
         except Exception as e:
-            self.logger.error(f"Cosine similarity calculation failed: {e}")
-            return 0.0
+            self.logger.error(f"Similarity calculation failed: {e}")
+            return []
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -398,7 +498,12 @@ class LoreEmbeddingManager:
                 max(1, self._metrics['cache_hits'] + self._metrics['cache_misses'])
             ),
             'total_cache_hits': self._metrics['cache_hits'],
-            'total_cache_misses': self._metrics['cache_misses']
+            'total_cache_misses': self._metrics['cache_misses'],
+            'memory_hits': self._metrics['memory_hits'],
+            'persistent_hits': self._metrics['persistent_hits'],
+            'cache_evictions': self._metrics['cache_evictions'],
+            'persistent_cache_enabled': self._store is not None,
+            'persistent_cache_size': self._store.count() if self._store is not None else 0
         }
     
     def get_performance_metrics(self) -> Dict[str, Any]:
@@ -414,9 +519,11 @@ class LoreEmbeddingManager:
             'model_name': self._embedding_model_name
         }
     
-    async def clear_cache(self):
-        """Clear the embedding cache"""
+    async def clear_cache(self, include_persistent: bool = False):
+        """Clear the in-memory embedding cache, and optionally the persistent store"""
         self._embedding_cache.clear()
+        if include_persistent and self._store is not None:
+            await asyncio.to_thread(self._store.clear)
         self.logger.info("Embedding cache cleared")
     
     async def warm_cache(self, texts: List[str]):
@@ -432,6 +539,7 @@ class LoreEmbeddingManager:
         """Configure cache settings"""
         if max_size is not None:
             self._cache_max_size = max_size
+            self._evict_cache_entries()
         if ttl is not None:
             self._cache_ttl = ttl
         
@@ -454,4 +562,10 @@ class LoreEmbeddingManager:
         self.logger.info(
             f"Batching configured: batch_size={self._batch_size}, "
             f"max_concurrent={self._max_concurrent_batches}"
-        )
\ No newline at end of file
+        )
+    
+    def close(self):
+        """Close the persistent embedding store; later lookups use the in-memory cache only"""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
@@ -0,0 +1,114 @@
+"""
+EmbeddingStore Module
+Persistent embedding cache for LoreGen backed by a SQLite file.
+Embeddings are stored as float32 BLOBs keyed by (model_name, text sha256),
+so they survive restarts and unchanged documents are never re-embedded.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping
+
+import numpy as np
+
+
+class EmbeddingStore:
+    """SQLite-backed store of float32 embeddings keyed by (model_name, text_hash)"""
+
+    def __init__(self, db_path: str):
+        """Open (or create) the store at db_path; ':memory:' keeps it in-process"""
+        self.db_path = db_path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model_name TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dimension INTEGER NOT NULL,
+                embedding BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (model_name, text_hash)
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+        # Kept up to date by put_many/clear so count() never queries
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, model_name: str, text_hashes: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Load stored embeddings for the given hashes; missing hashes are omitted"""
+        text_hashes = list(text_hashes)
+        found: Dict[str, np.ndarray] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(text_hashes), 500):
+            chunk = text_hashes[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT text_hash, embedding FROM embeddings "
+                    f"WHERE model_name = ? AND text_hash IN ({placeholders})",
+                    [model_name, *chunk]
+                ).fetchall()
+            for text_hash, blob in rows:
+                found[text_hash] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, model_name: str, embeddings: Mapping[str, np.ndarray]):
+        """Store embeddings, replacing any existing entry for the same key"""
+        if not embeddings:
+            return
+        now = time.time()
+        rows = [
+            (model_name, text_hash, int(vector.shape[0]),
+             np.ascontiguousarray(vector, dtype=np.float32).tobytes(), now)
+            for text_hash, vector in embeddings.items()
+        ]
+        with self._lock:
+            existing = self._count_existing(model_name, list(embeddings))
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(model_name, text_hash, dimension, embedding, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+            self._count += len(rows) - existing
+
+    def _count_existing(self, model_name: str, text_hashes: List[str]) -> int:
+        """Number of the given hashes already stored (caller holds the lock)"""
+        existing = 0
+        for start in range(0, len(text_hashes), 500):
+            chunk = text_hashes[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            existing += self._conn.execute(
+                f"SELECT COUNT(*) FROM embeddings WHERE model_name = ? AND text_hash IN ({placeholders})",
+                [model_name, *chunk]
+            ).fetchone()[0]
+        return existing
+
+    def count(self) -> int:
+        """Number of stored embeddings (a running count; no query)"""
+        with self._lock:
+            return self._count
+
+    def clear(self):
+        """Delete every stored embedding"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM embeddings")
+            self._count = 0
+
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
@@ -9,12 +9,15 @@ from typing import List, Dict, Any, AsyncGenerator, Optional
 from ..core.interfaces import IOrchestrator, AgentRequest, AgentResponse, ContentType
 from ..core.base_agent import BaseAgent
 from ..core.configuration import Configuration
-from ..tools.agent_tools import invoke_agent, update_workflow_context
+from ..core.workflow_engine import WorkflowEngine
+from ..tools.agent_tools import invoke_agent, update_workflow_context, WORKFLOW_CONTEXTS
 
 
 class OrchestratorAgent(BaseAgent, IOrchestrator):
     """Orchestrator agent that routes requests and coordinates workflows"""
     
+    WORKFLOW_ID_KEYS = ("author_id", "plot_id", "world_building_id", "characters_id")
+    
     def __init__(self, config: Configuration):
         instruction = """You are the Orchestrator Agent in a multi-agent book writing system.
 
@@ -42,6 +45,10 @@ Sequential workflow patterns:
 - Plot + World: plot_generator → world_building (with plot_id)  
 - Plot + World + Characters: plot_generator → world_building → characters (with plot_id, world_building_id)
 
+Independent steps:
+- Agents that do not need each other's IDs may be invoked together in the same turn
+  (e.g. critique and scoring of the same content); they run concurrently
+
 Workflow coordination approach:
 1. Create a workflow identifier (use a descriptive string like "plot_author_workflow")
 2. Use invoke_agent tool with parameters: agent_name, message, context, workflow_id
@@ -60,6 +67,13 @@ IMPORTANT: Always use the invoke_agent tool for coordination. Never generate cod
             config=config,
             tools=tools
         )
+        
+        # Runs routed agents as a dependency DAG instead of a strict chain
+        self.workflow_engine = WorkflowEngine(
+            invoke=invoke_agent,
+            contexts=WORKFLOW_CONTEXTS,
+            max_concurrency=config.agent_config.workflow_max_concurrency
+        )
     
     async def route_request(self, request: AgentRequest) -> List[str]:
         """Determine which agents should handle the request"""
@@ -88,11 +102,53 @@ IMPORTANT: Always use the invoke_agent tool for coordination. Never generate cod
             return await self._fallback_routing(request.content, request.context or {})
     
     async def coordinate_workflow(self, request: AgentRequest, agent_names: List[str]) -> AgentResponse:
-        """Coordinate execution across multiple agents"""
-        # This will be implemented with the actual agent execution logic
-        # For now, return the routing decision
-        response = await self.process_request(request)
-        return response
+        """
+        Coordinate execution across multiple agents.
+        
+        Agents are run by the workflow engine: each starts as soon as the agents
+        producing the IDs it needs have finished, so independent agents run
+        concurrently. Without agent names the orchestrator LLM coordinates.
+        """
+        if not agent_names:
+            return await self.process_request(request)
+        
+        context = dict(request.context or {})
+        context.setdefault("user_id", request.user_id)
+        context.setdefault("session_id", request.session_id)
+        workflow_id = context.pop("workflow_id", None) or f"workflow_{uuid.uuid4()}"
+        
+        try:
+            result = await self.workflow_engine.run(agent_names, request.content, context, workflow_id)
+        except ValueError as e:
+            self._logger.error(f"Invalid workflow {agent_names}: {e}", error=e)
+            return AgentResponse(
+                agent_name=self.name,
+                content="",
+                content_type=ContentType.PLOT,
+                success=False,
+                error=str(e)
+            )
+        
+        sections = []
+        for name, step in result.steps.items():
+            if step.success:
+                sections.append(f"## {name}\n{step.response or ''}")
+            else:
+                sections.append(f"## {name}\nFailed: {step.error}")
+        
+        failed = [name for name, step in result.steps.items() if not step.success]
+        return AgentResponse(
+            agent_name=self.name,
+            content="\n\n".join(sections),
+            content_type=ContentType.PLOT,
+            success=result.success,
+            error=f"Agents failed: {', '.join(failed)}" if failed else None,
+            metadata={
+                "workflow_id": result.workflow_id,
+                "workflow": result.to_dict(),
+                **{key: result.context[key] for key in self.WORKFLOW_ID_KEYS if key in result.context}
+            }
+        )
     
     async def _fallback_routing(self, content: str, context: Dict[str, Any]) -> List[str]:
         """Enhanced routing with structured context analysis"""
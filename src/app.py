@@ -2,6 +2,7 @@
 Refactored FastAPI application with proper dependency injection and modular architecture.
 """
 
+import os
 from fastapi import FastAPI, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
@@ -62,7 +63,11 @@ async def startup_event():
         raise RuntimeError("Application startup failed - ContentSavingService unavailable") from e
     
     # Register additional services in container
-    container.register_instance("connection_manager", ConnectionManager())
+    container.register_instance("connection_manager", ConnectionManager(
+        send_queue_size=int(os.getenv("WEBSOCKET_SEND_QUEUE_SIZE", "256")),
+        send_timeout=float(os.getenv("WEBSOCKET_SEND_TIMEOUT", "10.0")),
+        laggard_policy=os.getenv("WEBSOCKET_LAGGARD_POLICY", "drop_oldest")
+    ))
     container.register_instance("agent_factory", AgentFactory(config))
     
     # Register WebSocket handler with required ContentSavingService and SessionRepository
@@ -75,6 +80,9 @@ async def startup_event():
     )
     container.register_instance("websocket_handler", websocket_handler)
     
+    # Persist agent invocations and metrics in the background
+    await container.get("telemetry_sink").start()
+    
     logger.info("Application startup complete")
 
 
@@ -82,6 +90,18 @@ async def shutdown_event():
     """Application shutdown cleanup"""
     logger.info("Shutting down Multi-Agent Book Writer application")
     
+    # Flush queued telemetry before the database goes away
+    try:
+        await container.get("telemetry_sink").stop()
+    except Exception as e:
+        logger.error(f"Error flushing telemetry: {e}")
+    
+    # Stop agent worker processes (LoreGen clustering pool)
+    try:
+        container.get("agent_factory").shutdown()
+    except Exception as e:
+        logger.error(f"Error shutting down agents: {e}")
+    
     # Close database connections gracefully
     try:
         await container.close_database_connections()
@@ -10,6 +10,7 @@ from datetime import datetime
 from dataclasses import dataclass, asdict
 from .observability import get_observability_manager
 from .logging import get_logger
+from .telemetry_sink import TelemetrySink
 
 logger = get_logger("agent_tracker")
 
@@ -58,19 +59,96 @@ class AgentInvocation:
             self.tool_calls = []
         if self.tool_results is None:
             self.tool_results = []
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Convert to an agent_invocations row"""
+        return {
+            "invocation_id": self.invocation_id,
+            "agent_name": self.agent_name,
+            "user_id": self.user_id,
+            "session_id": self.session_id,
+            "request_content": self.request_content,
+            "request_context": self.request_context,
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "duration_ms": self.duration_ms,
+            "llm_model": self.llm_model,
+            "final_prompt": self.final_prompt,
+            "raw_response": self.raw_response,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "tool_calls": self.tool_calls or [],
+            "tool_results": self.tool_results or [],
+            "latency_ms": self.latency_ms,
+            "cost_estimate": self.cost_estimate,
+            "success": self.success,
+            "error_message": self.error_message,
+            "response_content": self.response_content,
+            "parsed_json": self.parsed_json
+        }
+
+
+def performance_metric_record(metric_name: str, value: float, tags: Optional[Dict[str, str]] = None,
+                              agent_name: str = None, user_id: str = None,
+                              session_id: str = None) -> Dict[str, Any]:
+    """Build a performance_metrics row"""
+    return {
+        "metric_name": metric_name,
+        "metric_value": value,
+        "tags": tags or {},
+        "agent_name": agent_name,
+        "user_id": user_id,
+        "session_id": session_id,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+def detach_external_ids(record: Dict[str, Any], json_field: str) -> Dict[str, Any]:
+    """
+    Move external user/session IDs out of a telemetry row's foreign key columns.
+
+    user_id/session_id reference users(id)/sessions(id) (UUIDs on Supabase),
+    but invocations carry the caller's external IDs, which may have no such row.
+    The FK columns are stored as NULL and the IDs kept in json_field instead.
+    """
+    record = dict(record)
+    details = dict(record.get(json_field) or {})
+    for column in ("user_id", "session_id"):
+        value = record.get(column)
+        record[column] = None
+        if value is not None:
+            details[f"external_{column}"] = value
+    record[json_field] = details
+    return record
 
 
 class AgentTracker:
     """Tracks detailed agent invocations and performance metrics"""
     
-    def __init__(self):
+    def __init__(self, sink: Optional[TelemetrySink] = None):
         self.observability = get_observability_manager()
         self.active_invocations: Dict[str, AgentInvocation] = {}
         self.invocation_history: List[AgentInvocation] = []
         self.max_history_size = 1000
+        self.sink = sink
         
         logger.info("Agent tracker initialized")
     
+    def attach_sink(self, sink: Optional[TelemetrySink]):
+        """Persist completed invocations and metrics through a write-behind sink"""
+        self.sink = sink
+    
+    def _record_metric(self, invocation: AgentInvocation, metric_name: str, value: float,
+                       tags: Dict[str, str]):
+        """Record a metric in memory and queue it for persistence"""
+        self.observability.record_performance_metric(metric_name, value, tags)
+        
+        if self.sink is not None:
+            self.sink.submit("performance_metrics", detach_external_ids(performance_metric_record(
+                metric_name, value, tags, invocation.agent_name, invocation.user_id, invocation.session_id
+            ), "tags"))
+    
     def start_invocation(self, invocation_id: str, agent_name: str, user_id: str, 
                         session_id: str, request_content: str, 
                         request_context: Optional[Dict[str, Any]] = None) -> AgentInvocation:
@@ -116,14 +194,14 @@ class AgentTracker:
         
         # Record performance metrics
         if latency_ms:
-            self.observability.record_performance_metric(
-                "llm_latency_ms", latency_ms, 
+            self._record_metric(
+                invocation, "llm_latency_ms", latency_ms,
                 {"agent": invocation.agent_name, "model": model}
             )
         
         if invocation.total_tokens:
-            self.observability.record_performance_metric(
-                "llm_tokens_total", invocation.total_tokens,
+            self._record_metric(
+                invocation, "llm_tokens_total", invocation.total_tokens,
                 {"agent": invocation.agent_name, "model": model}
             )
         
@@ -133,8 +211,8 @@ class AgentTracker:
             invocation.cost_estimate = cost
             
             if cost:
-                self.observability.record_performance_metric(
-                    "llm_cost_usd", cost,
+                self._record_metric(
+                    invocation, "llm_cost_usd", cost,
                     {"agent": invocation.agent_name, "model": model}
                 )
         
@@ -155,8 +233,8 @@ class AgentTracker:
         # Record tool usage metrics
         for tool_call in tool_calls:
             tool_name = tool_call.get('tool', 'unknown')
-            self.observability.record_performance_metric(
-                "tool_usage_count", 1,
+            self._record_metric(
+                invocation, "tool_usage_count", 1,
                 {"agent": invocation.agent_name, "tool": tool_name}
             )
         
@@ -180,11 +258,15 @@ class AgentTracker:
         invocation.parsed_json = parsed_json
         
         # Record overall performance metrics
-        self.observability.record_performance_metric(
-            "agent_duration_ms", invocation.duration_ms,
+        self._record_metric(
+            invocation, "agent_duration_ms", invocation.duration_ms,
             {"agent": invocation.agent_name, "success": str(success)}
         )
         
+        # Persist off the request path (prompt, response and LLM details ride on the row)
+        if self.sink is not None:
+            self.sink.submit("agent_invocations", detach_external_ids(invocation.to_record(), "request_context"))
+        
         # Move to history
         self.invocation_history.append(invocation)
         del self.active_invocations[invocation_id]
@@ -298,6 +380,10 @@ class AgentTracker:
         
         return None
     
+    def get_telemetry_stats(self) -> Optional[Dict[str, Any]]:
+        """Queue and flush statistics of the telemetry sink, if one is attached"""
+        return self.sink.get_stats() if self.sink is not None else None
+    
     def export_invocation_data(self, invocation_id: str) -> Optional[Dict[str, Any]]:
         """Export detailed invocation data for debugging"""
         
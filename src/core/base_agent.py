@@ -5,10 +5,12 @@ REFACTORED VERSION using modular architecture.
 CI/CD Pipeline Test: This comment demonstrates automated testing workflows.
 """
 
+import asyncio
 import uuid
 import time
 from typing import Dict, Any, Optional, AsyncGenerator, List
 from google.genai import types
+from google.adk.agents.run_config import RunConfig, StreamingMode
 
 from .interfaces import IAgent, AgentRequest, AgentResponse, StreamChunk, ContentType
 from .configuration import Configuration
@@ -162,6 +164,88 @@ class BaseAgent(MCPAgentMixin, IAgent):
     # Main processing methods
     async def process_request(self, request: AgentRequest) -> AgentResponse:
         """Process a request and return a response"""
+        response = None
+        async for chunk in self._run_invocation(request):
+            if chunk.is_complete:
+                response = chunk.metadata["response"]
+        return response
+    
+    async def process_request_streaming(self, request: AgentRequest) -> AsyncGenerator[StreamChunk, None]:
+        """
+        Process a request with streaming response.
+        
+        Text chunks are yielded as ADK events arrive. The final chunk has
+        is_complete=True and carries the complete AgentResponse in
+        metadata['response']; its text is the error message if the request failed.
+        Tracking and persistence are the same as process_request.
+        """
+        stream = self._run_invocation(request)
+        try:
+            async for chunk in stream:
+                if chunk.is_complete:
+                    response = chunk.metadata["response"]
+                    chunk.chunk = "" if response.success else (response.error or "")
+                yield chunk
+        finally:
+            # Close the invocation now (not at garbage collection) if the consumer stops early
+            await stream.aclose()
+    
+    def _event_text(self, event) -> Optional[str]:
+        """Extract the text carried by an ADK event, if any"""
+        if hasattr(event, 'content') and event.content:
+            parts = getattr(event.content, 'parts', None)
+            if isinstance(parts, (list, tuple)):
+                # genai Content: the text of its text parts
+                return ''.join(getattr(part, 'text', None) or '' for part in parts) or None
+            return str(event.content)
+        elif hasattr(event, 'text') and event.text:
+            return event.text
+        elif hasattr(event, 'delta') and event.delta:
+            return event.delta
+        elif hasattr(event, 'message') and hasattr(event.message, 'content'):
+            return str(event.message.content)
+        elif str(event):
+            # Fallback: convert event to string if it has meaningful content
+            event_str = str(event)
+            if event_str and event_str != repr(event):
+                return event_str
+        return None
+    
+    def _record_function_call(self, event, tool_calls: List[Dict]) -> None:
+        """Record a legitimate tool call carried by an ADK event"""
+        function_call = event.function_call
+        function_name = getattr(function_call, 'name', 'unknown')
+        
+        # Validate that this is a legitimate tool call, not malformed instruction text
+        if not self._tool_manager.is_valid_tool_call(function_name):
+            self._config_manager.logger.warning(f"Malformed or invalid function call detected: {function_name} - ignoring")
+            return
+        
+        self._config_manager.logger.info(f"Valid function call found: {function_name}")
+        try:
+            tool_call_data = {
+                'tool': function_name,
+                'args': getattr(function_call, 'arguments', {}),
+                'result': {'success': True, 'message': 'Tool detected in event'}
+            }
+            tool_calls.append(tool_call_data)
+            
+            # Track individual tool execution
+            with self._config_manager.observability.trace_tool_execution(
+                tool_call_data['tool'], self.name, tool_call_data['args']
+            ) as tool_span:
+                tool_span.set_attribute("tool.success", True)
+                
+        except Exception as e:
+            self._config_manager.logger.error(f"Error processing function call: {e}")
+    
+    async def _run_invocation(self, request: AgentRequest) -> AsyncGenerator[StreamChunk, None]:
+        """
+        Run one tracked agent invocation.
+        
+        Yields a StreamChunk per piece of text as ADK produces it, then one
+        is_complete chunk whose metadata['response'] is the AgentResponse.
+        """
         # Generate unique invocation ID
         invocation_id = f"{self.name}_{uuid.uuid4().hex[:8]}"
         
@@ -221,65 +305,48 @@ class BaseAgent(MCPAgentMixin, IAgent):
                         actual_session = self._sessions.get(request.session_id)
                         actual_session_id = getattr(actual_session, 'session_id', request.session_id) if actual_session else request.session_id
                         
+                        # With SSE streaming, partial events carry token deltas and each model
+                        # turn ends with a non-partial event repeating the whole text; forward
+                        # the deltas and skip that aggregate (a turn without deltas is forwarded)
+                        streamed_partial = False
+                        
                         # Handle ADK async iterator with error handling for serialization issues
                         try:
                             async for event in self._config_manager.adk_runner.run_async(
                                 user_id=request.user_id,
                                 session_id=actual_session_id,
-                                new_message=content_obj
+                                new_message=content_obj,
+                                run_config=RunConfig(streaming_mode=StreamingMode.SSE)
                             ):
                                 # Log every event we receive
-                                self._config_manager.logger.info(f"Received ADK event: {type(event).__name__}")
+                                self._config_manager.logger.debug(f"Received ADK event: {type(event).__name__}")
                                 
                                 # Check for function calls or tool usage in any form
                                 if hasattr(event, 'function_call'):
-                                    function_call = event.function_call
-                                    function_name = getattr(function_call, 'name', 'unknown')
-                                    
-                                    # Validate that this is a legitimate tool call, not malformed instruction text
-                                    if self._tool_manager.is_valid_tool_call(function_name):
-                                        self._config_manager.logger.info(f"Valid function call found: {function_name}")
-                                        # Try to record the tool call
-                                        try:
-                                            tool_call_data = {
-                                                'tool': function_name,
-                                                'args': getattr(function_call, 'arguments', {}),
-                                                'result': {'success': True, 'message': 'Tool detected in event'}
-                                            }
-                                            tool_calls.append(tool_call_data)
-                                            
-                                            # Track individual tool execution
-                                            with self._config_manager.observability.trace_tool_execution(
-                                                tool_call_data['tool'], self.name, tool_call_data['args']
-                                            ) as tool_span:
-                                                tool_span.set_attribute("tool.success", True)
-                                                
-                                        except Exception as e:
-                                            self._config_manager.logger.error(f"Error processing function call: {e}")
-                                    else:
-                                        self._config_manager.logger.warning(f"Malformed or invalid function call detected: {function_name} - ignoring")
-                            
-                                # Extract text content from events (primary response)
-                                if hasattr(event, 'content') and event.content:
-                                    content_parts.append(str(event.content))
-                                elif hasattr(event, 'text') and event.text:
-                                    content_parts.append(event.text)
-                                elif hasattr(event, 'delta') and event.delta:
-                                    content_parts.append(event.delta)
-                                elif hasattr(event, 'message') and hasattr(event.message, 'content'):
-                                    content_parts.append(str(event.message.content))
-                                elif str(event):
-                                    # Fallback: convert event to string if it has meaningful content
-                                    event_str = str(event)
-                                    if event_str and event_str != repr(event):
-                                        content_parts.append(event_str)
+                                    self._record_function_call(event, tool_calls)
+                                
+                                # Extract text content from events (primary response) and pass it on
+                                chunk_text = self._event_text(event)
+                                if getattr(event, 'partial', False) is True:
+                                    streamed_partial = streamed_partial or bool(chunk_text)
+                                elif streamed_partial:
+                                    streamed_partial = False
+                                    chunk_text = None
+                                if chunk_text:
+                                    content_parts.append(chunk_text)
+                                    yield StreamChunk(chunk=chunk_text, agent_name=self.name)
                         
                         except Exception as serialization_error:
                             if "Unable to serialize" in str(serialization_error):
                                 # Use error handler for serialization recovery
+                                streamed = ''.join(content_parts)
                                 content = self._error_handler.handle_serialization_error(
                                     serialization_error, content_parts, tool_calls
                                 )
+                                # Stream whatever the recovery added to the text already sent
+                                remainder = content[len(streamed):] if content.startswith(streamed) else content
+                                if remainder:
+                                    yield StreamChunk(chunk=remainder, agent_name=self.name)
                             else:
                                 raise serialization_error
                         else:
@@ -315,6 +382,7 @@ class BaseAgent(MCPAgentMixin, IAgent):
                     content = self._error_handler.handle_vertex_ai_error(e)
                     span.set_attribute("error", True)
                     span.set_attribute("error.message", str(e))
+                    yield StreamChunk(chunk=content, agent_name=self.name)
                 
                 # Record tool usage if any tools were called
                 if tool_calls:
@@ -358,7 +426,7 @@ class BaseAgent(MCPAgentMixin, IAgent):
                 span.set_attribute("response.content_length", len(content))
                 span.set_attribute("tools.called_count", len(tool_calls))
                 
-                return AgentResponse(
+                response = AgentResponse(
                     agent_name=self.name,
                     content=content,
                     content_type=self._response_processor.get_content_type(),
@@ -367,6 +435,15 @@ class BaseAgent(MCPAgentMixin, IAgent):
                     success=True
                 )
                 
+            except (GeneratorExit, asyncio.CancelledError):
+                # The consumer stopped reading (e.g. a streaming client disconnected)
+                self._config_manager.agent_tracker.complete_invocation(
+                    invocation_id=invocation_id,
+                    success=False,
+                    error_message="Stream closed before completion"
+                )
+                raise
+                
             except Exception as e:
                 # Complete invocation with error
                 self._config_manager.agent_tracker.complete_invocation(
@@ -380,77 +457,18 @@ class BaseAgent(MCPAgentMixin, IAgent):
                 span.set_attribute("error.message", str(e))
                 
                 error_content = self._error_handler.handle_general_error(e, "request processing")
-                return AgentResponse(
+                response = AgentResponse(
                     agent_name=self.name,
                     content="",
                     content_type=self._response_processor.get_content_type(),
                     success=False,
                     error=error_content
                 )
-    
-    async def process_request_streaming(self, request: AgentRequest) -> AsyncGenerator[StreamChunk, None]:
-        """Process a request with streaming response"""
-        try:
-            self._config_manager.logger.info(f"Processing streaming request for user {request.user_id}")
-            
-            # Prepare the message with context
-            message = await self._message_handler.prepare_message(request)
-            
-            # Execute the agent with streaming
-            try:
-                # Ensure session exists
-                await self._ensure_session(request.user_id, request.session_id)
-                
-                # Create proper message content object
-                content = types.Content(
-                    role='user',
-                    parts=[types.Part(text=message)]
-                )
-                
-                async for event in self._config_manager.adk_runner.run_async(
-                    user_id=request.user_id,
-                    session_id=request.session_id,
-                    new_message=content
-                ):
-                    # Extract text content from events
-                    chunk_text = None
-                    if hasattr(event, 'content') and event.content:
-                        chunk_text = str(event.content)
-                    elif hasattr(event, 'text') and event.text:
-                        chunk_text = event.text
-                    elif hasattr(event, 'delta') and event.delta:
-                        chunk_text = event.delta
-                    
-                    if chunk_text:
-                        yield StreamChunk(
-                            chunk=chunk_text,
-                            agent_name=self.name,
-                            is_complete=False
-                        )
-                        
-            except Exception as e:
-                # Error handling
-                error_message = self._error_handler.handle_general_error(e, "streaming")
-                yield StreamChunk(
-                    chunk=error_message,
-                    agent_name=self.name,
-                    is_complete=True
-                )
-            
-            # Send completion signal
-            yield StreamChunk(
-                chunk="",
-                agent_name=self.name,
-                is_complete=True
-            )
-            
-        except Exception as e:
-            error_message = self._error_handler.handle_general_error(e, "streaming request")
-            yield StreamChunk(
-                chunk=error_message,
-                agent_name=self.name,
-                is_complete=True
-            )
+        
+        yield StreamChunk(chunk="", agent_name=self.name, is_complete=True, metadata={
+            "response": response,
+            "invocation_id": invocation_id
+        })
     
     async def _ensure_session(self, user_id: str, session_id: str) -> None:
         """Ensure a session exists for the user"""
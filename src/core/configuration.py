@@ -44,6 +44,7 @@ class AgentConfig:
     max_retries: int = 3
     timeout: int = 30
     temperature: float = 0.7
+    workflow_max_concurrency: int = 3
 
 
 class Configuration:
@@ -88,7 +89,8 @@ class Configuration:
             model=os.getenv("AI_MODEL", "gemini-2.0-flash"),
             max_retries=int(os.getenv("AGENT_MAX_RETRIES", "3")),
             timeout=int(os.getenv("AGENT_TIMEOUT", "30")),
-            temperature=float(os.getenv("AGENT_TEMPERATURE", "0.7"))
+            temperature=float(os.getenv("AGENT_TEMPERATURE", "0.7")),
+            workflow_max_concurrency=int(os.getenv("AGENT_WORKFLOW_CONCURRENCY", "3"))
         )
     
     @property
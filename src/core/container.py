@@ -2,7 +2,8 @@
 Dependency injection container for the multi-agent book writing system.
 """
 
-from typing import Dict, Any, Type, TypeVar, Callable, Optional
+from contextvars import ContextVar
+from typing import Dict, Any, Type, TypeVar, Callable, Optional, Tuple
 from .interfaces import IConfiguration, IDatabase, ILogger, IValidator
 from .configuration import Configuration
 from .logging import get_logger
@@ -19,9 +20,11 @@ class ServiceContainer:
         self._factories: Dict[str, Callable[[], Any]] = {}
         self._singletons: Dict[str, Any] = {}
         
-        # Session context for tool usage
-        self._current_session_id: Optional[str] = None
-        self._current_user_id: Optional[str] = None
+        # Session context for tool usage. A ContextVar, so agents running
+        # concurrently on one event loop each see their own session.
+        self._session_context: ContextVar[Tuple[Optional[str], Optional[str]]] = ContextVar(
+            "session_context", default=(None, None)
+        )
         
         # Register core services
         self._register_core_services()
@@ -57,6 +60,9 @@ class ServiceContainer:
         
         # Agent factory
         self.register_singleton("agent_factory", self._create_agent_factory)
+        
+        # Write-behind persistence for agent telemetry
+        self.register_singleton("telemetry_sink", self._create_telemetry_sink)
     
     def _create_database_adapter(self):
         """Create database adapter instance with connection pooling"""
@@ -130,8 +136,13 @@ class ServiceContainer:
     def _create_session_repository(self):
         """Create session repository instance"""
         from src.repositories.session_repository import SessionRepository
+        import os
         database = self.get("database")
-        return SessionRepository(database)
+        return SessionRepository(
+            database,
+            identity_cache_ttl=float(os.getenv("SESSION_IDENTITY_CACHE_TTL", "300")),
+            identity_cache_size=int(os.getenv("SESSION_IDENTITY_CACHE_SIZE", "10000"))
+        )
     
     def _create_orchestrator_repository(self):
         """Create orchestrator repository instance"""
@@ -163,6 +174,22 @@ class ServiceContainer:
         config = self.get("config")
         return AgentFactory(config)
     
+    def _create_telemetry_sink(self):
+        """Create the telemetry sink and attach it to the agent tracker"""
+        from src.core.telemetry_sink import TelemetrySink
+        from src.core.agent_tracker import get_agent_tracker
+        import os
+        
+        sink = TelemetrySink(
+            self.get("database"),
+            max_queue_size=int(os.getenv("TELEMETRY_QUEUE_SIZE", "10000")),
+            batch_size=int(os.getenv("TELEMETRY_BATCH_SIZE", "200")),
+            flush_interval=float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "1.0")),
+            drop_policy=os.getenv("TELEMETRY_DROP_POLICY", TelemetrySink.DROP_OLDEST)
+        )
+        get_agent_tracker().attach_sink(sink)
+        return sink
+    
     def register_singleton(self, name: str, factory: Callable[[], T]) -> None:
         """Register a singleton service"""
         self._factories[name] = factory
@@ -246,28 +273,25 @@ class ServiceContainer:
         self._services.clear()
         self._factories.clear()
         self._singletons.clear()
-        self._current_session_id = None
-        self._current_user_id = None
+        self._session_context.set((None, None))
         self._register_core_services()
         self._validate_core_services()
     
     def set_session_context(self, session_id: str, user_id: str) -> None:
         """Set current session context for tools"""
-        self._current_session_id = session_id
-        self._current_user_id = user_id
+        self._session_context.set((session_id, user_id))
     
     def get_current_session_id(self) -> Optional[str]:
         """Get current session ID"""
-        return self._current_session_id
+        return self._session_context.get()[0]
     
     def get_current_user_id(self) -> Optional[str]:
         """Get current user ID"""
-        return self._current_user_id
+        return self._session_context.get()[1]
     
     def clear_session_context(self) -> None:
         """Clear session context"""
-        self._current_session_id = None
-        self._current_user_id = None
+        self._session_context.set((None, None))
     
     # Convenience methods for common services
     def plot_repository(self):
@@ -152,8 +152,9 @@ class IDatabase(ABC):
         pass
     
     @abstractmethod
-    async def search_content(self, query: str, content_type: ContentType, user_id: str) -> List[Dict[str, Any]]:
-        """Search for content"""
+    async def search_content(self, query: str, content_type: ContentType, user_id: str,
+                             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Search for content, best matches first"""
         pass
 
 
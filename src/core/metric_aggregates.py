@@ -0,0 +1,186 @@
+"""
+Streaming metric aggregates with bounded memory.
+Each metric keeps running totals, a ring buffer of recent values, a
+log-bucketed histogram for quantiles and counters per tag set, so recording
+is O(1) and summaries never rescan raw samples.
+"""
+
+import math
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Quantiles reported in summaries and the Prometheus exposition
+SUMMARY_QUANTILES: Tuple[Tuple[str, float], ...] = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+
+TagKey = Tuple[Tuple[str, str], ...]
+
+
+class RingBuffer:
+    """Fixed-capacity buffer of floats that overwrites its oldest value"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._values = array("d", [0.0]) * capacity
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, value: float):
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def values(self, last: Optional[int] = None) -> List[float]:
+        """Buffered values, oldest first; only the newest `last` if given"""
+        count = self._size if last is None else min(last, self._size)
+        start = self._next - count
+        return [self._values[(start + i) % self.capacity] for i in range(count)]
+
+
+class LogHistogram:
+    """
+    Log-bucketed histogram with bounded relative error (DDSketch style).
+
+    A value v lands in bucket ceil(log_gamma(v)), so any quantile is answered
+    within `relative_accuracy` of the true sample without storing samples.
+    Values at or below zero share one bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float):
+        self.count += 1
+        if value <= 0:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Nearest-rank estimate of the `fraction` quantile, or None when empty"""
+        return self.quantiles([fraction])[0]
+
+    def quantiles(self, fractions: List[float]) -> List[Optional[float]]:
+        """Estimates for several ascending fractions in one pass over the buckets"""
+        if not self.count:
+            return [None] * len(fractions)
+        ranks = [max(1, math.ceil(fraction * self.count)) for fraction in fractions]
+        estimates: List[Optional[float]] = []
+        seen = self._zero_count
+        while len(estimates) < len(ranks) and ranks[len(estimates)] <= seen:
+            estimates.append(0.0)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            while len(estimates) < len(ranks) and ranks[len(estimates)] <= seen:
+                # Midpoint of (gamma^(i-1), gamma^i] in relative terms
+                estimates.append(2 * self._gamma ** index / (self._gamma + 1))
+            if len(estimates) == len(ranks):
+                break
+        return estimates
+
+
+class MetricSeries:
+    """Running aggregates of one metric"""
+
+    def __init__(self, name: str, window: int = 1000, relative_accuracy: float = 0.01):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.recent = RingBuffer(window)
+        self.histogram = LogHistogram(relative_accuracy)
+        # {sorted tag items: [count, sum]}
+        self.by_tags: Dict[TagKey, List[float]] = {}
+
+    def record(self, value: float, tags: Optional[Dict[str, str]] = None):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.recent.append(value)
+        self.histogram.add(value)
+
+        if tags:
+            key = tuple(sorted(tags.items()))
+            counter = self.by_tags.get(key)
+            if counter is None:
+                self.by_tags[key] = [1, value]
+            else:
+                counter[0] += 1
+                counter[1] += value
+
+    def quantiles(self, fractions: List[float]) -> List[Optional[float]]:
+        # Bucket midpoints can fall just outside the observed range
+        return [None if estimate is None else min(max(estimate, self.min), self.max)
+                for estimate in self.histogram.quantiles(fractions)]
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        return self.quantiles([fraction])[0]
+
+    def summary(self) -> Dict[str, object]:
+        summary = {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "recent": self.recent.values(last=10),
+        }
+        estimates = self.quantiles([fraction for _, fraction in SUMMARY_QUANTILES])
+        for (label, _), estimate in zip(SUMMARY_QUANTILES, estimates):
+            summary[label] = estimate
+        return summary
+
+
+def _metric_name(prefix: str, name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", f"{prefix}_{name}" if prefix else name)
+
+
+def _label_value(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(items: Iterable[Tuple[str, object]]) -> str:
+    labels = ",".join(f'{re.sub(r"[^a-zA-Z0-9_]", "_", key)}="{_label_value(value)}"' for key, value in items)
+    return f"{{{labels}}}" if labels else ""
+
+
+def render_prometheus(series: Iterable[MetricSeries], prefix: str = "agentwriter") -> str:
+    """
+    Prometheus text exposition (format 0.0.4) of metric series.
+
+    Each metric is a summary with its quantiles, sum and count; tagged
+    recordings are exposed as <name>_tagged_total and <name>_tagged_sum
+    counters labelled with the tags.
+    """
+    lines: List[str] = []
+    for metric in series:
+        name = _metric_name(prefix, metric.name)
+        lines.append(f"# TYPE {name} summary")
+        estimates = metric.quantiles([fraction for _, fraction in SUMMARY_QUANTILES])
+        for (_, fraction), value in zip(SUMMARY_QUANTILES, estimates):
+            if value is not None:
+                lines.append(f'{name}{{quantile="{fraction}"}} {value!r}')
+        lines.append(f"{name}_sum {metric.total!r}")
+        lines.append(f"{name}_count {metric.count}")
+
+        if metric.by_tags:
+            lines.append(f"# TYPE {name}_tagged_total counter")
+            for key, (count, _) in metric.by_tags.items():
+                lines.append(f"{name}_tagged_total{_labels(key)} {count}")
+            lines.append(f"# TYPE {name}_tagged_sum counter")
+            for key, (_, total) in metric.by_tags.items():
+                lines.append(f"{name}_tagged_sum{_labels(key)} {float(total)!r}")
+    return "\n".join(lines) + "\n" if lines else ""
@@ -6,7 +6,6 @@ Enables comprehensive telemetry, performance monitoring, and debugging.
 import os
 import logging
 from typing import Optional, Dict, Any, List
-from datetime import datetime
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
@@ -15,6 +14,7 @@ from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExport
 from opentelemetry.sdk.resources import Resource
 
 from .logging import get_logger
+from .metric_aggregates import MetricSeries, render_prometheus
 
 logger = get_logger("observability")
 
@@ -63,7 +63,7 @@ class ADKObservabilityManager:
         self.config = config
         self.tracer_provider = None
         self.tracer = None
-        self.performance_metrics = {}
+        self.performance_metrics: Dict[str, MetricSeries] = {}
         
         if config.enabled:
             self._setup_tracing()
@@ -209,44 +209,24 @@ class ADKObservabilityManager:
     
     def record_performance_metric(self, metric_name: str, value: float, 
                                 tags: Optional[Dict[str, str]] = None):
-        """Record a performance metric"""
-        timestamp = datetime.utcnow().isoformat()
+        """Record a performance metric (O(1), folded into streaming aggregates)"""
+        series = self.performance_metrics.get(metric_name)
+        if series is None:
+            series = self.performance_metrics[metric_name] = MetricSeries(metric_name)
         
-        if metric_name not in self.performance_metrics:
-            self.performance_metrics[metric_name] = []
-        
-        metric_entry = {
-            "timestamp": timestamp,
-            "value": value,
-            "tags": tags or {}
-        }
-        
-        self.performance_metrics[metric_name].append(metric_entry)
-        
-        # Keep only recent metrics (last 1000 entries per metric)
-        if len(self.performance_metrics[metric_name]) > 1000:
-            self.performance_metrics[metric_name] = self.performance_metrics[metric_name][-1000:]
-        
-        logger.debug(f"Recorded metric {metric_name}: {value}", **tags or {})
+        series.record(value, tags)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get summary of performance metrics"""
-        summary = {}
-        
-        for metric_name, entries in self.performance_metrics.items():
-            if not entries:
-                continue
-            
-            values = [entry["value"] for entry in entries]
-            summary[metric_name] = {
-                "count": len(values),
-                "avg": sum(values) / len(values),
-                "min": min(values),
-                "max": max(values),
-                "recent": values[-10:] if len(values) >= 10 else values
-            }
-        
-        return summary
+        return {
+            metric_name: series.summary()
+            for metric_name, series in self.performance_metrics.items()
+            if series.count
+        }
+    
+    def render_prometheus_metrics(self) -> str:
+        """Performance metrics in Prometheus text exposition format"""
+        return render_prometheus(self.performance_metrics.values())
 
 
 class NoOpSpan:
@@ -0,0 +1,210 @@
+"""
+Write-behind telemetry sink.
+Buffers invocation and metric records in a bounded queue and persists them in
+batches off the request path, so tracing never adds database latency to agent
+responses.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .interfaces import IDatabase
+from .logging import get_logger
+
+logger = get_logger("telemetry_sink")
+
+
+class TelemetrySink:
+    """Bounded write-behind queue flushed with batch_insert on a size/time trigger"""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+    def __init__(self, database: IDatabase, max_queue_size: int = 10000, batch_size: int = 200,
+                 flush_interval: float = 1.0, drop_policy: str = DROP_OLDEST):
+        if drop_policy not in (self.DROP_OLDEST, self.DROP_NEWEST):
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+
+        self._database = database
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drop_policy = drop_policy
+
+        self._queue: Deque[Tuple[str, Dict[str, Any]]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        # Statistics
+        self.submitted = 0
+        self.dropped = 0
+        self.flushed = 0
+        self.failed = 0
+        self.flushes = 0
+        self.batches = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._flusher_task is not None and not self._flusher_task.done()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def _events(self):
+        """Create the loop-bound primitives on first use inside a running loop"""
+        if self._flush_lock is None:
+            self._wakeup = asyncio.Event()
+            self._space = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+
+    def submit(self, table: str, record: Dict[str, Any]) -> bool:
+        """
+        Queue a record without blocking.
+
+        When the queue is full the drop policy decides which record is lost:
+        drop_oldest evicts the head of the queue, drop_newest rejects this one.
+        Returns False only when this record was rejected.
+        """
+        self.submitted += 1
+        if len(self._queue) >= self.max_queue_size:
+            self.dropped += 1
+            if self.drop_policy == self.DROP_NEWEST:
+                return False
+            self._queue.popleft()
+
+        self._queue.append((table, record))
+        if len(self._queue) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    async def put(self, table: str, record: Dict[str, Any], timeout: Optional[float] = None) -> bool:
+        """
+        Queue a record, waiting up to `timeout` seconds for room when the queue is full.
+
+        This is the backpressure path for async producers; if there is still no
+        room after the wait, the drop policy applies as in submit().
+        """
+        self._events()
+        if len(self._queue) >= self.max_queue_size and self.running:
+            self._space.clear()
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(self._space.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.submit(table, record)
+
+    async def start(self):
+        """Start the background flusher"""
+        if self.running:
+            return
+        self._events()
+        self._stopping = False
+        self._flusher_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"Telemetry sink started (batch size {self.batch_size}, "
+                    f"interval {self.flush_interval}s, queue {self.max_queue_size})")
+
+    async def stop(self):
+        """Stop the background flusher and persist everything still queued"""
+        self._stopping = True
+        if self._flusher_task is not None:
+            self._wakeup.set()
+            await self._flusher_task
+            self._flusher_task = None
+        await self.flush()
+        logger.info(f"Telemetry sink stopped ({self.flushed} records flushed, {self.dropped} dropped)")
+
+    async def _flush_loop(self):
+        """Flush whenever a batch fills up or the interval elapses"""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                # Never let a flush error kill the flusher
+                logger.error(f"Telemetry flush failed: {e}")
+
+    async def flush(self) -> int:
+        """Persist all queued records in batches; returns the number written"""
+        self._events()
+        written = 0
+        async with self._flush_lock:
+            while self._queue:
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._space.set()
+
+                started = time.perf_counter()
+                written += await self._write_batch(batch)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+                self.flushes += 1
+                self.last_flush_ms = elapsed_ms
+                self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+                self.total_flush_ms += elapsed_ms
+        return written
+
+    async def _write_batch(self, batch: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """Write one batch with one batch_insert per table"""
+        by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for table, record in batch:
+            by_table.setdefault(table, []).append(record)
+
+        written = 0
+        for table, records in by_table.items():
+            try:
+                await self._database.batch_insert(table, records)
+                self.batches += 1
+                written += len(records)
+            except Exception as e:
+                # One bad record fails the whole statement; salvage the rest
+                logger.warning(f"Batch insert of {len(records)} {table} records failed, retrying one by one: {e}")
+                written += await self._write_individually(table, records)
+
+        self.flushed += written
+        return written
+
+    async def _write_individually(self, table: str, records: List[Dict[str, Any]]) -> int:
+        written = 0
+        for record in records:
+            try:
+                await self._database.insert(table, record)
+                written += 1
+            except Exception as e:
+                self.failed += 1
+                self.last_error = f"{table}: {e}"
+                logger.error(f"Dropping {table} telemetry record: {e}")
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue and flush statistics"""
+        return {
+            "running": self.running,
+            "queued": len(self._queue),
+            "max_queue_size": self.max_queue_size,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "drop_policy": self.drop_policy,
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "flushed": self.flushed,
+            "failed": self.failed,
+            "flushes": self.flushes,
+            "batches": self.batches,
+            "last_flush_ms": self.last_flush_ms,
+            "max_flush_ms": self.max_flush_ms,
+            "avg_flush_ms": self.total_flush_ms / self.flushes if self.flushes else 0.0,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,287 @@
+"""
+Dependency-aware workflow engine for multi-agent requests.
+Runs the agents chosen by the orchestrator as a DAG built from the data each
+agent needs and produces, so independent agents run concurrently.
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+from .logging import get_logger
+
+logger = get_logger("workflow_engine")
+
+
+@dataclass(frozen=True)
+class AgentDependencies:
+    """Context keys an agent needs before it can run, and the keys it produces"""
+    requires: Tuple[str, ...] = ()
+    produces: Tuple[str, ...] = ()
+
+
+# Declared data dependencies of each agent. An agent waits only for the
+# agents in the same workflow that produce a key it requires.
+AGENT_DEPENDENCIES: Dict[str, AgentDependencies] = {
+    "author_generator": AgentDependencies(produces=("author_id",)),
+    "plot_generator": AgentDependencies(produces=("plot_id",)),
+    "world_building": AgentDependencies(requires=("plot_id",), produces=("world_building_id",)),
+    "characters": AgentDependencies(
+        requires=("plot_id", "world_building_id"), produces=("characters_id",)
+    ),
+    "critique": AgentDependencies(produces=("critique",)),
+    "enhancement": AgentDependencies(requires=("critique",), produces=("enhanced_content",)),
+    "scoring": AgentDependencies(produces=("score",)),
+    "loregen": AgentDependencies(),
+}
+
+
+def workflow_results_key(workflow_id: str) -> str:
+    """Key under which step results are kept, apart from the shared agent context"""
+    return f"{workflow_id}:results"
+
+
+@dataclass
+class WorkflowStepResult:
+    """Outcome of one agent in a workflow"""
+    agent_name: str
+    success: bool
+    depends_on: List[str] = field(default_factory=list)
+    outputs: Dict[str, Any] = field(default_factory=dict)
+    response: Optional[str] = None
+    error: Optional[str] = None
+    skipped: bool = False
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": self.success,
+            "depends_on": self.depends_on,
+            "outputs": self.outputs,
+            "error": self.error,
+            "skipped": self.skipped,
+            "duration_ms": self.duration_ms
+        }
+
+
+@dataclass
+class WorkflowResult:
+    """Outcome of a whole workflow"""
+    workflow_id: str
+    steps: Dict[str, WorkflowStepResult]
+    stages: List[List[str]]
+    context: Dict[str, Any]
+    duration_ms: float
+
+    @property
+    def success(self) -> bool:
+        return all(step.success for step in self.steps.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workflow_id": self.workflow_id,
+            "success": self.success,
+            "stages": self.stages,
+            "steps": {name: step.to_dict() for name, step in self.steps.items()},
+            "duration_ms": self.duration_ms
+        }
+
+
+class WorkflowEngine:
+    """Executes a list of agents as a dependency DAG with bounded concurrency"""
+
+    def __init__(
+        self,
+        invoke: Callable[..., Awaitable[Dict[str, Any]]],
+        contexts: Any,
+        max_concurrency: int = 3,
+        dependencies: Optional[Dict[str, AgentDependencies]] = None
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            invoke: Coroutine function invoking one agent, with the signature of
+                tools.agent_tools.invoke_agent
+            contexts: Workflow context store (WORKFLOW_CONTEXTS)
+            max_concurrency: Maximum number of agents running at once
+            dependencies: Agent dependency declarations (defaults to AGENT_DEPENDENCIES)
+        """
+        self.invoke = invoke
+        self.contexts = contexts
+        self.max_concurrency = max(1, max_concurrency)
+        self.dependencies = dependencies if dependencies is not None else AGENT_DEPENDENCIES
+
+    def build_graph(self, agent_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Map each agent to the agents it waits for.
+
+        A required key that no agent in the workflow produces is expected to
+        come from the request context and adds no edge. When several agents
+        produce the same key, the one listed last before the consumer wins.
+        """
+        agent_names = list(dict.fromkeys(agent_names))
+        graph: Dict[str, List[str]] = {}
+        for index, name in enumerate(agent_names):
+            spec = self.dependencies.get(name, AgentDependencies())
+            upstream = []
+            for key in spec.requires:
+                producers = [
+                    other for other in agent_names
+                    if other != name and key in self.dependencies.get(other, AgentDependencies()).produces
+                ]
+                earlier = [p for p in producers if agent_names.index(p) < index]
+                producer = (earlier or producers or [None])[-1]
+                if producer and producer not in upstream:
+                    upstream.append(producer)
+            graph[name] = upstream
+        return graph
+
+    def plan(self, agent_names: List[str]) -> List[List[str]]:
+        """
+        Group agents into stages that can run concurrently.
+
+        Raises:
+            ValueError: If the declared dependencies form a cycle
+        """
+        graph = self.build_graph(agent_names)
+        stages: List[List[str]] = []
+        done: set = set()
+        while len(done) < len(graph):
+            ready = [name for name, upstream in graph.items()
+                     if name not in done and all(dep in done for dep in upstream)]
+            if not ready:
+                pending = [name for name in graph if name not in done]
+                raise ValueError(f"Circular agent dependencies: {pending}")
+            stages.append(ready)
+            done.update(ready)
+        return stages
+
+    async def run(
+        self,
+        agent_names: List[str],
+        message: str,
+        context: Optional[Dict[str, Any]] = None,
+        workflow_id: Optional[str] = None
+    ) -> WorkflowResult:
+        """
+        Run the agents, each as soon as the agents it depends on have finished.
+
+        Agents whose dependencies failed are skipped. Produced keys are shared
+        through the workflow context, and step results are recorded under
+        workflow_results_key(workflow_id).
+        """
+        workflow_id = workflow_id or f"workflow_{uuid.uuid4()}"
+        graph = self.build_graph(agent_names)
+        stages = self.plan(agent_names)
+        start_time = time.time()
+
+        if context:
+            self.contexts.update(workflow_id, context)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        done: Dict[str, asyncio.Future] = {
+            name: asyncio.get_running_loop().create_future() for name in graph
+        }
+        steps: Dict[str, WorkflowStepResult] = {}
+
+        async def run_step(name: str):
+            upstream = graph[name]
+            try:
+                upstream_results = [await done[dep] for dep in upstream]
+                failed = [result.agent_name for result in upstream_results if not result.success]
+                if failed:
+                    result = WorkflowStepResult(
+                        agent_name=name, success=False, depends_on=upstream, skipped=True,
+                        error=f"Skipped because {', '.join(failed)} failed"
+                    )
+                else:
+                    async with semaphore:
+                        result = await self._run_agent(name, upstream, upstream_results, message, workflow_id)
+            except Exception as e:
+                result = WorkflowStepResult(agent_name=name, success=False, depends_on=upstream, error=str(e))
+
+            steps[name] = result
+            self._record(workflow_id, result)
+            done[name].set_result(result)
+
+        await asyncio.gather(*(run_step(name) for name in graph))
+
+        result = WorkflowResult(
+            workflow_id=workflow_id,
+            steps={name: steps[name] for name in graph},
+            stages=stages,
+            context=dict(self.contexts.get(workflow_id, {})),
+            duration_ms=(time.time() - start_time) * 1000
+        )
+        self.contexts.set(workflow_results_key(workflow_id), result.to_dict())
+        logger.info(
+            f"Workflow {workflow_id} finished in {result.duration_ms:.0f}ms "
+            f"({len(stages)} stages, success={result.success})"
+        )
+        return result
+
+    async def _run_agent(
+        self,
+        name: str,
+        upstream: List[str],
+        upstream_results: List[WorkflowStepResult],
+        message: str,
+        workflow_id: str
+    ) -> WorkflowStepResult:
+        """Invoke one agent with the outputs of the agents it depends on"""
+        step_context: Dict[str, Any] = {}
+        for upstream_result in upstream_results:
+            step_context.update(upstream_result.outputs)
+
+        start_time = time.time()
+        response = await self.invoke(
+            agent_name=name,
+            message=message,
+            context=step_context or None,
+            workflow_id=workflow_id
+        )
+        duration_ms = (time.time() - start_time) * 1000
+
+        if not response.get("success"):
+            return WorkflowStepResult(
+                agent_name=name, success=False, depends_on=upstream,
+                error=response.get("error"), duration_ms=duration_ms
+            )
+
+        return WorkflowStepResult(
+            agent_name=name,
+            success=True,
+            depends_on=upstream,
+            outputs=self._extract_outputs(name, response, workflow_id),
+            response=response.get("response"),
+            duration_ms=duration_ms
+        )
+
+    def _extract_outputs(self, name: str, response: Dict[str, Any], workflow_id: str) -> Dict[str, Any]:
+        """Collect the keys an agent declares it produces from its response"""
+        spec = self.dependencies.get(name, AgentDependencies())
+        shared = self.contexts.get(workflow_id, {})
+        sources = [response.get("metadata") or {}, response.get("structured_data") or {}]
+
+        outputs = {}
+        for key in spec.produces:
+            value = next((source[key] for source in sources if key in source), None)
+            if value is None and not key.endswith("_id"):
+                # Content outputs (critique, score, ...) are the response itself
+                value = response.get("response")
+            if value is None:
+                value = shared.get(key)
+            if value is not None:
+                outputs[key] = value
+        return outputs
+
+    def _record(self, workflow_id: str, result: WorkflowStepResult):
+        """Share a finished step's outputs with the rest of the workflow"""
+        if result.outputs:
+            self.contexts.update(workflow_id, result.outputs)
+        completed = self.contexts.get(workflow_results_key(workflow_id), {})
+        step_results = dict(completed.get("steps", {}))
+        step_results[result.agent_name] = result.to_dict()
+        self.contexts.set(workflow_results_key(workflow_id), {"workflow_id": workflow_id, "steps": step_results})
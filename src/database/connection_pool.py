@@ -10,8 +10,12 @@ import sqlite3
 import asyncio
 import threading
 import time
-from typing import Dict, Any, List, Optional, Protocol, Union
-from dataclasses import dataclass, field
+import uuid
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, Any, Deque, List, Optional, Protocol, Tuple, Union
+from dataclasses import dataclass, field, replace
 from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty, Full
@@ -21,7 +25,9 @@ from ..core.logging import get_logger
 # Import modular components
 from .pool_configuration import ConnectionPoolConfig as ModularConnectionPoolConfig
 from .pool_metrics import PoolMetrics as ModularPoolMetrics
-from .connection_validator import SQLiteConnectionValidator, SupabaseConnectionValidator
+from .connection_validator import (
+    SQLiteConnectionValidator, SupabaseConnectionValidator, HealthCheckCache, ValidationResult
+)
 
 # Maintain backward compatibility with original API
 
@@ -29,6 +35,10 @@ from .connection_validator import SQLiteConnectionValidator, SupabaseConnectionV
 # Re-export modular components with original names for backward compatibility
 ConnectionPoolConfig = ModularConnectionPoolConfig
 
+# Upper bounds (seconds) of the checkout wait-time histogram buckets; a final bucket is unbounded
+WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
 @dataclass
 class PoolMetrics:
     """Connection pool performance metrics - backward compatibility wrapper"""
@@ -43,7 +53,14 @@ class PoolMetrics:
     query_count: int = 0
     avg_connection_time: float = 0.0
     last_reset: float = field(default_factory=time.time)
-    
+    # Checkouts that had to wait for a connection to be returned
+    waiting_acquirers: int = 0
+    waits: int = 0
+    wait_timeouts: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+    wait_histogram: List[int] = field(default_factory=lambda: [0] * (len(WAIT_TIME_BUCKETS) + 1))
+
     def reset(self):
         """Reset metrics counters"""
         self.connections_created = 0
@@ -52,8 +69,32 @@ class PoolMetrics:
         self.pool_misses = 0
         self.health_check_failures = 0
         self.query_count = 0
+        self.waits = 0
+        self.wait_timeouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.wait_histogram = [0] * (len(WAIT_TIME_BUCKETS) + 1)
         self.last_reset = time.time()
 
+    def record_wait(self, wait_time: float, timed_out: bool = False):
+        """Record how long a checkout waited for a returned connection"""
+        self.waits += 1
+        if timed_out:
+            self.wait_timeouts += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        self.wait_histogram[bisect_left(WAIT_TIME_BUCKETS, wait_time)] += 1
+
+    @property
+    def avg_wait_time(self) -> float:
+        """Mean wait of the checkouts that waited"""
+        return self.total_wait_time / self.waits if self.waits else 0.0
+
+    def wait_time_histogram(self) -> Dict[str, int]:
+        """Wait counts per bucket, keyed by the bucket's upper bound in seconds"""
+        labels = [f"{bound:g}" for bound in WAIT_TIME_BUCKETS] + ["+Inf"]
+        return dict(zip(labels, self.wait_histogram))
+
 
 class PooledConnection(Protocol):
     """Protocol for pooled database connections"""
@@ -69,7 +110,8 @@ class SQLitePooledConnection:
     created_at: float = field(default_factory=time.time)
     last_used: float = field(default_factory=time.time)
     use_count: int = 0
-    
+    connection_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
     def execute(self, query: str, params: List[Any] = None) -> sqlite3.Cursor:
         """Execute query and update metadata"""
         self.last_used = time.time()
@@ -80,11 +122,11 @@ class SQLitePooledConnection:
         else:
             cursor.execute(query)
         return cursor
-    
+
     def close(self) -> None:
         """Close the underlying connection"""
         self.connection.close()
-    
+
     def is_healthy(self) -> bool:
         """Check if connection is healthy"""
         try:
@@ -94,35 +136,55 @@ class SQLitePooledConnection:
             return True
         except (sqlite3.Error, sqlite3.OperationalError):
             return False
-    
+
     @property
     def is_idle_expired(self) -> bool:
         """Check if connection has been idle too long"""
         return (time.time() - self.last_used) > 300  # 5 minutes
 
 
-class SQLiteConnectionPool:
-    """High-performance SQLite connection pool with health monitoring"""
-    
-    def __init__(self, db_path: str, config: ConnectionPoolConfig):
-        self.db_path = db_path
+class AsyncConnectionPool(ABC):
+    """
+    Connection checkout shared by the SQLite and Supabase pools.
+
+    Idle connections sit in a non-blocking Queue. When every connection is
+    checked out, acquirers wait on futures in a FIFO deque and a returned
+    connection is handed straight to the oldest waiter, on the waiter's own
+    event loop, so waiting neither parks a thread nor polls. Each checkout
+    has a deadline of connection_timeout seconds.
+
+    Health checks are lazy: a connection is validated at checkout only when
+    its cached result (HealthCheckCache, TTL health_check_interval) expired,
+    and returning a connection runs no query.
+    """
+
+    POOL_NAME = "database"
+    # Run a health check at checkout when the cached result expired
+    validate_on_checkout = True
+    # Executor for background health checks (None: the loop's default executor)
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, config: ConnectionPoolConfig, logger_name: str):
         self.config = config
-        self.logger = get_logger("sqlite_pool")
-        
+        self.logger = get_logger(logger_name)
+
         # Connection pool and management
-        self._pool: Queue[SQLitePooledConnection] = Queue(maxsize=config.max_connections)
-        self._all_connections: List[SQLitePooledConnection] = []
+        self._pool: Queue = Queue(maxsize=config.max_connections)
+        self._all_connections: List[Any] = []
         self._lock = threading.RLock()
         self._metrics = PoolMetrics()
-        
+
+        # Checkouts waiting for a returned connection, oldest first
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
         # Health monitoring
+        self._health_cache = HealthCheckCache(
+            ttl_seconds=config.health_check_interval, max_size=config.max_connections * 2
+        )
         self._health_monitor_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._shutdown = False
-        
-        # Initialize minimum connections
-        self._initialize_pool()
-        
+
     def _initialize_pool(self):
         """Initialize the connection pool with minimum connections"""
         with self._lock:
@@ -131,88 +193,27 @@ class SQLiteConnectionPool:
                 if conn:
                     self._pool.put_nowait(conn)
                     self._all_connections.append(conn)
-    
-    def _create_connection(self) -> Optional[SQLitePooledConnection]:
-        """Create a new SQLite connection with optimizations"""
-        try:
-            # Create connection with optimizations
-            conn = sqlite3.connect(
-                self.db_path,
-                timeout=self.config.connection_timeout,
-                check_same_thread=False,
-                isolation_level=None  # Autocommit mode for better performance
-            )
-            
-            # Apply SQLite optimizations
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for better concurrency
-            conn.execute("PRAGMA synchronous = NORMAL")  # Balance safety and performance
-            conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-            conn.execute("PRAGMA temp_store = MEMORY")  # Store temp tables in memory
-            conn.execute("PRAGMA mmap_size = 268435456")  # 256MB memory-mapped I/O
-            
-            conn.row_factory = sqlite3.Row
-            
-            pooled_conn = SQLitePooledConnection(connection=conn)
-            
-            with self._lock:
-                self._metrics.connections_created += 1
-                self._metrics.total_connections += 1
-            
-            self.logger.debug(f"Created new SQLite connection. Total: {self._metrics.total_connections}")
-            return pooled_conn
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create SQLite connection: {e}")
-            return None
-    
+
+    @abstractmethod
+    def _create_connection(self):
+        """Create a new pooled connection, or None on failure"""
+        pass
+
     @asynccontextmanager
-    async def get_connection(self):
-        """Get a connection from the pool (async context manager)"""
+    async def get_connection(self, timeout: Optional[float] = None):
+        """
+        Get a connection from the pool (async context manager).
+
+        Args:
+            timeout: Checkout deadline in seconds (defaults to config.connection_timeout)
+
+        Raises:
+            TimeoutError: If no connection was returned to the pool before the deadline
+        """
         start_time = time.time()
-        connection = None
-        
+        connection = await self._acquire(self.config.connection_timeout if timeout is None else timeout)
+
         try:
-            # Try to get connection from pool
-            try:
-                connection = self._pool.get_nowait()
-                with self._lock:
-                    self._metrics.pool_hits += 1
-                    self._metrics.active_connections += 1
-                    self._metrics.idle_connections = max(0, self._metrics.idle_connections - 1)
-            except Empty:
-                # Pool is empty, create new connection if under limit
-                with self._lock:
-                    if self._metrics.total_connections < self.config.max_connections:
-                        connection = self._create_connection()
-                        if connection:
-                            self._all_connections.append(connection)
-                            self._metrics.pool_misses += 1
-                            self._metrics.active_connections += 1
-                    else:
-                        # Wait for a connection to become available
-                        await asyncio.sleep(0.01)  # Brief yield
-                        connection = await asyncio.get_event_loop().run_in_executor(
-                            None, self._pool.get, True, self.config.connection_timeout
-                        )
-                        with self._lock:
-                            self._metrics.pool_hits += 1
-                            self._metrics.active_connections += 1
-                            self._metrics.idle_connections = max(0, self._metrics.idle_connections - 1)
-            
-            if not connection:
-                raise Exception("Could not obtain database connection")
-            
-            # Health check the connection
-            if not connection.is_healthy():
-                self.logger.warning("Retrieved unhealthy connection, creating new one")
-                self._remove_connection(connection)
-                connection = self._create_connection()
-                if connection:
-                    self._all_connections.append(connection)
-                else:
-                    raise Exception("Could not create healthy database connection")
-            
             connection_time = time.time() - start_time
             with self._lock:
                 self._metrics.avg_connection_time = (
@@ -220,30 +221,169 @@ class SQLiteConnectionPool:
                     (self._metrics.query_count + 1)
                 )
                 self._metrics.query_count += 1
-            
+
             yield connection
-            
+
+        except Exception:
+            # The failure may have broken the connection; validate it at next checkout
+            self._health_cache.invalidate(connection.connection_id)
+            raise
         finally:
-            # Return connection to pool
-            if connection:
+            self._release(connection)
+
+    async def _acquire(self, timeout: float):
+        """Check out an idle or new connection, or wait in line for a returned one"""
+        wait_start = time.monotonic()
+        waiter = None
+
+        with self._lock:
+            connection = self._take_idle()
+            if connection is None:
+                if self._metrics.total_connections < self.config.max_connections:
+                    connection = self._open_connection()
+                    if connection is None:
+                        raise Exception(f"Could not obtain {self.POOL_NAME} connection")
+                else:
+                    loop = asyncio.get_running_loop()
+                    waiter = loop.create_future()
+                    self._waiters.append((loop, waiter))
+                    self._metrics.waiting_acquirers += 1
+
+        if waiter is not None:
+            connection = await self._wait_for_connection(waiter, wait_start, timeout)
+
+        if self.validate_on_checkout and not self._is_healthy(connection):
+            self.logger.warning("Retrieved unhealthy connection, creating new one")
+            self._remove_connection(connection)
+            with self._lock:
+                connection = self._open_connection()
+            if connection is None:
+                raise Exception(f"Could not create healthy {self.POOL_NAME} connection")
+
+        return connection
+
+    def _take_idle(self):
+        """Pop an idle connection without blocking (caller holds the lock)"""
+        try:
+            connection = self._pool.get_nowait()
+        except Empty:
+            return None
+        self._metrics.pool_hits += 1
+        self._metrics.active_connections += 1
+        self._metrics.idle_connections = max(0, self._metrics.idle_connections - 1)
+        return connection
+
+    def _open_connection(self):
+        """Create a connection that is checked out immediately (caller holds the lock)"""
+        connection = self._create_connection()
+        if connection:
+            self._all_connections.append(connection)
+            self._metrics.pool_misses += 1
+            self._metrics.active_connections += 1
+        return connection
+
+    async def _wait_for_connection(self, waiter: asyncio.Future, wait_start: float, timeout: float):
+        """Wait until a returned connection is handed to this waiter, or the deadline passes"""
+        try:
+            await asyncio.wait({waiter}, timeout=max(0.0, timeout - (time.monotonic() - wait_start)))
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        wait_time = time.monotonic() - wait_start
+        if not waiter.done():
+            self._abandon(waiter)
+            with self._lock:
+                self._metrics.record_wait(wait_time, timed_out=True)
+            raise TimeoutError(f"Timed out after {timeout}s waiting for a {self.POOL_NAME} connection")
+
+        connection = waiter.result()
+        with self._lock:
+            self._metrics.record_wait(wait_time)
+            self._metrics.pool_hits += 1
+        return connection
+
+    def _abandon(self, waiter: asyncio.Future):
+        """Leave the wait line; a connection handed over meanwhile goes back to the pool"""
+        with self._lock:
+            self._metrics.waiting_acquirers = max(0, self._metrics.waiting_acquirers - 1)
+            self._waiters = deque(entry for entry in self._waiters if entry[1] is not waiter)
+
+        if waiter.done() and not waiter.cancelled():
+            self._release(waiter.result())
+        else:
+            waiter.cancel()
+
+    def _release(self, connection):
+        """Return a connection: hand it to the oldest waiter, else back to the idle queue"""
+        if self._shutdown or connection.is_idle_expired:
+            self._remove_connection(connection)
+            self._serve_waiters()
+            return
+
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                if waiter.done():
+                    continue
                 try:
-                    # Only return healthy connections to pool
-                    if connection.is_healthy() and not connection.is_idle_expired:
-                        self._pool.put_nowait(connection)
-                        with self._lock:
-                            self._metrics.active_connections = max(0, self._metrics.active_connections - 1)
-                            self._metrics.idle_connections += 1
-                    else:
-                        # Remove expired or unhealthy connections
-                        self._remove_connection(connection)
-                except Full:
-                    # Pool is full, close connection
-                    self._remove_connection(connection)
-    
-    def _remove_connection(self, connection: SQLitePooledConnection):
+                    loop.call_soon_threadsafe(self._deliver, waiter, connection)
+                except RuntimeError:
+                    continue  # The waiter's event loop is closed
+                self._metrics.waiting_acquirers = max(0, self._metrics.waiting_acquirers - 1)
+                return
+
+            try:
+                self._pool.put_nowait(connection)
+                self._metrics.active_connections = max(0, self._metrics.active_connections - 1)
+                self._metrics.idle_connections += 1
+                return
+            except Full:
+                pass
+
+        # Pool is full, close connection
+        self._remove_connection(connection)
+
+    def _deliver(self, waiter: asyncio.Future, connection):
+        """Complete a waiter on its own loop (re-release if it gave up in the meantime)"""
+        if waiter.done():
+            self._release(connection)
+        else:
+            waiter.set_result(connection)
+
+    def _serve_waiters(self):
+        """Open a connection for the oldest waiter after a connection was removed"""
+        with self._lock:
+            if self._shutdown or not any(not waiter.done() for _, waiter in self._waiters):
+                return
+            if self._metrics.total_connections >= self.config.max_connections:
+                return
+            connection = self._open_connection()
+
+        if connection:
+            self._release(connection)
+
+    def _is_healthy(self, connection) -> bool:
+        """Cached health check; the connection is only queried when its result expired"""
+        result = self._health_cache.get(connection.connection_id)
+        if result is None:
+            result = self._record_health(connection, connection.is_healthy())
+        return result.is_valid
+
+    def _record_health(self, connection, healthy: bool) -> ValidationResult:
+        """Cache a health check result and count failures"""
+        result = ValidationResult.success() if healthy else ValidationResult.failure("Connection health check failed")
+        self._health_cache.set(connection.connection_id, result)
+        if not healthy:
+            with self._lock:
+                self._metrics.health_check_failures += 1
+        return result
+
+    def _remove_connection(self, connection):
         """Remove and close a connection"""
         try:
             connection.close()
+            self._health_cache.invalidate(connection.connection_id)
             with self._lock:
                 if connection in self._all_connections:
                     self._all_connections.remove(connection)
@@ -251,120 +391,80 @@ class SQLiteConnectionPool:
                 self._metrics.total_connections = max(0, self._metrics.total_connections - 1)
                 self._metrics.active_connections = max(0, self._metrics.active_connections - 1)
         except Exception as e:
-            self.logger.error(f"Error removing connection: {e}")
-    
+            self.logger.error(f"Error removing {self.POOL_NAME} connection: {e}")
+
     async def start_background_tasks(self):
         """Start background health monitoring and cleanup tasks"""
         if not self._health_monitor_task:
             self._health_monitor_task = asyncio.create_task(self._health_monitor())
         if not self._cleanup_task:
             self._cleanup_task = asyncio.create_task(self._cleanup_expired_connections())
-    
+
     async def _health_monitor(self):
-        """Background task to monitor connection health"""
+        """Background task to check connections whose cached health result expired"""
         while not self._shutdown:
             try:
                 with self._lock:
-                    unhealthy_connections = []
-                    for conn in self._all_connections:
-                        if not conn.is_healthy():
-                            unhealthy_connections.append(conn)
-                            self._metrics.health_check_failures += 1
-                
+                    connections = [
+                        conn for conn in self._all_connections
+                        if self._health_cache.get(conn.connection_id) is None
+                    ]
+
+                # Run the checks concurrently off the loop (Supabase checks are HTTP calls)
+                loop = asyncio.get_running_loop()
+                healthy = await asyncio.gather(*[
+                    loop.run_in_executor(self._executor, conn.is_healthy) for conn in connections
+                ])
+                unhealthy_connections = [
+                    conn for conn, ok in zip(connections, healthy)
+                    if not self._record_health(conn, ok).is_valid
+                ]
+
                 # Remove unhealthy connections
                 for conn in unhealthy_connections:
                     self._remove_connection(conn)
-                
+
                 # Ensure minimum connections
                 with self._lock:
                     needed = self.config.min_connections - self._metrics.total_connections
-                    
+
                 for _ in range(needed):
                     conn = self._create_connection()
                     if conn:
-                        self._all_connections.append(conn)
-                        try:
-                            self._pool.put_nowait(conn)
-                            with self._lock:
-                                self._metrics.idle_connections += 1
-                        except Full:
-                            pass  # Pool is full
-                
+                        with self._lock:
+                            self._all_connections.append(conn)
+                            self._metrics.active_connections += 1
+                        self._release(conn)
+
+                self._serve_waiters()
+
                 await asyncio.sleep(self.config.health_check_interval)
-                
+
             except Exception as e:
-                self.logger.error(f"Error in health monitor: {e}")
+                self.logger.error(f"Error in {self.POOL_NAME} health monitor: {e}")
                 await asyncio.sleep(5)
-    
+
+    @abstractmethod
     async def _cleanup_expired_connections(self):
         """Background task to clean up expired idle connections"""
-        while not self._shutdown:
-            try:
-                with self._lock:
-                    expired_connections = []
-                    for conn in self._all_connections:
-                        if conn.is_idle_expired and self._metrics.total_connections > self.config.min_connections:
-                            expired_connections.append(conn)
-                
-                # Remove expired connections
-                for conn in expired_connections:
-                    # Try to remove from pool queue (best effort)
-                    temp_connections = []
-                    while True:
-                        try:
-                            pool_conn = self._pool.get_nowait()
-                            if pool_conn != conn:
-                                temp_connections.append(pool_conn)
-                            else:
-                                with self._lock:
-                                    self._metrics.idle_connections = max(0, self._metrics.idle_connections - 1)
-                                break
-                        except Empty:
-                            break
-                    
-                    # Put back other connections
-                    for pool_conn in temp_connections:
-                        try:
-                            self._pool.put_nowait(pool_conn)
-                        except Full:
-                            pass
-                    
-                    self._remove_connection(conn)
-                
-                await asyncio.sleep(60)  # Check every minute
-                
-            except Exception as e:
-                self.logger.error(f"Error in cleanup task: {e}")
-                await asyncio.sleep(5)
-    
+        pass
+
     def get_metrics(self) -> PoolMetrics:
         """Get current pool metrics"""
         with self._lock:
             # Update current connection counts
             self._metrics.idle_connections = self._pool.qsize()
-            return PoolMetrics(
-                total_connections=self._metrics.total_connections,
-                active_connections=self._metrics.active_connections,
-                idle_connections=self._metrics.idle_connections,
-                connections_created=self._metrics.connections_created,
-                connections_closed=self._metrics.connections_closed,
-                pool_hits=self._metrics.pool_hits,
-                pool_misses=self._metrics.pool_misses,
-                health_check_failures=self._metrics.health_check_failures,
-                query_count=self._metrics.query_count,
-                avg_connection_time=self._metrics.avg_connection_time,
-                last_reset=self._metrics.last_reset
-            )
-    
+            return replace(self._metrics, wait_histogram=list(self._metrics.wait_histogram))
+
     def reset_metrics(self):
         """Reset performance metrics"""
         with self._lock:
             self._metrics.reset()
-    
+
     async def close(self):
         """Close all connections and shut down the pool"""
         self._shutdown = True
-        
+
         # Cancel background tasks
         if self._health_monitor_task:
             self._health_monitor_task.cancel()
@@ -372,32 +472,136 @@ class SQLiteConnectionPool:
                 await self._health_monitor_task
             except asyncio.CancelledError:
                 pass
-        
+
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
                 await self._cleanup_task
             except asyncio.CancelledError:
                 pass
-        
+
         # Close all connections
         with self._lock:
             connections_to_close = self._all_connections.copy()
             self._all_connections.clear()
-            
+            waiters, self._waiters = self._waiters, deque()
+
             # Empty the pool queue
             while not self._pool.empty():
                 try:
                     self._pool.get_nowait()
                 except Empty:
                     break
-        
+
+        # Fail checkouts still waiting for a connection
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(self._fail_waiter, waiter)
+            except RuntimeError:
+                pass
+
         for conn in connections_to_close:
             try:
                 conn.close()
             except Exception as e:
-                self.logger.error(f"Error closing connection: {e}")
-        
+                self.logger.error(f"Error closing {self.POOL_NAME} connection: {e}")
+
+    def _fail_waiter(self, waiter: asyncio.Future):
+        """Wake a waiter with an error because the pool closed"""
+        if not waiter.done():
+            waiter.set_exception(RuntimeError(f"{self.POOL_NAME} connection pool closed"))
+
+
+class SQLiteConnectionPool(AsyncConnectionPool):
+    """High-performance SQLite connection pool with health monitoring"""
+
+    POOL_NAME = "SQLite"
+
+    def __init__(self, db_path: str, config: ConnectionPoolConfig):
+        self.db_path = db_path
+        super().__init__(config, "sqlite_pool")
+
+        # Initialize minimum connections
+        self._initialize_pool()
+
+    def _create_connection(self) -> Optional[SQLitePooledConnection]:
+        """Create a new SQLite connection with optimizations"""
+        try:
+            # Create connection with optimizations
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.config.connection_timeout,
+                check_same_thread=False,
+                isolation_level=None  # Autocommit mode for better performance
+            )
+
+            # Apply SQLite optimizations
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging for better concurrency
+            conn.execute("PRAGMA synchronous = NORMAL")  # Balance safety and performance
+            conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
+            conn.execute("PRAGMA temp_store = MEMORY")  # Store temp tables in memory
+            conn.execute("PRAGMA mmap_size = 268435456")  # 256MB memory-mapped I/O
+
+            conn.row_factory = sqlite3.Row
+
+            pooled_conn = SQLitePooledConnection(connection=conn)
+
+            with self._lock:
+                self._metrics.connections_created += 1
+                self._metrics.total_connections += 1
+
+            self.logger.debug(f"Created new SQLite connection. Total: {self._metrics.total_connections}")
+            return pooled_conn
+
+        except Exception as e:
+            self.logger.error(f"Failed to create SQLite connection: {e}")
+            return None
+
+    async def _cleanup_expired_connections(self):
+        """Background task to clean up expired idle connections"""
+        while not self._shutdown:
+            try:
+                with self._lock:
+                    expired_connections = []
+                    for conn in self._all_connections:
+                        if conn.is_idle_expired and self._metrics.total_connections > self.config.min_connections:
+                            expired_connections.append(conn)
+
+                # Remove expired connections
+                for conn in expired_connections:
+                    # Try to remove from pool queue (best effort)
+                    temp_connections = []
+                    while True:
+                        try:
+                            pool_conn = self._pool.get_nowait()
+                            if pool_conn != conn:
+                                temp_connections.append(pool_conn)
+                            else:
+                                with self._lock:
+                                    self._metrics.idle_connections = max(0, self._metrics.idle_connections - 1)
+                                break
+                        except Empty:
+                            break
+
+                    # Put back other connections
+                    for pool_conn in temp_connections:
+                        try:
+                            self._pool.put_nowait(pool_conn)
+                        except Full:
+                            pass
+
+                    self._remove_connection(conn)
+
+                await asyncio.sleep(60)  # Check every minute
+
+            except Exception as e:
+                self.logger.error(f"Error in cleanup task: {e}")
+                await asyncio.sleep(5)
+
+    async def close(self):
+        """Close all connections and shut down the pool"""
+        await super().close()
         self.logger.info("SQLite connection pool closed")
 
 
@@ -408,12 +612,13 @@ class SupabasePooledConnection:
     created_at: float = field(default_factory=time.time)
     last_used: float = field(default_factory=time.time)
     use_count: int = 0
-    
+    connection_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
     def execute(self, table: str, operation: str, **kwargs) -> Any:
         """Execute Supabase operation and update metadata"""
         self.last_used = time.time()
         self.use_count += 1
-        
+
         table_ref = self.client.table(table)
         if operation == "select":
             return table_ref.select(kwargs.get("columns", "*"))
@@ -425,12 +630,12 @@ class SupabasePooledConnection:
             return table_ref.delete()
         else:
             raise ValueError(f"Unsupported operation: {operation}")
-    
+
     def close(self) -> None:
         """Close the Supabase client (graceful cleanup)"""
         # Supabase clients don't need explicit closing like DB connections
         pass
-    
+
     def is_healthy(self) -> bool:
         """Check if Supabase client is healthy"""
         try:
@@ -439,181 +644,54 @@ class SupabasePooledConnection:
             return True
         except Exception:
             return False
-    
+
     @property
     def is_idle_expired(self) -> bool:
         """Check if connection has been idle too long"""
         return (time.time() - self.last_used) > 300  # 5 minutes
 
 
-class SupabaseConnectionPool:
+class SupabaseConnectionPool(AsyncConnectionPool):
     """Connection pool for Supabase clients with health monitoring"""
-    
-    def __init__(self, url: str, key: str, config: ConnectionPoolConfig):
+
+    POOL_NAME = "Supabase"
+    # Health checks are HTTP calls; only the background monitor runs them, off the loop
+    validate_on_checkout = False
+
+    def __init__(self, url: str, key: str, config: ConnectionPoolConfig,
+                 executor: Optional[ThreadPoolExecutor] = None):
         self.url = url
         self.key = key
-        self.config = config
-        self.logger = get_logger("supabase_pool")
-        
-        # Connection pool and management
-        self._pool: Queue[SupabasePooledConnection] = Queue(maxsize=config.max_connections)
-        self._all_connections: List[SupabasePooledConnection] = []
-        self._lock = threading.RLock()
-        self._metrics = PoolMetrics()
-        
-        # Health monitoring
-        self._health_monitor_task: Optional[asyncio.Task] = None
-        self._cleanup_task: Optional[asyncio.Task] = None
-        self._shutdown = False
-        
+        super().__init__(config, "supabase_pool")
+
+        # Blocking client calls (health checks) run here, off the event loop
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=config.max_connections, thread_name_prefix="supabase-io"
+        )
+
         # Initialize minimum connections
         self._initialize_pool()
-    
-    def _initialize_pool(self):
-        """Initialize the connection pool with minimum connections"""
-        with self._lock:
-            for _ in range(self.config.min_connections):
-                conn = self._create_connection()
-                if conn:
-                    self._pool.put_nowait(conn)
-                    self._all_connections.append(conn)
-    
+
     def _create_connection(self) -> Optional[SupabasePooledConnection]:
         """Create a new Supabase client connection"""
         try:
             from supabase import create_client
             client = create_client(self.url, self.key)
-            
+
             pooled_conn = SupabasePooledConnection(client=client)
-            
+
             with self._lock:
                 self._metrics.connections_created += 1
                 self._metrics.total_connections += 1
-            
+
             self.logger.debug(f"Created new Supabase connection. Total: {self._metrics.total_connections}")
             return pooled_conn
-            
+
         except Exception as e:
             self.logger.error(f"Failed to create Supabase connection: {e}")
             return None
-    
-    @asynccontextmanager
-    async def get_connection(self):
-        """Get a connection from the pool (async context manager)"""
-        start_time = time.time()
-        connection = None
-        
-        try:
-            # Try to get connection from pool
-            try:
-                connection = self._pool.get_nowait()
-                with self._lock:
-                    self._metrics.pool_hits += 1
-                    self._metrics.active_connections += 1
-                    self._metrics.idle_connections = max(0, self._metrics.idle_connections - 1)
-            except Empty:
-                # Pool is empty, create new connection if under limit
-                with self._lock:
-                    if self._metrics.total_connections < self.config.max_connections:
-                        connection = self._create_connection()
-                        if connection:
-                            self._all_connections.append(connection)
-                            self._metrics.pool_misses += 1
-                            self._metrics.active_connections += 1
-                    else:
-                        # Wait for a connection to become available
-                        await asyncio.sleep(0.01)
-                        connection = await asyncio.get_event_loop().run_in_executor(
-                            None, self._pool.get, True, self.config.connection_timeout
-                        )
-                        with self._lock:
-                            self._metrics.pool_hits += 1
-                            self._metrics.active_connections += 1
-                            self._metrics.idle_connections = max(0, self._metrics.idle_connections - 1)
-            
-            if not connection:
-                raise Exception("Could not obtain Supabase connection")
-            
-            connection_time = time.time() - start_time
-            with self._lock:
-                self._metrics.avg_connection_time = (
-                    (self._metrics.avg_connection_time * self._metrics.query_count + connection_time) /
-                    (self._metrics.query_count + 1)
-                )
-                self._metrics.query_count += 1
-            
-            yield connection
-            
-        finally:
-            # Return connection to pool
-            if connection:
-                try:
-                    if not connection.is_idle_expired:
-                        self._pool.put_nowait(connection)
-                        with self._lock:
-                            self._metrics.active_connections = max(0, self._metrics.active_connections - 1)
-                            self._metrics.idle_connections += 1
-                    else:
-                        self._remove_connection(connection)
-                except Full:
-                    self._remove_connection(connection)
-    
-    def _remove_connection(self, connection: SupabasePooledConnection):
-        """Remove and close a connection"""
-        try:
-            connection.close()
-            with self._lock:
-                if connection in self._all_connections:
-                    self._all_connections.remove(connection)
-                self._metrics.connections_closed += 1
-                self._metrics.total_connections = max(0, self._metrics.total_connections - 1)
-                self._metrics.active_connections = max(0, self._metrics.active_connections - 1)
-        except Exception as e:
-            self.logger.error(f"Error removing Supabase connection: {e}")
-    
-    async def start_background_tasks(self):
-        """Start background health monitoring and cleanup tasks"""
-        if not self._health_monitor_task:
-            self._health_monitor_task = asyncio.create_task(self._health_monitor())
-        if not self._cleanup_task:
-            self._cleanup_task = asyncio.create_task(self._cleanup_expired_connections())
-    
-    async def _health_monitor(self):
-        """Background task to monitor connection health"""
-        while not self._shutdown:
-            try:
-                with self._lock:
-                    unhealthy_connections = []
-                    for conn in self._all_connections:
-                        if not conn.is_healthy():
-                            unhealthy_connections.append(conn)
-                            self._metrics.health_check_failures += 1
-                
-                # Remove unhealthy connections
-                for conn in unhealthy_connections:
-                    self._remove_connection(conn)
-                
-                # Ensure minimum connections
-                with self._lock:
-                    needed = self.config.min_connections - self._metrics.total_connections
-                    
-                for _ in range(needed):
-                    conn = self._create_connection()
-                    if conn:
-                        self._all_connections.append(conn)
-                        try:
-                            self._pool.put_nowait(conn)
-                            with self._lock:
-                                self._metrics.idle_connections += 1
-                        except Full:
-                            pass
-                
-                await asyncio.sleep(self.config.health_check_interval)
-                
-            except Exception as e:
-                self.logger.error(f"Error in Supabase health monitor: {e}")
-                await asyncio.sleep(5)
-    
+
     async def _cleanup_expired_connections(self):
         """Background task to clean up expired idle connections"""
         while not self._shutdown:
@@ -623,71 +701,21 @@ class SupabaseConnectionPool:
                     for conn in self._all_connections:
                         if conn.is_idle_expired and self._metrics.total_connections > self.config.min_connections:
                             expired_connections.append(conn)
-                
+
                 for conn in expired_connections:
                     self._remove_connection(conn)
-                
+
                 await asyncio.sleep(60)
-                
+
             except Exception as e:
                 self.logger.error(f"Error in Supabase cleanup task: {e}")
                 await asyncio.sleep(5)
-    
-    def get_metrics(self) -> PoolMetrics:
-        """Get current pool metrics"""
-        with self._lock:
-            self._metrics.idle_connections = self._pool.qsize()
-            return PoolMetrics(
-                total_connections=self._metrics.total_connections,
-                active_connections=self._metrics.active_connections,
-                idle_connections=self._metrics.idle_connections,
-                connections_created=self._metrics.connections_created,
-                connections_closed=self._metrics.connections_closed,
-                pool_hits=self._metrics.pool_hits,
-                pool_misses=self._metrics.pool_misses,
-                health_check_failures=self._metrics.health_check_failures,
-                query_count=self._metrics.query_count,
-                avg_connection_time=self._metrics.avg_connection_time,
-                last_reset=self._metrics.last_reset
-            )
-    
-    def reset_metrics(self):
-        """Reset performance metrics"""
-        with self._lock:
-            self._metrics.reset()
-    
+
     async def close(self):
         """Close all connections and shut down the pool"""
-        self._shutdown = True
-        
-        if self._health_monitor_task:
-            self._health_monitor_task.cancel()
-            try:
-                await self._health_monitor_task
-            except asyncio.CancelledError:
-                pass
-        
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-        
-        with self._lock:
-            connections_to_close = self._all_connections.copy()
-            self._all_connections.clear()
-            
-            while not self._pool.empty():
-                try:
-                    self._pool.get_nowait()
-                except Empty:
-                    break
-        
-        for conn in connections_to_close:
-            try:
-                conn.close()
-            except Exception as e:
-                self.logger.error(f"Error closing Supabase connection: {e}")
-        
-        self.logger.info("Supabase connection pool closed")
\ No newline at end of file
+        await super().close()
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+        self.logger.info("Supabase connection pool closed")
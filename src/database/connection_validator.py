@@ -399,7 +399,17 @@ class HealthCheckCache:
                 self._cache.popitem(last=False)
             
             self._cache[connection_id] = (time.time(), result)
-    
+
+    def invalidate(self, connection_id: str):
+        """
+        Drop the cached result for a connection so it is re-validated.
+
+        Args:
+            connection_id: Unique identifier for the connection
+        """
+        with self._lock:
+            self._cache.pop(connection_id, None)
+
     def clear(self):
         """Clear all cached results"""
         with self._lock:
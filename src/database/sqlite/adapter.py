@@ -10,6 +10,8 @@ from .connection_manager import SQLiteConnectionManager
 from .query_builder import SQLiteQueryBuilder  
 from .table_manager import SQLiteTableManager
 from .data_operations import SQLiteDataOperations
+from .executor import SQLiteExecutor
+from .analytics_queries import SQLiteAnalyticsQueries
 
 
 class SQLiteAdapter:
@@ -20,10 +22,13 @@ class SQLiteAdapter:
     but uses focused modules for better separation of concerns.
     """
     
+    # sessions/users are keyed by the external identifier itself (plots.session_id references sessions.id)
+    IDENTITY_COLUMNS = {"sessions": "id", "users": "id"}
+    
     def __init__(self, db_path: str = "local_database.db", pool_config=None):
         """Initialize adapter with modular components"""
         self.db_path = db_path
-        self.pool_config = pool_config  # Store pool config for future use
+        self.pool_config = pool_config
         self.logger = get_logger("sqlite_adapter")
         
         # Initialize modular components
@@ -31,11 +36,17 @@ class SQLiteAdapter:
         self.query_builder = SQLiteQueryBuilder()
         self.table_manager = SQLiteTableManager(self.connection_manager)
         self.synchronizer = SchemaSynchronizer(db_path)
+        self.executor = SQLiteExecutor(
+            self.connection_manager,
+            max_readers=pool_config.max_connections if pool_config else 4
+        )
         self.data_operations = SQLiteDataOperations(
             self.connection_manager, 
             self.query_builder, 
-            self.table_manager
+            self.table_manager,
+            executor=self.executor
         )
+        self.analytics = SQLiteAnalyticsQueries(self.connection_manager, self.executor)
         
         # Initialize database schema
         self.table_manager.create_all_tables()
@@ -49,6 +60,10 @@ class SQLiteAdapter:
         """Insert a record into the specified table"""
         return await self.data_operations.insert(table, data)
     
+    async def upsert_returning(self, table: str, data: Dict[str, Any], conflict_column: str) -> Dict[str, Any]:
+        """Insert a record unless conflict_column already matches one, returning the stored row"""
+        return await self.data_operations.upsert_returning(table, data, conflict_column)
+    
     async def select(self, table: str, filters: Optional[Dict[str, Any]] = None,
                     order_by: Optional[str] = None, desc: bool = False,
                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -87,12 +102,34 @@ class SQLiteAdapter:
         """Select multiple records by their IDs"""
         return await self.data_operations.batch_select_by_ids(table, ids)
     
+    async def batch_select_by_column(self, table: str, column: str, values: List[Any]) -> List[Dict[str, Any]]:
+        """Select records whose column matches any of the values"""
+        return await self.data_operations.batch_select_by_column(table, column, values)
+    
     async def batch_update(self, table: str, updates: List[Dict[str, Any]]) -> int:
         """Update multiple records in a batch"""
         return await self.data_operations.batch_update(table, updates)
     
+    # Analytics (aggregated in SQL)
+    
+    async def get_invocation_analytics(self, since: str, agent_name: Optional[str] = None) -> Dict[str, Any]:
+        """Aggregate agent invocations started since an ISO timestamp"""
+        return await self.analytics.invocation_analytics(since, agent_name)
+    
+    async def get_invocation_errors(self, since: str) -> Dict[str, Any]:
+        """Aggregate failed agent invocations started since an ISO timestamp"""
+        return await self.analytics.invocation_errors(since)
+    
+    async def get_score_distribution(self, limit: int = 50) -> Dict[str, Any]:
+        """Aggregate the most recent scores"""
+        return await self.analytics.score_distribution(limit)
+    
     # Specialized operations
     
+    async def get_session_content(self, session_id: str, tables: List[str]) -> List[Dict[str, Any]]:
+        """Get a session's rows from several tables in one query, oldest first"""
+        return await self.data_operations.select_union_by_column(tables, "session_id", session_id)
+    
     async def save_plot(self, plot_data: Dict[str, Any]) -> str:
         """Save a plot record"""
         return await self.data_operations.save_plot(plot_data)
@@ -121,23 +158,26 @@ class SQLiteAdapter:
         """Get plot with its associated author"""
         return await self.data_operations.get_plot_with_author(plot_id)
     
-    async def search_content(self, query: str, content_type: str, user_id: str) -> List[Dict[str, Any]]:
-        """Search content across different content types"""
-        return await self.data_operations.search_content(query, content_type, user_id)
+    async def search_content(self, query: str, content_type: str, user_id: str,
+                             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Full-text search a user's content of one type, best matches first"""
+        return await self.data_operations.search_content(query, content_type, user_id, limit)
     
-    # Pool metrics compatibility (simplified for modular design)
+    # Pool metrics
     
     async def get_pool_metrics(self) -> Dict[str, Any]:
-        """Get simplified pool metrics"""
+        """Get reader pool, write queue and connection metrics"""
+        executor_metrics = self.executor.get_metrics()
         return {
-            "total_operations": 0,  # Could be tracked if needed
-            "active_connections": 1,  # Simplified for current design
-            "adapter_type": "modular_sqlite"
+            "total_operations": executor_metrics["reads_executed"] + executor_metrics["writes_executed"],
+            "active_connections": self.connection_manager.open_connection_count,
+            "adapter_type": "modular_sqlite",
+            **executor_metrics
         }
     
     async def reset_pool_metrics(self):
-        """Reset pool metrics (placeholder)"""
-        pass
+        """Reset pool metrics"""
+        self.executor.reset_metrics()
     
     async def close(self):
         """Close the adapter and all components"""
@@ -0,0 +1,234 @@
+"""
+SQLite Analytics Queries - Aggregations for observability dashboards, computed in SQL.
+
+Time-window filters, GROUP BY agent/tool, nearest-rank percentiles and
+success rates all run inside SQLite and read only the columns they need, so
+payload columns (prompts, raw responses) are never transferred. Each public
+method runs its statements as one job on the reader pool.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ...core.logging import get_logger
+from .connection_manager import SQLiteConnectionManager
+from .executor import SQLiteExecutor
+
+
+# Duration percentiles reported per window and per agent
+DURATION_PERCENTILES: Tuple[Tuple[str, float], ...] = (
+    ("p50_duration_ms", 0.50),
+    ("p95_duration_ms", 0.95),
+    ("p99_duration_ms", 0.99),
+)
+
+# Rows of an invocation that count as failed
+_FAILED = "COALESCE(success, 0) = 0"
+
+
+def nearest_rank(fraction: float, count: int) -> int:
+    """1-based nearest rank of a percentile among `count` sorted values"""
+    return max(1, math.ceil(fraction * count))
+
+
+class SQLiteAnalyticsQueries:
+    """Runs dashboard aggregations over agent_invocations and scores inside SQLite"""
+
+    def __init__(self, connection_manager: SQLiteConnectionManager, executor: SQLiteExecutor):
+        self.connection_manager = connection_manager
+        self.executor = executor
+        self.logger = get_logger("sqlite_analytics_queries")
+
+    @staticmethod
+    def _invocation_window(since: str, agent_name: Optional[str] = None) -> Tuple[str, List[Any]]:
+        """WHERE clause restricting agent_invocations to a time window (and agent)"""
+        where = "start_time >= ?"
+        params: List[Any] = [since]
+        if agent_name:
+            where += " AND agent_name = ?"
+            params.append(agent_name)
+        return where, params
+
+    def _rows(self, query: str, params: Sequence[Any]) -> List[Dict[str, Any]]:
+        """Run one aggregate query on the calling reader thread"""
+        return self.connection_manager.execute_select(query, list(params))
+
+    # Agent invocations
+
+    def _invocation_analytics(self, since: str, agent_name: Optional[str]) -> Dict[str, Any]:
+        where, params = self._invocation_window(since, agent_name)
+
+        # One scan of the covering window index; the unary + stops the planner
+        # from walking the agent_name index (and the wide table rows) instead
+        groups = self._rows(f"""
+            SELECT agent_name, COUNT(*) AS invocations, COALESCE(SUM(success), 0) AS successful,
+                   SUM(NULLIF(duration_ms, 0)) AS duration_total, COUNT(NULLIF(duration_ms, 0)) AS timed,
+                   MIN(NULLIF(duration_ms, 0)) AS min_duration_ms, MAX(NULLIF(duration_ms, 0)) AS max_duration_ms,
+                   COALESCE(SUM(total_tokens), 0) AS total_tokens, COUNT(NULLIF(total_tokens, 0)) AS token_rows,
+                   COALESCE(SUM(cost_estimate), 0) AS total_cost
+            FROM agent_invocations WHERE {where}
+            GROUP BY +agent_name ORDER BY invocations DESC
+        """, params)
+
+        timed_total = sum(group["timed"] for group in groups)
+        summary = {
+            "total": sum(group["invocations"] for group in groups),
+            "successful": sum(group["successful"] for group in groups),
+            "avg_duration_ms": (sum(group["duration_total"] or 0 for group in groups) / timed_total
+                                if timed_total else None),
+            "max_duration_ms": max((g["max_duration_ms"] for g in groups if g["timed"]), default=None),
+            "min_duration_ms": min((g["min_duration_ms"] for g in groups if g["timed"]), default=None),
+            "total_tokens": sum(group["total_tokens"] for group in groups),
+            "avg_tokens": (sum(group["total_tokens"] for group in groups) /
+                           max(1, sum(group["token_rows"] for group in groups))),
+            "total_cost": sum(group["total_cost"] for group in groups),
+        }
+        by_agent = [
+            {
+                "agent_name": group["agent_name"],
+                "invocations": group["invocations"],
+                "successful": group["successful"],
+                "avg_duration_ms": group["duration_total"] / group["timed"] if group["timed"] else None,
+            }
+            for group in groups
+        ]
+        self._fill_percentiles(where, params, summary, by_agent, {g["agent_name"]: g["timed"] for g in groups})
+
+        tool_usage = self._rows(f"""
+            SELECT COALESCE(json_extract(call.value, '$.tool'), 'unknown') AS tool, COUNT(*) AS calls
+            FROM agent_invocations,
+                 json_each(CASE WHEN json_valid(tool_calls) THEN tool_calls ELSE '[]' END) AS call
+            WHERE {where}
+            GROUP BY 1 ORDER BY calls DESC
+        """, params)
+
+        recent_errors = self._rows(f"""
+            SELECT invocation_id, agent_name, error_message, start_time
+            FROM agent_invocations
+            WHERE {where} AND {_FAILED} AND error_message IS NOT NULL
+            ORDER BY start_time DESC LIMIT 20
+        """, params)
+
+        return {
+            "summary": summary,
+            "by_agent": by_agent,
+            "tool_usage": tool_usage,
+            "recent_errors": recent_errors,
+        }
+
+    def _fill_percentiles(self, where: str, params: List[Any], summary: Dict[str, Any],
+                          by_agent: List[Dict[str, Any]], timed: Dict[str, int]):
+        """
+        Add exact nearest-rank duration percentiles to the summary and each agent.
+
+        Ranks are worked out from the per-agent counts, so SQLite only has to
+        number the window's durations once and return the handful of rows at
+        those ranks.
+        """
+        overall_ranks = {
+            name: nearest_rank(fraction, sum(timed.values())) for name, fraction in DURATION_PERCENTILES
+        } if any(timed.values()) else {}
+        agent_ranks = {
+            agent: {name: nearest_rank(fraction, count) for name, fraction in DURATION_PERCENTILES}
+            for agent, count in timed.items() if count
+        }
+
+        rows = []
+        if overall_ranks:
+            wanted_agent = sorted({rank for ranks in agent_ranks.values() for rank in ranks.values()})
+            wanted_overall = sorted(set(overall_ranks.values()))
+            rows = self._rows(f"""
+                WITH ranked AS (
+                    SELECT agent_name, duration_ms,
+                           ROW_NUMBER() OVER (PARTITION BY agent_name ORDER BY duration_ms) AS agent_rank,
+                           ROW_NUMBER() OVER (ORDER BY duration_ms) AS overall_rank
+                    FROM agent_invocations WHERE {where} AND duration_ms > 0
+                )
+                SELECT agent_name, agent_rank, overall_rank, duration_ms FROM ranked
+                WHERE agent_rank IN ({', '.join('?' * len(wanted_agent))})
+                   OR overall_rank IN ({', '.join('?' * len(wanted_overall))})
+            """, params + wanted_agent + wanted_overall)
+
+        by_agent_rank = {(row["agent_name"], row["agent_rank"]): row["duration_ms"] for row in rows}
+        by_overall_rank = {row["overall_rank"]: row["duration_ms"] for row in rows}
+        for name, _ in DURATION_PERCENTILES:
+            summary[name] = by_overall_rank.get(overall_ranks.get(name))
+        for agent in by_agent:
+            ranks = agent_ranks.get(agent["agent_name"], {})
+            for name, _ in DURATION_PERCENTILES:
+                agent[name] = by_agent_rank.get((agent["agent_name"], ranks.get(name)))
+
+    async def invocation_analytics(self, since: str, agent_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Aggregate agent invocations started at or after `since` (ISO timestamp).
+
+        Returns {'summary', 'by_agent', 'tool_usage', 'recent_errors'}; summary and
+        by_agent rows carry counts, success totals, average and percentile durations.
+        """
+        try:
+            return await self.executor.read(self._invocation_analytics, since, agent_name)
+        except Exception as e:
+            self.logger.error(f"Error aggregating invocation analytics: {e}")
+            raise
+
+    def _invocation_errors(self, since: str) -> Dict[str, Any]:
+        where, params = self._invocation_window(since)
+        where += f" AND {_FAILED}"
+
+        total = self._rows(f"SELECT COUNT(*) AS total FROM agent_invocations WHERE {where}", params)[0]["total"]
+        patterns = self._rows(f"""
+            SELECT COALESCE(error_message, 'Unknown error') AS error_message, COUNT(*) AS count
+            FROM agent_invocations WHERE {where}
+            GROUP BY 1 ORDER BY count DESC LIMIT 10
+        """, params)
+        by_agent = self._rows(f"""
+            SELECT agent_name, COUNT(*) AS count
+            FROM agent_invocations WHERE {where}
+            GROUP BY agent_name ORDER BY count DESC
+        """, params)
+        recent = self._rows(f"""
+            SELECT invocation_id, agent_name, error_message, start_time,
+                   CASE WHEN length(request_content) > 100
+                        THEN substr(request_content, 1, 100) || '...'
+                        ELSE request_content END AS request_preview
+            FROM agent_invocations WHERE {where}
+            ORDER BY start_time DESC LIMIT 20
+        """, params)
+
+        return {"total": total, "patterns": patterns, "by_agent": by_agent, "recent": recent}
+
+    async def invocation_errors(self, since: str) -> Dict[str, Any]:
+        """
+        Aggregate failed agent invocations started at or after `since` (ISO timestamp).
+
+        Returns {'total', 'patterns', 'by_agent', 'recent'}; recent rows carry a
+        100-character request preview instead of the full request.
+        """
+        try:
+            return await self.executor.read(self._invocation_errors, since)
+        except Exception as e:
+            self.logger.error(f"Error aggregating invocation errors: {e}")
+            raise
+
+    # Scores
+
+    def _score_distribution(self, limit: int) -> Dict[str, Any]:
+        return self._rows("""
+            SELECT COUNT(*) AS total, AVG(overall_score) AS average,
+                   MIN(overall_score) AS min, MAX(overall_score) AS max,
+                   COALESCE(SUM(overall_score >= 8.0), 0) AS high,
+                   COALESCE(SUM(overall_score >= 6.0 AND overall_score < 8.0), 0) AS medium,
+                   COALESCE(SUM(overall_score < 6.0), 0) AS low
+            FROM (
+                SELECT COALESCE(overall_score, 0.0) AS overall_score
+                FROM scores ORDER BY created_at DESC LIMIT ?
+            )
+        """, [int(limit)])[0]
+
+    async def score_distribution(self, limit: int = 50) -> Dict[str, Any]:
+        """Count, average, range and quality bands of the most recent `limit` scores"""
+        try:
+            return await self.executor.read(self._score_distribution, limit)
+        except Exception as e:
+            self.logger.error(f"Error aggregating score distribution: {e}")
+            raise
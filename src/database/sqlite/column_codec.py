@@ -0,0 +1,246 @@
+"""
+SQLite Column Codec - Schema-aware JSON encoding and decoding of column values.
+
+JSON columns are declared per table in JSON_COLUMNS (schema_manager.py) and
+checked against the live schema once per table, so reads only decode columns
+that are known to hold JSON instead of sniffing every string value. Columns
+declared with a JSON type affinity in migrations are picked up as well.
+"""
+
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from ...core.logging import get_logger
+from .connection_manager import SQLiteConnectionManager
+from .schema_manager import JSON_COLUMNS
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Timestamp column filled in on insert, in order of preference
+TIMESTAMP_COLUMNS = ("created_at", "start_time", "timestamp")
+
+
+def dumps(value: Any) -> str:
+    """Serialize a value to a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value)
+
+
+def loads(value: str) -> Any:
+    """Parse a JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+_DECODE_ERRORS: Tuple[type, ...] = (ValueError, TypeError)
+if orjson is not None:
+    _DECODE_ERRORS += (orjson.JSONDecodeError,)
+
+
+def decode_value(value: Any) -> Any:
+    """Decode a stored JSON column value, leaving non-JSON text untouched"""
+    if not isinstance(value, (str, bytes)) or not value:
+        return value
+    try:
+        return loads(value)
+    except _DECODE_ERRORS:
+        return value
+
+
+class LazyJSONRow(dict):
+    """
+    Row whose JSON columns are decoded on first access.
+
+    Behaves like a plain dict for callers: item access, get(), items(), values(),
+    dict(row) and equality all see decoded values. Columns that are never read
+    are never parsed.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self, row: Mapping[str, Any], pending: Iterable[str]):
+        super().__init__(row)
+        self._pending = set(pending)
+
+    def _decode(self, key: Any):
+        """Decode one pending column in place"""
+        if key in self._pending:
+            self._pending.discard(key)
+            dict.__setitem__(self, key, decode_value(dict.__getitem__(self, key)))
+
+    def _decode_all(self):
+        """Decode every pending column in place"""
+        for key in list(self._pending):
+            self._decode(key)
+
+    def __getitem__(self, key):
+        self._decode(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self._pending.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._pending.discard(key)
+        dict.__delitem__(self, key)
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(row) and {**row} go through __getitem__
+        return iter(dict.keys(self))
+
+    def __eq__(self, other):
+        self._decode_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._decode_all()
+        return dict.__repr__(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *default):
+        self._decode(key)
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        self._decode(key)
+        return dict.setdefault(self, key, default)
+
+    def items(self):
+        self._decode_all()
+        return dict.items(self)
+
+    def values(self):
+        self._decode_all()
+        return dict.values(self)
+
+    def copy(self):
+        self._decode_all()
+        return dict(dict.items(self))
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+
+class SQLiteColumnCodec:
+    """Encodes row values for storage and decodes JSON columns read back"""
+
+    def __init__(self, connection_manager: SQLiteConnectionManager,
+                 json_columns: Optional[Mapping[str, Iterable[str]]] = None,
+                 lazy: bool = False):
+        """
+        Initialize the codec.
+
+        Args:
+            connection_manager: Used to introspect table columns (PRAGMA table_info)
+            json_columns: Declared JSON columns per table (defaults to JSON_COLUMNS)
+            lazy: Return LazyJSONRow rows that decode JSON columns on first access
+        """
+        self.connection_manager = connection_manager
+        self.lazy = lazy
+        self.logger = get_logger("sqlite_column_codec")
+
+        declared = JSON_COLUMNS if json_columns is None else json_columns
+        self._declared = {table: frozenset(columns) for table, columns in declared.items()}
+        # table -> (all columns, JSON columns); filled from the live schema on first use
+        self._schemas: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self._lock = threading.Lock()
+
+    # Schema introspection
+
+    def _load_schema(self, table: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Get (columns, JSON columns) for a table, introspecting it once"""
+        schema = self._schemas.get(table)
+        if schema is not None:
+            return schema
+
+        info = self.connection_manager.execute_select(f"PRAGMA table_info({table})")
+        columns = frozenset(row["name"] for row in info)
+        typed_json = frozenset(
+            row["name"] for row in info if "JSON" in (row["type"] or "").upper()
+        )
+        json_columns = (self._declared.get(table, frozenset()) & columns) | typed_json
+        schema = (columns, json_columns)
+
+        # Missing tables are not cached so they are picked up once created
+        if columns:
+            with self._lock:
+                self._schemas[table] = schema
+        return schema
+
+    def columns(self, table: str) -> FrozenSet[str]:
+        """Get the column names of a table"""
+        return self._load_schema(table)[0]
+
+    def json_columns(self, table: str) -> FrozenSet[str]:
+        """Get the columns of a table that hold JSON documents"""
+        return self._load_schema(table)[1]
+
+    def timestamp_column(self, table: str) -> Optional[str]:
+        """Get the column stamped with the current time on insert, if any"""
+        columns = self.columns(table)
+        for column in TIMESTAMP_COLUMNS:
+            if column in columns:
+                return column
+        return None
+
+    def invalidate(self, table: Optional[str] = None):
+        """Forget cached schema for one table (or all tables) after a migration"""
+        with self._lock:
+            if table is None:
+                self._schemas.clear()
+            else:
+                self._schemas.pop(table, None)
+
+    # Encoding
+
+    def encode(self, data: Mapping[str, Any]) -> Dict[str, Any]:
+        """Serialize dict/list values so they can be bound as SQLite parameters"""
+        return {
+            key: dumps(value) if isinstance(value, (dict, list)) else value
+            for key, value in data.items()
+        }
+
+    def prepare_insert(self, table: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in the timestamp column if missing and encode values for insert"""
+        column = self.timestamp_column(table)
+        if column and column not in data:
+            data[column] = datetime.utcnow().isoformat()
+        return self.encode(data)
+
+    # Decoding
+
+    def decode_rows(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Decode the JSON columns of rows selected from a table"""
+        json_columns = self.json_columns(table)
+        if not json_columns or not rows:
+            return rows
+
+        present = [column for column in json_columns if column in rows[0]]
+        if not present:
+            return rows
+
+        if self.lazy:
+            return [LazyJSONRow(row, present) for row in rows]
+
+        for row in rows:
+            for column in present:
+                row[column] = decode_value(row[column])
+        return rows
@@ -1,9 +1,13 @@
 """
 SQLite Connection Manager - Handles database connections and basic operations.
 Extracted from SQLiteAdapter for better modularity.
+
+Query helpers reuse one long-lived connection per thread instead of opening a
+new connection (and re-running the PRAGMA setup) for every statement.
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -11,118 +15,166 @@ from pathlib import Path
 from ...core.logging import get_logger
 
 
+# Connection-level tuning applied to every connection we open.
+# Mirrors the settings used by SQLiteConnectionPool in connection_pool.py.
+SQLITE_PRAGMAS = (
+    ("foreign_keys", "ON"),
+    ("synchronous", "NORMAL"),  # Safe with WAL, avoids an fsync per commit
+    ("cache_size", "-64000"),  # 64MB page cache
+    ("temp_store", "MEMORY"),
+    ("mmap_size", "268435456"),  # 256MB memory-mapped I/O
+)
+
+
 class SQLiteConnectionManager:
     """Manages SQLite database connections and basic operations"""
-    
-    def __init__(self, db_path: str):
+
+    def __init__(self, db_path: str, busy_timeout: float = 30.0):
         """Initialize connection manager with database path"""
         self.db_path = db_path
+        self.busy_timeout = busy_timeout
         self.logger = get_logger("sqlite_connection_manager")
+
+        # Thread-affine connection cache: each worker thread keeps its own
+        # connection, all of them are tracked so close() can release them.
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
         self._initialize_database()
-    
+
     def _initialize_database(self):
-        """Initialize SQLite database file and enable foreign keys"""
+        """Initialize SQLite database file, enable WAL mode and foreign keys"""
         try:
             # Ensure directory exists
             Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-            
+
             # Create database file if it doesn't exist
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 # Enable foreign keys
                 cursor.execute("PRAGMA foreign_keys = ON")
+                # WAL is persistent for the database file, so set it once here.
+                # Readers no longer block the writer (and vice versa).
+                cursor.execute("PRAGMA journal_mode = WAL")
                 conn.commit()
-            
+
             self.logger.info(f"SQLite database initialized at {self.db_path}")
         except Exception as e:
             self.logger.error(f"Failed to initialize SQLite database: {e}")
             raise
-    
-    def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with proper configuration"""
-        conn = sqlite3.connect(self.db_path)
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open a new connection with row factory and tuning pragmas applied"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            check_same_thread=False  # Only its owner thread uses it; close() may run elsewhere
+        )
         conn.row_factory = sqlite3.Row
-        
-        # Enable foreign keys for this connection
+
         cursor = conn.cursor()
-        cursor.execute("PRAGMA foreign_keys = ON")
-        
+        for pragma, value in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+        cursor.close()
+
+        return conn
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Get a new database connection with proper configuration.
+
+        The caller owns the returned connection and is responsible for closing it.
+        Query helpers on this class use the per-thread cached connection instead.
+        """
+        return self._create_connection()
+
+    def _get_thread_connection(self) -> sqlite3.Connection:
+        """Get the calling thread's cached connection, opening it on first use"""
+        conn = getattr(self._local, "connection", None)
+        if conn is None:
+            conn = self._create_connection()
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
+            self.logger.debug(
+                f"Opened SQLite connection for thread {threading.get_ident()}. "
+                f"Total: {len(self._connections)}"
+            )
         return conn
-    
+
+    @property
+    def open_connection_count(self) -> int:
+        """Number of cached per-thread connections currently open"""
+        with self._lock:
+            return len(self._connections)
+
     @contextmanager
     def transaction(self):
         """Context manager for database transactions"""
-        conn = self.get_connection()
+        conn = self._get_thread_connection()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
-            conn.close()
-    
+
     def execute_query(self, query: str, params: Optional[List[Any]] = None) -> None:
         """Execute a query that doesn't return results (INSERT, UPDATE, DELETE)"""
-        if params is None:
-            params = []
-        
-        conn = self.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-        finally:
-            conn.close()
-    
+        self.execute_query_with_rowcount(query, params)
+
     def execute_query_with_rowcount(self, query: str, params: Optional[List[Any]] = None) -> int:
         """Execute a query and return the number of affected rows"""
         if params is None:
             params = []
-        
-        conn = self.get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
+
+        with self.transaction() as conn:
+            cursor = conn.execute(query, params)
             rowcount = cursor.rowcount
-            conn.commit()
+            cursor.close()
             return rowcount
-        finally:
-            conn.close()
-    
+
     def execute_select(self, query: str, params: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
         """Execute a SELECT query and return results as list of dictionaries"""
         if params is None:
             params = []
-        
-        conn = self.get_connection()
+
+        conn = self._get_thread_connection()
+        cursor = conn.execute(query, params)
         try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
             rows = cursor.fetchall()
-            
-            # Convert Row objects to dictionaries
-            return [dict(row) for row in rows]
         finally:
-            conn.close()
-    
+            cursor.close()
+
+        # Convert Row objects to dictionaries
+        return [dict(row) for row in rows]
+
     def execute_count(self, query: str, params: Optional[List[Any]] = None) -> int:
         """Execute a COUNT query and return the count value"""
         if params is None:
             params = []
-        
-        conn = self.get_connection()
+
+        conn = self._get_thread_connection()
+        cursor = conn.execute(query, params)
         try:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
             result = cursor.fetchone()
-            return result[0] if result else 0
         finally:
-            conn.close()
-    
+            cursor.close()
+        return result[0] if result else 0
+
     def close(self):
-        """Close connection manager (placeholder for future cleanup)"""
-        # Currently no persistent connections to close
-        # This method exists for interface compatibility
-        pass
\ No newline at end of file
+        """Close all cached per-thread connections"""
+        with self._lock:
+            connections = self._connections
+            self._connections = []
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Error closing SQLite connection: {e}")
+
+        # Threads re-open lazily if the manager is used again after close()
+        self._local = threading.local()
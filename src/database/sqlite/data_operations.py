@@ -4,14 +4,15 @@ Extracted from SQLiteAdapter for better modularity.
 """
 
 import asyncio
-import json
 import uuid
-from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 from ...core.logging import get_logger
+from .column_codec import SQLiteColumnCodec, loads
 from .connection_manager import SQLiteConnectionManager
+from .executor import SQLiteExecutor
 from .query_builder import SQLiteQueryBuilder
+from .schema_manager import FTS_TABLES
 from .table_manager import SQLiteTableManager
 
 
@@ -19,27 +20,23 @@ class SQLiteDataOperations:
     """High-level data operations for SQLite database"""
     
     def __init__(self, connection_manager: SQLiteConnectionManager, 
-                 query_builder: SQLiteQueryBuilder, table_manager: SQLiteTableManager):
+                 query_builder: SQLiteQueryBuilder, table_manager: SQLiteTableManager,
+                 executor: Optional[SQLiteExecutor] = None,
+                 codec: Optional[SQLiteColumnCodec] = None):
         """Initialize data operations with dependencies"""
         self.connection_manager = connection_manager
         self.query_builder = query_builder
         self.table_manager = table_manager
+        # Reads go to a dedicated reader pool, writes to the single batching writer
+        self.executor = executor or SQLiteExecutor(connection_manager)
+        # Encodes values on write and decodes the schema's JSON columns on read
+        self.codec = codec or SQLiteColumnCodec(connection_manager)
         self.logger = get_logger("sqlite_data_operations")
     
-    def _serialize_json(self, data: Any) -> str:
-        """Serialize data to JSON string for storage"""
-        if isinstance(data, (dict, list)):
-            return json.dumps(data)
-        return str(data)
-    
-    def _deserialize_json(self, data: str) -> Any:
-        """Deserialize JSON string from storage"""
-        if not data:
-            return None
-        try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return data
+    def _select_rows(self, table: str, query: str, params: Optional[List[Any]] = None) -> List[Dict[str, Any]]:
+        """Run a SELECT against a table and decode its JSON columns (runs on the reader pool)"""
+        results = self.connection_manager.execute_select(query, params)
+        return self.codec.decode_rows(table, results)
     
     async def insert(self, table: str, data: Dict[str, Any]) -> str:
         """Insert a record into the specified table"""
@@ -48,52 +45,14 @@ class SQLiteDataOperations:
             if 'id' not in data:
                 data['id'] = str(uuid.uuid4())
             
-            # Add timestamp if not provided and table has created_at column
-            table_schemas = {
-                'users': True, 'authors': True, 'plots': True, 'world_building': True, 
-                'characters': True, 'orchestrator_decisions': True, 'genres': True, 
-                'target_audiences': True, 'sessions': False,  # sessions uses start_time not created_at
-                'subgenres': True, 'microgenres': True, 'tropes': True, 'tones': True,
-                'improvement_sessions': True, 'iterations': True, 'critiques': True,
-                'enhancements': True, 'scores': True, 'agent_invocations': True,
-                'performance_metrics': False, 'trace_events': True,  # performance_metrics uses timestamp
-                'content_ratings': True, 'lore_documents': True, 'lore_clusters': True
-            }
-            
-            if table in table_schemas and table_schemas[table] and 'created_at' not in data:
-                data['created_at'] = datetime.utcnow().isoformat()
-            elif table == 'sessions' and 'start_time' not in data:
-                data['start_time'] = datetime.utcnow().isoformat()
-            elif table == 'performance_metrics' and 'timestamp' not in data:
-                data['timestamp'] = datetime.utcnow().isoformat()
-            
-            # Serialize JSON fields
-            json_fields = [
-                'messages', 'agents_selected', 'characters', 'relationship_networks', 'character_dynamics',
-                'geography', 'political_landscape', 'cultural_systems', 'economic_framework', 
-                'historical_timeline', 'power_systems', 'languages_and_communication',
-                'religious_and_belief_systems', 'unique_elements', 'interests', 'critique_json',
-                'changes_made', 'category_scores', 'request_context', 'tool_calls', 'tool_results',
-                'parsed_json', 'tags', 'attributes', 'events', 'resource_attributes', 'metadata', 'embedding'
-            ]
-            serialized_data = {}
-            for key, value in data.items():
-                if key in json_fields and isinstance(value, (dict, list)):
-                    serialized_data[key] = self._serialize_json(value)
-                else:
-                    serialized_data[key] = value
+            # Stamp created_at (or the table's own timestamp column) and encode JSON values
+            serialized_data = self.codec.prepare_insert(table, data)
             
             # Build query
             query, params = self.query_builder.build_insert(table, serialized_data)
             
-            # Execute in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, 
-                self.connection_manager.execute_query, 
-                query, 
-                params
-            )
+            # Queue on the single writer thread
+            await self.executor.execute_write(query, params)
             
             # Return the ID
             return data['id']
@@ -102,6 +61,38 @@ class SQLiteDataOperations:
             self.logger.error(f"Error inserting into {table}: {e}")
             raise
     
+    async def upsert_returning(self, table: str, data: Dict[str, Any], conflict_column: str) -> Dict[str, Any]:
+        """
+        Insert a record unless one with the same conflict_column value exists.
+        
+        One writer round-trip: INSERT ... ON CONFLICT DO NOTHING RETURNING *, and
+        on conflict a SELECT of the existing row on the same connection.
+        
+        Returns:
+            The stored row; an existing row is returned unchanged
+        """
+        try:
+            # Generate ID if not provided
+            if 'id' not in data:
+                data['id'] = str(uuid.uuid4())
+            
+            serialized_data = self.codec.prepare_insert(table, data)
+            query, params = self.query_builder.build_upsert_returning(table, serialized_data, conflict_column)
+            lookup = f"SELECT * FROM {table} WHERE {conflict_column} = ?"
+            
+            def operation(conn) -> Dict[str, Any]:
+                row = conn.execute(query, params).fetchone()
+                if row is None:
+                    row = conn.execute(lookup, [serialized_data[conflict_column]]).fetchone()
+                return dict(row)
+            
+            row = await self.executor.write(operation)
+            return self.codec.decode_rows(table, [row])[0]
+        
+        except Exception as e:
+            self.logger.error(f"Error upserting into {table}: {e}")
+            raise
+    
     async def select(self, table: str, filters: Optional[Dict[str, Any]] = None,
                     order_by: Optional[str] = None, desc: bool = False,
                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -112,26 +103,8 @@ class SQLiteDataOperations:
                 table, filters, order_by, desc, limit
             )
             
-            # Execute in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_select,
-                query,
-                params
-            )
-            
-            # Deserialize JSON fields
-            for result in results:
-                for key, value in result.items():
-                    if isinstance(value, str) and (value.startswith('{') or value.startswith('[')):
-                        try:
-                            result[key] = self._deserialize_json(value)
-                        except:
-                            # If deserialization fails, keep as string
-                            pass
-            
-            return results
+            # Execute on the dedicated reader pool
+            return await self.executor.read(self._select_rows, table, query, params)
             
         except Exception as e:
             self.logger.error(f"Error selecting from {table}: {e}")
@@ -145,33 +118,14 @@ class SQLiteDataOperations:
     async def update(self, table: str, record_id: str, data: Dict[str, Any]) -> bool:
         """Update a record in the specified table"""
         try:
-            # Serialize JSON fields
-            json_fields = [
-                'messages', 'agents_selected', 'characters', 'relationship_networks', 'character_dynamics',
-                'geography', 'political_landscape', 'cultural_systems', 'economic_framework', 
-                'historical_timeline', 'power_systems', 'languages_and_communication',
-                'religious_and_belief_systems', 'unique_elements', 'interests', 'critique_json',
-                'changes_made', 'category_scores', 'request_context', 'tool_calls', 'tool_results',
-                'parsed_json', 'tags', 'attributes', 'events', 'resource_attributes', 'metadata', 'embedding'
-            ]
-            serialized_data = {}
-            for key, value in data.items():
-                if key in json_fields and isinstance(value, (dict, list)):
-                    serialized_data[key] = self._serialize_json(value)
-                else:
-                    serialized_data[key] = value
+            # Encode JSON values
+            serialized_data = self.codec.encode(data)
             
             # Build query
             query, params = self.query_builder.build_update(table, record_id, serialized_data)
             
-            # Execute in thread pool to avoid blocking and get row count
-            loop = asyncio.get_event_loop()
-            rows_affected = await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_query_with_rowcount,
-                query,
-                params
-            )
+            # Queue on the single writer thread
+            rows_affected = await self.executor.execute_write(query, params)
             
             return rows_affected > 0
             
@@ -185,14 +139,8 @@ class SQLiteDataOperations:
             # Build query
             query, params = self.query_builder.build_delete(table, record_id)
             
-            # Execute in thread pool to avoid blocking and get row count
-            loop = asyncio.get_event_loop()
-            rows_affected = await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_query_with_rowcount,
-                query,
-                params
-            )
+            # Queue on the single writer thread
+            rows_affected = await self.executor.execute_write(query, params)
             
             return rows_affected > 0
             
@@ -206,13 +154,9 @@ class SQLiteDataOperations:
             # Build query
             query, params = self.query_builder.build_count(table, filters)
             
-            # Execute in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            count = await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_count,
-                query,
-                params
+            # Execute on the dedicated reader pool
+            count = await self.executor.read(
+                self.connection_manager.execute_count, query, params
             )
             
             return count
@@ -226,15 +170,8 @@ class SQLiteDataOperations:
         try:
             query = f"SELECT * FROM {table_name} LIMIT {limit} OFFSET {offset}"
             
-            # Execute in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_select,
-                query
-            )
-            
-            return results
+            # Execute on the dedicated reader pool
+            return await self.executor.read(self._select_rows, table_name, query)
             
         except Exception as e:
             self.logger.error(f"Error getting all from {table_name}: {e}")
@@ -246,16 +183,8 @@ class SQLiteDataOperations:
             # Build search query
             query, params = self.query_builder.build_search(table_name, criteria, limit)
             
-            # Execute in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_select,
-                query,
-                params
-            )
-            
-            return results
+            # Execute on the dedicated reader pool
+            return await self.executor.read(self._select_rows, table_name, query, params)
             
         except Exception as e:
             self.logger.error(f"Error searching {table_name}: {e}")
@@ -264,7 +193,7 @@ class SQLiteDataOperations:
     async def batch_insert(self, table: str, records: List[Dict[str, Any]]) -> List[str]:
         """Insert multiple records in a batch"""
         try:
-            # Generate IDs and serialize JSON fields
+            # Generate IDs, stamp timestamps and encode JSON values
             processed_records = []
             record_ids = []
             
@@ -274,26 +203,13 @@ class SQLiteDataOperations:
                     record['id'] = str(uuid.uuid4())
                 record_ids.append(record['id'])
                 
-                # Serialize JSON fields
-                serialized_record = {}
-                for key, value in record.items():
-                    if isinstance(value, (dict, list)):
-                        serialized_record[key] = self._serialize_json(value)
-                    else:
-                        serialized_record[key] = value
-                processed_records.append(serialized_record)
+                processed_records.append(self.codec.prepare_insert(table, record))
             
             # Build batch query
             query, params = self.query_builder.build_batch_insert(table, processed_records)
             
-            # Execute in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_query,
-                query,
-                params
-            )
+            # Queue on the single writer thread
+            await self.executor.execute_write(query, params)
             
             return record_ids
             
@@ -307,36 +223,94 @@ class SQLiteDataOperations:
             # Build query
             query, params = self.query_builder.build_select_by_ids(table, ids)
             
-            # Execute in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                self.connection_manager.execute_select,
-                query,
-                params
-            )
-            
-            return results
+            # Execute on the dedicated reader pool
+            return await self.executor.read(self._select_rows, table, query, params)
             
         except Exception as e:
             self.logger.error(f"Error batch selecting from {table}: {e}")
             raise
     
-    async def batch_update(self, table: str, updates: List[Dict[str, Any]]) -> int:
-        """Update multiple records in a batch"""
+    # Values per IN (...) list, well under SQLite's bound-variable limit
+    _IN_VALUES_CHUNK = 200
+    
+    async def batch_select_by_column(self, table: str, column: str, values: List[Any]) -> List[Dict[str, Any]]:
+        """Select all records whose column matches any of the values, one query per chunk of values"""
+        if not values:
+            return []
+        
+        values = list(values)
+        chunks = [values[i:i + self._IN_VALUES_CHUNK] for i in range(0, len(values), self._IN_VALUES_CHUNK)]
+        
+        try:
+            queries = [self.query_builder.build_select_in(table, column, chunk) for chunk in chunks]
+            results = await asyncio.gather(*[
+                self.executor.read(self._select_rows, table, query, params) for query, params in queries
+            ])
+            return [row for rows in results for row in rows]
+            
+        except Exception as e:
+            self.logger.error(f"Error batch selecting from {table} by {column}: {e}")
+            raise
+    
+    async def select_union_by_column(self, tables: List[str], column: str, value: Any) -> List[Dict[str, Any]]:
+        """
+        Select rows matching column = value across several tables in one UNION ALL query.
+        
+        Returns {'source_table': ..., 'record': {...}} entries ordered by created_at.
+        Tables that do not exist or lack the column are skipped.
+        """
+        def select_union() -> List[Dict[str, Any]]:
+            table_columns = {}
+            for table in tables:
+                columns = self.codec.columns(table)
+                if column in columns:
+                    table_columns[table] = sorted(columns)
+            if not table_columns:
+                return []
+            
+            query, params = self.query_builder.build_union_select(table_columns, column, value)
+            rows = self.connection_manager.execute_select(query, params)
+            return [
+                {
+                    "source_table": row["source_table"],
+                    "record": self.codec.decode_rows(row["source_table"], [loads(row["record"])])[0]
+                }
+                for row in rows
+            ]
+        
         try:
-            updated_count = 0
+            return await self.executor.read(select_union)
             
-            # Process each update individually
-            # Note: Could be optimized with a single SQL query using CASE statements
-            # or temp tables, but current approach ensures better error isolation
+        except Exception as e:
+            self.logger.error(f"Error selecting {column}={value} across {tables}: {e}")
+            raise
+    
+    async def batch_update(self, table: str, updates: List[Dict[str, Any]]) -> int:
+        """
+        Update multiple records in one transaction.
+        
+        Each update is either {'id': ..., 'data': {...}} or {'id': ..., **fields}.
+        Updates touching the same columns run as a single executemany.
+        """
+        if not updates:
+            return 0
+        
+        try:
+            pairs = []
             for update_data in updates:
-                record_id = update_data.pop('id')  # Remove ID from update data
-                success = await self.update(table, record_id, update_data)
-                if success:
-                    updated_count += 1
+                fields = dict(update_data)
+                record_id = fields.pop('id')
+                if set(fields) == {'data'} and isinstance(fields['data'], dict):
+                    fields = fields['data']
+                pairs.append((record_id, self.codec.encode(fields)))
+            
+            statements = self.query_builder.build_batch_update(table, pairs)
+            
+            def operation(conn) -> int:
+                # Runs inside the writer's transaction, so the whole batch commits at once
+                return sum(conn.executemany(query, param_rows).rowcount for query, param_rows in statements)
             
-            return updated_count
+            return await self.executor.write(operation)
             
         except Exception as e:
             self.logger.error(f"Error batch updating {table}: {e}")
@@ -390,38 +364,36 @@ class SQLiteDataOperations:
             self.logger.error(f"Error getting plot with author for {plot_id}: {e}")
             raise
     
-    async def search_content(self, query: str, content_type: str, user_id: str) -> List[Dict[str, Any]]:
-        """Search content across different content types"""
+    async def search_content(self, query: str, content_type: str, user_id: str,
+                             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search a user's content of one type, best matches first.
+        
+        Uses the FTS5 index with bm25 ranking (see FTS_TABLES); rows carry a
+        ``relevance_score`` where higher is better. Falls back to a LIKE scan
+        when FTS5 is unavailable.
+        """
         try:
-            # Map content types to tables and searchable fields
-            content_mappings = {
-                "plots": ["title", "plot_summary"],
-                "authors": ["author_name", "biography"],
-                "world_building": ["world_name", "overview"],
-                "characters": ["characters"]
-            }
-            
-            if content_type not in content_mappings:
+            if content_type not in FTS_TABLES:
                 return []
             
-            # Build search criteria
-            search_criteria = {}
-            for field in content_mappings[content_type]:
-                search_criteria[field] = f"%{query}%"
-            
-            # Add user filter
-            results = await self.select(content_type, {"user_id": user_id})
+            weights = FTS_TABLES[content_type]
+            filters = {"user_id": user_id}
             
-            # Filter results based on search criteria
-            filtered_results = []
-            for result in results:
-                for field in content_mappings[content_type]:
-                    if field in result and result[field]:
-                        if query.lower() in str(result[field]).lower():
-                            filtered_results.append(result)
-                            break
+            if self.table_manager.fts_enabled:
+                match_expression = self.query_builder.build_fts_match(query)
+                if match_expression is None:
+                    return []
+                sql, params = self.query_builder.build_fts_search(
+                    content_type, weights, match_expression, filters, limit
+                )
+            else:
+                sql, params = self.query_builder.build_text_search(
+                    content_type, list(weights), query, filters, limit
+                )
             
-            return filtered_results
+            # Execute on the dedicated reader pool
+            return await self.executor.read(self._select_rows, content_type, sql, params)
             
         except Exception as e:
             self.logger.error(f"Error searching content: {e}")
@@ -429,5 +401,6 @@ class SQLiteDataOperations:
     
     async def close(self):
         """Close data operations (cleanup)"""
-        # Delegate to connection manager
+        # Flush queued writes before releasing connections
+        await self.executor.close()
         self.connection_manager.close()
\ No newline at end of file
@@ -0,0 +1,285 @@
+"""
+SQLite Executor - Dedicated thread pools for SQLite reads and writes.
+
+Reads run on a bounded reader pool that is not shared with the rest of the
+application. Writes are funnelled through a single writer thread that drains
+a queue and commits everything queued so far in one transaction, so concurrent
+writers never contend for SQLite's database lock.
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from ...core.logging import get_logger
+from .connection_manager import SQLiteConnectionManager
+
+
+@dataclass
+class _WriteJob:
+    """A queued write operation waiting for the writer thread"""
+    operation: Callable[[sqlite3.Connection], Any]
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+# Sentinel pushed onto the write queue to stop the writer thread
+_STOP = object()
+
+# How long write() yields to the event loop before retrying a full write queue
+_QUEUE_FULL_RETRY_SECONDS = 0.005
+
+
+class SQLiteExecutor:
+    """Bounded reader pool plus a single batching writer thread for SQLite"""
+
+    def __init__(self, connection_manager: SQLiteConnectionManager,
+                 max_readers: int = 4, max_batch_size: int = 100,
+                 max_queue_size: int = 10000):
+        """
+        Initialize the executor.
+
+        Args:
+            connection_manager: Provides per-thread reader connections and the writer connection
+            max_readers: Number of threads in the dedicated reader pool
+            max_batch_size: Maximum number of queued writes committed in one transaction
+            max_queue_size: Maximum number of writes waiting for the writer thread
+        """
+        self.connection_manager = connection_manager
+        self.max_readers = max_readers
+        self.max_batch_size = max_batch_size
+        self.logger = get_logger("sqlite_executor")
+
+        self._readers = ThreadPoolExecutor(
+            max_workers=max_readers, thread_name_prefix="sqlite-reader"
+        )
+        self._write_queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._closed = False
+
+        self._metrics_lock = threading.Lock()
+        self._reset_counters()
+
+    def _reset_counters(self):
+        """Reset write-path counters"""
+        with self._metrics_lock:
+            self._writes_executed = 0
+            self._writes_failed = 0
+            self._write_batches = 0
+            self._total_wait_time = 0.0
+            self._max_wait_time = 0.0
+            self._reads_executed = 0
+            self._last_reset = time.time()
+
+    # Read path
+
+    async def read(self, func: Callable[..., Any], *args) -> Any:
+        """Run a blocking read function on the dedicated reader pool"""
+        if self._closed:
+            raise RuntimeError("SQLite executor is closed")
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._readers, func, *args)
+        with self._metrics_lock:
+            self._reads_executed += 1
+        return result
+
+    # Write path
+
+    async def write(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Queue a write for the writer thread and wait for it to be committed.
+
+        Args:
+            operation: Callable receiving the writer connection; its return value is returned
+
+        Returns:
+            The operation's result once the enclosing batch has committed
+        """
+        if self._closed:
+            raise RuntimeError("SQLite executor is closed")
+        self._ensure_writer_started()
+
+        job = _WriteJob(operation=operation)
+        # A full queue is backpressure: wait on the event loop, never on a reader thread
+        while True:
+            try:
+                self._write_queue.put_nowait(job)
+                break
+            except queue.Full:
+                await asyncio.sleep(_QUEUE_FULL_RETRY_SECONDS)
+
+        # Cancelling the caller cancels the job if the writer has not started it yet
+        return await asyncio.wrap_future(job.future)
+
+    async def execute_write(self, query: str, params: Optional[List[Any]] = None) -> int:
+        """Queue a single INSERT/UPDATE/DELETE statement and return its row count"""
+        params = params or []
+
+        def operation(conn: sqlite3.Connection) -> int:
+            return conn.execute(query, params).rowcount
+
+        return await self.write(operation)
+
+    def _ensure_writer_started(self):
+        """Start the writer thread on first use"""
+        if self._writer_thread is not None:
+            return
+        with self._writer_lock:
+            if self._writer_thread is None:
+                thread = threading.Thread(
+                    target=self._writer_loop, name="sqlite-writer", daemon=True
+                )
+                thread.start()
+                self._writer_thread = thread
+
+    def _writer_loop(self):
+        """Drain the write queue, committing each drained batch in one transaction"""
+        conn: Optional[sqlite3.Connection] = None
+        try:
+            while True:
+                job = self._write_queue.get()
+                if job is _STOP:
+                    break
+
+                batch = [job]
+                stop_requested = False
+                while len(batch) < self.max_batch_size:
+                    try:
+                        next_job = self._write_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if next_job is _STOP:
+                        stop_requested = True
+                        break
+                    batch.append(next_job)
+
+                # Skip writes whose caller was cancelled; the rest can no longer be cancelled
+                batch = [job for job in batch if job.future.set_running_or_notify_cancel()]
+
+                if batch and conn is None:
+                    try:
+                        conn = self.connection_manager.get_connection()
+                        conn.isolation_level = None  # Transactions are managed in _run_batch
+                    except Exception as e:
+                        self.logger.error(f"SQLite writer could not open a connection: {e}")
+                        conn = None
+                        self._fail_batch(batch, e)
+                        batch = []
+
+                if batch:
+                    try:
+                        self._run_batch(conn, batch)
+                    except Exception as e:
+                        # Keep the writer alive; every later write() depends on it
+                        self.logger.error(f"SQLite writer failed on a batch of {len(batch)}: {e}")
+                        self._fail_batch(batch, e)
+                if stop_requested:
+                    break
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _fail_batch(self, batch: List[_WriteJob], error: BaseException):
+        """Fail every job in a batch that could not be executed"""
+        with self._metrics_lock:
+            self._writes_failed += len(batch)
+        for job in batch:
+            self._deliver(job, None, error)
+
+    def _deliver(self, job: _WriteJob, result: Any, error: Optional[BaseException]):
+        """Resolve a job's future, ignoring one that is already resolved"""
+        try:
+            if error is None:
+                job.future.set_result(result)
+            else:
+                job.future.set_exception(error)
+        except InvalidStateError:
+            pass
+
+    def _run_batch(self, conn: sqlite3.Connection, batch: List[_WriteJob]):
+        """Execute a batch of writes in one transaction, isolating failures per job"""
+        started_at = time.perf_counter()
+        results: List[Any] = []
+        errors: List[Optional[BaseException]] = []
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job in batch:
+                # A savepoint per job lets one failing write roll back alone
+                conn.execute("SAVEPOINT job")
+                try:
+                    results.append(job.operation(conn))
+                    errors.append(None)
+                    conn.execute("RELEASE SAVEPOINT job")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT job")
+                    conn.execute("RELEASE SAVEPOINT job")
+                    results.append(None)
+                    errors.append(e)
+            conn.execute("COMMIT")
+        except Exception as e:
+            # The transaction itself failed (e.g. disk I/O); fail every job in it
+            self.logger.error(f"SQLite write batch of {len(batch)} failed: {e}")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            results = [None] * len(batch)
+            errors = [e] * len(batch)
+
+        with self._metrics_lock:
+            self._write_batches += 1
+            for job, error in zip(batch, errors):
+                wait_time = started_at - job.enqueued_at
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+                if error is None:
+                    self._writes_executed += 1
+                else:
+                    self._writes_failed += 1
+
+        for job, result, error in zip(batch, results, errors):
+            self._deliver(job, result, error)
+
+    # Metrics and lifecycle
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get reader pool and write queue metrics"""
+        with self._metrics_lock:
+            completed = self._writes_executed + self._writes_failed
+            return {
+                "reader_threads": self.max_readers,
+                "reads_executed": self._reads_executed,
+                "write_queue_depth": self._write_queue.qsize(),
+                "writes_executed": self._writes_executed,
+                "writes_failed": self._writes_failed,
+                "write_batches": self._write_batches,
+                "avg_write_batch_size": completed / self._write_batches if self._write_batches else 0.0,
+                "avg_write_wait_ms": (self._total_wait_time / completed * 1000) if completed else 0.0,
+                "max_write_wait_ms": self._max_wait_time * 1000,
+                "last_reset": self._last_reset,
+            }
+
+    def reset_metrics(self):
+        """Reset executor counters"""
+        self._reset_counters()
+
+    async def close(self):
+        """Flush pending writes, stop the writer thread and shut down the reader pool"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._writer_thread is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_queue.put, _STOP)
+            await loop.run_in_executor(None, self._writer_thread.join)
+            self._writer_thread = None
+
+        self._readers.shutdown(wait=True)
@@ -74,6 +74,12 @@ class SQLiteIndexManager:
             ("idx_characters_session_id", "characters", ["session_id"]),
             ("idx_characters_plot_id", "characters", ["plot_id"]),
             
+            # Session content and iteration lookups
+            ("idx_orchestrator_decisions_session_id", "orchestrator_decisions", ["session_id"]),
+            ("idx_critiques_iteration_id", "critiques", ["iteration_id"]),
+            ("idx_enhancements_iteration_id", "enhancements", ["iteration_id"]),
+            ("idx_scores_iteration_id", "scores", ["iteration_id"]),
+            
             # Content ratings indexes
             ("idx_content_ratings_content_id", "content_ratings", ["content_id"]),
             ("idx_content_ratings_content_type", "content_ratings", ["content_type"]),
@@ -84,6 +90,10 @@ class SQLiteIndexManager:
             # Agent invocations indexes
             ("idx_agent_invocations_agent_name", "agent_invocations", ["agent_name"]),
             ("idx_agent_invocations_user_id", "agent_invocations", ["user_id"]),
+            # Covers the time-window analytics so they never read payload columns
+            ("idx_agent_invocations_window", "agent_invocations",
+             ["start_time", "agent_name", "success", "duration_ms", "total_tokens", "cost_estimate", "tool_calls"]),
+            ("idx_scores_created_at", "scores", ["created_at"]),
         ]
         
         for index_name, table_name, columns in all_indexes:
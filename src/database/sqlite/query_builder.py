@@ -18,6 +18,9 @@ class SQLiteQueryBuilder:
         
         # Regex for validating SQL identifiers (table/column names)
         self._identifier_pattern = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+        
+        # Word tokens extracted from free-text search input
+        self._search_token_pattern = re.compile(r'\w+', re.UNICODE)
     
     def sanitize_table_name(self, table_name: str) -> str:
         """Sanitize table name to prevent SQL injection"""
@@ -48,6 +51,14 @@ class SQLiteQueryBuilder:
         
         return query, params
     
+    def build_upsert_returning(self, table: str, data: Dict[str, Any],
+                               conflict_column: str) -> Tuple[str, List[Any]]:
+        """Build INSERT ... ON CONFLICT DO NOTHING RETURNING * (no row is returned on conflict)"""
+        query, params = self.build_insert(table, data)
+        conflict_column = self.sanitize_column_name(conflict_column)
+        
+        return f"{query} ON CONFLICT({conflict_column}) DO NOTHING RETURNING *", params
+    
     def build_select(self, table: str, filters: Optional[Dict[str, Any]] = None,
                     order_by: Optional[str] = None, desc: bool = False,
                     limit: Optional[int] = None) -> Tuple[str, List[Any]]:
@@ -177,6 +188,34 @@ class SQLiteQueryBuilder:
         
         return query, params
     
+    def build_batch_update(self, table: str,
+                           updates: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, List[List[Any]]]]:
+        """
+        Build executemany-ready UPDATE statements for (record_id, data) pairs.
+
+        Updates touching the same columns share one statement; returns a list of
+        (query, param_rows) with one param row per record.
+        """
+        if not updates:
+            raise ValueError("Batch update records cannot be empty")
+
+        # Sanitize table name
+        table = self.sanitize_table_name(table)
+
+        statements: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for record_id, data in updates:
+            if not data:
+                raise ValueError("Update data cannot be empty")
+            columns = tuple(data.keys())
+            statements.setdefault(columns, []).append([data[col] for col in columns] + [record_id])
+
+        batch = []
+        for columns, param_rows in statements.items():
+            set_clause = ', '.join(f"{self.sanitize_column_name(col)} = ?" for col in columns)
+            batch.append((f"UPDATE {table} SET {set_clause} WHERE id = ?", param_rows))
+
+        return batch
+
     def build_select_by_ids(self, table: str, ids: List[str]) -> Tuple[str, List[Any]]:
         """Build SELECT query for multiple IDs"""
         if not ids:
@@ -188,4 +227,108 @@ class SQLiteQueryBuilder:
         placeholders = ', '.join(['?' for _ in ids])
         query = f"SELECT * FROM {table} WHERE id IN ({placeholders})"
         
-        return query, ids
\ No newline at end of file
+        return query, ids
+    
+    def build_select_in(self, table: str, column: str, values: List[Any]) -> Tuple[str, List[Any]]:
+        """Build SELECT query matching any of several values in one column"""
+        if not values:
+            raise ValueError("Values list cannot be empty")
+        
+        # Sanitize table and column names
+        table = self.sanitize_table_name(table)
+        column = self.sanitize_column_name(column)
+        
+        placeholders = ', '.join(['?' for _ in values])
+        query = f"SELECT * FROM {table} WHERE {column} IN ({placeholders})"
+        
+        return query, list(values)
+    
+    def build_union_select(self, table_columns: Dict[str, List[str]], filter_column: str, value: Any,
+                           order_column: str = "created_at") -> Tuple[str, List[Any]]:
+        """
+        Build one UNION ALL query over several tables filtered on a shared column.
+        
+        Tables have different columns, so each row comes back as
+        (source_table, sort_key, record) with the full row packed into a
+        json_object, ordered by each table's order_column.
+        """
+        if not table_columns:
+            raise ValueError("Union tables cannot be empty")
+        
+        filter_column = self.sanitize_column_name(filter_column)
+        branches = []
+        for table, columns in table_columns.items():
+            table = self.sanitize_table_name(table)
+            fields = ', '.join(f"'{column}', {column}" for column in map(self.sanitize_column_name, columns))
+            sort_key = self.sanitize_column_name(order_column) if order_column in columns else "NULL"
+            branches.append(
+                f"SELECT '{table}' AS source_table, {sort_key} AS sort_key, json_object({fields}) AS record "
+                f"FROM {table} WHERE {filter_column} = ?"
+            )
+        
+        query = " UNION ALL ".join(branches) + " ORDER BY sort_key"
+        return query, [value] * len(branches)
+    
+    def build_fts_match(self, search_text: str) -> Optional[str]:
+        """
+        Build an FTS5 MATCH expression from free-text user input.
+        
+        Each word becomes a quoted prefix term so FTS5 operators in the input
+        are never interpreted. Terms are OR-ed; bm25 ranks rows matching more
+        terms higher. Returns None when the input has no searchable words.
+        """
+        tokens = self._search_token_pattern.findall(search_text)
+        if not tokens:
+            return None
+        return " OR ".join(f'"{token}"*' for token in tokens)
+    
+    def build_fts_search(self, table: str, weights: Dict[str, float], match_expression: str,
+                         filters: Optional[Dict[str, Any]] = None,
+                         limit: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """Build a bm25-ranked FTS5 search joined back to its content table"""
+        table = self.sanitize_table_name(table)
+        fts_table = f"{table}_fts"
+        weight_args = ", ".join(str(float(weight)) for weight in weights.values())
+        
+        query = (
+            f"SELECT t.*, -bm25({fts_table}, {weight_args}) AS relevance_score "
+            f"FROM {fts_table} JOIN {table} t ON t.rowid = {fts_table}.rowid "
+            f"WHERE {fts_table} MATCH ?"
+        )
+        params: List[Any] = [match_expression]
+        
+        if filters:
+            for key, value in filters.items():
+                query += f" AND t.{self.sanitize_column_name(key)} = ?"
+                params.append(value)
+        
+        query += " ORDER BY relevance_score DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        
+        return query, params
+    
+    def build_text_search(self, table: str, columns: List[str], search_text: str,
+                          filters: Optional[Dict[str, Any]] = None,
+                          limit: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """Build a LIKE-based search over several columns (fallback when FTS5 is unavailable)"""
+        table = self.sanitize_table_name(table)
+        
+        conditions = []
+        params: List[Any] = []
+        if filters:
+            for key, value in filters.items():
+                conditions.append(f"{self.sanitize_column_name(key)} = ?")
+                params.append(value)
+        
+        like_conditions = [f"{self.sanitize_column_name(column)} LIKE ?" for column in columns]
+        conditions.append(f"({' OR '.join(like_conditions)})")
+        params.extend([f"%{search_text}%"] * len(columns))
+        
+        query = f"SELECT * FROM {table} WHERE {' AND '.join(conditions)}"
+        if limit:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        
+        return query, params
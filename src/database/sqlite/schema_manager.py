@@ -3,12 +3,69 @@ SQLite Schema Manager - Handles database table schema creation and management.
 Extracted from SQLiteTableManager for better modularity and single responsibility.
 """
 
-from typing import List, Dict, Any
+import sqlite3
+from typing import List, Dict, Any, Tuple
 
 from ...core.logging import get_logger
 from .connection_manager import SQLiteConnectionManager
 
 
+# Full-text searchable columns per content table, with bm25 column weights.
+# Each table gets a "<table>_fts" FTS5 index kept in sync by triggers.
+FTS_TABLES: Dict[str, Dict[str, float]] = {
+    "plots": {"title": 10.0, "plot_summary": 5.0},
+    "authors": {"author_name": 10.0, "pen_name": 8.0, "biography": 3.0},
+    "world_building": {"world_name": 10.0, "overview": 3.0},
+    "characters": {"world_context_integration": 5.0, "characters": 3.0},
+}
+
+# Columns that hold JSON documents, per table. Values written to these
+# columns are encoded on insert/update and decoded on read (see column_codec.py).
+JSON_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "sessions": ("messages",),
+    "world_building": (
+        "geography", "political_landscape", "cultural_systems", "economic_framework",
+        "historical_timeline", "power_systems", "languages_and_communication",
+        "religious_and_belief_systems", "unique_elements",
+    ),
+    "characters": ("characters",),
+    "orchestrator_decisions": ("agents_selected",),
+    "target_audiences": ("interests",),
+    "critiques": ("critique_json",),
+    "enhancements": ("changes_made",),
+    "scores": ("category_scores", "improvement_trajectory", "recommendations"),
+    "agent_invocations": ("request_context", "tool_calls", "tool_results", "parsed_json"),
+    "performance_metrics": ("tags",),
+    "trace_events": ("attributes", "events", "resource_attributes"),
+    "lore_documents": ("embedding", "metadata"),
+    "lore_clusters": ("centroid",),
+}
+
+# Foreign keys per child table: {fk_column: parent_table}. Mirrors the
+# REFERENCES clauses below (and the Supabase migrations) so relation loaders
+# can resolve the real join column for a table pair instead of guessing.
+FOREIGN_KEYS: Dict[str, Dict[str, str]] = {
+    "sessions": {"user_id": "users"},
+    "authors": {"session_id": "sessions", "user_id": "users"},
+    "plots": {"session_id": "sessions", "user_id": "users", "author_id": "authors"},
+    "world_building": {"session_id": "sessions", "user_id": "users", "plot_id": "plots"},
+    "characters": {
+        "session_id": "sessions", "user_id": "users",
+        "plot_id": "plots", "world_id": "world_building",
+    },
+    "orchestrator_decisions": {"session_id": "sessions", "user_id": "users"},
+    "subgenres": {"genre_id": "genres"},
+    "microgenres": {"subgenre_id": "subgenres"},
+    "iterations": {"improvement_session_id": "improvement_sessions"},
+    "critiques": {"iteration_id": "iterations"},
+    "enhancements": {"iteration_id": "iterations"},
+    "scores": {"iteration_id": "iterations"},
+    "agent_invocations": {"user_id": "users", "session_id": "sessions"},
+    "performance_metrics": {"user_id": "users", "session_id": "sessions"},
+    "content_ratings": {"user_id": "users"},
+}
+
+
 class SQLiteSchemaManager:
     """Manages SQLite database table schemas"""
     
@@ -16,6 +73,7 @@ class SQLiteSchemaManager:
         """Initialize schema manager with connection manager"""
         self.connection_manager = connection_manager
         self.logger = get_logger("sqlite_schema_manager")
+        self.fts_enabled = False
     
     def create_users_table(self):
         """Create users table"""
@@ -428,6 +486,61 @@ class SQLiteSchemaManager:
         """
         self.connection_manager.execute_query(query)
     
+    def create_fts_table(self, table_name: str):
+        """Create an external-content FTS5 index over a table plus its sync triggers"""
+        columns = list(FTS_TABLES[table_name])
+        fts_table = f"{table_name}_fts"
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{column}" for column in columns)
+        old_values = ", ".join(f"old.{column}" for column in columns)
+        is_new = not self.table_exists(fts_table)
+        
+        self.connection_manager.execute_query(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+                {column_list},
+                content='{table_name}',
+                content_rowid='rowid'
+            )
+        """)
+        
+        # Keep the index in sync with the content table
+        self.connection_manager.execute_query(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {table_name} BEGIN
+                INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+            END
+        """)
+        self.connection_manager.execute_query(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {table_name} BEGIN
+                INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                VALUES ('delete', old.rowid, {old_values});
+            END
+        """)
+        self.connection_manager.execute_query(f"""
+            CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {column_list} ON {table_name} BEGIN
+                INSERT INTO {fts_table}({fts_table}, rowid, {column_list})
+                VALUES ('delete', old.rowid, {old_values});
+                INSERT INTO {fts_table}(rowid, {column_list}) VALUES (new.rowid, {new_values});
+            END
+        """)
+        
+        # Index rows that existed before the FTS table was added
+        if is_new:
+            self.connection_manager.execute_query(
+                f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"
+            )
+    
+    def create_fts_tables(self) -> bool:
+        """Create FTS5 indexes for all searchable content tables"""
+        try:
+            for table_name in FTS_TABLES:
+                self.create_fts_table(table_name)
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            # SQLite builds without FTS5 fall back to LIKE-based search
+            self.logger.warning(f"FTS5 unavailable, full-text search disabled: {e}")
+            self.fts_enabled = False
+        return self.fts_enabled
+    
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists"""
         query = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
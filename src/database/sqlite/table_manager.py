@@ -67,6 +67,9 @@ class SQLiteTableManager:
         # Create indexes for performance
         self.create_indexes()
         
+        # Create full-text search indexes
+        self.create_fts_tables()
+        
         self.logger.info("All database tables created successfully")
     
     # Table creation methods - delegate to schema manager
@@ -171,6 +174,15 @@ class SQLiteTableManager:
         """Create performance indexes for all tables"""
         return self.index_manager.create_all_indexes()
     
+    def create_fts_tables(self) -> bool:
+        """Create FTS5 full-text indexes for searchable content tables"""
+        return self.schema_manager.create_fts_tables()
+    
+    @property
+    def fts_enabled(self) -> bool:
+        """Whether FTS5 full-text indexes are available"""
+        return self.schema_manager.fts_enabled
+    
     # Schema introspection methods - delegate to schema manager
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists"""
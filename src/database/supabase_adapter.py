@@ -3,8 +3,11 @@ Supabase database adapter implementing the IDatabase interface.
 Direct Supabase client wrapper without supabase_service dependency.
 """
 
+import asyncio
+import json
 import os
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from supabase import create_client, Client
 from ..core.interfaces import IDatabase, ContentType
 from ..core.logging import get_logger
@@ -34,6 +37,13 @@ class SupabaseAdapter(IDatabase):
             enable_metrics=True
         )
         
+        # The supabase client is synchronous; its HTTP round-trips run here so
+        # they never block the event loop. One worker per pooled connection.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.pool_config.max_connections,
+            thread_name_prefix="supabase-io"
+        )
+        
         try:
             # Create primary client for immediate use
             self.client: Client = create_client(self.url, self.key)
@@ -46,11 +56,16 @@ class SupabaseAdapter(IDatabase):
             self.logger.error(f"Failed to initialize Supabase client: {e}")
             raise
     
+    async def _execute(self, query: Any) -> Any:
+        """Run a PostgREST query builder's blocking execute() on the I/O executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, query.execute)
+    
     async def insert(self, table_name: str, data: Dict[str, Any]) -> str:
         """Insert data into table and return ID using connection pool"""
         try:
             async with self.connection_pool.get_connection() as conn:
-                response = conn.client.table(table_name).insert(data).execute()
+                response = await self._execute(conn.client.table(table_name).insert(data))
                 if response.data:
                     return response.data[0]["id"]
                 raise Exception("No data returned from insert")
@@ -58,11 +73,32 @@ class SupabaseAdapter(IDatabase):
             self.logger.error(f"Error inserting into {table_name}: {e}", error=e)
             raise
     
+    async def upsert_returning(self, table_name: str, data: Dict[str, Any], conflict_column: str) -> Dict[str, Any]:
+        """Insert a record unless conflict_column already matches one, returning the stored row"""
+        try:
+            async with self.connection_pool.get_connection() as conn:
+                # ON CONFLICT DO NOTHING: an existing row is left as is and not returned
+                response = await self._execute(
+                    conn.client.table(table_name).upsert(data, on_conflict=conflict_column, ignore_duplicates=True)
+                )
+                if response.data:
+                    return response.data[0]
+                
+                response = await self._execute(
+                    conn.client.table(table_name).select("*").eq(conflict_column, data[conflict_column]).limit(1)
+                )
+                if response.data:
+                    return response.data[0]
+                raise Exception("No data returned from upsert")
+        except Exception as e:
+            self.logger.error(f"Error upserting into {table_name}: {e}", error=e)
+            raise
+    
     async def get_by_id(self, table_name: str, entity_id: str) -> Optional[Dict[str, Any]]:
         """Get entity by ID using connection pool"""
         try:
             async with self.connection_pool.get_connection() as conn:
-                response = conn.client.table(table_name).select("*").eq("id", entity_id).execute()
+                response = await self._execute(conn.client.table(table_name).select("*").eq("id", entity_id))
                 return response.data[0] if response.data else None
         except Exception as e:
             self.logger.error(f"Error getting {table_name} by ID {entity_id}: {e}", error=e)
@@ -72,7 +108,7 @@ class SupabaseAdapter(IDatabase):
         """Update entity by ID using connection pool"""
         try:
             async with self.connection_pool.get_connection() as conn:
-                response = conn.client.table(table_name).update(data).eq("id", entity_id).execute()
+                response = await self._execute(conn.client.table(table_name).update(data).eq("id", entity_id))
                 return len(response.data) > 0
         except Exception as e:
             self.logger.error(f"Error updating {table_name} {entity_id}: {e}", error=e)
@@ -82,7 +118,7 @@ class SupabaseAdapter(IDatabase):
         """Delete entity by ID using connection pool"""
         try:
             async with self.connection_pool.get_connection() as conn:
-                response = conn.client.table(table_name).delete().eq("id", entity_id).execute()
+                response = await self._execute(conn.client.table(table_name).delete().eq("id", entity_id))
                 return len(response.data) > 0
         except Exception as e:
             self.logger.error(f"Error deleting {table_name} {entity_id}: {e}", error=e)
@@ -92,7 +128,7 @@ class SupabaseAdapter(IDatabase):
         """Get all entities with pagination using connection pool"""
         try:
             async with self.connection_pool.get_connection() as conn:
-                response = conn.client.table(table_name).select("*").order("created_at", desc=True).range(offset, offset + limit - 1).execute()
+                response = await self._execute(conn.client.table(table_name).select("*").order("created_at", desc=True).range(offset, offset + limit - 1))
                 return response.data
         except Exception as e:
             self.logger.error(f"Error getting all {table_name}: {e}", error=e)
@@ -108,7 +144,7 @@ class SupabaseAdapter(IDatabase):
                 for key, value in criteria.items():
                     query = query.eq(key, value)
                 
-                response = query.order("created_at", desc=True).limit(limit).execute()
+                response = await self._execute(query.order("created_at", desc=True).limit(limit))
                 return response.data
         except Exception as e:
             self.logger.error(f"Error searching {table_name}: {e}", error=e)
@@ -124,7 +160,7 @@ class SupabaseAdapter(IDatabase):
                     for key, value in criteria.items():
                         query = query.eq(key, value)
                 
-                response = query.execute()
+                response = await self._execute(query)
                 return response.count or 0
         except Exception as e:
             self.logger.error(f"Error counting {table_name}: {e}", error=e)
@@ -143,7 +179,7 @@ class SupabaseAdapter(IDatabase):
                 user_data = await self._create_or_get_user(external_user_id)
                 
                 # Get the session by external session_id to get internal UUID
-                session_response = self.client.table("sessions").select("*").eq("session_id", external_session_id).execute()
+                session_response = await self._execute(self.client.table("sessions").select("*").eq("session_id", external_session_id))
                 if not session_response.data:
                     # Create session if it doesn't exist
                     session_data = await self._create_session(external_session_id, external_user_id)
@@ -172,7 +208,7 @@ class SupabaseAdapter(IDatabase):
                 user_data = await self._create_or_get_user(external_user_id)
                 
                 # Get the session by external session_id to get internal UUID
-                session_response = self.client.table("sessions").select("*").eq("session_id", external_session_id).execute()
+                session_response = await self._execute(self.client.table("sessions").select("*").eq("session_id", external_session_id))
                 if not session_response.data:
                     # Create session if it doesn't exist
                     session_data = await self._create_session(external_session_id, external_user_id)
@@ -197,25 +233,64 @@ class SupabaseAdapter(IDatabase):
         """Retrieve author by ID"""
         return await self.get_by_id("authors", author_id)
     
-    async def search_content(self, query: str, content_type: ContentType, user_id: str) -> List[Dict[str, Any]]:
-        """Search for content"""
+    # Searchable text columns per content table, with relevance weights (as in SQLite's FTS_TABLES)
+    _SEARCH_COLUMNS = {
+        "plots": {"title": 10.0, "plot_summary": 5.0},
+        "authors": {"author_name": 10.0, "pen_name": 8.0, "biography": 3.0},
+        "world_building": {"world_name": 10.0, "overview": 3.0},
+        "characters": {"world_context_integration": 5.0},
+    }
+    _CONTENT_TYPE_TABLES = {
+        ContentType.PLOT: "plots",
+        ContentType.AUTHOR: "authors",
+        ContentType.WORLD_BUILDING: "world_building",
+        ContentType.CHARACTERS: "characters",
+    }
+    
+    async def search_content(self, query: str, content_type: ContentType, user_id: str,
+                             limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Search a user's content of one type, best matches first.
+        
+        content_type may be a ContentType or a table name. The `limit` most
+        recent rows matching any search column (ilike) are fetched and ranked by
+        weighted match count into ``relevance_score``; PostgREST has no bm25.
+        """
         try:
-            # Get user UUID
-            user_data = await self._create_or_get_user(user_id)
-            user_uuid = user_data["id"]
+            table_name = self._CONTENT_TYPE_TABLES.get(content_type, content_type)
+            weights = self._SEARCH_COLUMNS.get(table_name)
+            if not weights:
+                return []
             
-            if content_type == ContentType.PLOT:
-                return await self._search_plots(user_id, query, 20)
-            elif content_type == ContentType.AUTHOR:
-                # Search authors by name
-                response = self.client.table("authors").select("*").eq("user_id", user_uuid).or_(f"author_name.ilike.%{query}%,pen_name.ilike.%{query}%").order("created_at", desc=True).limit(20).execute()
-                return response.data
-            else:
+            # Content rows reference the internal user UUID, not the external user_id
+            user_data = await self._create_or_get_user(user_id)
+            user_uuid = user_data.get("id")
+            if not user_uuid:
                 return []
+            
+            filters = ",".join(f"{column}.ilike.%{query}%" for column in weights)
+            response = await self._execute(self.client.table(table_name).select("*").eq("user_id", user_uuid).or_(filters).order("created_at", desc=True).limit(limit))
+            
+            rows = response.data or []
+            for row in rows:
+                row["relevance_score"] = self._match_relevance(row, weights, query)
+            rows.sort(key=lambda row: row["relevance_score"], reverse=True)
+            return rows
         except Exception as e:
             self.logger.error(f"Error searching content: {e}", error=e)
             raise
     
+    @staticmethod
+    def _match_relevance(row: Dict[str, Any], weights: Dict[str, float], query: str) -> float:
+        """Weighted count of case-insensitive query occurrences across the search columns"""
+        needle = query.lower()
+        if not needle:
+            return 0.0
+        return sum(
+            weight * str(row.get(column) or "").lower().count(needle)
+            for column, weight in weights.items()
+        )
+    
     # Additional methods for repository compatibility
     async def get_plots_by_user(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get plots for a user using external user_id"""
@@ -229,7 +304,7 @@ class SupabaseAdapter(IDatabase):
         """Get plot with associated author"""
         try:
             # Get plot data
-            plot_response = self.client.table("plots").select("*").eq("id", plot_id).execute()
+            plot_response = await self._execute(self.client.table("plots").select("*").eq("id", plot_id))
             if not plot_response.data:
                 return {}
             
@@ -237,7 +312,7 @@ class SupabaseAdapter(IDatabase):
             
             # Get associated author if exists
             if plot.get("author_id"):
-                author_response = self.client.table("authors").select("*").eq("id", plot["author_id"]).execute()
+                author_response = await self._execute(self.client.table("authors").select("*").eq("id", plot["author_id"]))
                 if author_response.data:
                     plot["author"] = author_response.data[0]
             
@@ -264,7 +339,7 @@ class SupabaseAdapter(IDatabase):
             ORDER BY ordinal_position;
             """
             
-            response = self.client.rpc('exec_sql', {'sql': query}).execute()
+            response = await self._execute(self.client.rpc('exec_sql', {'sql': query}))
             return response.data
         except Exception as e:
             self.logger.error(f"Error getting table schema: {e}")
@@ -274,13 +349,13 @@ class SupabaseAdapter(IDatabase):
         """Create or get user by external user_id"""
         try:
             # Try to get existing user (using correct field name)
-            response = self.client.table("users").select("*").eq("user_id", user_id).execute()
+            response = await self._execute(self.client.table("users").select("*").eq("user_id", user_id))
             if response.data:
                 return response.data[0]
             
             # Create new user (matching actual database schema)
             user_data = {"user_id": user_id}
-            response = self.client.table("users").insert(user_data).execute()
+            response = await self._execute(self.client.table("users").insert(user_data))
             return response.data[0] if response.data else user_data
         except Exception as e:
             self.logger.error(f"Error creating/getting user: {e}")
@@ -299,35 +374,20 @@ class SupabaseAdapter(IDatabase):
                 "created_at": "now()",
                 "updated_at": "now()"
             }
-            response = self.client.table("sessions").insert(session_data).execute()
+            response = await self._execute(self.client.table("sessions").insert(session_data))
             return response.data[0] if response.data else session_data
         except Exception as e:
             self.logger.error(f"Error creating session: {e}")
             return {"session_id": session_id, "user_id": user_id}
     
-    async def _search_plots(self, user_id: str, query: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Search plots for a user"""
-        try:
-            response = (self.client.table("plots")
-                       .select("*")
-                       .eq("user_id", user_id)
-                       .ilike("title", f"%{query}%")
-                       .limit(limit)
-                       .execute())
-            return response.data
-        except Exception as e:
-            self.logger.error(f"Error searching plots: {e}")
-            return []
-    
     async def _get_user_plots(self, user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Get plots for a user"""
         try:
-            response = (self.client.table("plots")
+            response = await self._execute(self.client.table("plots")
                        .select("*")
                        .eq("user_id", user_id)
                        .order("created_at", desc=True)
-                       .limit(limit)
-                       .execute())
+                       .limit(limit))
             return response.data
         except Exception as e:
             self.logger.error(f"Error getting user plots: {e}")
@@ -337,10 +397,9 @@ class SupabaseAdapter(IDatabase):
         """Get authors for a user"""
         try:
             # Get authors through plots since authors don't directly reference users
-            response = (self.client.table("plots")
+            response = await self._execute(self.client.table("plots")
                        .select("author_id")
-                       .eq("user_id", user_id)
-                       .execute())
+                       .eq("user_id", user_id))
             
             if not response.data:
                 return []
@@ -350,11 +409,10 @@ class SupabaseAdapter(IDatabase):
                 return []
             
             # Get unique authors
-            authors_response = (self.client.table("authors")
+            authors_response = await self._execute(self.client.table("authors")
                                .select("*")
                                .in_("id", list(set(author_ids)))
-                               .limit(limit)
-                               .execute())
+                               .limit(limit))
             return authors_response.data
         except Exception as e:
             self.logger.error(f"Error getting user authors: {e}")
@@ -389,7 +447,7 @@ class SupabaseAdapter(IDatabase):
         
         try:
             async with self.connection_pool.get_connection() as conn:
-                response = conn.client.table(table_name).insert(records).execute()
+                response = await self._execute(conn.client.table(table_name).insert(records))
                 return [record["id"] for record in response.data] if response.data else []
         except Exception as e:
             self.logger.error(f"Error in batch insert to {table_name}: {e}")
@@ -402,30 +460,104 @@ class SupabaseAdapter(IDatabase):
         
         try:
             async with self.connection_pool.get_connection() as conn:
-                response = conn.client.table(table_name).select("*").in_("id", ids).execute()
+                response = await self._execute(conn.client.table(table_name).select("*").in_("id", ids))
                 return response.data if response.data else []
         except Exception as e:
             self.logger.error(f"Error in batch select from {table_name}: {e}")
             raise
     
+    async def get_session_content(self, session_id: str, tables: List[str]) -> List[Dict[str, Any]]:
+        """Get a session's rows from several tables via the session_content view, oldest first"""
+        try:
+            async with self.connection_pool.get_connection() as conn:
+                response = await self._execute(
+                    conn.client.table("session_content").select("source_table, record")
+                    .eq("session_id", session_id).in_("source_table", list(tables)).order("created_at")
+                )
+                return response.data or []
+        except Exception as e:
+            self.logger.error(f"Error getting session content for {session_id}: {e}")
+            raise
+    
+    async def _rpc(self, function_name: str, params: Dict[str, Any]) -> Any:
+        """Call a Postgres function (see migrations) and return its result"""
+        try:
+            async with self.connection_pool.get_connection() as conn:
+                response = await self._execute(conn.client.rpc(function_name, params))
+                return response.data
+        except Exception as e:
+            self.logger.error(f"Error calling {function_name}: {e}")
+            raise
+    
+    async def get_invocation_analytics(self, since: str, agent_name: Optional[str] = None) -> Dict[str, Any]:
+        """Aggregate agent invocations started since an ISO timestamp, in Postgres"""
+        return await self._rpc("agent_invocation_analytics", {"p_since": since, "p_agent_name": agent_name}) or {}
+    
+    async def get_invocation_errors(self, since: str) -> Dict[str, Any]:
+        """Aggregate failed agent invocations started since an ISO timestamp, in Postgres"""
+        return await self._rpc("agent_invocation_errors", {"p_since": since}) or {}
+    
+    async def get_score_distribution(self, limit: int = 50) -> Dict[str, Any]:
+        """Aggregate the most recent scores, in Postgres"""
+        return await self._rpc("score_distribution", {"p_limit": limit}) or {}
+    
+    # IDs per in_() filter, keeping the request URL well under gateway limits
+    _ID_FILTER_CHUNK = 200
+    
+    async def batch_select_by_column(self, table_name: str, column: str, values: List[Any]) -> List[Dict[str, Any]]:
+        """Select records whose column matches any of the values, one in_() per chunk"""
+        if not values:
+            return []
+        
+        values = list(values)
+        chunks = [values[i:i + self._ID_FILTER_CHUNK] for i in range(0, len(values), self._ID_FILTER_CHUNK)]
+        
+        try:
+            async with self.connection_pool.get_connection() as conn:
+                responses = await asyncio.gather(*[
+                    self._execute(conn.client.table(table_name).select("*").in_(column, chunk))
+                    for chunk in chunks
+                ])
+                return [row for response in responses for row in (response.data or [])]
+        except Exception as e:
+            self.logger.error(f"Error in batch select from {table_name} by {column}: {e}")
+            raise
+    
     async def batch_update(self, table_name: str, updates: List[Dict[str, Any]]) -> int:
-        """Update multiple records using connection pool"""
+        """
+        Update multiple records in bulk using connection pool.
+        
+        Each update is either {'id': ..., 'data': {...}} or {'id': ..., **fields}.
+        Records are grouped by identical changes and each group is one
+        update().in_("id", ...) per chunk of IDs, so only the changed columns
+        are written and no rows are created.
+        """
         if not updates:
             return 0
         
-        updated_count = 0
+        changes: Dict[str, Dict[str, Any]] = {}
+        for update in updates:
+            fields = dict(update)
+            record_id = fields.pop('id')
+            if set(fields) == {'data'} and isinstance(fields['data'], dict):
+                fields = fields['data']
+            changes.setdefault(record_id, {}).update(fields)
+        
+        groups: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+        for record_id, data in changes.items():
+            key = json.dumps(data, sort_keys=True, default=str)
+            groups.setdefault(key, (data, []))[1].append(record_id)
         
         try:
             async with self.connection_pool.get_connection() as conn:
-                for update in updates:
-                    record_id = update['id']
-                    data = update['data']
-                    
-                    response = conn.client.table(table_name).update(data).eq("id", record_id).execute()
-                    if response.data and len(response.data) > 0:
-                        updated_count += 1
-                
-                return updated_count
+                responses = await asyncio.gather(*[
+                    self._execute(
+                        conn.client.table(table_name).update(data).in_("id", record_ids[i:i + self._ID_FILTER_CHUNK])
+                    )
+                    for data, record_ids in groups.values()
+                    for i in range(0, len(record_ids), self._ID_FILTER_CHUNK)
+                ])
+                return sum(len(response.data or []) for response in responses)
         except Exception as e:
             self.logger.error(f"Error in batch update to {table_name}: {e}")
             raise
@@ -439,4 +571,5 @@ class SupabaseAdapter(IDatabase):
         """Close the database adapter and connection pool"""
         if hasattr(self, 'connection_pool'):
             await self.connection_pool.close()
-            self.logger.info("Supabase adapter closed")
\ No newline at end of file
+            self.logger.info("Supabase adapter closed")
+        self._executor.shutdown(wait=False)
\ No newline at end of file
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 from .base_repository import BaseRepository
 from ..core.interfaces import IDatabase
 from ..core.logging import get_logger
-from ..core.agent_tracker import AgentInvocation
+from ..core.agent_tracker import AgentInvocation, performance_metric_record
 
 logger = get_logger("agent_invocation_repository")
 
@@ -20,31 +20,7 @@ class AgentInvocationRepository(BaseRepository):
     
     def _serialize(self, invocation: AgentInvocation) -> Dict[str, Any]:
         """Convert AgentInvocation to database format"""
-        return {
-            "invocation_id": invocation.invocation_id,
-            "agent_name": invocation.agent_name,
-            "user_id": invocation.user_id,
-            "session_id": invocation.session_id,
-            "request_content": invocation.request_content,
-            "request_context": invocation.request_context,
-            "start_time": invocation.start_time.isoformat() if invocation.start_time else None,
-            "end_time": invocation.end_time.isoformat() if invocation.end_time else None,
-            "duration_ms": invocation.duration_ms,
-            "llm_model": invocation.llm_model,
-            "final_prompt": invocation.final_prompt,
-            "raw_response": invocation.raw_response,
-            "prompt_tokens": invocation.prompt_tokens,
-            "completion_tokens": invocation.completion_tokens,
-            "total_tokens": invocation.total_tokens,
-            "tool_calls": invocation.tool_calls or [],
-            "tool_results": invocation.tool_results or [],
-            "latency_ms": invocation.latency_ms,
-            "cost_estimate": invocation.cost_estimate,
-            "success": invocation.success,
-            "error_message": invocation.error_message,
-            "response_content": invocation.response_content,
-            "parsed_json": invocation.parsed_json
-        }
+        return invocation.to_record()
     
     def _deserialize(self, data: Dict[str, Any]) -> AgentInvocation:
         """Convert database data to AgentInvocation"""
@@ -138,102 +114,69 @@ class AgentInvocationRepository(BaseRepository):
     
     async def get_performance_analytics(self, agent_name: str = None, 
                                       hours: int = 24) -> Dict[str, Any]:
-        """Get performance analytics for agents"""
+        """
+        Get performance analytics for agents.
+        
+        Time-window filtering, per-agent and per-tool grouping, percentiles and
+        success rates are computed by the database; only aggregates are returned.
+        """
         try:
-            # Build query filters
-            filters = {}
-            if agent_name:
-                filters["agent_name"] = agent_name
-            
-            # Time range filter
             since_time = datetime.utcnow() - timedelta(hours=hours)
+            analytics = await self._database.get_invocation_analytics(since_time.isoformat(), agent_name)
             
-            # For SQLite, we'll use a simple approach
-            # For production, consider using raw SQL for complex analytics
-            results = await self._database.select(
-                self._table_name,
-                filters=filters,
-                order_by="start_time",
-                desc=True,
-                limit=1000
-            )
-            
-            # Filter by time (basic approach)
-            recent_results = [
-                row for row in results 
-                if row.get("start_time") and 
-                datetime.fromisoformat(row["start_time"]) >= since_time
-            ]
-            
-            if not recent_results:
+            summary = analytics.get("summary") or {}
+            total_invocations = summary.get("total") or 0
+            if not total_invocations:
                 return {"total_invocations": 0, "timeframe_hours": hours}
             
-            # Calculate analytics
-            total_invocations = len(recent_results)
-            successful_invocations = len([r for r in recent_results if r.get("success")])
-            success_rate = successful_invocations / total_invocations if total_invocations > 0 else 0
-            
-            # Duration statistics
-            durations = [r["duration_ms"] for r in recent_results if r.get("duration_ms")]
-            avg_duration = sum(durations) / len(durations) if durations else 0
-            max_duration = max(durations) if durations else 0
-            min_duration = min(durations) if durations else 0
-            
-            # Token statistics
-            tokens = [r["total_tokens"] for r in recent_results if r.get("total_tokens")]
-            total_tokens = sum(tokens) if tokens else 0
-            avg_tokens = total_tokens / len(tokens) if tokens else 0
-            
-            # Cost statistics
-            costs = [r["cost_estimate"] for r in recent_results if r.get("cost_estimate")]
-            total_cost = sum(costs) if costs else 0
-            
-            # Agent usage patterns
-            agent_usage = {}
-            for result in recent_results:
-                agent = result["agent_name"]
-                agent_usage[agent] = agent_usage.get(agent, 0) + 1
-            
-            # Tool usage patterns
-            tool_usage = {}
-            for result in recent_results:
-                tool_calls = result.get("tool_calls", [])
-                for tool_call in tool_calls:
-                    tool_name = tool_call.get("tool", "unknown")
-                    tool_usage[tool_name] = tool_usage.get(tool_name, 0) + 1
-            
-            # Recent errors
-            recent_errors = [
-                {
-                    "invocation_id": r["invocation_id"],
-                    "agent": r["agent_name"],
-                    "error": r["error_message"],
-                    "timestamp": r["start_time"]
-                }
-                for r in recent_results[-20:] 
-                if not r.get("success") and r.get("error_message")
-            ]
+            total_cost = summary.get("total_cost") or 0
             
             return {
                 "timeframe_hours": hours,
                 "total_invocations": total_invocations,
-                "success_rate": round(success_rate, 3),
+                "success_rate": round((summary.get("successful") or 0) / total_invocations, 3),
                 "performance": {
-                    "avg_duration_ms": round(avg_duration, 2),
-                    "max_duration_ms": max_duration,
-                    "min_duration_ms": min_duration
+                    "avg_duration_ms": round(summary.get("avg_duration_ms") or 0, 2),
+                    "max_duration_ms": summary.get("max_duration_ms") or 0,
+                    "min_duration_ms": summary.get("min_duration_ms") or 0,
+                    "p50_duration_ms": summary.get("p50_duration_ms") or 0,
+                    "p95_duration_ms": summary.get("p95_duration_ms") or 0,
+                    "p99_duration_ms": summary.get("p99_duration_ms") or 0
                 },
                 "token_usage": {
-                    "total_tokens": total_tokens,
-                    "avg_tokens_per_invocation": round(avg_tokens, 2)
+                    "total_tokens": summary.get("total_tokens") or 0,
+                    "avg_tokens_per_invocation": round(summary.get("avg_tokens") or 0, 2)
                 },
                 "cost_analysis": {
                     "total_cost_usd": round(total_cost, 4),
-                    "avg_cost_per_invocation": round(total_cost / total_invocations, 6) if total_invocations > 0 else 0
+                    "avg_cost_per_invocation": round(total_cost / total_invocations, 6)
+                },
+                "agent_usage_patterns": {
+                    row["agent_name"]: row["invocations"] for row in analytics.get("by_agent", [])
+                },
+                "agent_performance": {
+                    row["agent_name"]: {
+                        "invocations": row["invocations"],
+                        "success_rate": round((row.get("successful") or 0) / row["invocations"], 3),
+                        "avg_duration_ms": round(row.get("avg_duration_ms") or 0, 2),
+                        "p50_duration_ms": row.get("p50_duration_ms") or 0,
+                        "p95_duration_ms": row.get("p95_duration_ms") or 0,
+                        "p99_duration_ms": row.get("p99_duration_ms") or 0
+                    }
+                    for row in analytics.get("by_agent", [])
+                },
+                "tool_usage_patterns": {
+                    row["tool"]: row["calls"] for row in analytics.get("tool_usage", [])
                 },
-                "agent_usage_patterns": agent_usage,
-                "tool_usage_patterns": tool_usage,
-                "recent_errors": recent_errors
+                "recent_errors": [
+                    {
+                        "invocation_id": row["invocation_id"],
+                        "agent": row["agent_name"],
+                        "error": row["error_message"],
+                        "timestamp": row["start_time"]
+                    }
+                    for row in analytics.get("recent_errors", [])
+                ]
             }
             
         except Exception as e:
@@ -246,15 +189,7 @@ class AgentInvocationRepository(BaseRepository):
                                     session_id: str = None) -> str:
         """Save a performance metric"""
         try:
-            data = {
-                "metric_name": metric_name,
-                "metric_value": value,
-                "tags": tags or {},
-                "agent_name": agent_name,
-                "user_id": user_id,
-                "session_id": session_id,
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            data = performance_metric_record(metric_name, value, tags, agent_name, user_id, session_id)
             
             result = await self._database.insert("performance_metrics", data)
             return result.get("id") if isinstance(result, dict) else str(result)
@@ -264,56 +199,28 @@ class AgentInvocationRepository(BaseRepository):
             raise
     
     async def get_error_analysis(self, hours: int = 24) -> Dict[str, Any]:
-        """Get detailed error analysis"""
+        """Get detailed error analysis, aggregated by the database"""
         try:
             since_time = datetime.utcnow() - timedelta(hours=hours)
+            errors = await self._database.get_invocation_errors(since_time.isoformat())
             
-            results = await self._database.select(
-                self._table_name,
-                filters={"success": False},
-                order_by="start_time",
-                desc=True,
-                limit=500
-            )
-            
-            # Filter by time
-            recent_errors = [
-                row for row in results 
-                if row.get("start_time") and 
-                datetime.fromisoformat(row["start_time"]) >= since_time
-            ]
-            
-            if not recent_errors:
+            if not errors.get("total"):
                 return {"total_errors": 0, "timeframe_hours": hours}
             
-            # Error pattern analysis
-            error_patterns = {}
-            agent_errors = {}
-            
-            for error in recent_errors:
-                error_msg = error.get("error_message", "Unknown error")
-                agent_name = error["agent_name"]
-                
-                # Count error patterns
-                error_patterns[error_msg] = error_patterns.get(error_msg, 0) + 1
-                
-                # Count errors by agent
-                agent_errors[agent_name] = agent_errors.get(agent_name, 0) + 1
-            
             return {
                 "timeframe_hours": hours,
-                "total_errors": len(recent_errors),
-                "error_patterns": dict(sorted(error_patterns.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "errors_by_agent": agent_errors,
+                "total_errors": errors["total"],
+                "error_patterns": {row["error_message"]: row["count"] for row in errors.get("patterns", [])},
+                "errors_by_agent": {row["agent_name"]: row["count"] for row in errors.get("by_agent", [])},
                 "recent_errors": [
                     {
-                        "invocation_id": e["invocation_id"],
-                        "agent": e["agent_name"],
-                        "error": e["error_message"],
-                        "timestamp": e["start_time"],
-                        "request_preview": e["request_content"][:100] + "..." if len(e["request_content"]) > 100 else e["request_content"]
+                        "invocation_id": row["invocation_id"],
+                        "agent": row["agent_name"],
+                        "error": row["error_message"],
+                        "timestamp": row["start_time"],
+                        "request_preview": row["request_preview"]
                     }
-                    for e in recent_errors[:20]
+                    for row in errors.get("recent", [])
                 ]
             }
             
@@ -7,6 +7,7 @@ from typing import Dict, Any, List, Optional, TypeVar, Generic
 from datetime import datetime
 from ..core.interfaces import IDatabase
 from ..core.logging import get_logger
+from .batch_operations import apply_batch_update
 
 T = TypeVar('T')
 
@@ -63,6 +64,19 @@ class BaseRepository(ABC, Generic[T]):
             self._logger.error(f"Error updating {self._table_name} {entity_id}: {e}", error=e)
             raise
     
+    async def update_many(self, changes: Dict[str, Dict[str, Any]]) -> int:
+        """Apply field changes to many entities in bulk, keyed by entity ID"""
+        if not changes:
+            return 0
+        try:
+            updates = [{"id": entity_id, "data": data} for entity_id, data in changes.items()]
+            updated = await apply_batch_update(self._database, self._table_name, updates)
+            self._logger.info(f"Updated {updated} {self._table_name} records in bulk")
+            return updated
+        except Exception as e:
+            self._logger.error(f"Error bulk updating {self._table_name}: {e}", error=e)
+            raise
+    
     async def delete(self, entity_id: str) -> bool:
         """Delete an entity by ID"""
         try:
@@ -92,6 +106,14 @@ class BaseRepository(ABC, Generic[T]):
             self._logger.error(f"Error searching {self._table_name}: {e}", error=e)
             raise
     
+    async def search_text(self, query: str, user_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Full-text search a user's entities in raw format, best matches first"""
+        try:
+            return await self._database.search_content(query, self._table_name, user_id, limit)
+        except Exception as e:
+            self._logger.error(f"Error text searching {self._table_name}: {e}", error=e)
+            raise
+    
     async def count(self, criteria: Optional[Dict[str, Any]] = None) -> int:
         """Count entities matching criteria"""
         try:
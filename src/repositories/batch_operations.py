@@ -3,14 +3,32 @@ Batch operations to reduce N+1 query problems in repositories.
 Provides efficient methods for bulk data operations.
 """
 
+import asyncio
 from typing import Dict, Any, List, Optional, TypeVar, Generic
 from abc import ABC, abstractmethod
 from ..core.interfaces import IDatabase
 from ..core.logging import get_logger
+from .relation_loader import RelationLoader
 
 T = TypeVar('T')
 
 
+async def apply_batch_update(database: IDatabase, table_name: str, updates: List[Dict[str, Any]]) -> int:
+    """
+    Apply per-record changes, each {'id': ..., 'data': {...}}.
+
+    Uses the adapter's bulk batch_update when available, else one update per record.
+    """
+    if hasattr(database, 'batch_update'):
+        return await database.batch_update(table_name, updates)
+
+    updated_count = 0
+    for update in updates:
+        if await database.update(table_name, update['id'], update['data']):
+            updated_count += 1
+    return updated_count
+
+
 class BatchOperationsMixin:
     """Mixin class to add batch operations to repositories"""
     
@@ -71,6 +89,23 @@ class BatchOperationsMixin:
             self._logger.error(f"Error in batch create: {e}")
             raise
     
+    async def batch_update(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Apply per-record changes in bulk.
+        
+        Each update is {'id': ..., 'data': {...}}. Uses the adapter's bulk update
+        (one round-trip or transaction) when available.
+        """
+        if not updates:
+            return 0
+        
+        try:
+            return await apply_batch_update(self._database, self._table_name, updates)
+            
+        except Exception as e:
+            self._logger.error(f"Error in batch update: {e}")
+            raise
+    
     async def batch_update_by_criteria(self, criteria: Dict[str, Any], updates: Dict[str, Any]) -> int:
         """Update multiple entities matching criteria"""
         try:
@@ -79,59 +114,25 @@ class BatchOperationsMixin:
             if not entities:
                 return 0
             
-            # Prepare batch updates
-            batch_updates = []
-            for entity in entities:
-                batch_updates.append({
-                    'id': entity['id'],
-                    'data': updates
-                })
-            
-            # Use database batch update if available
-            if hasattr(self._database, 'batch_update'):
-                return await self._database.batch_update(self._table_name, batch_updates)
-            
-            # Fallback to individual updates
-            updated_count = 0
-            for entity in entities:
-                success = await self._database.update(self._table_name, entity['id'], updates)
-                if success:
-                    updated_count += 1
-            return updated_count
+            # Same changes for every match: a single bulk update
+            return await self.batch_update([
+                {'id': entity['id'], 'data': updates}
+                for entity in entities
+            ])
             
         except Exception as e:
             self._logger.error(f"Error in batch update by criteria: {e}")
             raise
     
     async def get_with_related_data(self, entity_id: str, related_tables: List[str]) -> Dict[str, Any]:
-        """Get an entity with its related data in a single operation to avoid N+1"""
+        """Get an entity with its related data, one query per related table"""
         try:
             # Get the main entity
             entity = await self._database.get_by_id(self._table_name, entity_id)
             if not entity:
                 return {}
             
-            # Get related data
-            for related_table in related_tables:
-                # Common foreign key patterns
-                foreign_key_patterns = [
-                    f"{self._table_name[:-1]}_id",  # plots -> plot_id
-                    f"{self._table_name}_id",       # plots -> plots_id
-                    "parent_id",
-                    "owner_id",
-                    "user_id"
-                ]
-                
-                for fk_pattern in foreign_key_patterns:
-                    related_data = await self._database.search(
-                        related_table, 
-                        {fk_pattern: entity_id}, 
-                        limit=100
-                    )
-                    if related_data:
-                        entity[f"{related_table}"] = related_data
-                        break
-            
+            await self._attach_related([entity], related_tables)
             return entity
             
         except Exception as e:
@@ -149,48 +150,40 @@ class BatchOperationsMixin:
             if not entities:
                 return []
             
-            # Create entity lookup map
-            entity_map = {entity['id']: entity for entity in entities}
-            
-            # Get related data for all entities at once
-            for related_table in related_tables:
-                foreign_key_patterns = [
-                    f"{self._table_name[:-1]}_id",
-                    f"{self._table_name}_id",
-                    "parent_id",
-                    "owner_id",
-                    "user_id"
-                ]
-                
-                for fk_pattern in foreign_key_patterns:
-                    # Get all related records in one query
-                    all_related = []
-                    for entity_id in entity_ids:
-                        related_data = await self._database.search(
-                            related_table,
-                            {fk_pattern: entity_id},
-                            limit=100
-                        )
-                        for record in related_data:
-                            record['parent_entity_id'] = entity_id
-                            all_related.append(record)
-                    
-                    # Group related data by parent entity
-                    if all_related:
-                        for record in all_related:
-                            parent_id = record.get('parent_entity_id')
-                            if parent_id in entity_map:
-                                if related_table not in entity_map[parent_id]:
-                                    entity_map[parent_id][related_table] = []
-                                entity_map[parent_id][related_table].append(record)
-                        break
-            
-            return list(entity_map.values())
+            await self._attach_related(entities, related_tables)
+            return entities
             
         except Exception as e:
             self._logger.error(f"Error getting multiple entities with related data: {e}")
             raise
     
+    async def _attach_related(self, entities: List[Dict[str, Any]], related_tables: List[str],
+                              loader: Optional[RelationLoader] = None) -> None:
+        """
+        Attach related rows to each entity under the related table's name.
+        
+        Join columns come from the schema's foreign keys; each relation is one
+        IN (...) query and independent relations are loaded concurrently.
+        """
+        loader = loader or RelationLoader(self._database)
+        
+        async def attach(related_table: str):
+            try:
+                relation = loader.resolve(self._table_name, related_table)
+            except ValueError as e:
+                self._logger.warning(f"Skipping related table: {e}")
+                return
+            
+            related_rows = await loader.load_many(
+                relation.table, relation.column,
+                [entity.get(relation.local_key) for entity in entities]
+            )
+            for entity, rows in zip(entities, related_rows):
+                if rows:
+                    entity[related_table] = rows
+        
+        await asyncio.gather(*[attach(related_table) for related_table in dict.fromkeys(related_tables)])
+    
     async def search_with_pagination_and_related(
         self, 
         criteria: Dict[str, Any], 
@@ -212,9 +205,7 @@ class BatchOperationsMixin:
             
             # Get related data if requested
             if related_tables and entities:
-                entity_ids = [entity['id'] for entity in entities]
-                entities_with_related = await self.get_multiple_with_related_data(entity_ids, related_tables)
-                entities = entities_with_related
+                await self._attach_related(entities, related_tables)
             
             return {
                 'data': entities,
@@ -272,8 +263,6 @@ class OptimizedPlotRepository:
         """Get all session content (plots, authors, world building, characters) in batch"""
         try:
             # Get all content for session in parallel
-            import asyncio
-            
             plots_task = self._database.search("plots", {"session_id": session_id}, limit=100)
             authors_task = self._database.search("authors", {"session_id": session_id}, limit=100)
             worlds_task = self._database.search("world_building", {"session_id": session_id}, limit=100)
@@ -344,31 +333,21 @@ class OptimizedCharactersRepository:
             if not plot_ids:
                 return []
             
-            # Get all characters for the plots
-            all_characters = []
-            for plot_id in plot_ids:
-                characters = await self._database.search("characters", {"plot_id": plot_id}, limit=100)
-                all_characters.extend(characters)
+            # Get all characters for the plots in one query
+            loader = RelationLoader(self._database)
+            characters_per_plot = await loader.load_many("characters", "plot_id", plot_ids)
+            all_characters = [character for characters in characters_per_plot for character in characters]
             
             if not all_characters:
                 return []
             
-            # Get unique world IDs
-            world_ids = list(set([char.get("world_id") for char in all_characters if char.get("world_id")]))
-            
-            # Batch get world building data
-            worlds = []
-            if world_ids:
-                worlds = await self.batch_ops.batch_get_by_ids(world_ids)
-            
-            # Create world lookup map
-            world_map = {world['id']: world for world in worlds}
+            # Batch get world building data (world_id -> world_building, deduplicated)
+            worlds_per_character = await loader.load_related("characters", all_characters, "world_building")
             
             # Attach world context to characters
-            for character in all_characters:
-                world_id = character.get("world_id")
-                if world_id and world_id in world_map:
-                    character['world_context'] = world_map[world_id]
+            for character, worlds in zip(all_characters, worlds_per_character):
+                if worlds:
+                    character['world_context'] = worlds[0]
             
             return all_characters
             
@@ -0,0 +1,86 @@
+"""
+In-process TTL cache for resolved session and user identities.
+Lets SessionRepository skip the existence round-trips for identities it has already resolved.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class IdentityCache:
+    """
+    Thread-safe LRU cache whose entries expire ttl_seconds after being stored.
+
+    Sync tools resolve sessions through run_async_safe on worker threads, so
+    lookups are guarded by a lock rather than relying on a single event loop.
+    Hits and misses are counted for the metrics router.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_size: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._cache[key]
+                self.misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Cache a value, evicting the least recently used entries at capacity"""
+        with self._lock:
+            self._cache.pop(key, None)
+            while len(self._cache) >= self.max_size:
+                self._cache.popitem(last=False)
+            self._cache[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop one entry; returns whether it was cached"""
+        with self._lock:
+            removed = self._cache.pop(key, None) is not None
+            if removed:
+                self.invalidations += 1
+            return removed
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._cache.clear()
+
+    def size(self) -> int:
+        """Number of cached entries, including expired ones not yet evicted"""
+        with self._lock:
+            return len(self._cache)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
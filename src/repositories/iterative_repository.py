@@ -116,7 +116,28 @@ class IterativeRepository:
         except Exception as e:
             self._logger.error(f"Error saving score for iteration {iteration_id}: {e}", error=e)
             raise
-    
+
+    async def update_scores(self, changes: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Apply field changes to many score records in one bulk update.
+
+        Args:
+            changes: Field changes keyed by score record ID
+
+        Returns:
+            Number of score records updated
+        """
+        try:
+            updated = await self._database.batch_update(
+                "scores", [{"id": score_id, "data": data} for score_id, data in changes.items()]
+            )
+            self._logger.info(f"Updated {updated} score records")
+            return updated
+
+        except Exception as e:
+            self._logger.error(f"Error bulk updating scores: {e}", error=e)
+            raise
+
     async def get_iteration_history(self, iteration_id: str) -> Dict[str, Any]:
         """
         Get complete history for an iteration (critique, enhancement, scoring).
@@ -170,37 +191,23 @@ class IterativeRepository:
             Dictionary containing quality trend analysis
         """
         try:
-            # Get recent scores
-            recent_scores = await self._database.select(
-                "scores",
-                order_by="created_at",
-                desc=True,
-                limit=limit
-            )
+            # Count, average, range and quality bands are computed by the database
+            distribution = await self._database.get_score_distribution(limit)
             
-            if not recent_scores:
+            if not distribution.get("total"):
                 return {"message": "No scoring data available"}
             
-            # Calculate trends
-            scores = [score.get("overall_score", 0.0) for score in recent_scores]
-            avg_score = sum(scores) / len(scores)
-            
-            # Quality distribution
-            high_quality = len([s for s in scores if s >= 8.0])
-            medium_quality = len([s for s in scores if 6.0 <= s < 8.0])
-            low_quality = len([s for s in scores if s < 6.0])
-            
             return {
-                "total_iterations": len(recent_scores),
-                "average_score": round(avg_score, 2),
+                "total_iterations": distribution["total"],
+                "average_score": round(distribution["average"], 2),
                 "quality_distribution": {
-                    "high_quality": high_quality,
-                    "medium_quality": medium_quality, 
-                    "low_quality": low_quality
+                    "high_quality": distribution["high"],
+                    "medium_quality": distribution["medium"], 
+                    "low_quality": distribution["low"]
                 },
                 "score_range": {
-                    "min": min(scores),
-                    "max": max(scores)
+                    "min": distribution["min"],
+                    "max": distribution["max"]
                 }
             }
             
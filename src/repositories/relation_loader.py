@@ -0,0 +1,131 @@
+"""
+Relation-aware batch loader for related-record lookups.
+Resolves join columns from the schema's foreign keys and batches lookups DataLoader-style.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+
+from ..core.interfaces import IDatabase
+from ..core.logging import get_logger
+from ..database.sqlite.schema_manager import FOREIGN_KEYS
+
+
+@dataclass(frozen=True)
+class Relation:
+    """How rows of a source table reach rows of a related table"""
+    table: str        # Related table to query
+    column: str       # Column of the related table matched with IN (...)
+    local_key: str    # Source row field holding the values to match
+    many: bool        # True for child rows (one-to-many), False for a parent row
+
+
+class RelationLoader:
+    """
+    Batches and coalesces related-record lookups, DataLoader-style.
+
+    load() calls made in the same event-loop tick are collected and dispatched
+    as one IN (...) query per (table, column). Results are cached per
+    (table, column, value) for the loader's lifetime, so identical lookups
+    share one fetch; scope a loader to a single request.
+    """
+
+    def __init__(self, database: IDatabase, foreign_keys: Optional[Dict[str, Dict[str, str]]] = None):
+        self._database = database
+        self._foreign_keys = foreign_keys if foreign_keys is not None else FOREIGN_KEYS
+        self._cache: Dict[Tuple[str, str, Any], asyncio.Future] = {}
+        self._pending: Dict[Tuple[str, str], Dict[Any, asyncio.Future]] = {}
+        self._tasks: set = set()
+        self._logger = get_logger("relation_loader")
+        self.queries_issued = 0
+
+    def resolve(self, table: str, related_table: str) -> Relation:
+        """Find the foreign key joining table to related_table in either direction"""
+        for column, parent in self._foreign_keys.get(related_table, {}).items():
+            if parent == table:
+                return Relation(related_table, column, "id", many=True)
+
+        for column, parent in self._foreign_keys.get(table, {}).items():
+            if parent == related_table:
+                return Relation(related_table, "id", column, many=False)
+
+        raise ValueError(f"No foreign key relates {table} to {related_table}")
+
+    def load(self, table: str, column: str, value: Any) -> asyncio.Future:
+        """Rows of table whose column equals value, batched with other loads in this tick"""
+        loop = asyncio.get_running_loop()
+        if value is None:
+            empty = loop.create_future()
+            empty.set_result([])
+            return empty
+
+        key = (table, column, value)
+        future = self._cache.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._cache[key] = future
+            batch = self._pending.setdefault((table, column), {})
+            if not batch:
+                loop.call_soon(self._dispatch, table, column)
+            batch[value] = future
+
+        # Shield so one cancelled caller does not cancel the shared lookup
+        return asyncio.shield(future)
+
+    async def load_many(self, table: str, column: str, values: Iterable[Any]) -> List[List[Dict[str, Any]]]:
+        """Rows per value, in input order; all values share one IN (...) query"""
+        return list(await asyncio.gather(*[self.load(table, column, value) for value in values]))
+
+    async def load_related(self, table: str, entities: List[Dict[str, Any]],
+                           related_table: str) -> List[List[Dict[str, Any]]]:
+        """Related rows for each entity of table, in input order"""
+        relation = self.resolve(table, related_table)
+        return await self.load_many(
+            relation.table, relation.column, [entity.get(relation.local_key) for entity in entities]
+        )
+
+    def _dispatch(self, table: str, column: str):
+        """Start the fetch for everything queued against (table, column)"""
+        batch = self._pending.pop((table, column), None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._fetch(table, column, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, table: str, column: str, batch: Dict[Any, asyncio.Future]):
+        """Run one IN (...) query and resolve every queued future from it"""
+        try:
+            rows = await self._select_in(table, column, list(batch))
+        except Exception as e:
+            self._logger.error(f"Error loading {table} by {column}: {e}")
+            for value, future in batch.items():
+                # Failed lookups are not cached, so a later load retries
+                self._cache.pop((table, column, value), None)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        grouped: Dict[Any, List[Dict[str, Any]]] = {}
+        for row in rows:
+            grouped.setdefault(row.get(column), []).append(row)
+
+        for value, future in batch.items():
+            if not future.done():
+                future.set_result(grouped.get(value, []))
+
+    async def _select_in(self, table: str, column: str, values: List[Any]) -> List[Dict[str, Any]]:
+        """Select rows matching any value, using the adapter's set-based query when available"""
+        self.queries_issued += 1
+        if hasattr(self._database, 'batch_select_by_column'):
+            return await self._database.batch_select_by_column(table, column, values)
+
+        if column == "id" and hasattr(self._database, 'batch_select_by_ids'):
+            return await self._database.batch_select_by_ids(table, values)
+
+        # Fallback to concurrent individual queries
+        results = await asyncio.gather(*[
+            self._database.search(table, {column: value}, limit=100) for value in values
+        ])
+        return [row for rows in results for row in rows]
@@ -3,24 +3,48 @@ Repository for session-related operations.
 Handles session data aggregation, orchestrator decisions, and session management.
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from .base_repository import BaseRepository
+from .identity_cache import IdentityCache
+from .relation_loader import RelationLoader
 from ..database.supabase_adapter import SupabaseAdapter
 from ..core.logging import get_logger
 
 
+# Session-keyed content tables returned by get_session_data
+SESSION_CONTENT_TABLES = ("plots", "authors", "world_building", "characters", "orchestrator_decisions")
+
+# Tables whose rows appear on the session timeline
+TIMELINE_TABLES = ("plots", "authors", "world_building", "characters")
+
+# Iterative improvement tables, keyed by iteration_id
+ITERATION_TABLES = ("critiques", "enhancements", "scores")
+
+# Columns holding the external session/user identifiers (migrations/001 schema);
+# adapters with a different schema declare their own IDENTITY_COLUMNS
+DEFAULT_IDENTITY_COLUMNS = {"sessions": "session_id", "users": "user_id"}
+
+
 class SessionRepository:
     """Repository for session operations and data aggregation"""
     
-    def __init__(self, database: SupabaseAdapter):
+    def __init__(self, database: SupabaseAdapter, identity_cache_ttl: float = 300.0,
+                 identity_cache_size: int = 10000):
         self._database = database
         self._logger = get_logger("session_repository")
+        # session_id -> session row and user_id -> user UUID, see ensure_session_exists
+        self._session_cache = IdentityCache(identity_cache_ttl, identity_cache_size)
+        self._user_cache = IdentityCache(identity_cache_ttl, identity_cache_size)
     
     async def get_session_data(self, session_id: str) -> Dict[str, Any]:
         """
         Aggregate all content for a session across all tables.
         
+        Session tables are read in one round-trip and the iteration tables with
+        one batched iteration_id IN (...) query each, run concurrently.
+        
         Args:
             session_id: The session identifier
             
@@ -41,34 +65,23 @@ class SessionRepository:
                 "scores": []
             }
             
-            # Get data from each table
-            plots = await self._database.search("plots", criteria={"session_id": session_id})
-            authors = await self._database.search("authors", criteria={"session_id": session_id})
-            world_building = await self._database.search("world_building", criteria={"session_id": session_id})
-            characters = await self._database.search("characters", criteria={"session_id": session_id})
-            orchestrator_decisions = await self._database.search("orchestrator_decisions", criteria={"session_id": session_id})
+            # Get data from every session table in one query, oldest first
+            for item in await self._get_session_content(session_id, SESSION_CONTENT_TABLES):
+                session_data[item["source_table"]].append(item["record"])
+            plots = session_data["plots"]
             
             # Get iterative improvement data
             # Note: These tables are keyed by iteration_id, need to join through plots/content
             if plots:
-                plot_ids = [plot.get("id") for plot in plots]
-                for plot_id in plot_ids:
-                    critiques = await self._database.search("critiques", criteria={"iteration_id": f"plot_{plot_id}"})
-                    enhancements = await self._database.search("enhancements", criteria={"iteration_id": f"plot_{plot_id}"})
-                    scores = await self._database.search("scores", criteria={"iteration_id": f"plot_{plot_id}"})
-                    
-                    session_data["critiques"].extend(critiques)
-                    session_data["enhancements"].extend(enhancements)
-                    session_data["scores"].extend(scores)
-            
-            # Populate session data
-            session_data["plots"] = plots
-            session_data["authors"] = authors
-            session_data["world_building"] = world_building
-            session_data["characters"] = characters
-            session_data["orchestrator_decisions"] = orchestrator_decisions
-            
-            self._logger.info(f"Retrieved session data for {session_id} with {len(plots)} plots, {len(authors)} authors, {len(world_building)} worlds, {len(characters)} characters")
+                iteration_ids = [f"plot_{plot.get('id')}" for plot in plots]
+                loader = RelationLoader(self._database)
+                results = await asyncio.gather(*[
+                    loader.load_many(table, "iteration_id", iteration_ids) for table in ITERATION_TABLES
+                ])
+                for table, rows_per_plot in zip(ITERATION_TABLES, results):
+                    session_data[table] = [row for rows in rows_per_plot for row in rows]
+            
+            self._logger.info(f"Retrieved session data for {session_id} with {len(plots)} plots, {len(session_data['authors'])} authors, {len(session_data['world_building'])} worlds, {len(session_data['characters'])} characters")
             
             return session_data
             
@@ -87,64 +100,69 @@ class SessionRepository:
             List of timeline events sorted by creation time
         """
         try:
-            # Get session data first
-            session_data = await self.get_session_data(session_id)
-            
-            if not session_data:
-                return []
-            
-            # Build timeline from all content types
-            timeline = []
-            
-            # Add plots to timeline
-            for plot in session_data.get("plots", []):
-                timeline.append({
-                    "timestamp": plot.get("created_at"),
-                    "type": "plot",
-                    "id": plot.get("id"),
-                    "title": plot.get("title"),
-                    "summary": plot.get("plot_summary", "")[:100] + "..." if plot.get("plot_summary") else ""
-                })
-            
-            # Add authors to timeline
-            for author in session_data.get("authors", []):
-                timeline.append({
-                    "timestamp": author.get("created_at"),
-                    "type": "author",
-                    "id": author.get("id"),
-                    "name": author.get("author_name"),
-                    "pen_name": author.get("pen_name")
-                })
-            
-            # Add world building to timeline
-            for world in session_data.get("world_building", []):
-                timeline.append({
-                    "timestamp": world.get("created_at"),
-                    "type": "world_building",
-                    "id": world.get("id"),
-                    "name": world.get("world_name"),
-                    "plot_id": world.get("plot_id")
-                })
-            
-            # Add characters to timeline
-            for char_set in session_data.get("characters", []):
-                timeline.append({
-                    "timestamp": char_set.get("created_at"),
-                    "type": "characters",
-                    "id": char_set.get("id"),
-                    "count": char_set.get("character_count"),
-                    "plot_id": char_set.get("plot_id")
-                })
-            
-            # Sort by timestamp
-            timeline.sort(key=lambda x: x.get("timestamp", ""))
-            
-            return timeline
+            # The aggregated query already returns rows in creation order
+            content = await self._get_session_content(session_id, TIMELINE_TABLES)
+            return [self._timeline_event(item["source_table"], item["record"]) for item in content]
             
         except Exception as e:
             self._logger.error(f"Error building timeline for session {session_id}: {e}", error=e)
             raise
     
+    async def _get_session_content(self, session_id: str, tables: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        Get a session's rows from several tables as {'source_table', 'record'} entries, oldest first.
+        
+        Uses the adapter's single-query UNION ALL path when available.
+        """
+        if hasattr(self._database, "get_session_content"):
+            return await self._database.get_session_content(session_id, list(tables))
+        
+        # Fallback to one concurrent search per table
+        results = await asyncio.gather(*[
+            self._database.search(table, criteria={"session_id": session_id}) for table in tables
+        ])
+        content = [
+            {"source_table": table, "record": record}
+            for table, records in zip(tables, results) for record in records
+        ]
+        content.sort(key=lambda item: item["record"].get("created_at") or "")
+        return content
+    
+    @staticmethod
+    def _timeline_event(table: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Format one session row as a timeline event"""
+        if table == "plots":
+            return {
+                "timestamp": record.get("created_at"),
+                "type": "plot",
+                "id": record.get("id"),
+                "title": record.get("title"),
+                "summary": record.get("plot_summary", "")[:100] + "..." if record.get("plot_summary") else ""
+            }
+        if table == "authors":
+            return {
+                "timestamp": record.get("created_at"),
+                "type": "author",
+                "id": record.get("id"),
+                "name": record.get("author_name"),
+                "pen_name": record.get("pen_name")
+            }
+        if table == "world_building":
+            return {
+                "timestamp": record.get("created_at"),
+                "type": "world_building",
+                "id": record.get("id"),
+                "name": record.get("world_name"),
+                "plot_id": record.get("plot_id")
+            }
+        return {
+            "timestamp": record.get("created_at"),
+            "type": "characters",
+            "id": record.get("id"),
+            "count": record.get("character_count"),
+            "plot_id": record.get("plot_id")
+        }
+    
     async def get_recent_sessions(self, limit: int = 50) -> Dict[str, Any]:
         """
         Get list of recent sessions with basic statistics.
@@ -257,12 +275,15 @@ class SessionRepository:
             
             stats["total_content"] = sum(stats[key] for key in ["plots", "authors", "world_building", "characters"])
             
-            # Get timeline for session duration
-            timeline = await self.get_session_timeline(session_id)
-            if timeline:
-                stats["session_start"] = timeline[0]["timestamp"]
-                stats["session_end"] = timeline[-1]["timestamp"]
-                stats["duration_items"] = len(timeline)
+            # Session duration from the timeline content already loaded
+            timestamps = sorted(
+                record.get("created_at") or ""
+                for table in TIMELINE_TABLES for record in session_data.get(table, [])
+            )
+            if timestamps:
+                stats["session_start"] = timestamps[0]
+                stats["session_end"] = timestamps[-1]
+                stats["duration_items"] = len(timestamps)
             
             return {
                 "session_id": session_id,
@@ -287,6 +308,9 @@ class SessionRepository:
             Confirmation message
         """
         try:
+            # Forget the cached identity so the session is resolved again on next use
+            self._session_cache.invalidate(session_id)
+            
             # For safety, we'll just return a warning message for now
             # In production, this would need additional confirmation mechanisms
             return {
@@ -303,6 +327,10 @@ class SessionRepository:
         """
         Ensure a session exists in the database, create if it doesn't.
         
+        Resolved sessions are cached for the identity cache TTL, so repeated
+        saves in a session skip the database. On a miss the user and session
+        are each resolved with one upsert when the adapter supports it.
+        
         Args:
             session_id: Session identifier
             user_id: User identifier
@@ -310,41 +338,68 @@ class SessionRepository:
         Returns:
             Dictionary containing session information
         """
+        cached = self._session_cache.get(session_id)
+        if cached is not None:
+            return dict(cached)
+        
         try:
-            # Check if session exists
-            existing_sessions = await self._database.search(
-                "sessions", 
-                criteria={"session_id": session_id}
-            )
-            
-            if existing_sessions:
-                self._logger.debug(f"Session {session_id} already exists")
-                return existing_sessions[0]
-            
-            # Ensure user exists first (foreign key requirement) and get their UUID
-            user_data = await self._ensure_user_exists(user_id)
-            user_uuid = user_data["id"]  # Get the actual UUID for foreign key
-            
-            # Create new session
-            session_data = {
-                "session_id": session_id,    # external session identifier
-                "user_id": user_uuid,        # internal user UUID for foreign key
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            session_record_id = await self._database.insert("sessions", session_data)
-            self._logger.info(f"Created new session {session_id} for user {user_id}")
+            session_column = self._identity_column("sessions")
+            
+            if hasattr(self._database, "upsert_returning"):
+                # Ensure user exists first (foreign key requirement) and get their UUID
+                user_uuid = await self._get_user_uuid(user_id)
+                session = await self._database.upsert_returning(
+                    "sessions", {session_column: session_id, "user_id": user_uuid}, session_column
+                )
+            else:
+                session = await self._find_or_create_session(session_id, user_id, session_column)
             
-            return {
-                "id": session_record_id,
-                **session_data
-            }
+            self._session_cache.set(session_id, dict(session))
+            return session
             
         except Exception as e:
             self._logger.error(f"Error ensuring session exists {session_id}: {e}", error=e)
             raise
     
+    async def _find_or_create_session(self, session_id: str, user_id: str, session_column: str) -> Dict[str, Any]:
+        """Search-then-insert fallback for adapters without upsert_returning"""
+        # Check if session exists
+        existing_sessions = await self._database.search(
+            "sessions", 
+            criteria={session_column: session_id}
+        )
+        
+        if existing_sessions:
+            self._logger.debug(f"Session {session_id} already exists")
+            return existing_sessions[0]
+        
+        # Ensure user exists first (foreign key requirement) and get their UUID
+        user_uuid = await self._get_user_uuid(user_id)
+        
+        # Create new session
+        session_data = {
+            session_column: session_id,  # external session identifier
+            "user_id": user_uuid,        # internal user UUID for foreign key
+            "created_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow().isoformat()
+        }
+        
+        session_record_id = await self._database.insert("sessions", session_data)
+        self._logger.info(f"Created new session {session_id} for user {user_id}")
+        
+        return {
+            "id": session_record_id,
+            **session_data
+        }
+    
+    async def _get_user_uuid(self, user_id: str) -> str:
+        """Internal UUID of a user, from the identity cache or _ensure_user_exists"""
+        user_uuid = self._user_cache.get(user_id)
+        if user_uuid is None:
+            user_uuid = (await self._ensure_user_exists(user_id))["id"]
+            self._user_cache.set(user_id, user_uuid)
+        return user_uuid
+    
     async def _ensure_user_exists(self, user_id: str) -> Dict[str, Any]:
         """
         Ensure a user exists in the database, create if it doesn't.
@@ -356,10 +411,15 @@ class SessionRepository:
             Dictionary containing user information
         """
         try:
+            user_column = self._identity_column("users")
+            
+            if hasattr(self._database, "upsert_returning"):
+                return await self._database.upsert_returning("users", {user_column: user_id}, user_column)
+            
             # Check if user exists (using correct field name)
             existing_users = await self._database.search(
                 "users", 
-                criteria={"user_id": user_id}
+                criteria={user_column: user_id}
             )
             
             if existing_users:
@@ -368,7 +428,7 @@ class SessionRepository:
             
             # Create new user (matching actual database schema)
             user_data = {
-                "user_id": user_id,  # external user identifier
+                user_column: user_id,  # external user identifier
                 "created_at": datetime.utcnow().isoformat(),
                 "updated_at": datetime.utcnow().isoformat()
             }
@@ -384,6 +444,23 @@ class SessionRepository:
         except Exception as e:
             self._logger.error(f"Error ensuring user exists {user_id}: {e}", error=e)
             raise
+    
+    def _identity_column(self, table: str) -> str:
+        """Column of sessions/users holding the external identifier for this adapter's schema"""
+        columns = getattr(self._database, "IDENTITY_COLUMNS", None) or DEFAULT_IDENTITY_COLUMNS
+        return columns[table]
+    
+    def get_identity_cache_stats(self) -> Dict[str, Any]:
+        """Hit rates of the session and user identity caches"""
+        sessions = self._session_cache.get_stats()
+        users = self._user_cache.get_stats()
+        hits = sessions["hits"] + users["hits"]
+        lookups = hits + sessions["misses"] + users["misses"]
+        return {
+            "sessions": sessions,
+            "users": users,
+            "hit_rate": hits / lookups if lookups else 0.0
+        }
 
     async def search_sessions(self, user_id: str = None, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -2,6 +2,7 @@
 Content management and search API routes using repository pattern.
 """
 
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Dict, Any, List, Optional
 from ..core.container import container
@@ -77,150 +78,27 @@ async def search_user_content(
         raise HTTPException(status_code=400, detail="Search query cannot be empty")
     
     try:
-        search_results = []
-        query_lower = query.lower()
-        
         # Get repositories
         repos = get_repositories()
+        search_targets = {
+            "plot": repos["plot_repo"],
+            "author": repos["author_repo"],
+            "world": repos["world_repo"],
+            "characters": repos["characters_repo"],
+        }
+        if content_type:
+            search_targets = {k: v for k, v in search_targets.items() if k == content_type}
         
-        # Search plots if no type filter or type is 'plot'
-        if not content_type or content_type == "plot":
-            plots = await repos["plot_repo"].get_user_plots(user_id)
-            for plot in plots:
-                score = 0
-                title = plot.get("title", "").lower()
-                summary = plot.get("plot_summary", "").lower()
-                
-                # Calculate relevance score
-                if query_lower in title:
-                    score += 10
-                if query_lower in summary:
-                    score += 5
-                
-                # Word matching for more complex queries
-                query_words = query_lower.split()
-                for word in query_words:
-                    if word in title:
-                        score += 3
-                    if word in summary:
-                        score += 1
-                
-                if score > 0:
-                    search_results.append({
-                        "type": "plot",
-                        "id": plot.get("id"),
-                        "title": plot.get("title"),
-                        "summary": plot.get("plot_summary", "")[:200] + "...",
-                        "created_at": plot.get("created_at"),
-                        "session_id": plot.get("session_id"),
-                        "relevance_score": score
-                    })
-        
-        # Search authors if no type filter or type is 'author'
-        if not content_type or content_type == "author":
-            authors = await repos["author_repo"].get_user_authors(user_id)
-            for author in authors:
-                score = 0
-                name = author.get("author_name", "").lower()
-                pen_name = author.get("pen_name", "").lower()
-                bio = author.get("biography", "").lower()
-                
-                # Calculate relevance score
-                if query_lower in name:
-                    score += 10
-                if query_lower in pen_name:
-                    score += 8
-                if query_lower in bio:
-                    score += 3
-                
-                # Word matching
-                query_words = query_lower.split()
-                for word in query_words:
-                    if word in name:
-                        score += 5
-                    if word in pen_name:
-                        score += 4
-                    if word in bio:
-                        score += 1
-                
-                if score > 0:
-                    search_results.append({
-                        "type": "author",
-                        "id": author.get("id"),
-                        "title": author.get("author_name"),
-                        "summary": f"Pen name: {author.get('pen_name', 'N/A')}",
-                        "created_at": author.get("created_at"),
-                        "session_id": author.get("session_id"),
-                        "relevance_score": score
-                    })
-        
-        # Search world building if no type filter or type is 'world'
-        if not content_type or content_type == "world":
-            worlds = await repos["world_repo"].get_user_world_building(user_id)
-            for world in worlds:
-                score = 0
-                name = world.get("world_name", "").lower()
-                content_text = world.get("world_content", "").lower()
-                
-                # Calculate relevance score
-                if query_lower in name:
-                    score += 10
-                if query_lower in content_text:
-                    score += 3
-                
-                # Word matching
-                query_words = query_lower.split()
-                for word in query_words:
-                    if word in name:
-                        score += 5
-                    if word in content_text:
-                        score += 1
-                
-                if score > 0:
-                    search_results.append({
-                        "type": "world_building",
-                        "id": world.get("id"),
-                        "title": world.get("world_name"),
-                        "summary": world.get("world_content", "")[:200] + "...",
-                        "created_at": world.get("created_at"),
-                        "session_id": world.get("session_id"),
-                        "relevance_score": score
-                    })
+        # Ranking and LIMIT happen in the database; content types are searched concurrently
+        result_sets = await asyncio.gather(*(
+            repo.search_text(query, user_id, limit) for repo in search_targets.values()
+        ))
         
-        # Search characters if no type filter or type is 'characters'
-        if not content_type or content_type == "characters":
-            characters = await repos["characters_repo"].get_user_characters(user_id)
-            for char_set in characters:
-                score = 0
-                context = char_set.get("world_context_integration", "").lower()
-                characters_data = str(char_set.get("characters", [])).lower()
-                
-                # Calculate relevance score
-                if query_lower in context:
-                    score += 5
-                if query_lower in characters_data:
-                    score += 3
-                
-                # Word matching
-                query_words = query_lower.split()
-                for word in query_words:
-                    if word in context:
-                        score += 2
-                    if word in characters_data:
-                        score += 1
-                
-                if score > 0:
-                    search_results.append({
-                        "type": "characters",
-                        "id": char_set.get("id"),
-                        "title": f"Character Set ({char_set.get('character_count', 0)} characters)",
-                        "summary": char_set.get("world_context_integration", "")[:200] + "...",
-                        "created_at": char_set.get("created_at"),
-                        "session_id": char_set.get("session_id"),
-                        "relevance_score": score
-                    })
+        search_results = []
+        for result_type, rows in zip(search_targets, result_sets):
+            search_results.extend(_format_search_result(result_type, row) for row in rows)
         
-        # Sort by relevance score (highest first) and apply limit
+        # Merge per-type results by relevance score (highest first) and apply limit
         search_results.sort(key=lambda x: x["relevance_score"], reverse=True)
         search_results = search_results[:limit]
         
@@ -237,6 +115,42 @@ async def search_user_content(
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
+def _format_search_result(result_type: str, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a ranked database row into a search API result"""
+    if result_type == "plot":
+        result = {
+            "type": "plot",
+            "title": row.get("title"),
+            "summary": (row.get("plot_summary") or "")[:200] + "...",
+        }
+    elif result_type == "author":
+        result = {
+            "type": "author",
+            "title": row.get("author_name"),
+            "summary": f"Pen name: {row.get('pen_name') or 'N/A'}",
+        }
+    elif result_type == "world":
+        result = {
+            "type": "world_building",
+            "title": row.get("world_name"),
+            "summary": (row.get("overview") or "")[:200] + "...",
+        }
+    else:
+        result = {
+            "type": "characters",
+            "title": f"Character Set ({row.get('character_count', 0)} characters)",
+            "summary": (row.get("world_context_integration") or "")[:200] + "...",
+        }
+    
+    result.update({
+        "id": row.get("id"),
+        "created_at": row.get("created_at"),
+        "session_id": row.get("session_id"),
+        "relevance_score": round(row.get("relevance_score") or 0.0, 4)
+    })
+    return result
+
+
 @router.get("/search/{user_id}/suggestions")
 async def get_search_suggestions(
     user_id: str,
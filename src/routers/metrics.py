@@ -4,8 +4,11 @@ Provides insights into connection pool utilization and performance.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import PlainTextResponse
 from typing import Dict, Any
 from ..core.container import get_container
+from ..core.agent_tracker import get_agent_tracker
+from ..core.observability import get_observability_manager
 from ..core.logging import get_logger
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
@@ -130,6 +133,110 @@ async def get_database_health() -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail="Failed to check database health")
 
 
+@router.get("/telemetry")
+async def get_telemetry_metrics() -> Dict[str, Any]:
+    """Get write-behind telemetry queue and flush statistics"""
+    try:
+        stats = get_agent_tracker().get_telemetry_stats()
+        
+        if stats is None:
+            return {
+                "message": "Telemetry sink not attached",
+                "metrics": {}
+            }
+        
+        # Queue pressure
+        if stats["max_queue_size"] > 0:
+            stats["queue_utilization_percentage"] = round(
+                (stats["queued"] / stats["max_queue_size"]) * 100, 2
+            )
+        
+        return {
+            "message": "Telemetry metrics retrieved successfully",
+            "metrics": stats
+        }
+        
+    except Exception as e:
+        logger.error(f"Error retrieving telemetry metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve telemetry metrics")
+
+
+@router.get("/websocket")
+async def get_websocket_metrics() -> Dict[str, Any]:
+    """Get in-flight and queued WebSocket message counts per client"""
+    try:
+        container = get_container()
+        
+        if not container.has_service("websocket_handler"):
+            return {
+                "message": "WebSocket handler not available",
+                "metrics": {}
+            }
+        
+        handler = container.get("websocket_handler")
+        clients = handler.get_client_stats()
+        
+        return {
+            "message": "WebSocket metrics retrieved successfully",
+            "metrics": {
+                "clients": clients,
+                "total_in_flight": sum(stats["in_flight"] for stats in clients.values()),
+                "total_queued": sum(stats["queued"] for stats in clients.values()),
+                "total_rejected": sum(stats["rejected"] for stats in clients.values()),
+                "send": handler.connection_manager.get_send_stats()
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"Error retrieving WebSocket metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve WebSocket metrics")
+
+
+@router.get("/sessions/identity-cache")
+async def get_session_identity_cache_metrics() -> Dict[str, Any]:
+    """Get hit rates of the session/user identity cache behind ensure_session_exists"""
+    try:
+        container = get_container()
+        session_repository = container.session_repository()
+        
+        return {
+            "message": "Session identity cache metrics retrieved successfully",
+            "metrics": session_repository.get_identity_cache_stats()
+        }
+    
+    except Exception as e:
+        logger.error(f"Error retrieving session identity cache metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve session identity cache metrics")
+
+
+@router.get("/agents/summary")
+async def get_agent_metrics_summary() -> Dict[str, Any]:
+    """Get streaming aggregates (count, avg, min/max, p50/p95/p99) of agent metrics"""
+    try:
+        return {
+            "message": "Agent metrics retrieved successfully",
+            "metrics": get_observability_manager().get_performance_summary()
+        }
+        
+    except Exception as e:
+        logger.error(f"Error retrieving agent metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to retrieve agent metrics")
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics() -> PlainTextResponse:
+    """Expose agent metrics in Prometheus text format"""
+    try:
+        return PlainTextResponse(
+            get_observability_manager().render_prometheus_metrics(),
+            media_type="text/plain; version=0.0.4"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error rendering Prometheus metrics: {e}")
+        raise HTTPException(status_code=500, detail="Failed to render Prometheus metrics")
+
+
 @router.get("/performance/summary")
 async def get_performance_summary() -> Dict[str, Any]:
     """Get overall system performance summary"""
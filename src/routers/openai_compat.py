@@ -9,7 +9,6 @@ from pydantic import BaseModel
 from datetime import datetime
 import json
 import uuid
-import asyncio
 
 from ..core.interfaces import AgentRequest
 from ..core.logging import get_logger
@@ -247,75 +246,66 @@ async def create_chat_completion(
 
 
 async def create_streaming_response(agent, agent_request, request):
-    """Create a streaming response in OpenAI format"""
+    """Create a streaming response in OpenAI format, one SSE chunk per agent text chunk"""
+    
+    completion_id = f"chatcmpl-{uuid.uuid4()}"
+    created = int(datetime.now().timestamp())
+    
+    def sse_chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+        chunk = ChatCompletionChunk(
+            id=completion_id,
+            created=created,
+            model=request.model,
+            choices=[{
+                "index": 0,
+                "delta": delta,
+                "finish_reason": finish_reason
+            }]
+        )
+        return f"data: {chunk.json()}\n\n"
+    
+    def sse_error(message: str, code: str) -> str:
+        error_chunk = {
+            "error": {
+                "message": message,
+                "type": "internal_error",
+                "code": code
+            }
+        }
+        return f"data: {json.dumps(error_chunk)}\n\n"
     
     async def generate():
-        completion_id = f"chatcmpl-{uuid.uuid4()}"
-        
         try:
-            # Process request (assuming agent supports streaming)
-            response = await agent.process_request(agent_request)
-            
-            # For now, simulate streaming by chunking the response
-            # In a real implementation, agents would yield chunks
-            content = response.content
-            chunk_size = 20  # Words per chunk
-            words = content.split()
+            first = True
             
-            for i in range(0, len(words), chunk_size):
-                chunk_words = words[i:i + chunk_size]
-                chunk_content = " ".join(chunk_words)
+            # Forward agent output as it is generated
+            async for chunk in agent.process_request_streaming(agent_request):
+                if chunk.is_complete:
+                    response = (chunk.metadata or {}).get("response")
+                    if response is not None and not response.success:
+                        yield sse_error(response.error or "Agent request failed", "agent_error")
+                        return
+                    continue
                 
-                if i > 0:
-                    chunk_content = " " + chunk_content
-                
-                chunk = ChatCompletionChunk(
-                    id=completion_id,
-                    created=int(datetime.now().timestamp()),
-                    model=request.model,
-                    choices=[{
-                        "index": 0,
-                        "delta": {
-                            "role": "assistant" if i == 0 else None,
-                            "content": chunk_content
-                        },
-                        "finish_reason": None
-                    }]
-                )
-                
-                yield f"data: {chunk.json()}\n\n"
-                await asyncio.sleep(0.05)  # Simulate streaming delay
+                if chunk.chunk:
+                    delta = {"role": "assistant", "content": chunk.chunk} if first else {"content": chunk.chunk}
+                    first = False
+                    yield sse_chunk(delta)
             
             # Send final chunk
-            final_chunk = ChatCompletionChunk(
-                id=completion_id,
-                created=int(datetime.now().timestamp()),
-                model=request.model,
-                choices=[{
-                    "index": 0,
-                    "delta": {},
-                    "finish_reason": "stop"
-                }]
-            )
-            
-            yield f"data: {final_chunk.json()}\n\n"
+            yield sse_chunk({}, finish_reason="stop")
             yield "data: [DONE]\n\n"
             
         except Exception as e:
             logger.error(f"Streaming error: {e}")
-            error_chunk = {
-                "error": {
-                    "message": str(e),
-                    "type": "internal_error",
-                    "code": "streaming_error"
-                }
-            }
-            yield f"data: {json.dumps(error_chunk)}\n\n"
+            yield sse_error(str(e), "streaming_error")
     
     from fastapi.responses import StreamingResponse
     return StreamingResponse(
         generate(),
-        media_type="text/event-stream"
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream (which would defeat time-to-first-token)
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
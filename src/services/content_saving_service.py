@@ -1,6 +1,7 @@
 """
 Centralized service for saving agent-generated content to database.
-Delegates to tool functions to eliminate code duplication.
+Awaits the async persistence API behind the writing tools to eliminate code
+duplication without running the synchronous tool wrappers on the event loop.
 """
 
 from typing import Dict, Any, Optional
@@ -10,7 +11,7 @@ from ..core.logging import get_logger
 class ContentSavingService:
     """
     Centralized service for saving all types of agent-generated content.
-    Delegates to tool functions to maintain single source of truth.
+    Shares the writing tools' async implementation to maintain single source of truth.
     """
     
     def __init__(self, plot_repository, author_repository, world_building_repository, 
@@ -72,69 +73,55 @@ class ContentSavingService:
     
     async def _save_plot_via_tool(self, response_data: Dict[str, Any], session_id: str, 
                                 user_id: str, orchestrator_params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Save plot data using the save_plot tool function"""
-        from ..tools.writing_tools import save_plot
-        
-        # Set up session context (tool functions expect this)
-        from ..core.container import get_container
-        container = get_container()
-        container.set_session_context(session_id, user_id)
+        """Save plot data through the save_plot tool's async implementation"""
+        from ..tools.writing_tools import save_plot_async
         
         # Extract author_id from orchestrator params if available
         author_id = orchestrator_params.get("author_id") if orchestrator_params else None
         
-        # Call the tool function
-        result = save_plot(
+        result = await save_plot_async(
             title=response_data.get("title", ""),
             plot_summary=response_data.get("plot_summary", ""),
             genre=response_data.get("genre"),
             themes=response_data.get("themes"),
             session_id=session_id,
             user_id=user_id,
-            author_id=author_id
+            author_id=author_id,
+            plot_repository=self.plot_repository,
+            session_repository=self.session_repository
         )
         
         return result
     
     async def _save_author_via_tool(self, response_data: Dict[str, Any], session_id: str, user_id: str) -> Dict[str, Any]:
-        """Save author data using the save_author tool function"""
-        from ..tools.writing_tools import save_author
-        
-        # Set up session context
-        from ..core.container import get_container
-        container = get_container()
-        container.set_session_context(session_id, user_id)
+        """Save author data through the save_author tool's async implementation"""
+        from ..tools.writing_tools import save_author_async
         
-        # Call the tool function
-        result = save_author(
+        result = await save_author_async(
             author_name=response_data.get("author_name", ""),
             author_bio=response_data.get("biography", ""),
             writing_style=response_data.get("writing_style", ""),
             session_id=session_id,
             user_id=user_id,
             pen_name=response_data.get("pen_name"),
-            genres=response_data.get("genres")
+            genres=response_data.get("genres"),
+            author_repository=self.author_repository
         )
         
         return result
     
     async def _save_world_building_via_tool(self, response_data: Dict[str, Any], session_id: str, 
                                           user_id: str, orchestrator_params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Save world building data using the save_world_building tool function"""
-        from ..tools.writing_tools import save_world_building
+        """Save world building data through the save_world_building tool's async implementation"""
+        from ..tools.writing_tools import save_world_building_async
         
         # Validate required context
         plot_id = orchestrator_params.get("plot_id") if orchestrator_params else None
         if not plot_id:
             raise ValueError("Cannot save world_building data: missing plot_id in context")
         
-        # Set up session context
-        from ..core.container import get_container
-        container = get_container()
-        container.set_session_context(session_id, user_id)
-        
-        # Call the tool function with correct parameters matching save_world_building interface
-        result = save_world_building(
+        # Parameters match the save_world_building interface
+        result = await save_world_building_async(
             world_name=response_data.get("world_name", ""),
             description=response_data.get("world_content", ""),  # Tool expects 'description', not 'world_content'
             plot_id=plot_id,
@@ -144,15 +131,16 @@ class ContentSavingService:
             culture=response_data.get("culture"),
             history=response_data.get("history"),
             magic_system=response_data.get("magic_system"),
-            technology=response_data.get("technology")
+            technology=response_data.get("technology"),
+            world_repository=self.world_building_repository
         )
         
         return result
     
     async def _save_characters_via_tool(self, response_data: Dict[str, Any], session_id: str, 
                                       user_id: str, orchestrator_params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Save characters data using the save_characters tool function"""
-        from ..tools.writing_tools import save_characters
+        """Save characters data through the save_characters tool's async implementation"""
+        from ..tools.writing_tools import save_characters_async
         
         # Validate required context
         plot_id = orchestrator_params.get("plot_id") if orchestrator_params else None
@@ -163,18 +151,14 @@ class ContentSavingService:
         if not world_id:
             raise ValueError("Cannot save characters data: missing world_id in context")
         
-        # Set up session context
-        from ..core.container import get_container
-        container = get_container()
-        container.set_session_context(session_id, user_id)
-        
-        # Call the tool function with correct parameters matching save_characters interface
-        result = save_characters(
+        # Parameters match the save_characters interface
+        result = await save_characters_async(
             plot_id=plot_id,
             world_building_id=world_id,
             characters=response_data.get("characters", []),
             session_id=session_id,
-            user_id=user_id
+            user_id=user_id,
+            characters_repository=self.characters_repository
         )
         
         return result
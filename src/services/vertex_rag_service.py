@@ -9,7 +9,9 @@ Based on confirmed API research and requirements:
 """
 
 import asyncio
+import os
 import re
+import tempfile
 from typing import List, Dict, Any, Optional
 import logging
 from dataclasses import dataclass
@@ -42,6 +44,15 @@ class VertexRAGService:
     Service for Vertex AI RAG operations including semantic chunking,
     corpus management, and content retrieval.
     """
+
+    # Chunks packed into each text file handed to rag.import_files
+    CHUNKS_PER_IMPORT_FILE = 100
+    # Between chunks in an import file; RAG Engine ingests the file as text and re-chunks it
+    IMPORT_CHUNK_SEPARATOR = "\n\n"
+    # Local files accepted by a single rag.import_files call
+    MAX_PATHS_PER_IMPORT = 25
+    # rag.import_files calls in flight at once when a corpus needs several
+    MAX_CONCURRENT_IMPORTS = 4
     
     def __init__(self, config: Optional[Configuration] = None):
         """Initialize Vertex AI RAG service with configuration"""
@@ -57,6 +68,9 @@ class VertexRAGService:
         self.location = google_config['location']
         
         vertexai.init(project=self.project_id, location=self.location)
+
+        # Corpus display name -> resource name, so lookups skip rag.list_corpora()
+        self._corpus_resources: Dict[str, str] = {}
         
         self.logger.info(f"Initialized Vertex AI RAG service for project {self.project_id}")
     
@@ -79,12 +93,14 @@ class VertexRAGService:
             )
             
             # Create RAG corpus with managed vector database
-            rag_corpus = rag.create_corpus(
+            rag_corpus = await asyncio.to_thread(
+                rag.create_corpus,
                 display_name=corpus_name,
                 backend_config=rag.RagVectorDbConfig(
                     rag_embedding_model_config=embedding_config
                 )
             )
+            self._corpus_resources[corpus_name] = rag_corpus.name
             
             self.logger.info(f"Created RAG corpus: {rag_corpus.name}")
             return rag_corpus.name
@@ -146,7 +162,8 @@ class VertexRAGService:
             )
             
             # Perform retrieval query
-            response = rag.retrieval_query(
+            response = await asyncio.to_thread(
+                rag.retrieval_query,
                 rag_resources=[
                     rag.RagResource(rag_corpus=corpus_name)
                 ],
@@ -197,12 +214,9 @@ class VertexRAGService:
         """Check if corpus already exists for a plot"""
         corpus_name = f"corpus-book-{plot_id}"
         try:
-            # List all corpora and check if our corpus exists
-            corpora = rag.list_corpora()
-            for corpus in corpora:
-                if corpus.display_name == corpus_name:
-                    self.logger.info(f"Found existing corpus: {corpus_name}")
-                    return True
+            if await self._resolve_corpus(corpus_name):
+                self.logger.info(f"Found existing corpus: {corpus_name}")
+                return True
             
             self.logger.info(f"Corpus {corpus_name} does not exist")
             return False
@@ -215,13 +229,12 @@ class VertexRAGService:
         """Delete corpus when plot is deleted"""
         corpus_name = f"corpus-book-{plot_id}"
         try:
-            # Find the corpus to delete
-            corpora = rag.list_corpora()
-            for corpus in corpora:
-                if corpus.display_name == corpus_name:
-                    rag.delete_corpus(corpus.name)
-                    self.logger.info(f"Deleted corpus {corpus_name}")
-                    return True
+            resource_name = await self._resolve_corpus(corpus_name)
+            if resource_name:
+                await asyncio.to_thread(rag.delete_corpus, resource_name)
+                self._corpus_resources.pop(corpus_name, None)
+                self.logger.info(f"Deleted corpus {corpus_name}")
+                return True
             
             self.logger.warning(f"Corpus {corpus_name} not found for deletion")
             return False
@@ -231,55 +244,79 @@ class VertexRAGService:
             return False
     
     async def import_chunks_to_corpus(self, corpus_name: str, chunks: List[Dict[str, Any]]) -> bool:
-        """Import chunked content to Vertex AI RAG corpus"""
+        """
+        Import chunked content to Vertex AI RAG corpus.
+
+        Chunks are packed CHUNKS_PER_IMPORT_FILE to a plain-text file and the files
+        are imported with one rag.import_files call per MAX_PATHS_PER_IMPORT
+        files (usually a single call), run concurrently off the event loop.
+
+        Args:
+            corpus_name: Corpus display name or resource name
+            chunks: Chunks as returned by chunk_content
+        """
         try:
-            # Find the corpus by name
-            corpora = rag.list_corpora()
-            target_corpus = None
-            
-            for corpus in corpora:
-                if corpus.display_name == corpus_name:
-                    target_corpus = corpus
-                    break
-            
-            if not target_corpus:
+            resource_name = await self._resolve_corpus(corpus_name)
+            if not resource_name:
                 self.logger.error(f"Corpus {corpus_name} not found for import")
                 return False
-            
-            # Import chunks as files to the corpus
-            for i, chunk in enumerate(chunks):
-                chunk_text = chunk.get('text', '')
-                chunk_metadata = chunk.get('metadata', {})
-                
-                # Create a temporary file-like object for the chunk
-                import tempfile
-                import os
-                
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp_file:
-                    tmp_file.write(chunk_text)
-                    tmp_file_path = tmp_file.name
-                
-                try:
-                    # Import the chunk file to corpus
-                    rag.import_files(
-                        corpus_name=target_corpus.name,
-                        paths=[tmp_file_path],
-                        chunk_size=512,  # Match our chunking strategy
-                        chunk_overlap=100
-                    )
-                    
-                    self.logger.debug(f"Imported chunk {i+1} to corpus {corpus_name}")
-                    
-                finally:
-                    # Clean up temporary file
-                    os.unlink(tmp_file_path)
-            
-            self.logger.info(f"Successfully imported {len(chunks)} chunks to corpus {corpus_name}")
+
+            if not chunks:
+                return True
+
+            with tempfile.TemporaryDirectory(prefix="rag-import-") as tmp_dir:
+                paths = await asyncio.to_thread(self._write_import_files, tmp_dir, chunks)
+                path_groups = [
+                    paths[i:i + self.MAX_PATHS_PER_IMPORT]
+                    for i in range(0, len(paths), self.MAX_PATHS_PER_IMPORT)
+                ]
+                semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_IMPORTS)
+
+                async def import_group(group: List[str]):
+                    async with semaphore:
+                        await asyncio.to_thread(
+                            rag.import_files,
+                            corpus_name=resource_name,
+                            paths=group,
+                            chunk_size=512,  # Match our chunking strategy
+                            chunk_overlap=100
+                        )
+
+                await asyncio.gather(*(import_group(group) for group in path_groups))
+
+            self.logger.info(
+                f"Successfully imported {len(chunks)} chunks in {len(paths)} files to corpus {corpus_name}"
+            )
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to import chunks to corpus {corpus_name}: {e}")
             return False
+
+    async def _resolve_corpus(self, corpus_name: str) -> Optional[str]:
+        """Resource name for a corpus display name, listing corpora only on a cache miss"""
+        if corpus_name.startswith("projects/"):
+            return corpus_name
+
+        resource_name = self._corpus_resources.get(corpus_name)
+        if resource_name:
+            return resource_name
+
+        corpora = await asyncio.to_thread(lambda: list(rag.list_corpora()))
+        self._corpus_resources.update({corpus.display_name: corpus.name for corpus in corpora})
+        return self._corpus_resources.get(corpus_name)
+
+    def _write_import_files(self, directory: str, chunks: List[Dict[str, Any]]) -> List[str]:
+        """Pack chunk texts into plain-text files, separated by IMPORT_CHUNK_SEPARATOR"""
+        paths = []
+        for start in range(0, len(chunks), self.CHUNKS_PER_IMPORT_FILE):
+            path = os.path.join(directory, f"chunks-{start // self.CHUNKS_PER_IMPORT_FILE:04d}.txt")
+            with open(path, "w", encoding="utf-8") as import_file:
+                import_file.write(self.IMPORT_CHUNK_SEPARATOR.join(
+                    chunk.get('text', '') for chunk in chunks[start:start + self.CHUNKS_PER_IMPORT_FILE]
+                ))
+            paths.append(path)
+        return paths
     
     def _get_project_config(self) -> Dict[str, str]:
         """Get project configuration"""
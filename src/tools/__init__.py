@@ -7,6 +7,10 @@ from .writing_tools import (
     save_author,
     save_world_building,
     save_characters,
+    save_plot_async,
+    save_author_async,
+    save_world_building_async,
+    save_characters_async,
     get_plot,
     get_author,
     list_plots,
@@ -31,6 +35,12 @@ __all__ = [
     'list_plots',
     'list_authors',
     
+    # Async persistence API behind the writing tools
+    'save_plot_async',
+    'save_author_async',
+    'save_world_building_async',
+    'save_characters_async',
+    
     # Agent coordination tools (functions)
     'invoke_agent',
     'get_agent_context',
@@ -12,7 +12,6 @@ from threading import Lock
 # Google ADK uses simple functions as tools
 
 from ..core.container import get_container
-from ..core.safe_async_runner import run_async_safe
 
 logger = logging.getLogger(__name__)
 
@@ -108,8 +107,11 @@ class TTLCache:
 # Workflow context storage with automatic cleanup (prevents memory leaks)
 WORKFLOW_CONTEXTS = TTLCache(ttl_seconds=1800)  # 30 minutes TTL
 
+# Maximum time a nested agent invocation may take
+AGENT_INVOCATION_TIMEOUT = 30.0
 
-def invoke_agent(
+
+async def invoke_agent(
     agent_name: str,
     message: str,
     context: Optional[Dict[str, Any]] = None,
@@ -118,6 +120,9 @@ def invoke_agent(
     """
     Invoke another agent in the workflow
     
+    Runs the nested agent on the caller's event loop (ADK awaits async tools
+    directly), so nested calls cost no extra thread or event loop.
+    
     Args:
         agent_name: Name of the agent to invoke
         message: Message to send to the agent
@@ -176,12 +181,22 @@ def invoke_agent(
             context=merged_context
         )
         
-        # Process the request synchronously using safe async runner
         logger.info(f"Invoking agent '{agent_name}' with message: {message[:100]}...")
         
-        # Use safe async runner to prevent race conditions and event loop conflicts
+        # Run the nested agent as its own task, so session context it sets
+        # (a ContextVar in the container) does not leak back to the caller
         try:
-            response = run_async_safe(agent.process_request(agent_request), timeout=30.0)
+            response = await asyncio.wait_for(
+                asyncio.create_task(agent.process_request(agent_request)),
+                timeout=AGENT_INVOCATION_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Agent '{agent_name}' timed out after {AGENT_INVOCATION_TIMEOUT}s")
+            return {
+                "success": False,
+                "error": f"Agent execution timed out after {AGENT_INVOCATION_TIMEOUT} seconds",
+                "message": f"Agent '{agent_name}' execution failed"
+            }
         except Exception as e:
             logger.error(f"Agent execution failed: {e}")
             return {
@@ -5,7 +5,6 @@ Writing tools for agents to persist content to the database
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import asyncio
 import uuid
 from functools import wraps
 
@@ -17,51 +16,62 @@ from ..core.safe_async_runner import run_async_safe
 logger = logging.getLogger(__name__)
 
 
-def save_plot(
+# Async persistence API: awaited directly by ContentSavingService and wrapped
+# by the synchronous ADK tools below. Repositories default to the container's.
+
+def _resolve_session(container, session_id: Optional[str], user_id: Optional[str]):
+    """Fall back to the container's session context for missing IDs"""
+    if not session_id:
+        session_id = container.get_current_session_id()
+        logger.info(f"Retrieved session_id from container: {session_id}")
+    if not user_id:
+        user_id = container.get_current_user_id()
+        logger.info(f"Retrieved user_id from container: {user_id}")
+    return session_id, user_id
+
+
+def _ensure_valid_uuid(value: Optional[str]) -> str:
+    """Return value if it is a UUID, otherwise a new one - required for database compatibility"""
+    if not value:
+        return str(uuid.uuid4())
+    try:
+        uuid.UUID(value)
+        return value
+    except (ValueError, TypeError):
+        logger.warning(f"Invalid UUID '{value}', generating new one")
+        return str(uuid.uuid4())
+
+
+def _save_failed(error: Exception, message: str) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": str(error),
+        "message": message
+    }
+
+
+async def save_plot_async(
     title: str,
     plot_summary: str,
     genre: Optional[str] = None,
     themes: Optional[List[str]] = None,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
-    author_id: Optional[str] = None
+    author_id: Optional[str] = None,
+    plot_repository=None,
+    session_repository=None
 ) -> Dict[str, Any]:
-    """
-    Save a generated plot to the database
-    
-    Args:
-        title: The title of the plot
-        plot_summary: The full plot summary
-        genre: The genre of the plot
-        themes: List of themes in the plot
-        session_id: Current session ID
-        user_id: Current user ID
-        author_id: Associated author ID if any
-        
-    Returns:
-        Dict containing the saved plot ID and confirmation
-    """
+    """Async implementation of save_plot"""
     try:
         container = get_container()
-        plot_repository = container.plot_repository()
-        session_repository = container.session_repository()
-        
-        # Get session info from context if not provided
-        if not session_id:
-            session_id = container.get_current_session_id()
-            logger.info(f"Retrieved session_id from container: {session_id}")
-        if not user_id:
-            user_id = container.get_current_user_id()
-            logger.info(f"Retrieved user_id from container: {user_id}")
+        plot_repository = plot_repository or container.plot_repository()
+        session_repository = session_repository or container.session_repository()
+        session_id, user_id = _resolve_session(container, session_id, user_id)
         
-        # Ensure session exists before creating plot using safe async runner
-        run_async_safe(session_repository.ensure_session_exists(session_id, user_id), timeout=10.0)
+        # Ensure session exists before creating plot
+        await session_repository.ensure_session_exists(session_id, user_id)
         logger.info(f"Session {session_id} ensured to exist")
         
-        logger.info(f"Final session_id: {session_id}, user_id: {user_id}")
-        
-        # Generate proper UUIDs if not provided
-        
         from ..models.entities import Plot
         plot_entity = Plot(
             session_id=session_id or str(uuid.uuid4()),
@@ -78,30 +88,7 @@ def save_plot(
                 "themes": themes or []
             }
         
-        # Run async operation synchronously for ADK compatibility
-        def run_create():
-            try:
-                # Try to run in new event loop
-                return asyncio.run(plot_repository.create(plot_entity))
-            except RuntimeError:
-                # We're in an async context, run in thread
-                import concurrent.futures
-                import threading
-                
-                def threaded_create():
-                    new_loop = asyncio.new_event_loop()
-                    try:
-                        asyncio.set_event_loop(new_loop)
-                        return new_loop.run_until_complete(plot_repository.create(plot_entity))
-                    finally:
-                        new_loop.close()
-                        asyncio.set_event_loop(None)
-                
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(threaded_create)
-                    return future.result(timeout=10)
-        
-        plot_id = run_create()
+        plot_id = await plot_repository.create(plot_entity)
         
         logger.info(f"Saved plot '{title}' with ID: {plot_id}")
         
@@ -113,67 +100,30 @@ def save_plot(
         
     except Exception as e:
         logger.error(f"Error saving plot: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to save plot"
-        }
+        return _save_failed(e, "Failed to save plot")
 
 
-def save_author(
+async def save_author_async(
     author_name: str,
     author_bio: str,
     writing_style: str,
     pen_name: Optional[str] = None,
     genres: Optional[List[str]] = None,
     session_id: Optional[str] = None,
-    user_id: Optional[str] = None
+    user_id: Optional[str] = None,
+    author_repository=None
 ) -> Dict[str, Any]:
-    """
-    Save a generated author profile to the database
-    
-    Args:
-        author_name: The author's full name
-        author_bio: Biography of the author
-        writing_style: Description of writing style
-        pen_name: Optional pen name
-        genres: List of genres the author writes
-        session_id: Current session ID
-        user_id: Current user ID
-        
-    Returns:
-        Dict containing the saved author ID and confirmation
-    """
+    """Async implementation of save_author"""
     logger.info(f"Creating author: {author_name}")
     try:
         container = get_container()
-        author_repository = container.author_repository()
+        author_repository = author_repository or container.author_repository()
         
         # Note: Duplicate check removed due to timeout issues in async context
         # The AI agent instructions now emphasize creating unique names instead
-        
-        # Get session info from context if not provided
-        if not session_id:
-            session_id = container.get_current_session_id()
-        if not user_id:
-            user_id = container.get_current_user_id()
-        
-        
-        # Ensure we have valid UUIDs - this is critical for database compatibility
-        def ensure_valid_uuid(value, fallback_prefix="generated"):
-            if not value:
-                return str(uuid.uuid4())
-            # If it's already a valid UUID, return as-is
-            try:
-                uuid.UUID(value)
-                return value
-            except (ValueError, TypeError):
-                # If not a valid UUID, generate a new one
-                logger.warning(f"Invalid UUID '{value}', generating new one")
-                return str(uuid.uuid4())
-        
-        session_id = ensure_valid_uuid(session_id)
-        user_id = ensure_valid_uuid(user_id)
+        session_id, user_id = _resolve_session(container, session_id, user_id)
+        session_id = _ensure_valid_uuid(session_id)
+        user_id = _ensure_valid_uuid(user_id)
         
         logger.info(f"Creating author '{author_name}' with session_id: {session_id}, user_id: {user_id}")
         
@@ -191,7 +141,7 @@ def save_author(
         if genres:
             author_entity.metadata = {"genres": genres}
         
-        author_id = run_async_safe(author_repository.create(author_entity), timeout=10.0)
+        author_id = await author_repository.create(author_entity)
         
         logger.info(f"Saved author '{author_name}' with ID: {author_id}")
         
@@ -203,14 +153,10 @@ def save_author(
         
     except Exception as e:
         logger.error(f"Error saving author '{author_name}': {str(e)}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": f"Failed to save author '{author_name}': {str(e)}"
-        }
+        return _save_failed(e, f"Failed to save author '{author_name}': {str(e)}")
 
 
-def save_world_building(
+async def save_world_building_async(
     world_name: str,
     description: str,
     plot_id: str,
@@ -220,35 +166,14 @@ def save_world_building(
     magic_system: Optional[Dict[str, Any]] = None,
     technology: Optional[Dict[str, Any]] = None,
     session_id: Optional[str] = None,
-    user_id: Optional[str] = None
+    user_id: Optional[str] = None,
+    world_repository=None
 ) -> Dict[str, Any]:
-    """
-    Save world building details to the database
-    
-    Args:
-        world_name: Name of the world
-        description: Overall world description
-        plot_id: Associated plot ID
-        geography: Geographic details
-        culture: Cultural information
-        history: Historical background
-        magic_system: Magic system details (if applicable)
-        technology: Technology level and details
-        session_id: Current session ID
-        user_id: Current user ID
-        
-    Returns:
-        Dict containing the saved world building ID and confirmation
-    """
+    """Async implementation of save_world_building"""
     try:
         container = get_container()
-        world_repository = container.world_building_repository()
-        
-        # Get session info from context if not provided
-        if not session_id:
-            session_id = container.get_current_session_id()
-        if not user_id:
-            user_id = container.get_current_user_id()
+        world_repository = world_repository or container.world_building_repository()
+        session_id, user_id = _resolve_session(container, session_id, user_id)
         
         from ..models.entities import WorldBuilding
         
@@ -277,7 +202,7 @@ def save_world_building(
             world_content=world_content
         )
         
-        world_id = run_async_safe(world_repository.create(world_entity), timeout=10.0)
+        world_id = await world_repository.create(world_entity)
         
         logger.info(f"Saved world '{world_name}' with ID: {world_id}")
         
@@ -289,42 +214,22 @@ def save_world_building(
         
     except Exception as e:
         logger.error(f"Error saving world building: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to save world building"
-        }
+        return _save_failed(e, "Failed to save world building")
 
 
-def save_characters(
+async def save_characters_async(
     plot_id: str,
     world_building_id: str,
     characters: List[Dict[str, Any]],
     session_id: Optional[str] = None,
-    user_id: Optional[str] = None
+    user_id: Optional[str] = None,
+    characters_repository=None
 ) -> Dict[str, Any]:
-    """
-    Save character information to the database
-    
-    Args:
-        plot_id: Associated plot ID
-        world_building_id: Associated world building ID
-        characters: List of character dictionaries
-        session_id: Current session ID
-        user_id: Current user ID
-        
-    Returns:
-        Dict containing the saved characters ID and confirmation
-    """
+    """Async implementation of save_characters"""
     try:
         container = get_container()
-        characters_repository = container.characters_repository()
-        
-        # Get session info from context if not provided
-        if not session_id:
-            session_id = container.get_current_session_id()
-        if not user_id:
-            user_id = container.get_current_user_id()
+        characters_repository = characters_repository or container.characters_repository()
+        session_id, user_id = _resolve_session(container, session_id, user_id)
         
         from ..models.entities import Characters
         characters_entity = Characters(
@@ -336,7 +241,7 @@ def save_characters(
             characters=characters
         )
         
-        characters_id = run_async_safe(characters_repository.create(characters_entity), timeout=10.0)
+        characters_id = await characters_repository.create(characters_entity)
         
         logger.info(f"Saved {len(characters)} characters with ID: {characters_id}")
         
@@ -349,11 +254,152 @@ def save_characters(
         
     except Exception as e:
         logger.error(f"Error saving characters: {str(e)}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Failed to save characters"
-        }
+        return _save_failed(e, "Failed to save characters")
+
+
+# Synchronous ADK tools - thin shims over the async API above. They resolve the
+# session before run_async_safe, whose worker thread does not see the caller's
+# ContextVar session context.
+
+def save_plot(
+    title: str,
+    plot_summary: str,
+    genre: Optional[str] = None,
+    themes: Optional[List[str]] = None,
+    session_id: Optional[str] = None,
+    user_id: Optional[str] = None,
+    author_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Save a generated plot to the database
+    
+    Args:
+        title: The title of the plot
+        plot_summary: The full plot summary
+        genre: The genre of the plot
+        themes: List of themes in the plot
+        session_id: Current session ID
+        user_id: Current user ID
+        author_id: Associated author ID if any
+        
+    Returns:
+        Dict containing the saved plot ID and confirmation
+    """
+    try:
+        session_id, user_id = _resolve_session(get_container(), session_id, user_id)
+        return run_async_safe(save_plot_async(
+            title, plot_summary, genre=genre, themes=themes,
+            session_id=session_id, user_id=user_id, author_id=author_id
+        ), timeout=10.0)
+    except Exception as e:
+        logger.error(f"Error saving plot: {str(e)}")
+        return _save_failed(e, "Failed to save plot")
+
+
+def save_author(
+    author_name: str,
+    author_bio: str,
+    writing_style: str,
+    pen_name: Optional[str] = None,
+    genres: Optional[List[str]] = None,
+    session_id: Optional[str] = None,
+    user_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Save a generated author profile to the database
+    
+    Args:
+        author_name: The author's full name
+        author_bio: Biography of the author
+        writing_style: Description of writing style
+        pen_name: Optional pen name
+        genres: List of genres the author writes
+        session_id: Current session ID
+        user_id: Current user ID
+        
+    Returns:
+        Dict containing the saved author ID and confirmation
+    """
+    try:
+        session_id, user_id = _resolve_session(get_container(), session_id, user_id)
+        return run_async_safe(save_author_async(
+            author_name, author_bio, writing_style, pen_name=pen_name, genres=genres,
+            session_id=session_id, user_id=user_id
+        ), timeout=10.0)
+    except Exception as e:
+        logger.error(f"Error saving author '{author_name}': {str(e)}")
+        return _save_failed(e, f"Failed to save author '{author_name}': {str(e)}")
+
+
+def save_world_building(
+    world_name: str,
+    description: str,
+    plot_id: str,
+    geography: Optional[Dict[str, Any]] = None,
+    culture: Optional[Dict[str, Any]] = None,
+    history: Optional[Dict[str, Any]] = None,
+    magic_system: Optional[Dict[str, Any]] = None,
+    technology: Optional[Dict[str, Any]] = None,
+    session_id: Optional[str] = None,
+    user_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Save world building details to the database
+    
+    Args:
+        world_name: Name of the world
+        description: Overall world description
+        plot_id: Associated plot ID
+        geography: Geographic details
+        culture: Cultural information
+        history: Historical background
+        magic_system: Magic system details (if applicable)
+        technology: Technology level and details
+        session_id: Current session ID
+        user_id: Current user ID
+        
+    Returns:
+        Dict containing the saved world building ID and confirmation
+    """
+    try:
+        session_id, user_id = _resolve_session(get_container(), session_id, user_id)
+        return run_async_safe(save_world_building_async(
+            world_name, description, plot_id, geography=geography, culture=culture, history=history,
+            magic_system=magic_system, technology=technology, session_id=session_id, user_id=user_id
+        ), timeout=10.0)
+    except Exception as e:
+        logger.error(f"Error saving world building: {str(e)}")
+        return _save_failed(e, "Failed to save world building")
+
+
+def save_characters(
+    plot_id: str,
+    world_building_id: str,
+    characters: List[Dict[str, Any]],
+    session_id: Optional[str] = None,
+    user_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Save character information to the database
+    
+    Args:
+        plot_id: Associated plot ID
+        world_building_id: Associated world building ID
+        characters: List of character dictionaries
+        session_id: Current session ID
+        user_id: Current user ID
+        
+    Returns:
+        Dict containing the saved characters ID and confirmation
+    """
+    try:
+        session_id, user_id = _resolve_session(get_container(), session_id, user_id)
+        return run_async_safe(save_characters_async(
+            plot_id, world_building_id, characters, session_id=session_id, user_id=user_id
+        ), timeout=10.0)
+    except Exception as e:
+        logger.error(f"Error saving characters: {str(e)}")
+        return _save_failed(e, "Failed to save characters")
 
 
 def get_plot(plot_id: str) -> Dict[str, Any]:
@@ -3,9 +3,11 @@ WebSocket handlers for real-time communication.
 """
 
 from .connection_manager import ConnectionManager
+from .message_dispatcher import MessageDispatcher
 from .websocket_handler import WebSocketHandler
 
 __all__ = [
     "ConnectionManager",
+    "MessageDispatcher",
     "WebSocketHandler",
 ]
\ No newline at end of file
@@ -2,21 +2,152 @@
 WebSocket connection manager for handling client connections.
 """
 
-from typing import Dict
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+import json
 import time
 import asyncio
 from fastapi import WebSocket
 from ..core.interfaces import IConnectionManager
 from ..core.logging import get_logger
+from ..core.metric_aggregates import MetricSeries
+
+# Laggard policies applied when a client's send queue is full
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+DISCONNECT = "disconnect"
+LAGGARD_POLICIES = (DROP_OLDEST, DROP_NEWEST, DISCONNECT)
+
+
+def encode_json(data: Dict[str, Any]) -> str:
+    """Encode a JSON frame the way WebSocket.send_json does"""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+class ClientSender:
+    """Bounded queue of encoded frames drained by one send task per client"""
+    
+    def __init__(self, client_id: str, websocket: WebSocket, max_queue_size: int, send_timeout: float,
+                 laggard_policy: str, on_failure: Callable[[str, str], None],
+                 shared_latency: Optional[MetricSeries] = None):
+        self.client_id = client_id
+        self.websocket = websocket
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        self.laggard_policy = laggard_policy
+        self._on_failure = on_failure
+        self._queue: Deque[Tuple[str, float]] = deque()
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+        
+        # Enqueue-to-sent latency of this client and of all clients
+        self.latency = MetricSeries("send_latency_ms", window=100)
+        self._shared_latency = shared_latency
+        self.sent = 0
+        self.dropped = 0
+        self.timeouts = 0
+        self.errors = 0
+        
+        self._task = asyncio.create_task(self._run())
+    
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+    
+    def enqueue(self, text: str) -> bool:
+        """Queue a frame without blocking; returns False when it was not queued"""
+        if self._closed:
+            return False
+        
+        if len(self._queue) >= self.max_queue_size:
+            if self.laggard_policy == DROP_OLDEST:
+                self._queue.popleft()
+                self.dropped += 1
+            elif self.laggard_policy == DROP_NEWEST:
+                self.dropped += 1
+                return False
+            else:
+                self._on_failure(self.client_id, "send queue full")
+                return False
+        
+        self._queue.append((text, time.perf_counter()))
+        self._idle.clear()
+        self._ready.set()
+        return True
+    
+    async def _run(self):
+        while True:
+            while not self._queue:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+            text, queued_at = self._queue.popleft()
+            
+            try:
+                await asyncio.wait_for(self.websocket.send_text(text), self.send_timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self._on_failure(self.client_id, f"send timed out after {self.send_timeout}s")
+                return
+            except Exception as e:
+                self.errors += 1
+                self._on_failure(self.client_id, f"send failed: {e}")
+                return
+            
+            self.sent += 1
+            latency_ms = (time.perf_counter() - queued_at) * 1000
+            self.latency.record(latency_ms)
+            if self._shared_latency is not None:
+                self._shared_latency.record(latency_ms)
+    
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued frame was sent; False on timeout"""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def close(self):
+        """Stop sending and discard queued frames"""
+        self._closed = True
+        self._queue.clear()
+        self._idle.set()
+        if self._task is not asyncio.current_task():
+            self._task.cancel()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "latency_ms": self.latency.summary()
+        }
 
 
 class ConnectionManager(IConnectionManager):
     """Manages WebSocket connections with reconnection support"""
     
-    def __init__(self):
+    def __init__(self, send_queue_size: int = 256, send_timeout: float = 10.0, laggard_policy: str = DROP_OLDEST):
+        if laggard_policy not in LAGGARD_POLICIES:
+            raise ValueError(f"Unknown laggard policy: {laggard_policy}")
+        
         self.active_connections: Dict[str, WebSocket] = {}
         self.session_metadata: Dict[str, Dict] = {}  # Track session data for recovery
         self.logger = get_logger("websocket.manager")
+        
+        # Fan-out: one bounded send queue and send task per client
+        self.send_queue_size = send_queue_size
+        self.send_timeout = send_timeout
+        self.laggard_policy = laggard_policy
+        self.senders: Dict[str, ClientSender] = {}
+        self.send_latency = MetricSeries("websocket_send_latency_ms")
+        self.laggards_disconnected = 0
+        
         self._cleanup_task = None
         self._start_cleanup_task()
     
@@ -28,6 +159,7 @@ class ConnectionManager(IConnectionManager):
         is_reconnection = client_id in self.session_metadata
         
         self.active_connections[client_id] = websocket
+        self._start_sender(client_id, websocket)
         
         # Initialize or restore session metadata
         current_time = time.time()
@@ -44,8 +176,40 @@ class ConnectionManager(IConnectionManager):
             self.logger.info(f"Client {client_id} reconnected (attempt #{self.session_metadata[client_id]['reconnection_count']})", 
                            client_id=client_id)
     
+    def _start_sender(self, client_id: str, websocket: WebSocket) -> None:
+        """Replace the client's send queue, e.g. after a reconnection"""
+        previous = self.senders.get(client_id)
+        if previous:
+            previous.close()
+        self.senders[client_id] = ClientSender(
+            client_id, websocket, self.send_queue_size, self.send_timeout, self.laggard_policy,
+            self._drop_laggard, self.send_latency
+        )
+    
+    def _stop_sender(self, client_id: str) -> None:
+        sender = self.senders.pop(client_id, None)
+        if sender:
+            sender.close()
+    
+    def _drop_laggard(self, client_id: str, reason: str) -> None:
+        """Disconnect a client whose socket failed, stalled or fell too far behind"""
+        websocket = self.active_connections.get(client_id)
+        self.logger.warning(f"Disconnecting client {client_id}: {reason}", client_id=client_id)
+        self.laggards_disconnected += 1
+        self.disconnect(client_id)
+        if websocket is not None:
+            # Ends the client's receive loop; the socket may already be gone
+            asyncio.create_task(self._close_quietly(websocket))
+    
+    async def _close_quietly(self, websocket: WebSocket) -> None:
+        try:
+            await asyncio.wait_for(websocket.close(code=1013, reason="Client too slow"), self.send_timeout)
+        except Exception:
+            pass
+    
     def disconnect(self, client_id: str) -> None:
         """Disconnect a WebSocket client while preserving session metadata for reconnection"""
+        self._stop_sender(client_id)
         if client_id in self.active_connections:
             del self.active_connections[client_id]
             # Keep session metadata for potential reconnection - don't delete it here
@@ -53,6 +217,7 @@ class ConnectionManager(IConnectionManager):
     
     def cleanup_session(self, client_id: str) -> None:
         """Permanently clean up a session (call when session expires)"""
+        self._stop_sender(client_id)
         if client_id in self.active_connections:
             del self.active_connections[client_id]
         if client_id in self.session_metadata:
@@ -64,52 +229,54 @@ class ConnectionManager(IConnectionManager):
         return self.session_metadata.get(client_id, {})
     
     async def send_message(self, message: str, client_id: str) -> None:
-        """Send message to specific client"""
-        if client_id in self.active_connections:
-            try:
-                await self.active_connections[client_id].send_text(message)
-            except Exception as e:
-                self.logger.error(f"Error sending message to {client_id}: {e}", client_id=client_id, error=e)
-                self.disconnect(client_id)
+        """Queue a message for a specific client; frames are sent in order by its send task"""
+        sender = self.senders.get(client_id)
+        if sender:
+            sender.enqueue(message)
     
     async def send_json(self, data: Dict, client_id: str) -> None:
-        """Send JSON data to specific client"""
-        if client_id in self.active_connections:
-            try:
-                await self.active_connections[client_id].send_json(data)
-            except Exception as e:
-                self.logger.error(f"Error sending JSON to {client_id}: {e}", client_id=client_id, error=e)
-                self.disconnect(client_id)
+        """Queue JSON data for a specific client"""
+        if client_id not in self.senders:
+            return
+        try:
+            text = encode_json(data)
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Error encoding JSON for {client_id}: {e}", client_id=client_id, error=e)
+            return
+        await self.send_message(text, client_id)
     
-    async def broadcast_message(self, message: str) -> None:
-        """Broadcast message to all connected clients"""
-        disconnected_clients = []
-        
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                self.logger.error(f"Error broadcasting to {client_id}: {e}", client_id=client_id, error=e)
-                disconnected_clients.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+    async def broadcast_message(self, message: str) -> int:
+        """Queue a message for all connected clients without waiting on any of them"""
+        queued = 0
+        # Copy: a DISCONNECT policy may drop clients while fanning out
+        for sender in list(self.senders.values()):
+            if sender.enqueue(message):
+                queued += 1
+        return queued
     
-    async def broadcast_json(self, data: Dict) -> None:
-        """Broadcast JSON data to all connected clients"""
-        disconnected_clients = []
-        
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_json(data)
-            except Exception as e:
-                self.logger.error(f"Error broadcasting JSON to {client_id}: {e}", client_id=client_id, error=e)
-                disconnected_clients.append(client_id)
-        
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            self.disconnect(client_id)
+    async def broadcast_json(self, data: Dict) -> int:
+        """Encode JSON data once and queue it for all connected clients"""
+        return await self.broadcast_message(encode_json(data))
+    
+    async def flush(self, client_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """Wait until queued frames of one or all clients were sent; False on timeout"""
+        if client_id is not None:
+            senders = [self.senders[client_id]] if client_id in self.senders else []
+        else:
+            senders = list(self.senders.values())
+        results = await asyncio.gather(*(sender.drain(timeout) for sender in senders))
+        return all(results)
+    
+    def get_send_stats(self) -> Dict[str, Any]:
+        """Send queue depth, drops and enqueue-to-sent latency per client"""
+        return {
+            "laggard_policy": self.laggard_policy,
+            "send_queue_size": self.send_queue_size,
+            "send_timeout": self.send_timeout,
+            "laggards_disconnected": self.laggards_disconnected,
+            "latency_ms": self.send_latency.summary(),
+            "clients": {client_id: sender.get_stats() for client_id, sender in self.senders.items()}
+        }
     
     def get_connected_clients(self) -> list[str]:
         """Get list of connected client IDs"""
@@ -161,5 +328,7 @@ class ConnectionManager(IConnectionManager):
         """Shutdown the connection manager and cleanup resources"""
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
+        for client_id in list(self.senders):
+            self._stop_sender(client_id)
         self.active_connections.clear()
         self.session_metadata.clear()
\ No newline at end of file
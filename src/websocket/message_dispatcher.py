@@ -0,0 +1,130 @@
+"""
+Per-connection message dispatcher.
+Long-running WebSocket messages are queued in a bounded inbox and processed
+as cancellable tasks, so the connection keeps reading while an agent workflow
+runs and control messages (cancel, status, search) are answered immediately.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from ..core.logging import get_logger
+
+logger = get_logger("websocket.dispatcher")
+
+MessageHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class MessageDispatcher:
+    """Bounded inbox with up to `max_concurrent` messages of one client in flight"""
+
+    def __init__(self, client_id: str, handler: MessageHandler, max_queued: int = 16, max_concurrent: int = 1):
+        if max_queued < 1 or max_concurrent < 1:
+            raise ValueError("max_queued and max_concurrent must be at least 1")
+
+        self.client_id = client_id
+        self.max_queued = max_queued
+        self.max_concurrent = max_concurrent
+        self._handler = handler
+        self._inbox: Deque[Dict[str, Any]] = deque()
+        self._ready: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+        self._in_flight: Set[asyncio.Task] = set()
+        self._closed = False
+
+        # Statistics
+        self.accepted = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def queued(self) -> int:
+        return len(self._inbox)
+
+    def submit(self, message: Dict[str, Any]) -> bool:
+        """
+        Queue a message without blocking.
+
+        Returns False when the inbox is full or the dispatcher is closed; the
+        caller tells the client to retry later.
+        """
+        if self._closed or len(self._inbox) >= self.max_queued:
+            self.rejected += 1
+            return False
+
+        if not self._workers:
+            self._ready = asyncio.Event()
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrent)]
+
+        self._inbox.append(message)
+        self.accepted += 1
+        self._ready.set()
+        return True
+
+    def cancel(self) -> Tuple[int, int]:
+        """Cancel in-flight messages and drop queued ones; returns (cancelled, dropped)"""
+        dropped = len(self._inbox)
+        self._inbox.clear()
+        cancelled = 0
+        for task in self._in_flight:
+            if task.cancel():
+                cancelled += 1
+        return cancelled, dropped
+
+    async def close(self):
+        """Cancel everything and wait for the tasks to unwind"""
+        self._closed = True
+        self.cancel()
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self):
+        while True:
+            while not self._inbox:
+                self._ready.clear()
+                await self._ready.wait()
+            message = self._inbox.popleft()
+
+            task = asyncio.create_task(self._handler(message))
+            self._in_flight.add(task)
+            task.add_done_callback(self._task_done)
+            try:
+                # wait() does not raise when the task is cancelled, only when this worker is
+                await asyncio.wait({task})
+            finally:
+                if not task.done():
+                    task.cancel()
+
+    def _task_done(self, task: asyncio.Task):
+        self._in_flight.discard(task)
+        if task.cancelled():
+            self.cancelled += 1
+        elif task.exception() is not None:
+            self.failed += 1
+            logger.error(f"Message handler failed for {self.client_id}: {task.exception()}",
+                         client_id=self.client_id, error=task.exception())
+        else:
+            self.processed += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "max_concurrent": self.max_concurrent,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "processed": self.processed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+        }
@@ -2,6 +2,7 @@
 WebSocket message handler for multi-agent system communication.
 """
 
+import asyncio
 import json
 from typing import Dict, Any
 from fastapi import WebSocket
@@ -11,20 +12,30 @@ from ..core.configuration import Configuration
 from ..core.validation import Validator, ValidationError
 from ..core.logging import get_logger
 from ..websocket.connection_manager import ConnectionManager
+from ..websocket.message_dispatcher import MessageDispatcher
 from ..agents.agent_factory import AgentFactory
 
 
 class WebSocketHandler:
     """Handles WebSocket messages and coordinates with multi-agent system"""
     
+    # Message types run as queued, cancellable tasks; everything else is answered inline
+    DISPATCHED_MESSAGE_TYPES = frozenset({"message"})
+    
     def __init__(self, connection_manager: ConnectionManager, agent_factory: AgentFactory, config: Configuration,
-                 content_saving_service, session_repository=None):
+                 content_saving_service, session_repository=None,
+                 max_queued_messages: int = 16, max_concurrent_messages: int = 1):
         self.connection_manager = connection_manager
         self.agent_factory = agent_factory
         self.config = config
         self.validator = Validator()
         self.logger = get_logger("websocket.handler")
         
+        # Per-connection dispatchers for long-running agent messages
+        self.max_queued_messages = max_queued_messages
+        self.max_concurrent_messages = max_concurrent_messages
+        self.dispatchers: Dict[str, MessageDispatcher] = {}
+        
         # Require content saving service - no fallback to supabase_service
         if not content_saving_service:
             raise ValueError("ContentSavingService is required - no fallback to supabase_service allowed")
@@ -116,8 +127,29 @@ class WebSocketHandler:
                 self.logger.info(f"WebSocket connection cleanup completed for {client_id}", 
                                client_id=client_id)
     
+    def get_client_stats(self) -> Dict[str, Dict[str, Any]]:
+        """In-flight and queued message counts per connected client"""
+        return {client_id: dispatcher.get_stats() for client_id, dispatcher in self.dispatchers.items()}
+    
     async def _message_loop(self, client_id: str, session_id: str):
         """Main message processing loop"""
+        dispatcher = MessageDispatcher(
+            client_id,
+            lambda message_data: self._process_message(client_id, session_id, message_data),
+            max_queued=self.max_queued_messages,
+            max_concurrent=self.max_concurrent_messages
+        )
+        self.dispatchers[client_id] = dispatcher
+        try:
+            await self._receive_messages(client_id, session_id, dispatcher)
+        finally:
+            # Cancel running workflows of this connection
+            await dispatcher.close()
+            if self.dispatchers.get(client_id) is dispatcher:
+                del self.dispatchers[client_id]
+    
+    async def _receive_messages(self, client_id: str, session_id: str, dispatcher: MessageDispatcher):
+        """Keep reading while agent messages run in the dispatcher"""
         while self.connection_manager.is_connected(client_id):
             try:
                 # Get WebSocket from connection manager
@@ -129,8 +161,8 @@ class WebSocketHandler:
                 data = await websocket.receive_text()
                 message_data = json.loads(data)
                 
-                # Process the message
-                await self._process_message(client_id, session_id, message_data)
+                # Queue long-running messages, answer the rest immediately
+                await self._dispatch_message(client_id, session_id, dispatcher, message_data)
                 
             except json.JSONDecodeError as e:
                 await self.connection_manager.send_json({
@@ -150,6 +182,7 @@ class WebSocketHandler:
                             "type": "error",
                             "error": "Message processing failed"
                         }, client_id)
+                        await self.connection_manager.flush(client_id, timeout=1.0)
                     except Exception:
                         # If sending fails, the connection is dead anyway
                         break
@@ -158,6 +191,40 @@ class WebSocketHandler:
         # Clean up connection
         self.connection_manager.disconnect(client_id)
     
+    async def _dispatch_message(self, client_id: str, session_id: str, dispatcher: MessageDispatcher,
+                                message_data: Dict[str, Any]):
+        """Route a message to the dispatcher or handle a control message inline"""
+        message_type = message_data.get("type", "message")
+        
+        if message_type in self.DISPATCHED_MESSAGE_TYPES:
+            if not dispatcher.submit(message_data):
+                await self.connection_manager.send_json({
+                    "type": "error",
+                    "code": "busy",
+                    "error": "Too many pending messages, please wait for the current request to finish",
+                    "in_flight": dispatcher.in_flight,
+                    "queued": dispatcher.queued
+                }, client_id)
+        elif message_type == "cancel":
+            cancelled, dropped = dispatcher.cancel()
+            self.logger.info(f"Client {client_id} cancelled {cancelled} running and {dropped} queued messages",
+                             client_id=client_id)
+            await self.connection_manager.send_json({
+                "type": "cancelled",
+                "cancelled": cancelled,
+                "dropped": dropped
+            }, client_id)
+        elif message_type == "status":
+            await self.connection_manager.send_json({
+                "type": "status",
+                "in_flight": dispatcher.in_flight,
+                "queued": dispatcher.queued
+            }, client_id)
+        elif message_type == "ping":
+            await self.connection_manager.send_json({"type": "pong"}, client_id)
+        else:
+            await self._process_message(client_id, session_id, message_data)
+    
     async def _save_agent_response_to_database(
         self, 
         agent_name: str, 
@@ -356,6 +423,12 @@ class WebSocketHandler:
             # Clear session context
             container.clear_session_context()
             
+        except asyncio.CancelledError:
+            # Cancelled by the client or a disconnect - nothing to report back
+            self.logger.info(f"Agent message cancelled for {client_id}", client_id=client_id)
+            from ..core.container import get_container
+            get_container().clear_session_context()
+            raise
         except Exception as e:
             self.logger.error(f"Error in tool-based agent processing: {e}", error=e)
             await self.connection_manager.send_json({
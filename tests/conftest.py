@@ -359,6 +359,7 @@ def cleanup_environment():
     # Set test environment variables
     os.environ['TESTING'] = 'true'
     os.environ['LOG_LEVEL'] = 'ERROR'  # Reduce log noise during tests
+    os.environ['EMBEDDING_CACHE_PATH'] = ':memory:'  # Keep embedding cache per-test
     
     yield
     
@@ -25,10 +25,10 @@ class TestMultiAgentBookCreationWorkflow:
     """Test complete book creation workflows involving multiple agents"""
     
     @pytest.mark.asyncio
-    @patch('src.tools.writing_tools.save_plot')
-    @patch('src.tools.writing_tools.save_author')
-    @patch('src.tools.writing_tools.save_world_building')
-    @patch('src.tools.writing_tools.save_characters')
+    @patch('src.tools.writing_tools.save_plot_async')
+    @patch('src.tools.writing_tools.save_author_async')
+    @patch('src.tools.writing_tools.save_world_building_async')
+    @patch('src.tools.writing_tools.save_characters_async')
     async def test_complete_fantasy_book_creation_workflow(self, mock_save_characters, mock_save_world_building,
                                                           mock_save_author, mock_save_plot,
                                                           mock_config, mock_plot_repository, 
@@ -140,9 +140,9 @@ class TestMultiAgentBookCreationWorkflow:
         assert workflow_duration < 5.0  # 5 seconds max for mocked operations
     
     @pytest.mark.asyncio
-    @patch('src.tools.writing_tools.save_plot')
-    @patch('src.tools.writing_tools.save_author')
-    @patch('src.tools.writing_tools.save_world_building')
+    @patch('src.tools.writing_tools.save_plot_async')
+    @patch('src.tools.writing_tools.save_author_async')
+    @patch('src.tools.writing_tools.save_world_building_async')
     async def test_science_fiction_book_workflow_with_dependencies(self, mock_save_world_building, mock_save_author, mock_save_plot,
                                                                   mock_config, mock_plot_repository, 
                                                                   mock_author_repository, mock_world_building_repository,
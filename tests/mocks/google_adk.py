@@ -48,15 +48,41 @@ class MockInMemoryMemoryService:
         self.memories.pop(session_id, None)
 
 
+class MockEvent:
+    """Mock ADK event carrying response text; partial marks an SSE token delta"""
+    
+    def __init__(self, content: str, partial: bool = False):
+        self.content = content
+        self.partial = partial
+
+
+class MockStreamingMode:
+    """Mock of google.adk.agents.run_config.StreamingMode"""
+    NONE = "none"
+    SSE = "sse"
+    BIDI = "bidi"
+
+
+class MockRunConfig:
+    """Mock of google.adk.agents.run_config.RunConfig"""
+    
+    def __init__(self, streaming_mode: str = MockStreamingMode.NONE, **kwargs):
+        self.streaming_mode = streaming_mode
+
+
 class MockInMemoryRunner:
     """Mock implementation of Google ADK InMemoryRunner"""
     
-    def __init__(self, agent, app_name: str = "test_app"):
+    def __init__(self, agent, app_name: str = "test_app", response_tokens: List[str] = None,
+                 token_delay: float = 0.0):
         self.agent = agent
         self.app_name = app_name
         self.session_service = MockInMemorySessionService()
         self.memory_service = MockInMemoryMemoryService()
         self._running = False
+        # Streamed by run_async, one event per token
+        self.response_tokens = response_tokens or ["Mock ", "response"]
+        self.token_delay = token_delay
     
     async def start(self):
         """Start the runner"""
@@ -81,6 +107,23 @@ class MockInMemoryRunner:
         
         return f"Processed: {message}"
     
+    async def run_async(self, user_id: str = None, session_id: str = None, new_message=None,
+                        run_config: MockRunConfig = None):
+        """
+        Generate the response tokens token_delay apart, emitting events as ADK does.
+        
+        With SSE streaming each token is a partial event and the model turn ends
+        with one aggregated non-partial event; otherwise only the aggregated event
+        is emitted once generation finishes.
+        """
+        mode = getattr(run_config, 'streaming_mode', None)
+        sse = getattr(mode, 'value', mode) == MockStreamingMode.SSE
+        for token in self.response_tokens:
+            await asyncio.sleep(self.token_delay)
+            if sse:
+                yield MockEvent(token, partial=True)
+        yield MockEvent(''.join(self.response_tokens))
+    
     @property
     def is_running(self) -> bool:
         return self._running
@@ -117,6 +160,10 @@ class MockGoogleADK:
     
     class agents:
         Agent = MockAgent
+        
+        class run_config:
+            RunConfig = MockRunConfig
+            StreamingMode = MockStreamingMode
     
     class sessions:
         InMemorySessionService = MockInMemorySessionService
@@ -141,6 +188,7 @@ def install_mocks():
     google_adk = MockGoogleADK()
     sys.modules['google.adk'] = google_adk
     sys.modules['google.adk.agents'] = google_adk.agents
+    sys.modules['google.adk.agents.run_config'] = google_adk.agents.run_config
     sys.modules['google.adk.sessions'] = google_adk.sessions
     sys.modules['google.adk.memory'] = google_adk.memory
     sys.modules['google.adk.runners'] = google_adk.runners
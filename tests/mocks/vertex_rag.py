@@ -0,0 +1,97 @@
+"""
+Local fake of the vertexai.rag module for testing and benchmarking without Vertex AI.
+"""
+import threading
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+
+class MockRagCorpus:
+    """Corpus record as returned by rag.create_corpus / rag.list_corpora"""
+
+    def __init__(self, name: str, display_name: str):
+        self.name = name
+        self.display_name = display_name
+        self.documents: List[Dict[str, Any]] = []
+
+
+class MockRag:
+    """
+    In-memory stand-in for vertexai.rag.
+
+    Every SDK call sleeps `latency` seconds, like a blocking round trip to
+    the RAG Engine API, and is counted in `calls`. Like RAG Engine,
+    import_files ingests each file as plain text and re-chunks it into
+    chunk_size-token windows overlapping by chunk_overlap (whitespace-
+    separated words stand in for tokens); each window is one retrievable context.
+    """
+
+    def __init__(self, latency: float = 0.0, project: str = "test-project", location: str = "us-central1"):
+        self.latency = latency
+        self.parent = f"projects/{project}/locations/{location}"
+        self.corpora: Dict[str, MockRagCorpus] = {}
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        # Config types are plain attribute bags
+        for config_type in ("RagEmbeddingModelConfig", "VertexPredictionEndpoint", "RagVectorDbConfig",
+                            "RagRetrievalConfig", "Filter", "RagResource"):
+            setattr(self, config_type, SimpleNamespace)
+
+    def _call(self, operation: str):
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def create_corpus(self, display_name: str, backend_config: Any = None) -> MockRagCorpus:
+        self._call("create_corpus")
+        corpus = MockRagCorpus(f"{self.parent}/ragCorpora/{uuid.uuid4().int % 10 ** 12}", display_name)
+        with self._lock:
+            self.corpora[corpus.name] = corpus
+        return corpus
+
+    def list_corpora(self) -> List[MockRagCorpus]:
+        self._call("list_corpora")
+        with self._lock:
+            return list(self.corpora.values())
+
+    def delete_corpus(self, name: str):
+        self._call("delete_corpus")
+        with self._lock:
+            if self.corpora.pop(name, None) is None:
+                raise ValueError(f"Corpus {name} not found")
+
+    def import_files(self, corpus_name: str, paths: List[str], chunk_size: int = 512, chunk_overlap: int = 100):
+        self._call("import_files")
+        documents = []
+        step = max(1, chunk_size - chunk_overlap)
+        for path in paths:
+            with open(path, encoding="utf-8") as import_file:
+                words = import_file.read().split()
+            for start in range(0, max(1, len(words) - chunk_overlap), step):
+                if words:
+                    documents.append({"text": " ".join(words[start:start + chunk_size])})
+
+        with self._lock:
+            corpus = self.corpora.get(corpus_name)
+            if corpus is None:
+                raise ValueError(f"Corpus {corpus_name} not found")
+            corpus.documents.extend(documents)
+        return SimpleNamespace(imported_rag_files_count=len(paths))
+
+    def retrieval_query(self, rag_resources: List[Any], text: str, rag_retrieval_config: Any = None):
+        self._call("retrieval_query")
+        top_k = getattr(rag_retrieval_config, "top_k", 3)
+        contexts = []
+        with self._lock:
+            for resource in rag_resources:
+                corpus = self.corpora.get(resource.rag_corpus)
+                if corpus is None:
+                    continue
+                for document in corpus.documents:
+                    if text.lower() in document["text"].lower():
+                        contexts.append(SimpleNamespace(text=document["text"], distance=0.1))
+        return SimpleNamespace(contexts=contexts[:top_k])
@@ -5,6 +5,7 @@ Tests the refactored LoreGen agent following the successful Phase 1A pattern.
 
 import pytest
 import asyncio
+import time
 from unittest.mock import Mock, AsyncMock, patch
 from typing import Dict, Any, List
 
@@ -113,6 +114,26 @@ class TestLoreGenAgentRefactored:
         assert hasattr(agent, '_document_processor')
         assert hasattr(agent, '_embedding_manager')
     
+    def test_agent_factory_shutdown_stops_clustering_engine(self, config):
+        """Test: Application shutdown reaches the clustering engine through the agent factory"""
+        from src.agents.agent_factory import AgentFactory
+        from src.agents.loregen import LoreGenAgent
+        
+        factory = AgentFactory(config)
+        with patch('src.agents.loregen.LoreGenAgent.shutdown') as mock_shutdown:
+            factory._agent_cache["loregen_test"] = LoreGenAgent(config)
+            factory.shutdown()
+        
+        mock_shutdown.assert_called_once()
+        assert factory._agent_cache == {}
+        
+        agent = LoreGenAgent(config)
+        with patch.object(agent.get_clustering_service()._engine, 'shutdown') as mock_engine_shutdown, \
+             patch.object(agent.get_embedding_manager(), 'close') as mock_store_close:
+            agent.shutdown()
+        mock_engine_shutdown.assert_called_once()
+        mock_store_close.assert_called_once()
+    
     @pytest.mark.asyncio
     async def test_rag_service_initialization(self, config):
         """Test: LoreRAGService initializes correctly"""
@@ -278,7 +299,121 @@ class TestLoreGenAgentRefactored:
         assert all('concept_area' in exp for exp in expansions)
         assert all('expanded_content' in exp for exp in expansions)
         assert all(len(exp['expanded_content']) > 100 for exp in expansions)
-    
+
+    @pytest.mark.asyncio
+    async def test_generate_expansions_runs_concurrently_with_bound(self, config):
+        """Test: Expansions run concurrently up to MAX_CONCURRENT_EXPANSIONS and keep area order"""
+        from src.agents.loregen import LoreGenAgent
+
+        agent = LoreGenAgent(config)
+        agent.MAX_CONCURRENT_EXPANSIONS = 2
+        in_flight = 0
+        peak = 0
+
+        async def generate(prompt, session_id=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return f"Detailed expansion written in {session_id} " * 5
+
+        agent._generate_content = generate
+        areas = [{'concept_area': f"Area {i}", 'chunks': []} for i in range(5)]
+
+        expansions = await agent._generate_expansions(areas)
+
+        assert [exp['concept_area'] for exp in expansions] == [f"Area {i}" for i in range(5)]
+        assert peak == 2
+        assert len({exp['expanded_content'] for exp in expansions}) == 5  # One session per area
+        assert all(exp['generation_seconds'] >= 0.02 for exp in expansions)
+
+    @pytest.mark.asyncio
+    async def test_generate_expansions_uses_and_deletes_per_run_sessions(self, config):
+        """Test: Each run gets its own expansion sessions, deleted once the expansion finishes"""
+        from src.agents.loregen import LoreGenAgent
+
+        agent = LoreGenAgent(config)
+        used_sessions = []
+
+        async def generate(prompt, session_id=None):
+            used_sessions.append(session_id)
+            agent._sessions[session_id] = Mock(id=f"adk-{session_id}")
+            return "Detailed expansion content for the sparse area that is long enough to keep. " * 2
+
+        agent._generate_content = generate
+        runner = Mock()
+        runner.session_service.delete_session = AsyncMock()
+        areas = [{'concept_area': f"Area {i}", 'chunks': []} for i in range(2)]
+
+        with patch.object(type(agent), '_runner', new=runner):
+            await asyncio.gather(agent._generate_expansions(areas), agent._generate_expansions(areas))
+
+        assert len(set(used_sessions)) == 4
+        assert agent._sessions == {}
+        deleted = {call.kwargs['session_id'] for call in runner.session_service.delete_session.await_args_list}
+        assert deleted == {f"adk-{session_id}" for session_id in used_sessions}
+
+    @pytest.mark.asyncio
+    async def test_generate_expansions_returns_partial_results_on_timeout(self, config):
+        """Test: A slow or failing area is dropped without losing the others"""
+        from src.agents.loregen import LoreGenAgent
+
+        agent = LoreGenAgent(config)
+        agent.EXPANSION_TIMEOUT_SECONDS = 0.05
+
+        async def generate(prompt, session_id=None):
+            if "Slow Area" in prompt:
+                await asyncio.sleep(1)
+            if "Broken Area" in prompt:
+                raise RuntimeError("model unavailable")
+            return "Detailed expansion content for the sparse area that is long enough to keep. " * 2
+
+        agent._generate_content = generate
+        areas = [{'concept_area': name, 'chunks': []} for name in ("Fast Area", "Slow Area", "Broken Area")]
+        stage_metrics = {}
+
+        expansions = await agent._generate_expansions(areas, stage_metrics=stage_metrics)
+
+        assert [exp['concept_area'] for exp in expansions] == ["Fast Area"]
+        assert stage_metrics == {'areas_requested': 3, 'areas_timed_out': 1, 'areas_failed': 1}
+
+    @pytest.mark.asyncio
+    async def test_process_request_streaming_yields_expansions_as_completed(self, config, mock_world_data):
+        """Test: Streaming yields each expansion when it finishes, then the full response"""
+        from src.agents.loregen import LoreGenAgent
+
+        agent = LoreGenAgent(config)
+        agent._get_world_building = AsyncMock(return_value=mock_world_data)
+        agent._detect_sparse_areas = AsyncMock(return_value=[
+            {'concept_area': 'House Drakmoor', 'chunks': []},
+            {'concept_area': 'Trade System', 'chunks': []}
+        ])
+
+        async def generate(prompt, session_id=None):
+            await asyncio.sleep(0.05 if "House Drakmoor" in prompt else 0.01)
+            return "Detailed expansion content for the sparse area that is long enough to keep. " * 2
+
+        agent._generate_content = generate
+        request = AgentRequest(
+            content="Use this plot's worldbuilding and expand",
+            user_id="test-user",
+            session_id="test-session",
+            context={"plot_id": "plot-123"}
+        )
+
+        chunks = [chunk async for chunk in agent.process_request_streaming(request)]
+
+        assert [chunk.metadata['concept_area'] for chunk in chunks[:-1]] == ['Trade System', 'House Drakmoor']
+        assert chunks[-1].is_complete is True
+        response = chunks[-1].metadata['response']
+        assert response.success is True
+        assert response.parsed_json['expanded_areas_count'] == 2
+        stage_timings = response.parsed_json['expansion_metrics']['stage_timings']
+        assert stage_timings['areas_requested'] == 2
+        assert stage_timings['expansion_seconds'] < 0.1  # Concurrent, not 0.05 + 0.01 plus overhead
+        assert {'world_lookup_seconds', 'sparse_detection_seconds', 'integration_seconds'} <= set(stage_timings)
+
     @pytest.mark.asyncio
     async def test_integrate_expansions_workflow(self, config, mock_world_data, mock_expansions):
         """Test: Expansion integration maintains content coherence"""
@@ -525,6 +660,124 @@ class TestLoreClusteringService:
         assert len(sparse_areas) <= 2
         assert all('concept_area' in area for area in sparse_areas)
         assert all('avg_pairwise_distance' in area for area in sparse_areas)
+    
+    def test_avg_pairwise_distance_matches_pairwise_matrix(self):
+        """Test: Closed-form mean cosine distance equals the full pairwise average"""
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_distances
+        from src.agents.loregen_modules.clustering_service import LoreClusteringService
+        
+        service = LoreClusteringService()
+        
+        rng = np.random.default_rng(7)
+        embeddings = rng.normal(size=(50, 32))
+        embeddings[3] = 0.0  # Zero vectors are maximally distant
+        
+        distances = cosine_distances(embeddings)
+        expected = distances[np.triu_indices_from(distances, k=1)].mean()
+        
+        assert abs(service._calculate_avg_pairwise_distance(embeddings) - expected) < 1e-9
+        assert service._calculate_avg_pairwise_distance(embeddings[:1]) == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_silhouette_computed_once_per_clustering(self):
+        """Test: Silhouette is computed once, not once per cluster, and sampled when large"""
+        import numpy as np
+        from src.agents.loregen_modules import clustering_service as module
+        
+        service = module.LoreClusteringService()
+        service.set_clustering_parameters(silhouette_sample_size=20)
+        
+        rng = np.random.default_rng(1)
+        centers = rng.normal(size=(3, 8)) * 5
+        embeddings = np.vstack([center + rng.normal(size=(15, 8)) for center in centers]).tolist()
+        chunks = [{'text': f'chunk {i}', 'metadata': {}} for i in range(len(embeddings))]
+        
+        with patch.object(module, 'silhouette_score', wraps=module.silhouette_score) as mock_score:
+            clusters = await service.perform_kmeans_clustering(embeddings, chunks, n_clusters=3)
+        
+        assert len(clusters) == 3
+        mock_score.assert_called_once()
+        assert mock_score.call_args.kwargs['sample_size'] == 20
+        assert len({cluster['silhouette_score'] for cluster in clusters}) == 1
+    
+    @pytest.mark.asyncio
+    async def test_k_sweep_reuses_winning_model_and_warm_starts(self):
+        """Test: The elbow winner is not refitted and re-analysis warm-starts from it"""
+        import numpy as np
+        from src.agents.loregen_modules import clustering_engine
+        from src.agents.loregen_modules.clustering_service import LoreClusteringService
+        
+        service = LoreClusteringService(clustering_engine.ClusteringEngine(max_workers=1))
+        
+        rng = np.random.default_rng(3)
+        centers = rng.normal(size=(4, 16)) * 5
+        embeddings = np.vstack([center + rng.normal(size=(10, 16)) for center in centers])
+        chunks = [{'text': f'chunk {i}', 'metadata': {}} for i in range(len(embeddings))]
+        
+        with patch.object(clustering_engine, 'fit_kmeans', wraps=clustering_engine.fit_kmeans) as mock_fit:
+            first = await service.perform_kmeans_clustering(embeddings.tolist(), chunks, cache_key="plot-1")
+            assert mock_fit.call_count == 9  # k = 2..10, no extra fit for the winner
+            
+            # A small edit: nudge one chunk and cluster again
+            embeddings[0] += 0.01
+            mock_fit.reset_mock()
+            second = await service.perform_kmeans_clustering(embeddings.tolist(), chunks, cache_key="plot-1")
+            assert mock_fit.call_count == 1
+            assert mock_fit.call_args.args[4] is not None  # warm-started from previous centers
+        
+        assert len(second) == len(first)
+    
+    @pytest.mark.asyncio
+    async def test_clustering_engine_process_pool_sweep(self):
+        """Test: Parallel sweep in worker processes matches the sequential sweep"""
+        import numpy as np
+        from src.agents.loregen_modules.clustering_engine import ClusteringEngine
+        
+        rng = np.random.default_rng(5)
+        embeddings = rng.normal(size=(30, 8))
+        
+        parallel = ClusteringEngine(max_workers=2)
+        sequential = ClusteringEngine(max_workers=1)
+        try:
+            parallel_fits = await parallel.sweep(embeddings, [2, 3, 4])
+            sequential_fits = await sequential.sweep(embeddings, [2, 3, 4])
+        finally:
+            parallel.shutdown()
+        
+        assert [f.n_clusters for f in parallel_fits] == [2, 3, 4]
+        assert [round(f.inertia, 6) for f in parallel_fits] == [round(f.inertia, 6) for f in sequential_fits]
+    
+    def test_clustering_engine_pool_uses_spawn_context(self):
+        """Test: Worker processes are spawned, not forked from the threaded server"""
+        from src.agents.loregen_modules.clustering_engine import ClusteringEngine
+        
+        engine = ClusteringEngine(max_workers=2)
+        try:
+            assert engine._get_pool()._mp_context.get_start_method() == "spawn"
+        finally:
+            engine.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_warm_start_points_are_bounded_and_expire(self):
+        """Test: Remembered clusterings are evicted LRU-first and expire after the TTL"""
+        import numpy as np
+        from src.agents.loregen_modules.clustering_engine import ClusteringEngine, KMeansFit
+        
+        engine = ClusteringEngine(max_workers=1, warm_start_max_size=2, warm_start_ttl=60)
+        embeddings = np.random.default_rng(7).normal(size=(12, 4))
+        fit = await engine.fit(embeddings, 2)
+        
+        engine.remember("plot-1", fit)
+        engine.remember("plot-2", fit)
+        assert await engine.warm_start(embeddings, "plot-1") is not None  # plot-1 is now most recent
+        engine.remember("plot-3", fit)
+        assert list(engine._previous) == ["plot-1", "plot-3"]
+        
+        with patch('src.agents.loregen_modules.clustering_engine.time.monotonic', return_value=time.monotonic() + 61):
+            assert await engine.warm_start(embeddings, "plot-3") is None
+        assert "plot-3" not in engine._previous
+        assert isinstance(engine._previous["plot-1"][1], KMeansFit)
 
 
 class TestLoreDocumentProcessor:
@@ -611,4 +864,111 @@ class TestLoreEmbeddingManager:
             embeddings2 = await manager.get_embeddings(texts)
             
             assert embeddings1 == embeddings2
-            mock_embed.assert_called_once()  # Only called once due to caching
\ No newline at end of file
+            mock_embed.assert_called_once()  # Only called once due to caching
+    
+    @pytest.mark.asyncio
+    async def test_similar_embeddings_match_brute_force(self, config):
+        """Test: Vectorized top-k matches pairwise cosine similarity ordering"""
+        import numpy as np
+        from src.agents.loregen_modules.embedding_manager import LoreEmbeddingManager
+        
+        manager = LoreEmbeddingManager(config)
+        
+        rng = np.random.default_rng(0)
+        candidates = rng.normal(size=(200, 16)).tolist()
+        query = rng.normal(size=16).tolist()
+        
+        results = await manager.get_similar_embeddings(query, candidates, top_k=5)
+        
+        q = np.array(query)
+        expected = sorted(
+            ((i, float(np.dot(q, c) / (np.linalg.norm(q) * np.linalg.norm(c))))
+             for i, c in enumerate(np.array(candidates))),
+            key=lambda x: x[1], reverse=True
+        )[:5]
+        assert [i for i, _ in results] == [i for i, _ in expected]
+        assert all(abs(a[1] - b[1]) < 1e-5 for a, b in zip(results, expected))
+    
+    @pytest.mark.asyncio
+    async def test_similar_embeddings_batch_and_index_reuse(self, config):
+        """Test: Batched queries against a prebuilt index return per-query results"""
+        from src.agents.loregen_modules.embedding_manager import LoreEmbeddingManager, EmbeddingIndex
+        
+        manager = LoreEmbeddingManager(config)
+        
+        index = manager.build_similarity_index([[1.0, 0.0], [0.0, 1.0], [0.0, 0.0]])
+        assert isinstance(index, EmbeddingIndex)
+        
+        results = await manager.get_similar_embeddings_batch(
+            [[2.0, 0.1], [0.1, 3.0]], index, top_k=10
+        )
+        
+        assert [i for i, _ in results[0]] == [0, 1, 2]
+        assert [i for i, _ in results[1]] == [1, 0, 2]
+        # Zero vectors score 0 instead of dividing by zero
+        assert results[0][2][1] == 0.0
+        assert await manager.get_similar_embeddings([1.0, 0.0], [], top_k=3) == []
+    
+    @pytest.mark.asyncio
+    async def test_embedding_cache_persists_across_instances(self, config, tmp_path):
+        """Test: Embeddings survive a restart via the persistent cache tier"""
+        from src.agents.loregen_modules.embedding_manager import LoreEmbeddingManager
+        
+        cache_path = str(tmp_path / "embeddings.db")
+        texts = ["World document", "Another document"]
+        
+        first = LoreEmbeddingManager(config, cache_path=cache_path)
+        with patch.object(first, '_generate_vertex_embeddings') as mock_embed:
+            mock_embed.return_value = [[0.5, 0.25, 0.125], [1.0, 2.0, 4.0]]
+            embeddings1 = await first.get_embeddings(texts)
+        
+        second = LoreEmbeddingManager(config, cache_path=cache_path)
+        with patch.object(second, '_generate_vertex_embeddings') as mock_embed:
+            embeddings2 = await second.get_embeddings(texts)
+            mock_embed.assert_not_called()
+        
+        assert embeddings1 == embeddings2 == [[0.5, 0.25, 0.125], [1.0, 2.0, 4.0]]
+        stats = second.get_cache_stats()
+        assert stats['persistent_hits'] == 2
+        assert stats['memory_hits'] == 0
+        assert stats['persistent_cache_size'] == 2
+    
+    def test_embedding_store_keeps_running_count(self, tmp_path):
+        """Test: The store's size is tracked across replaces, reopen and clear without a COUNT per call"""
+        import numpy as np
+        from src.agents.loregen_modules.embedding_store import EmbeddingStore
+        
+        cache_path = str(tmp_path / "embeddings.db")
+        store = EmbeddingStore(cache_path)
+        store.put_many("model", {"a": np.ones(3), "b": np.ones(3)})
+        store.put_many("model", {"b": np.zeros(3), "c": np.ones(3)})  # "b" is replaced
+        assert store.count() == 3
+        store.close()
+        
+        reopened = EmbeddingStore(cache_path)
+        assert reopened.count() == 3
+        reopened.clear()
+        assert reopened.count() == 0
+        reopened.close()
+    
+    @pytest.mark.asyncio
+    async def test_embedding_cache_lru_eviction(self, config):
+        """Test: In-memory tier evicts least recently used entries one at a time"""
+        from src.agents.loregen_modules.embedding_manager import LoreEmbeddingManager
+        
+        manager = LoreEmbeddingManager(config)
+        manager.configure_caching(max_size=2)
+        
+        with patch.object(manager, '_generate_vertex_embeddings') as mock_embed:
+            mock_embed.side_effect = lambda texts: [[float(len(t)), 1.0] for t in texts]
+            await manager.get_embeddings(["a"])
+            await manager.get_embeddings(["bb"])
+            await manager.get_embeddings(["a"])    # "a" becomes most recently used
+            await manager.get_embeddings(["ccc"])  # evicts "bb"
+        
+        stats = manager.get_cache_stats()
+        assert stats['cache_size'] == 2
+        assert stats['cache_evictions'] == 1
+        assert stats['memory_hits'] == 1
+        assert manager._get_from_cache(manager._hash_text("bb")) is None
+        assert manager._get_from_cache(manager._hash_text("a")) is not None
@@ -0,0 +1,122 @@
+"""
+Tests for agent coordination tools: async-native invoke_agent and workflow context.
+"""
+
+import pytest
+import asyncio
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
+
+from src.core.container import ServiceContainer
+from src.core.interfaces import AgentResponse, ContentType
+from src.tools import agent_tools
+
+
+class StubAgent:
+    """Agent stand-in that records where it ran"""
+
+    def __init__(self, name, container, delay=0.0, metadata=None):
+        self.name = name
+        self.container = container
+        self.delay = delay
+        self.metadata = metadata or {}
+        self.loop = None
+        self.thread = None
+        self.requests = []
+
+    async def process_request(self, request):
+        self.loop = asyncio.get_running_loop()
+        self.thread = threading.get_ident()
+        self.requests.append(request)
+        self.container.set_session_context(request.session_id, request.user_id)
+        await asyncio.sleep(self.delay)
+        return AgentResponse(
+            agent_name=self.name,
+            content=f"{self.name} done",
+            content_type=ContentType.PLOT,
+            metadata=self.metadata
+        )
+
+
+class TestInvokeAgent:
+    """Tests for nested agent invocation on the caller's event loop"""
+
+    @pytest.fixture
+    def container(self):
+        """Real container for session context, with a mocked agent factory"""
+        container = ServiceContainer()
+        container.agent_factory = MagicMock()
+        return container
+
+    @pytest.fixture
+    def agents(self, container):
+        """Registered stub agents"""
+        agents = {
+            "plot_generator": StubAgent("plot_generator", container, metadata={"plot_id": "plot-1"}),
+            "slow": StubAgent("slow", container, delay=1.0),
+        }
+        container.agent_factory.return_value.get_agent.side_effect = agents.get
+        with patch.object(agent_tools, "get_container", return_value=container):
+            yield agents
+
+    @pytest.mark.asyncio
+    async def test_runs_on_callers_loop(self, agents):
+        """Test nested agents run on the calling loop and thread"""
+        threads_before = threading.active_count()
+        result = await agent_tools.invoke_agent("plot_generator", "Write a plot")
+
+        assert result["success"] is True
+        assert result["response"] == "plot_generator done"
+        assert agents["plot_generator"].loop is asyncio.get_running_loop()
+        assert agents["plot_generator"].thread == threading.get_ident()
+        assert threading.active_count() <= threads_before
+
+    @pytest.mark.asyncio
+    async def test_workflow_context_updated_from_metadata(self, agents):
+        """Test IDs returned by an agent are stored in the workflow context"""
+        workflow_id = f"wf-{uuid.uuid4()}"
+        await agent_tools.invoke_agent(
+            "plot_generator", "Write a plot", context={"genre": "fantasy"}, workflow_id=workflow_id
+        )
+
+        context = agent_tools.get_agent_context(workflow_id)["context"]
+        assert context["genre"] == "fantasy"
+        assert context["plot_id"] == "plot-1"
+
+    @pytest.mark.asyncio
+    async def test_nested_session_context_does_not_leak(self, agents, container):
+        """Test session context set by the nested agent stays in the nested call"""
+        container.set_session_context("outer-session", "outer-user")
+
+        await agent_tools.invoke_agent(
+            "plot_generator", "Write a plot", context={"session_id": "inner-session"}
+        )
+
+        assert agents["plot_generator"].requests[0].session_id == "inner-session"
+        assert container.get_current_session_id() == "outer-session"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_invocations_overlap(self, agents):
+        """Test independent invocations run concurrently instead of serializing"""
+        agents["slow"].delay = 0.2
+        started = asyncio.get_running_loop().time()
+        results = await asyncio.gather(*(
+            agent_tools.invoke_agent("slow", f"request {i}") for i in range(5)
+        ))
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert all(result["success"] for result in results)
+        assert elapsed < 0.2 * 5 / 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_unknown_agent(self, agents):
+        """Test timeouts and unknown agents return failure results"""
+        with patch.object(agent_tools, "AGENT_INVOCATION_TIMEOUT", 0.05):
+            result = await agent_tools.invoke_agent("slow", "Take too long")
+        assert result["success"] is False
+        assert "timed out" in result["error"]
+
+        result = await agent_tools.invoke_agent("missing", "Anyone there?")
+        assert result["success"] is False
+        assert "not found" in result["error"]
@@ -658,4 +658,23 @@ class TestBaseRepositoryIntegration:
         assert mock_database.get_by_id.call_count == 3
         
         for i, entity in enumerate(retrieved_entities):
-            assert entity.name == f"Entity {i + 1}"
\ No newline at end of file
+            assert entity.name == f"Entity {i + 1}"    
+    @pytest.mark.asyncio
+    async def test_update_many_uses_bulk_update(self, mock_database):
+        """
+        Test bulk field updates go to the adapter's batch_update in one call
+        """
+        # Arrange
+        repo = ConcreteTestRepository(mock_database, "test_entities")
+        mock_database.batch_update.return_value = 2
+        
+        # Act
+        updated = await repo.update_many({"id1": {"name": "A"}, "id2": {"name": "B"}})
+        
+        # Assert
+        assert updated == 2
+        mock_database.batch_update.assert_awaited_once_with("test_entities", [
+            {"id": "id1", "data": {"name": "A"}},
+            {"id": "id2", "data": {"name": "B"}}
+        ])
+        mock_database.update.assert_not_called()
@@ -37,6 +37,7 @@ mock_supabase.Client = MagicMock()
 sys.modules['supabase'] = mock_supabase
 
 from src.database.connection_pool import (
+    AsyncConnectionPool,
     ConnectionPoolConfig, 
     PoolMetrics, 
     SQLitePooledConnection, 
@@ -872,4 +873,137 @@ class TestConnectionPoolIntegration:
             try:
                 os.unlink(temp_path)
             except OSError:
-                pass
\ No newline at end of file
+                pass
+
+class TestAsyncConnectionPoolCheckout:
+    """Test waiter hand-off, checkout deadlines and lazy health checks"""
+
+    @pytest.fixture
+    def temp_db_path(self):
+        """Create temporary database file for testing"""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        yield path
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_fifo_order(self, temp_db_path):
+        """A returned connection goes to the oldest waiting acquirer"""
+        config = ConnectionPoolConfig(min_connections=1, max_connections=1, connection_timeout=5)
+        pool = SQLiteConnectionPool(temp_db_path, config)
+        order = []
+
+        async def acquire(task_id):
+            async with pool.get_connection():
+                order.append(task_id)
+                await asyncio.sleep(0)
+
+        try:
+            async with pool.get_connection():
+                tasks = [asyncio.create_task(acquire(i)) for i in range(5)]
+                await asyncio.sleep(0.01)
+                assert pool.get_metrics().waiting_acquirers == 5
+
+            await asyncio.gather(*tasks)
+
+            assert order == [0, 1, 2, 3, 4]
+            metrics = pool.get_metrics()
+            assert metrics.waits == 5
+            assert metrics.waiting_acquirers == 0
+            assert sum(metrics.wait_time_histogram().values()) == 5
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_checkout_deadline_raises_timeout(self, temp_db_path):
+        """A waiter gives up after its deadline and leaves the wait line"""
+        config = ConnectionPoolConfig(min_connections=1, max_connections=1, connection_timeout=5)
+        pool = SQLiteConnectionPool(temp_db_path, config)
+
+        try:
+            async with pool.get_connection() as held:
+                with pytest.raises(TimeoutError):
+                    async with pool.get_connection(timeout=0.05):
+                        pass
+                assert pool.get_metrics().waiting_acquirers == 0
+
+            # The connection goes back to the idle queue, not to the abandoned waiter
+            async with pool.get_connection(timeout=0.05) as connection:
+                assert connection is held
+
+            metrics = pool.get_metrics()
+            assert metrics.wait_timeouts == 1
+            assert metrics.max_wait_time >= 0.05
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_is_cached_between_checkouts(self, temp_db_path):
+        """Connections are queried for health only when the cached result expired"""
+        config = ConnectionPoolConfig(min_connections=1, max_connections=1, health_check_interval=60)
+        pool = SQLiteConnectionPool(temp_db_path, config)
+
+        try:
+            with patch.object(SQLitePooledConnection, 'is_healthy', return_value=True) as is_healthy:
+                for _ in range(10):
+                    async with pool.get_connection():
+                        pass
+
+            assert is_healthy.call_count == 1
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_monitor_checks_sqlite_connections(self, temp_db_path):
+        """The background monitor runs SQLite checks on the default executor and drops failures"""
+        config = ConnectionPoolConfig(min_connections=1, max_connections=2, health_check_interval=60)
+        pool = SQLiteConnectionPool(temp_db_path, config)
+        unhealthy = pool._all_connections[0]
+
+        try:
+            with patch.object(SQLitePooledConnection, 'is_healthy', return_value=False):
+                await pool.start_background_tasks()
+                for _ in range(100):
+                    if pool.get_metrics().health_check_failures:
+                        break
+                    await asyncio.sleep(0.01)
+
+            assert pool.get_metrics().health_check_failures == 1
+            assert unhealthy not in pool._all_connections
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending_waiters(self, temp_db_path):
+        """Closing the pool wakes waiting acquirers with an error"""
+        config = ConnectionPoolConfig(min_connections=1, max_connections=1, connection_timeout=5)
+        pool = SQLiteConnectionPool(temp_db_path, config)
+
+        async def acquire():
+            async with pool.get_connection():
+                pass
+
+        context = pool.get_connection()
+        await context.__aenter__()
+        waiter = asyncio.create_task(acquire())
+        await asyncio.sleep(0.01)
+
+        await pool.close()
+
+        with pytest.raises(RuntimeError):
+            await waiter
+        await context.__aexit__(None, None, None)
+
+    def test_pool_subclasses_must_implement_connection_hooks(self):
+        """The shared pool is abstract over connection creation and idle cleanup"""
+        class IncompletePool(AsyncConnectionPool):
+            def _create_connection(self):
+                return None
+
+        with pytest.raises(TypeError):
+            AsyncConnectionPool(ConnectionPoolConfig(), "test_pool")
+        with pytest.raises(TypeError):
+            IncompletePool(ConnectionPoolConfig(), "test_pool")
@@ -0,0 +1,197 @@
+"""
+Tests for the per-connection message dispatcher and its WebSocketHandler integration.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.websockets import WebSocketDisconnect
+
+from src.core.interfaces import AgentResponse, ContentType
+from src.websocket.connection_manager import ConnectionManager
+from src.websocket.message_dispatcher import MessageDispatcher
+from src.websocket.websocket_handler import WebSocketHandler
+
+
+class FakeWebSocket:
+    """Client socket fed from a queue; None disconnects"""
+
+    def __init__(self):
+        self.incoming = asyncio.Queue()
+        self.sent = []
+        self.received = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self):
+        data = await self.incoming.get()
+        if data is None:
+            raise WebSocketDisconnect()
+        return data
+
+    async def send_text(self, data):
+        self.sent.append(json.loads(data))
+        self.received.set()
+
+    async def close(self, code=1000, reason=None):
+        pass
+
+    def send(self, **message):
+        self.incoming.put_nowait(json.dumps(message))
+
+    async def wait_for(self, message_type, timeout=1.0):
+        async def find():
+            while True:
+                for message in self.sent:
+                    if message["type"] == message_type:
+                        return message
+                self.received.clear()
+                await self.received.wait()
+        return await asyncio.wait_for(find(), timeout)
+
+
+class TestMessageDispatcher:
+    """Bounded inbox, cancellable in-flight tasks"""
+
+    async def test_processes_in_order_with_one_in_flight(self):
+        handled = []
+
+        async def handler(message):
+            await asyncio.sleep(0.01)
+            handled.append(message["n"])
+
+        dispatcher = MessageDispatcher("client", handler, max_queued=4)
+        assert all(dispatcher.submit({"n": n}) for n in range(3))
+        assert (dispatcher.in_flight, dispatcher.queued) == (0, 3)
+
+        await asyncio.sleep(0)
+        assert (dispatcher.in_flight, dispatcher.queued) == (1, 2)
+
+        await asyncio.sleep(0.1)
+        assert handled == [0, 1, 2]
+        assert dispatcher.get_stats()["processed"] == 3
+        await dispatcher.close()
+
+    async def test_rejects_when_full(self):
+        dispatcher = MessageDispatcher("client", AsyncMock(), max_queued=2)
+
+        accepted = [dispatcher.submit({"n": n}) for n in range(3)]
+
+        assert accepted == [True, True, False]
+        assert dispatcher.get_stats()["rejected"] == 1
+        await dispatcher.close()
+        assert not dispatcher.submit({"n": 4})
+
+    async def test_cancel_and_close(self):
+        started = asyncio.Event()
+
+        async def handler(message):
+            started.set()
+            await asyncio.sleep(60)
+
+        dispatcher = MessageDispatcher("client", handler)
+        dispatcher.submit({"n": 0})
+        dispatcher.submit({"n": 1})
+        await started.wait()
+
+        assert dispatcher.cancel() == (1, 1)
+        await asyncio.sleep(0.01)
+        assert dispatcher.get_stats()["cancelled"] == 1
+
+        dispatcher.submit({"n": 2})
+        await asyncio.sleep(0)
+        await dispatcher.close()
+        assert dispatcher.in_flight == 0
+        assert dispatcher.get_stats()["cancelled"] == 2
+
+    async def test_handler_failure_is_counted(self):
+        dispatcher = MessageDispatcher("client", AsyncMock(side_effect=RuntimeError("boom")))
+        dispatcher.submit({})
+        await asyncio.sleep(0.01)
+
+        assert dispatcher.get_stats()["failed"] == 1
+        await dispatcher.close()
+
+
+class TestWebSocketHandlerDispatch:
+    """The connection keeps reading while an agent message runs"""
+
+    @pytest.fixture
+    async def setup(self):
+        release = asyncio.Event()
+
+        async def process_request(request):
+            await release.wait()
+            return AgentResponse(agent_name="orchestrator", content="done", content_type=ContentType.PLOT)
+
+        orchestrator = MagicMock()
+        orchestrator.process_request = process_request
+        agent_factory = MagicMock()
+        agent_factory.create_agent.return_value = orchestrator
+        agent_factory.get_available_agents.return_value = ["orchestrator"]
+
+        connection_manager = ConnectionManager()
+        handler = WebSocketHandler(connection_manager, agent_factory, MagicMock(),
+                                   content_saving_service=AsyncMock(), session_repository=AsyncMock(),
+                                   max_queued_messages=1)
+        websocket = FakeWebSocket()
+        connection = asyncio.create_task(handler.handle_connection(websocket, "session1"))
+        await websocket.wait_for("connection_established")
+
+        yield handler, websocket, release
+
+        websocket.incoming.put_nowait(None)
+        await asyncio.wait_for(connection, 1.0)
+        connection_manager.shutdown()
+
+    async def test_status_and_search_answered_while_agent_runs(self, setup):
+        handler, websocket, release = setup
+
+        websocket.send(type="message", content="Write a plot", user_id="user1")
+        await websocket.wait_for("stream_chunk")
+        websocket.send(type="search", content="dragons", user_id="user1")
+        websocket.send(type="status")
+
+        status = await websocket.wait_for("status")
+        assert (status["in_flight"], status["queued"]) == (1, 0)
+        assert await websocket.wait_for("stream_end")
+        assert handler.get_client_stats()["client_session1"]["in_flight"] == 1
+
+        release.set()
+        assert (await websocket.wait_for("workflow_complete"))["message"] == "Request processed successfully"
+
+    async def test_busy_when_inbox_full_and_cancel(self, setup):
+        handler, websocket, release = setup
+
+        websocket.send(type="message", content="Write a plot", user_id="user1")
+        await websocket.wait_for("stream_chunk")
+        for _ in range(2):
+            websocket.send(type="message", content="Write a plot", user_id="user1")
+
+        busy = await websocket.wait_for("error")
+        assert busy["code"] == "busy"
+        assert (busy["in_flight"], busy["queued"]) == (1, 1)
+
+        websocket.send(type="cancel")
+        cancelled = await websocket.wait_for("cancelled")
+        assert (cancelled["cancelled"], cancelled["dropped"]) == (1, 1)
+
+        websocket.send(type="ping")
+        assert await websocket.wait_for("pong")
+        assert handler.get_client_stats()["client_session1"]["in_flight"] == 0
+
+    async def test_disconnect_cancels_running_agent(self, setup):
+        handler, websocket, release = setup
+
+        websocket.send(type="message", content="Write a plot", user_id="user1")
+        await websocket.wait_for("stream_chunk")
+        dispatcher = handler.dispatchers["client_session1"]
+
+        websocket.incoming.put_nowait(None)
+        await asyncio.sleep(0.05)
+
+        assert "client_session1" not in handler.dispatchers
+        assert dispatcher.get_stats()["cancelled"] == 1
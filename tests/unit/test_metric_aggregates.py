@@ -0,0 +1,89 @@
+"""
+Tests for streaming metric aggregates and the Prometheus exposition.
+"""
+
+import random
+
+from src.core.metric_aggregates import LogHistogram, MetricSeries, RingBuffer, render_prometheus
+from src.core.observability import ADKObservabilityManager, ObservabilityConfig
+
+
+class TestRingBuffer:
+    """Fixed memory, oldest values overwritten"""
+
+    def test_wraps_around(self):
+        buffer = RingBuffer(3)
+        for value in range(5):
+            buffer.append(float(value))
+
+        assert len(buffer) == 3
+        assert buffer.values() == [2.0, 3.0, 4.0]
+        assert buffer.values(last=2) == [3.0, 4.0]
+
+
+class TestLogHistogram:
+    """Quantiles within the configured relative error"""
+
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(3)
+        samples = [rng.lognormvariate(6, 1) for _ in range(20000)]
+        histogram = LogHistogram(relative_accuracy=0.01)
+        for sample in samples:
+            histogram.add(sample)
+
+        ordered = sorted(samples)
+        for fraction in (0.5, 0.95, 0.99):
+            exact = ordered[int(fraction * len(ordered)) - 1]
+            assert abs(histogram.quantile(fraction) - exact) / exact <= 0.011
+
+    def test_zero_and_empty(self):
+        histogram = LogHistogram()
+        assert histogram.quantile(0.5) is None
+
+        for value in (0.0, 0.0, 5.0):
+            histogram.add(value)
+        assert histogram.quantile(0.5) == 0.0
+        assert abs(histogram.quantile(0.99) - 5.0) / 5.0 <= 0.01
+
+
+class TestMetricSeries:
+    """Totals, quantiles and tag counters without raw samples"""
+
+    def test_summary(self):
+        series = MetricSeries("agent_duration_ms", window=5)
+        for value in range(1, 101):
+            series.record(float(value), {"agent": "plot" if value % 2 else "author"})
+
+        summary = series.summary()
+        assert (summary["count"], summary["avg"], summary["min"], summary["max"]) == (100, 50.5, 1.0, 100.0)
+        assert summary["recent"] == [96.0, 97.0, 98.0, 99.0, 100.0]
+        assert abs(summary["p95"] - 95) <= 1
+        assert series.by_tags[(("agent", "plot"),)] == [50, 2500.0]
+
+    def test_prometheus_exposition(self):
+        series = MetricSeries("llm.latency_ms")
+        series.record(10.0, {"agent": "plot", "model": 'gemini "flash"'})
+        series.record(30.0, {"agent": "plot", "model": 'gemini "flash"'})
+
+        text = render_prometheus([series])
+
+        assert "# TYPE agentwriter_llm_latency_ms summary" in text
+        assert 'agentwriter_llm_latency_ms{quantile="0.5"} 10.0' in text
+        assert "agentwriter_llm_latency_ms_sum 40.0\nagentwriter_llm_latency_ms_count 2" in text
+        assert 'agentwriter_llm_latency_ms_tagged_total{agent="plot",model="gemini \\"flash\\""} 2' in text
+        assert text.endswith("\n")
+
+
+class TestObservabilityManagerMetrics:
+    """record_performance_metric feeds the streaming aggregates"""
+
+    def test_summary_and_prometheus(self):
+        manager = ADKObservabilityManager(ObservabilityConfig())
+        for value in (100.0, 200.0, 300.0):
+            manager.record_performance_metric("agent_duration_ms", value, {"agent": "plot"})
+
+        summary = manager.get_performance_summary()["agent_duration_ms"]
+        assert (summary["count"], summary["avg"], summary["max"]) == (3, 200.0, 300.0)
+        assert abs(summary["p50"] - 200.0) <= 2
+        assert "agentwriter_agent_duration_ms_count 3" in manager.render_prometheus_metrics()
+        assert render_prometheus([]) == ""
@@ -0,0 +1,162 @@
+"""
+Tests for the relation-aware batch loader and BatchOperationsMixin related-data loading.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.repositories.batch_operations import BatchOperationsMixin, OptimizedCharactersRepository
+from src.repositories.relation_loader import RelationLoader, Relation
+
+
+class CountingDatabase:
+    """Wraps an adapter, recording every set-based select and per-row search"""
+
+    def __init__(self, adapter: SQLiteAdapter):
+        self._adapter = adapter
+        self.selects = []
+        self.searches = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __getattr__(self, name):
+        return getattr(self._adapter, name)
+
+    async def batch_select_by_column(self, table, column, values):
+        self.selects.append((table, column, sorted(values)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await self._adapter.batch_select_by_column(table, column, values)
+        finally:
+            self.in_flight -= 1
+
+    async def search(self, table, criteria, limit=50):
+        self.searches += 1
+        return await self._adapter.search(table, criteria, limit)
+
+
+@pytest.fixture
+async def adapter():
+    """SQLite adapter on a temporary database"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        adapter = SQLiteAdapter(os.path.join(tmp_dir, "relations.db"))
+        yield adapter
+        await adapter.close()
+
+
+@pytest.fixture
+async def story(adapter):
+    """Two plots by one author, each with a world and characters"""
+    user_id = await adapter.insert("users", {"name": "Loader User"})
+    author_id = await adapter.insert("authors", {"user_id": user_id, "author_name": "A. Writer"})
+    plot_ids, world_ids = [], []
+    for i in range(2):
+        plot_id = await adapter.insert("plots", {
+            "user_id": user_id, "author_id": author_id, "title": f"Plot {i}", "plot_summary": "Summary"
+        })
+        world_id = await adapter.insert("world_building", {
+            "user_id": user_id, "plot_id": plot_id, "world_name": f"World {i}",
+            "world_type": "fantasy", "overview": "Overview"
+        })
+        for _ in range(i + 1):
+            await adapter.insert("characters", {
+                "user_id": user_id, "plot_id": plot_id, "world_id": world_id, "character_count": 1,
+                "world_context_integration": "Integrated", "characters": []
+            })
+        plot_ids.append(plot_id)
+        world_ids.append(world_id)
+    return {"author_id": author_id, "plot_ids": plot_ids, "world_ids": world_ids}
+
+
+class TestRelationResolution:
+    """Foreign keys are read from the schema, in both directions"""
+
+    def test_resolves_child_and_parent_relations(self):
+        loader = RelationLoader(database=None)
+
+        assert loader.resolve("plots", "characters") == Relation("characters", "plot_id", "id", many=True)
+        assert loader.resolve("plots", "authors") == Relation("authors", "id", "author_id", many=False)
+        assert loader.resolve("characters", "world_building") == Relation("world_building", "id", "world_id", many=False)
+        with pytest.raises(ValueError):
+            loader.resolve("plots", "genres")
+
+
+class TestRelationLoader:
+    """Batching and coalescing of lookups"""
+
+    async def test_lookups_in_one_tick_share_one_query(self, adapter, story):
+        database = CountingDatabase(adapter)
+        loader = RelationLoader(database)
+        plot_ids = story["plot_ids"]
+
+        first, second, repeat = await asyncio.gather(
+            loader.load("characters", "plot_id", plot_ids[0]),
+            loader.load("characters", "plot_id", plot_ids[1]),
+            loader.load("characters", "plot_id", plot_ids[0]),
+        )
+
+        assert database.selects == [("characters", "plot_id", sorted(plot_ids))]
+        assert (len(first), len(second)) == (1, 2)
+        assert repeat is first
+
+    async def test_repeated_lookup_is_served_from_cache(self, adapter, story):
+        database = CountingDatabase(adapter)
+        loader = RelationLoader(database)
+
+        await loader.load_many("world_building", "id", story["world_ids"])
+        worlds = await loader.load_many("world_building", "id", story["world_ids"][:1])
+
+        assert len(database.selects) == 1
+        assert worlds[0][0]["world_name"] == "World 0"
+
+    async def test_failed_lookup_is_not_cached(self, adapter, story):
+        loader = RelationLoader(adapter)
+
+        with pytest.raises(ValueError):
+            await loader.load("characters", "bad column", story["plot_ids"][0])
+
+        assert await loader.load("characters", "plot_id", "missing") == []
+
+
+class TestBatchOperationsRelatedData:
+    """BatchOperationsMixin issues one query per relation, concurrently"""
+
+    async def test_multiple_entities_load_each_relation_once(self, adapter, story):
+        database = CountingDatabase(adapter)
+        batch_ops = BatchOperationsMixin(database, "plots")
+
+        plots = await batch_ops.get_multiple_with_related_data(
+            story["plot_ids"], ["characters", "world_building", "authors"]
+        )
+
+        assert sorted(table for table, _, _ in database.selects) == ["authors", "characters", "world_building"]
+        assert database.max_in_flight == 3
+        assert database.searches == 0
+        by_title = {plot["title"]: plot for plot in plots}
+        assert len(by_title["Plot 1"]["characters"]) == 2
+        assert by_title["Plot 0"]["world_building"][0]["world_name"] == "World 0"
+        assert by_title["Plot 0"]["authors"][0]["id"] == story["author_id"]
+
+    async def test_single_entity_skips_unrelated_tables(self, adapter, story):
+        batch_ops = BatchOperationsMixin(adapter, "plots")
+
+        plot = await batch_ops.get_with_related_data(story["plot_ids"][0], ["characters", "genres"])
+
+        assert len(plot["characters"]) == 1
+        assert "genres" not in plot
+
+    async def test_characters_with_world_context(self, adapter, story):
+        database = CountingDatabase(adapter)
+        repository = OptimizedCharactersRepository(database)
+
+        characters = await repository.get_characters_with_world_context(story["plot_ids"])
+
+        assert len(characters) == 3
+        assert all(c["world_context"]["id"] == c["world_id"] for c in characters)
+        assert [table for table, _, _ in database.selects] == ["characters", "world_building"]
@@ -0,0 +1,150 @@
+"""
+Tests for SessionRepository session aggregation against a temporary SQLite database.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.repositories.session_repository import SessionRepository
+
+
+class CountingAdapter:
+    """Wraps an adapter, counting database round-trips by method"""
+
+    def __init__(self, adapter: SQLiteAdapter):
+        self._adapter = adapter
+        self.calls = []
+
+    def __getattr__(self, name):
+        attribute = getattr(self._adapter, name)
+        if not callable(attribute):
+            return attribute
+
+        async def counted(*args, **kwargs):
+            self.calls.append(name)
+            return await attribute(*args, **kwargs)
+        return counted
+
+
+@pytest.fixture
+async def adapter():
+    """SQLite adapter on a temporary database"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        adapter = SQLiteAdapter(os.path.join(tmp_dir, "sessions.db"))
+        yield adapter
+        await adapter.close()
+
+
+@pytest.fixture
+async def session(adapter):
+    """A session with interleaved content and one critiqued plot"""
+    user_id = await adapter.insert("users", {"name": "Session User"})
+    session_id = await adapter.insert("sessions", {"user_id": user_id})
+    await adapter.insert("authors", {
+        "session_id": session_id, "author_name": "A. Writer", "created_at": "2025-01-01T00:00:00"
+    })
+    plot_ids = []
+    for i in range(3):
+        plot_ids.append(await adapter.insert("plots", {
+            "session_id": session_id, "title": f"Plot {i}", "plot_summary": "Summary",
+            "created_at": f"2025-01-0{i + 2}T00:00:00"
+        }))
+    await adapter.insert("world_building", {
+        "session_id": session_id, "plot_id": plot_ids[0], "world_name": "World",
+        "created_at": "2025-01-01T12:00:00"
+    })
+    await adapter.insert("orchestrator_decisions", {
+        "session_id": session_id, "request_content": "Write a plot", "routing_decision": "plot_generator"
+    })
+
+    iteration_id = f"plot_{plot_ids[1]}"
+    await adapter.insert("iterations", {"id": iteration_id, "iteration_number": 1, "content": "Draft"})
+    await adapter.insert("critiques", {"iteration_id": iteration_id, "critique_json": {"ok": True}, "agent_response": "Fine"})
+    await adapter.insert("scores", {
+        "iteration_id": iteration_id, "overall_score": 8.5, "category_scores": {},
+        "score_rationale": "Good", "improvement_trajectory": []
+    })
+    return session_id
+
+
+class TestSessionAggregation:
+    """Session data and timeline are read in a fixed number of round-trips"""
+
+    async def test_session_data_round_trips_do_not_grow_with_plots(self, adapter, session):
+        database = CountingAdapter(adapter)
+        repository = SessionRepository(database)
+
+        data = await repository.get_session_data(session)
+
+        assert sorted(database.calls) == ["batch_select_by_column"] * 3 + ["get_session_content"]
+        assert [plot["title"] for plot in data["plots"]] == ["Plot 0", "Plot 1", "Plot 2"]
+        assert len(data["authors"]) == len(data["world_building"]) == len(data["orchestrator_decisions"]) == 1
+        assert data["critiques"][0]["critique_json"] == {"ok": True}
+        assert len(data["scores"]) == 1
+        assert data["enhancements"] == []
+
+    async def test_timeline_is_one_query_in_creation_order(self, adapter, session):
+        database = CountingAdapter(adapter)
+        repository = SessionRepository(database)
+
+        timeline = await repository.get_session_timeline(session)
+
+        assert database.calls == ["get_session_content"]
+        assert [event["type"] for event in timeline] == ["author", "world_building", "plot", "plot", "plot"]
+        assert timeline[2]["summary"] == "Summary..."
+
+    async def test_statistics_reuse_session_data(self, adapter, session):
+        repository = SessionRepository(adapter)
+
+        result = await repository.get_session_statistics(session)
+
+        assert result["statistics"]["total_content"] == 5
+        assert result["statistics"]["session_start"] == "2025-01-01T00:00:00"
+        assert result["statistics"]["duration_items"] == 5
+
+
+class TestSessionIdentityCache:
+    """ensure_session_exists resolves each identity once per TTL with a single upsert"""
+
+    async def test_miss_upserts_once_then_hits_cache(self, adapter):
+        database = CountingAdapter(adapter)
+        repository = SessionRepository(database)
+
+        session = await repository.ensure_session_exists("session-1", "user-1")
+        for _ in range(3):
+            assert await repository.ensure_session_exists("session-1", "user-1") == session
+
+        assert database.calls == ["upsert_returning", "upsert_returning"]
+        assert session["id"] == "session-1" and session["user_id"] == "user-1"
+        assert (await adapter.get_by_id("users", "user-1"))["id"] == "user-1"
+
+        stats = repository.get_identity_cache_stats()
+        assert stats["sessions"]["hits"] == 3 and stats["sessions"]["misses"] == 1
+        assert stats["hit_rate"] == 0.6
+
+    async def test_existing_session_is_returned_unchanged(self, adapter, session):
+        repository = SessionRepository(adapter)
+        stored = await adapter.get_by_id("sessions", session)
+
+        resolved = await repository.ensure_session_exists(session, "another-user")
+
+        assert resolved["user_id"] == stored["user_id"]
+        assert await adapter.count("sessions") == 1
+
+    async def test_delete_and_ttl_invalidate(self, adapter):
+        database = CountingAdapter(adapter)
+        repository = SessionRepository(database, identity_cache_ttl=0.05)
+        await repository.ensure_session_exists("session-1", "user-1")
+
+        await repository.delete_session("session-1")
+        await repository.ensure_session_exists("session-1", "user-1")
+        assert database.calls == ["upsert_returning"] * 3
+
+        await asyncio.sleep(0.06)
+        await repository.ensure_session_exists("session-1", "user-1")
+        assert database.calls == ["upsert_returning"] * 5
+        assert repository.get_identity_cache_stats()["sessions"]["invalidations"] == 1
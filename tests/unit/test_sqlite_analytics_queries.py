@@ -0,0 +1,124 @@
+"""
+Tests for SQL-side analytics over agent invocations and scores.
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.repositories.agent_invocation_repository import AgentInvocationRepository
+from src.repositories.iterative_repository import IterativeRepository
+
+
+def invocation(i, agent_name, start_time, duration_ms, success=True, error=None, tools=()):
+    """An agent_invocations row"""
+    return {
+        "invocation_id": f"inv-{i}",
+        "agent_name": agent_name,
+        "request_content": "r" * 150,
+        "start_time": start_time.isoformat(),
+        "duration_ms": duration_ms,
+        "total_tokens": 100,
+        "cost_estimate": 0.01,
+        "success": success,
+        "error_message": error,
+        "tool_calls": [{"tool": tool} for tool in tools],
+        "final_prompt": "p" * 1000,
+        "raw_response": "x" * 1000,
+    }
+
+
+@pytest.fixture
+async def adapter():
+    """SQLite adapter seeded with invocations inside and outside a 24h window"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        adapter = SQLiteAdapter(os.path.join(tmp_dir, "analytics.db"))
+        now = datetime.utcnow()
+        rows = [
+            invocation(i, "plot_generator", now - timedelta(minutes=i), duration_ms=(i + 1) * 10.0,
+                       tools=("save_plot",) if i % 2 else ())
+            for i in range(20)
+        ]
+        rows += [
+            invocation(20, "author_generator", now - timedelta(minutes=1), 500.0, success=False, error="Timeout"),
+            invocation(21, "author_generator", now - timedelta(minutes=2), 0, success=False, error="Timeout",
+                       tools=("save_author", "invoke_agent")),
+            invocation(22, "author_generator", now - timedelta(minutes=3), 300.0, success=False, error="Bad JSON"),
+            # Outside the window
+            invocation(23, "plot_generator", now - timedelta(hours=30), 9999.0, success=False, error="Old"),
+        ]
+        await adapter.batch_insert("agent_invocations", rows)
+        yield adapter
+        await adapter.close()
+
+
+class TestInvocationAnalytics:
+    """Aggregates are computed in SQL over the requested window"""
+
+    async def test_performance_analytics(self, adapter):
+        repository = AgentInvocationRepository(adapter)
+
+        analytics = await repository.get_performance_analytics(hours=24)
+
+        assert analytics["total_invocations"] == 23
+        assert analytics["success_rate"] == round(20 / 23, 3)
+        assert analytics["performance"]["max_duration_ms"] == 500.0
+        assert analytics["performance"]["min_duration_ms"] == 10.0
+        assert analytics["agent_usage_patterns"] == {"plot_generator": 20, "author_generator": 3}
+        plot_stats = analytics["agent_performance"]["plot_generator"]
+        assert (plot_stats["p50_duration_ms"], plot_stats["p95_duration_ms"], plot_stats["p99_duration_ms"]) == (100.0, 190.0, 200.0)
+        assert analytics["agent_performance"]["author_generator"]["success_rate"] == 0.0
+        assert analytics["tool_usage_patterns"] == {"save_plot": 10, "save_author": 1, "invoke_agent": 1}
+        assert [error["invocation_id"] for error in analytics["recent_errors"]] == ["inv-20", "inv-21", "inv-22"]
+        assert analytics["token_usage"] == {"total_tokens": 2300, "avg_tokens_per_invocation": 100.0}
+
+    async def test_performance_analytics_for_one_agent(self, adapter):
+        repository = AgentInvocationRepository(adapter)
+
+        analytics = await repository.get_performance_analytics(agent_name="author_generator", hours=24)
+
+        assert analytics["total_invocations"] == 3
+        assert analytics["performance"]["p50_duration_ms"] == 300.0
+        assert list(analytics["agent_usage_patterns"]) == ["author_generator"]
+
+    async def test_empty_window(self, adapter):
+        repository = AgentInvocationRepository(adapter)
+
+        assert await repository.get_performance_analytics(agent_name="missing") == {
+            "total_invocations": 0, "timeframe_hours": 24
+        }
+
+    async def test_error_analysis(self, adapter):
+        repository = AgentInvocationRepository(adapter)
+
+        errors = await repository.get_error_analysis(hours=24)
+
+        assert errors["total_errors"] == 3
+        assert errors["error_patterns"] == {"Timeout": 2, "Bad JSON": 1}
+        assert errors["errors_by_agent"] == {"author_generator": 3}
+        assert errors["recent_errors"][0]["request_preview"] == "r" * 100 + "..."
+
+
+class TestScoreDistribution:
+    """Quality trends aggregate the latest scores in SQL"""
+
+    async def test_quality_trends(self, adapter):
+        await adapter.batch_insert("scores", [
+            {"overall_score": score, "category_scores": "{}", "score_rationale": "ok",
+             "improvement_trajectory": "[]", "created_at": f"2025-01-{day:02d}"}
+            for day, score in enumerate([9.0, 7.0, 5.0, 8.5], start=1)
+        ])
+        repository = IterativeRepository(adapter)
+
+        trends = await repository.get_quality_trends(limit=3)
+
+        assert trends == {
+            "total_iterations": 3,
+            "average_score": round((7.0 + 5.0 + 8.5) / 3, 2),
+            "quality_distribution": {"high_quality": 1, "medium_quality": 1, "low_quality": 1},
+            "score_range": {"min": 5.0, "max": 8.5},
+        }
+        assert await IterativeRepository(adapter).get_quality_trends(limit=0) == {"message": "No scoring data available"}
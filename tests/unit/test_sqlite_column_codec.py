@@ -0,0 +1,131 @@
+"""
+Tests for the schema-aware SQLite JSON column codec.
+"""
+
+import pytest
+import tempfile
+import os
+import json
+
+from src.database.sqlite.column_codec import SQLiteColumnCodec, LazyJSONRow
+from src.database.sqlite.connection_manager import SQLiteConnectionManager
+from src.database.sqlite.data_operations import SQLiteDataOperations
+from src.database.sqlite.query_builder import SQLiteQueryBuilder
+from src.database.sqlite.table_manager import SQLiteTableManager
+
+
+class TestSQLiteColumnCodec:
+    """Tests for JSON column encoding/decoding driven by the table schema"""
+
+    @pytest.fixture
+    def temp_db_path(self):
+        """Create temporary database file"""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        yield path
+        # Cleanup
+        if os.path.exists(path):
+            os.unlink(path)
+
+    @pytest.fixture
+    def connection_manager(self, temp_db_path):
+        """Create connection manager with all tables"""
+        manager = SQLiteConnectionManager(temp_db_path)
+        SQLiteTableManager(manager).create_all_tables()
+        yield manager
+        manager.close()
+
+    @pytest.fixture
+    def codec(self, connection_manager):
+        """Create codec for the application schema"""
+        return SQLiteColumnCodec(connection_manager)
+
+    @pytest.fixture
+    async def data_operations(self, connection_manager):
+        """Create data operations and close its executor after the test"""
+        ops = SQLiteDataOperations(
+            connection_manager, SQLiteQueryBuilder(), SQLiteTableManager(connection_manager)
+        )
+        yield ops
+        await ops.executor.close()
+
+    def test_json_columns_follow_schema(self, codec):
+        """Test only declared columns that exist in the table are treated as JSON"""
+        assert codec.json_columns("sessions") == frozenset({"messages"})
+        assert "metadata" in codec.json_columns("lore_documents")
+        assert codec.json_columns("plots") == frozenset()
+
+    def test_timestamp_column_per_table(self, codec):
+        """Test the insert timestamp column is taken from the table's columns"""
+        assert codec.timestamp_column("plots") == "created_at"
+        assert codec.timestamp_column("sessions") == "start_time"
+        assert codec.timestamp_column("performance_metrics") == "timestamp"
+        assert codec.timestamp_column("genres") == "created_at"
+
+    def test_decode_only_touches_json_columns(self, codec):
+        """Test text columns that merely look like JSON are returned unchanged"""
+        rows = [{"id": "1", "content": '{"not": "decoded"}', "metadata": '{"a": 1}'}]
+        decoded = codec.decode_rows("lore_documents", rows)
+        assert decoded[0]["content"] == '{"not": "decoded"}'
+        assert decoded[0]["metadata"] == {"a": 1}
+
+    def test_invalid_json_is_kept_as_text(self, codec):
+        """Test malformed JSON in a JSON column is returned as stored"""
+        rows = [{"id": "1", "metadata": "{broken"}]
+        assert codec.decode_rows("lore_documents", rows)[0]["metadata"] == "{broken"
+
+    def test_json_type_affinity_is_detected(self, connection_manager, codec):
+        """Test columns declared with a JSON type are decoded without registration"""
+        connection_manager.execute_query("CREATE TABLE extras (id TEXT PRIMARY KEY, payload JSON)")
+        assert codec.json_columns("extras") == frozenset({"payload"})
+
+    def test_lazy_rows_decode_on_access(self, connection_manager):
+        """Test lazy rows parse JSON only when read and still behave like dicts"""
+        codec = SQLiteColumnCodec(connection_manager, lazy=True)
+        rows = codec.decode_rows("lore_documents", [{"id": "1", "metadata": '{"a": [1, 2]}'}])
+        row = rows[0]
+
+        assert isinstance(row, LazyJSONRow)
+        assert dict.__getitem__(row, "metadata") == '{"a": [1, 2]}'
+        assert row["metadata"] == {"a": [1, 2]}
+        assert dict(row) == {"id": "1", "metadata": {"a": [1, 2]}}
+        assert json.loads(json.dumps(row)) == {"id": "1", "metadata": {"a": [1, 2]}}
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_data_operations(self, data_operations):
+        """Test JSON values round-trip and look-alike text stays text"""
+        doc_id = await data_operations.insert("lore_documents", {
+            "content": "[chapter one]",
+            "metadata": {"tags": ["a", "b"], "nested": {"draft": True}},
+        })
+        plot_id = await data_operations.insert("plots", {
+            "title": "{Braces}",
+            "plot_summary": "[1, 2]",
+        })
+
+        doc = await data_operations.get_by_id("lore_documents", doc_id)
+        assert doc["metadata"] == {"tags": ["a", "b"], "nested": {"draft": True}}
+        assert doc["content"] == "[chapter one]"
+        assert doc["created_at"] is not None
+
+        plot = await data_operations.get_by_id("plots", plot_id)
+        assert plot["title"] == "{Braces}"
+        assert plot["plot_summary"] == "[1, 2]"
+
+        # Every read path decodes JSON columns the same way
+        batch = await data_operations.batch_select_by_ids("lore_documents", [doc_id])
+        assert batch[0]["metadata"]["tags"] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_update_and_batch_insert_encode_json(self, data_operations):
+        """Test update and batch insert encode dict/list values"""
+        ids = await data_operations.batch_insert("performance_metrics", [
+            {"metric_name": "latency", "metric_value": 1.0, "tags": {"agent": "a"}},
+            {"metric_name": "latency", "metric_value": 2.0, "tags": {"agent": "b"}},
+        ])
+        await data_operations.update("performance_metrics", ids[0], {"tags": {"agent": "c"}})
+
+        rows = await data_operations.batch_select_by_ids("performance_metrics", ids)
+        tags = sorted(row["tags"]["agent"] for row in rows)
+        assert tags == ["b", "c"]
+        assert all(row["timestamp"] for row in rows)
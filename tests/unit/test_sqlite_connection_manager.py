@@ -192,4 +192,51 @@ class TestSQLiteConnectionManager:
         connection_manager.close()
         
         # Should not raise errors on multiple closes
-        connection_manager.close()
\ No newline at end of file
+        connection_manager.close()
+    
+    def test_wal_journal_mode_enabled(self, connection_manager):
+        """Test database is switched to write-ahead logging"""
+        results = connection_manager.execute_select("PRAGMA journal_mode")
+        assert results[0]["journal_mode"] == "wal"
+    
+    def test_queries_reuse_thread_connection(self, connection_manager):
+        """Test repeated queries on one thread share a single cached connection"""
+        for _ in range(5):
+            connection_manager.execute_select("SELECT 1")
+            connection_manager.execute_count("SELECT COUNT(*) FROM sqlite_master")
+        
+        assert connection_manager.open_connection_count == 1
+        
+        # Tuning pragmas are applied to the cached connection
+        results = connection_manager.execute_select("PRAGMA synchronous")
+        assert results[0]["synchronous"] == 1  # NORMAL
+    
+    def test_each_thread_gets_own_connection(self, connection_manager):
+        """Test worker threads get independent connections"""
+        import threading
+        
+        connection_manager.execute_query("CREATE TABLE test_table (id TEXT PRIMARY KEY)")
+        
+        def worker(index):
+            connection_manager.execute_query("INSERT INTO test_table VALUES (?)", [str(index)])
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert connection_manager.execute_count("SELECT COUNT(*) FROM test_table") == 4
+        assert connection_manager.open_connection_count == 5
+    
+    def test_close_releases_cached_connections(self, connection_manager):
+        """Test close() releases cached connections and later queries reopen lazily"""
+        connection_manager.execute_select("SELECT 1")
+        assert connection_manager.open_connection_count == 1
+        
+        connection_manager.close()
+        assert connection_manager.open_connection_count == 0
+        
+        results = connection_manager.execute_select("SELECT 1 AS value")
+        assert results[0]["value"] == 1
+        assert connection_manager.open_connection_count == 1
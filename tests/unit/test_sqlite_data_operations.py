@@ -274,6 +274,69 @@ class TestSQLiteDataOperations:
         updated_results = await data_operations.batch_select_by_ids("plots", inserted_ids)
         assert all("Updated" in r["title"] for r in updated_results)
     
+    @pytest.mark.asyncio
+    async def test_batch_update_is_one_write(self, data_operations):
+        """Test bulk updates accept both update shapes and commit as a single write"""
+        user_id = str(uuid4())
+        await data_operations.insert("users", {"id": user_id, "name": "Test User"})
+        ids = await data_operations.batch_insert("plots", [
+            {"title": f"Plot {i}", "plot_summary": "Summary", "user_id": user_id}
+            for i in range(50)
+        ])
+        writes_before = data_operations.executor.get_metrics()["writes_executed"]
+        
+        updates = [{"id": plot_id, "data": {"genre": "Bulk"}} for plot_id in ids[:40]]
+        updates += [{"id": plot_id, "title": "Flat", "genre": "Bulk"} for plot_id in ids[40:]]
+        updates.append({"id": str(uuid4()), "data": {"genre": "Missing"}})
+        
+        updated_count = await data_operations.batch_update("plots", updates)
+        
+        assert updated_count == 50
+        assert data_operations.executor.get_metrics()["writes_executed"] == writes_before + 1
+        results = await data_operations.batch_select_by_ids("plots", ids)
+        assert all(r["genre"] == "Bulk" for r in results)
+        assert sum(r["title"] == "Flat" for r in results) == 10
+        assert "id" in updates[0]  # Caller's dicts are left intact
+
+    @pytest.mark.asyncio
+    async def test_batch_select_by_column_chunks_in_list(self, data_operations):
+        """Test large value lists are split into bounded IN (...) queries"""
+        user_id = str(uuid4())
+        await data_operations.insert("users", {"id": user_id, "name": "Test User"})
+        ids = await data_operations.batch_insert("plots", [
+            {"title": f"Plot {i}", "plot_summary": "Summary", "user_id": user_id}
+            for i in range(450)
+        ])
+
+        with patch.object(data_operations.query_builder, 'build_select_in',
+                          wraps=data_operations.query_builder.build_select_in) as mock_build:
+            results = await data_operations.batch_select_by_column("plots", "id", ids + [str(uuid4())])
+
+        assert sorted(r["id"] for r in results) == sorted(ids)
+        assert [len(call.args[2]) for call in mock_build.call_args_list] == [200, 200, 51]
+
+    @pytest.mark.asyncio
+    async def test_select_union_by_column(self, data_operations):
+        """Test one query returns a session's rows from several tables, decoded and ordered"""
+        user_id = str(uuid4())
+        await data_operations.insert("users", {"id": user_id, "name": "Test User"})
+        for session_id in ("s1", "s2"):
+            await data_operations.insert("sessions", {"id": session_id, "user_id": user_id})
+        await data_operations.insert("plots", {
+            "title": "Plot", "plot_summary": "Summary", "session_id": "s1", "created_at": "2025-01-02"
+        })
+        await data_operations.insert("characters", {
+            "session_id": "s1", "character_count": 1, "world_context_integration": "Context",
+            "characters": [{"name": "Ada"}], "created_at": "2025-01-01"
+        })
+        await data_operations.insert("plots", {"title": "Other", "plot_summary": "Summary", "session_id": "s2"})
+        
+        rows = await data_operations.select_union_by_column(["plots", "characters", "missing"], "session_id", "s1")
+        
+        assert [row["source_table"] for row in rows] == ["characters", "plots"]
+        assert rows[0]["record"]["characters"] == [{"name": "Ada"}]
+        assert rows[1]["record"]["title"] == "Plot"
+    
     @pytest.mark.asyncio
     async def test_specialized_plot_operations(self, data_operations):
         """Test specialized plot operations"""
@@ -413,4 +476,62 @@ class TestSQLiteDataOperations:
         retrieved = await data_operations.get_by_id("lore_documents", lore_id)
         
         assert retrieved is not None
-        # Note: metadata might be stored as JSON string depending on implementation
\ No newline at end of file
+        # Note: metadata might be stored as JSON string depending on implementation
+    
+    @pytest.mark.asyncio
+    async def test_content_search_ranked_and_limited(self, data_operations):
+        """Test full-text search ranks title matches first and applies the limit in SQL"""
+        user_id = str(uuid4())
+        other_user_id = str(uuid4())
+        await data_operations.insert("users", {"id": user_id, "name": "Test User"})
+        await data_operations.insert("users", {"id": other_user_id, "name": "Other User"})
+        
+        title_match = await data_operations.save_plot({
+            "title": "Dragon Empire", "plot_summary": "A tale of kings", "user_id": user_id
+        })
+        summary_match = await data_operations.save_plot({
+            "title": "Quiet Village", "plot_summary": "A dragon sleeps nearby", "user_id": user_id
+        })
+        await data_operations.save_plot({
+            "title": "Dragon Rider", "plot_summary": "Not yours", "user_id": other_user_id
+        })
+        await data_operations.save_plot({
+            "title": "Unrelated", "plot_summary": "Nothing here", "user_id": user_id
+        })
+        
+        results = await data_operations.search_content("dragon", "plots", user_id)
+        assert [r["id"] for r in results] == [title_match, summary_match]
+        assert results[0]["relevance_score"] > results[1]["relevance_score"]
+        
+        limited = await data_operations.search_content("dragon", "plots", user_id, limit=1)
+        assert [r["id"] for r in limited] == [title_match]
+    
+    @pytest.mark.asyncio
+    async def test_content_search_index_follows_updates_and_deletes(self, data_operations):
+        """Test FTS triggers keep the index in sync with the content table"""
+        user_id = str(uuid4())
+        await data_operations.insert("users", {"id": user_id, "name": "Test User"})
+        author_id = await data_operations.save_author({
+            "author_name": "Ada Quill", "biography": "Writes mysteries", "user_id": user_id
+        })
+        
+        await data_operations.update("authors", author_id, {"biography": "Writes romance"})
+        assert await data_operations.search_content("mysteries", "authors", user_id) == []
+        assert len(await data_operations.search_content("romance", "authors", user_id)) == 1
+        
+        await data_operations.delete("authors", author_id)
+        assert await data_operations.search_content("romance", "authors", user_id) == []
+    
+    @pytest.mark.asyncio
+    async def test_content_search_ignores_query_operators(self, data_operations):
+        """Test FTS5 syntax in user input is treated as plain words"""
+        user_id = str(uuid4())
+        await data_operations.insert("users", {"id": user_id, "name": "Test User"})
+        await data_operations.save_plot({
+            "title": "Storm Coast", "plot_summary": "Sailors and storms", "user_id": user_id
+        })
+        
+        results = await data_operations.search_content('storm" OR NEAR(', "plots", user_id)
+        assert len(results) == 1
+        assert await data_operations.search_content('"*()', "plots", user_id) == []
+        assert await data_operations.search_content("storm", "unknown_table", user_id) == []
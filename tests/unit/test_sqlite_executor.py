@@ -0,0 +1,175 @@
+"""
+Tests for the SQLite executor: dedicated reader pool and single batching writer.
+"""
+
+import pytest
+import tempfile
+import os
+import asyncio
+import sqlite3
+import threading
+
+from src.database.sqlite.connection_manager import SQLiteConnectionManager
+from src.database.sqlite.executor import SQLiteExecutor
+
+
+class TestSQLiteExecutor:
+    """Tests for reader/writer separation and write batching"""
+
+    @pytest.fixture
+    def temp_db_path(self):
+        """Create temporary database file"""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        yield path
+        # Cleanup
+        if os.path.exists(path):
+            os.unlink(path)
+
+    @pytest.fixture
+    def connection_manager(self, temp_db_path):
+        """Create connection manager with a test table"""
+        manager = SQLiteConnectionManager(temp_db_path)
+        manager.execute_query("CREATE TABLE items (id TEXT PRIMARY KEY, value INTEGER)")
+        yield manager
+        manager.close()
+
+    @pytest.fixture
+    async def executor(self, connection_manager):
+        """Create executor and close it after the test"""
+        executor = SQLiteExecutor(connection_manager, max_readers=2)
+        yield executor
+        await executor.close()
+
+    @pytest.mark.asyncio
+    async def test_write_then_read(self, executor, connection_manager):
+        """Test committed writes are visible to subsequent reads"""
+        rowcount = await executor.execute_write(
+            "INSERT INTO items (id, value) VALUES (?, ?)", ["a", 1]
+        )
+        assert rowcount == 1
+
+        rows = await executor.read(connection_manager.execute_select, "SELECT * FROM items")
+        assert rows == [{"id": "a", "value": 1}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_are_batched(self, executor, connection_manager):
+        """Test concurrent writers are grouped into fewer transactions"""
+        await asyncio.gather(*(
+            executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", [str(i), i])
+            for i in range(200)
+        ))
+
+        count = await executor.read(connection_manager.execute_count, "SELECT COUNT(*) FROM items")
+        assert count == 200
+
+        metrics = executor.get_metrics()
+        assert metrics["writes_executed"] == 200
+        assert metrics["write_batches"] < 200
+        assert metrics["avg_write_batch_size"] > 1
+        assert metrics["write_queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failing_write_does_not_affect_batch(self, executor, connection_manager):
+        """Test one failing statement only fails its own caller"""
+        results = await asyncio.gather(
+            executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["dup", 1]),
+            executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["dup", 2]),
+            executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["other", 3]),
+            return_exceptions=True
+        )
+
+        assert results[0] == 1
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        assert results[2] == 1
+
+        rows = await executor.read(
+            connection_manager.execute_select, "SELECT id FROM items ORDER BY id"
+        )
+        assert [row["id"] for row in rows] == ["dup", "other"]
+        assert executor.get_metrics()["writes_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_reset(self, executor):
+        """Test metrics counters reset"""
+        await executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["a", 1])
+        assert executor.get_metrics()["writes_executed"] == 1
+
+        executor.reset_metrics()
+        metrics = executor.get_metrics()
+        assert metrics["writes_executed"] == 0
+        assert metrics["write_batches"] == 0
+        assert metrics["avg_write_wait_ms"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_closed_executor_rejects_work(self, connection_manager):
+        """Test work submitted after close() is rejected"""
+        executor = SQLiteExecutor(connection_manager)
+        await executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["a", 1])
+        await executor.close()
+
+        with pytest.raises(RuntimeError):
+            await executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["b", 2])
+
+        assert connection_manager.execute_count("SELECT COUNT(*) FROM items") == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_write_does_not_stop_writer(self, executor, connection_manager):
+        """Test cancelling running and queued writes leaves the writer serving later writes"""
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_insert(conn):
+            started.set()
+            release.wait(5)
+            return conn.execute("INSERT INTO items (id, value) VALUES ('running', 1)").rowcount
+
+        running = asyncio.create_task(executor.write(blocking_insert))
+        await asyncio.to_thread(started.wait, 5)
+        queued = asyncio.create_task(
+            executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["queued", 2])
+        )
+        await asyncio.sleep(0.01)
+
+        running.cancel()
+        queued.cancel()
+        release.set()
+
+        rowcount = await asyncio.wait_for(
+            executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", ["after", 3]), 5
+        )
+        assert rowcount == 1
+        assert executor._writer_thread.is_alive()
+
+        rows = await executor.read(
+            connection_manager.execute_select, "SELECT id FROM items ORDER BY id"
+        )
+        # The running write had started and commits; the queued one never runs
+        assert [row["id"] for row in rows] == ["after", "running"]
+
+    @pytest.mark.asyncio
+    async def test_full_write_queue_does_not_block_readers(self, connection_manager):
+        """Test writers waiting on a full queue leave the reader pool free"""
+        executor = SQLiteExecutor(connection_manager, max_readers=1, max_queue_size=1)
+        release = threading.Event()
+        try:
+            blocked = asyncio.create_task(executor.write(lambda conn: release.wait(5)))
+            await asyncio.sleep(0.01)
+            writes = [
+                asyncio.create_task(
+                    executor.execute_write("INSERT INTO items (id, value) VALUES (?, ?)", [str(i), i])
+                )
+                for i in range(5)
+            ]
+            await asyncio.sleep(0.01)
+
+            count = await asyncio.wait_for(
+                executor.read(connection_manager.execute_count, "SELECT COUNT(*) FROM items"), 1
+            )
+            assert count == 0
+
+            release.set()
+            assert await asyncio.gather(*writes) == [1] * 5
+            await blocked
+        finally:
+            release.set()
+            await executor.close()
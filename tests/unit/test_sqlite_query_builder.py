@@ -141,6 +141,23 @@ class TestSQLiteQueryBuilder:
         assert params[3:6] == ["2", "Name2", 200]
         assert params[6:9] == ["3", "Name3", 300]
     
+    def test_build_batch_update_query(self, query_builder):
+        """Test building executemany UPDATE statements grouped by column set"""
+        updates = [
+            ("1", {"name": "Name1", "value": 100}),
+            ("2", {"name": "Name2", "value": 200}),
+            ("3", {"value": 300})
+        ]
+        
+        statements = query_builder.build_batch_update("test_table", updates)
+        
+        assert statements == [
+            ("UPDATE test_table SET name = ?, value = ? WHERE id = ?", [["Name1", 100, "1"], ["Name2", 200, "2"]]),
+            ("UPDATE test_table SET value = ? WHERE id = ?", [[300, "3"]])
+        ]
+        with pytest.raises(ValueError):
+            query_builder.build_batch_update("test_table", [("1", {"bad name": 1})])
+    
     def test_build_select_by_ids_query(self, query_builder):
         """Test building SELECT queries for multiple IDs"""
         ids = ["id1", "id2", "id3"]
@@ -151,6 +168,33 @@ class TestSQLiteQueryBuilder:
         assert query == expected_query
         assert params == ids
     
+    def test_build_select_in_query(self, query_builder):
+        """Test building SELECT queries matching several values of one column"""
+        query, params = query_builder.build_select_in("characters", "plot_id", ("p1", "p2"))
+        
+        assert query == "SELECT * FROM characters WHERE plot_id IN (?, ?)"
+        assert params == ["p1", "p2"]
+        with pytest.raises(ValueError):
+            query_builder.build_select_in("characters", "plot_id; DROP", ["p1"])
+    
+    def test_build_union_select_query(self, query_builder):
+        """Test building one UNION ALL query over tables with different columns"""
+        query, params = query_builder.build_union_select(
+            {"plots": ["id", "title", "created_at"], "authors": ["id", "author_name"]}, "session_id", "s1"
+        )
+        
+        assert query == (
+            "SELECT 'plots' AS source_table, created_at AS sort_key, "
+            "json_object('id', id, 'title', title, 'created_at', created_at) AS record "
+            "FROM plots WHERE session_id = ? UNION ALL "
+            "SELECT 'authors' AS source_table, NULL AS sort_key, "
+            "json_object('id', id, 'author_name', author_name) AS record "
+            "FROM authors WHERE session_id = ? ORDER BY sort_key"
+        )
+        assert params == ["s1", "s1"]
+        with pytest.raises(ValueError):
+            query_builder.build_union_select({"plots; DROP": ["id"]}, "session_id", "s1")
+    
     def test_sanitize_column_names(self, query_builder):
         """Test column name sanitization for security"""
         # Test valid column names
@@ -216,4 +260,24 @@ class TestSQLiteQueryBuilder:
         # Parameters should contain the original values
         assert "Book with 'quotes' and \"double quotes\"" in params
         assert "Text with ; semicolon and -- comment" in params
-        assert "Multi\nline\ntext" in params
\ No newline at end of file
+        assert "Multi\nline\ntext" in params
+    
+    def test_build_fts_match_quotes_terms(self, query_builder):
+        """Test free-text input becomes quoted prefix terms"""
+        assert query_builder.build_fts_match("dark forest") == '"dark"* OR "forest"*'
+        assert query_builder.build_fts_match('a"b NEAR(') == '"a"* OR "b"* OR "NEAR"*'
+        assert query_builder.build_fts_match("  !?  ") is None
+    
+    def test_build_fts_search(self, query_builder):
+        """Test ranked FTS query with filters and limit"""
+        query, params = query_builder.build_fts_search(
+            "plots", {"title": 10.0, "plot_summary": 5.0}, '"x"*', {"user_id": "u1"}, 5
+        )
+        assert "plots_fts MATCH ?" in query
+        assert "bm25(plots_fts, 10.0, 5.0)" in query
+        assert "AND t.user_id = ?" in query
+        assert query.endswith("ORDER BY relevance_score DESC LIMIT ?")
+        assert params == ['"x"*', "u1", 5]
+        
+        with pytest.raises(ValueError):
+            query_builder.build_fts_search("plots", {"title": 1.0}, '"x"*', {"bad; col": "u1"})
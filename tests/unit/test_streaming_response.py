@@ -0,0 +1,156 @@
+"""
+Tests for token streaming from BaseAgent through the OpenAI-compatible endpoint.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tests.mocks.google_adk import MockInMemoryRunner
+from src.core.agent_tracker import AgentTracker
+from src.core.configuration import Configuration
+from src.core.interfaces import AgentRequest, AgentResponse, ContentType, StreamChunk
+from src.routers.openai_compat import ChatCompletionRequest, ChatMessage, create_streaming_response
+
+
+@pytest.fixture
+def tracker():
+    return AgentTracker()
+
+
+@pytest.fixture
+def streaming_agent(tracker):
+    """BaseAgent whose ADK runner streams three token events"""
+    factory = MagicMock()
+    factory.create_runner.return_value = MockInMemoryRunner(None, response_tokens=["Once ", "upon ", "a time"])
+    conversation_manager = AsyncMock()
+    conversation_manager.get_conversation_context.return_value = {
+        "has_conversation_history": False, "context_summary": "", "user_preferences": {}
+    }
+    config = MagicMock(spec=Configuration)
+    config.model_name = "gemini-1.5-flash"
+    with patch('src.core.agent_modules.agent_config_manager.get_adk_service_factory', return_value=factory), \
+         patch('src.core.agent_modules.agent_config_manager.get_agent_tracker', return_value=tracker):
+        from src.core.base_agent import BaseAgent
+        agent = BaseAgent("plot_generator", "Plot generator", "Write plots", config)
+    agent._message_handler.conversation_manager = conversation_manager
+    agent._sessions["session-1"] = MagicMock(session_id="session-1")
+    return agent
+
+
+def agent_request():
+    return AgentRequest(content="Write a plot", user_id="user-1", session_id="session-1")
+
+
+def sse_events(body):
+    return [event[len("data: "):] for event in body]
+
+
+async def collect(body):
+    return [event async for event in body]
+
+
+class TestBaseAgentStreaming:
+    """process_request_streaming yields ADK text as it arrives and tracks like process_request"""
+
+    async def test_streams_chunks_and_tracks_invocation(self, streaming_agent, tracker):
+        chunks = [chunk async for chunk in streaming_agent.process_request_streaming(agent_request())]
+
+        assert [chunk.chunk for chunk in chunks[:-1]] == ["Once ", "upon ", "a time"]
+        final = chunks[-1]
+        assert final.is_complete and final.chunk == ""
+        assert final.metadata["response"].content == "Once upon a time"
+
+        invocation = tracker.invocation_history[-1]
+        assert invocation.invocation_id == final.metadata["invocation_id"]
+        assert invocation.success and invocation.raw_response == "Once upon a time"
+        assert tracker.active_invocations == {}
+
+    async def test_process_request_matches_stream(self, streaming_agent):
+        response = await streaming_agent.process_request(agent_request())
+
+        assert response.success
+        assert response.content == "Once upon a time"
+
+    async def test_closed_stream_completes_invocation(self, streaming_agent, tracker):
+        stream = streaming_agent.process_request_streaming(agent_request())
+        assert (await stream.__anext__()).chunk == "Once "
+        await stream.aclose()
+
+        assert tracker.active_invocations == {}
+        assert tracker.invocation_history[-1].success is False
+
+    async def test_requests_sse_and_skips_aggregated_event(self, streaming_agent):
+        runner = streaming_agent._config_manager.adk_runner
+        run_configs = []
+        run_async = runner.run_async
+
+        def recording_run_async(**kwargs):
+            run_configs.append(kwargs.get("run_config"))
+            return run_async(**kwargs)
+
+        runner.run_async = recording_run_async
+        chunks = [chunk async for chunk in streaming_agent.process_request_streaming(agent_request())]
+
+        mode = run_configs[0].streaming_mode
+        assert getattr(mode, "value", mode) == "sse"
+        assert [chunk.chunk for chunk in chunks[:-1]] == ["Once ", "upon ", "a time"]
+        assert chunks[-1].metadata["response"].content == "Once upon a time"
+
+    async def test_non_streaming_events_are_forwarded(self, streaming_agent):
+        runner = streaming_agent._config_manager.adk_runner
+        run_async = runner.run_async
+        runner.run_async = lambda **kwargs: run_async(**{**kwargs, "run_config": None})
+
+        chunks = [chunk async for chunk in streaming_agent.process_request_streaming(agent_request())]
+
+        assert [chunk.chunk for chunk in chunks[:-1]] == ["Once upon a time"]
+        assert chunks[-1].metadata["response"].content == "Once upon a time"
+
+
+class StubStreamingAgent:
+    """Agent yielding fixed StreamChunks"""
+
+    def __init__(self, chunks, response):
+        self.chunks = chunks
+        self.response = response
+
+    async def process_request_streaming(self, request):
+        for chunk in self.chunks:
+            yield StreamChunk(chunk=chunk, agent_name="plot_generator")
+        yield StreamChunk(chunk="", agent_name="plot_generator", is_complete=True,
+                          metadata={"response": self.response})
+
+
+class TestOpenAIStreamingResponse:
+    """Agent chunks become chat.completion.chunk SSE events"""
+
+    request = ChatCompletionRequest(model="books-writer-plot", messages=[ChatMessage(role="user", content="A plot")])
+
+    async def test_forwards_chunks(self):
+        response = AgentResponse(agent_name="plot_generator", content="Once upon", content_type=ContentType.PLOT)
+        agent = StubStreamingAgent(["Once ", "upon"], response)
+
+        streaming_response = await create_streaming_response(agent, agent_request(), self.request)
+        events = sse_events(await collect(streaming_response.body_iterator))
+
+        assert events[-1] == "[DONE]\n\n"
+        chunks = [json.loads(event) for event in events[:-1]]
+        assert [chunk["choices"][0]["delta"] for chunk in chunks] == [
+            {"role": "assistant", "content": "Once "}, {"content": "upon"}, {}
+        ]
+        assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+        assert len({chunk["id"] for chunk in chunks}) == 1
+
+    async def test_failed_request_sends_error(self):
+        response = AgentResponse(agent_name="plot_generator", content="", content_type=ContentType.PLOT,
+                                 success=False, error="An error occurred")
+        agent = StubStreamingAgent([], response)
+
+        streaming_response = await create_streaming_response(agent, agent_request(), self.request)
+        events = sse_events(await collect(streaming_response.body_iterator))
+
+        assert json.loads(events[-1])["error"] == {
+            "message": "An error occurred", "type": "internal_error", "code": "agent_error"
+        }
@@ -431,6 +431,58 @@ class TestSupabaseAdapterCRUDOperations:
         # Assert
         assert result is False
         mock_delete.eq.assert_called_once_with("id", entity_id)
+    
+    @pytest.mark.asyncio
+    async def test_batch_update_same_changes_single_request(self, mock_adapter):
+        """
+        Test bulk update with identical changes
+        Should issue one update().in_() instead of one request per record
+        """
+        # Arrange
+        adapter, mock_client, mock_pool, mock_conn = mock_adapter
+        ids = [str(uuid.uuid4()) for _ in range(150)]
+        mock_in = mock_client.table.return_value.update.return_value.in_
+        mock_in.return_value.execute.return_value.data = [{"id": i} for i in ids]
+        
+        # Act
+        updated = await adapter.batch_update("scores", [{"id": i, "data": {"overall_score": 9}} for i in ids])
+        
+        # Assert
+        assert updated == 150
+        mock_client.table.return_value.update.assert_called_once_with({"overall_score": 9})
+        mock_in.assert_called_once_with("id", ids)
+        mock_client.table.return_value.upsert.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_batch_update_mixed_changes_one_update_per_change_set(self, mock_adapter):
+        """
+        Test bulk update with per-record changes
+        Should issue one update().in_() per distinct change set, never a read-modify-write upsert
+        """
+        # Arrange
+        adapter, mock_client, mock_pool, mock_conn = mock_adapter
+        mock_table = mock_client.table.return_value
+        mock_in = mock_table.update.return_value.in_
+        mock_in.side_effect = lambda column, ids: MagicMock(**{
+            "execute.return_value.data": [{"id": i} for i in ids if i != "missing"]
+        })
+        
+        # Act
+        updated = await adapter.batch_update("plots", [
+            {"id": "a", "data": {"title": "Same"}},
+            {"id": "b", "genre": "z"},
+            {"id": "c", "data": {"title": "Same"}},
+            {"id": "missing", "data": {"title": "ghost"}}
+        ])
+        
+        # Assert
+        assert updated == 3
+        assert mock_table.update.call_args_list == [
+            call({"title": "Same"}), call({"genre": "z"}), call({"title": "ghost"})
+        ]
+        assert mock_in.call_args_list == [call("id", ["a", "c"]), call("id", ["b"]), call("id", ["missing"])]
+        mock_table.select.assert_not_called()
+        mock_table.upsert.assert_not_called()
 
 
 class TestSupabaseAdapterQueryOperations:
@@ -852,47 +904,51 @@ class TestSupabaseAdapterSpecializedOperations:
         mock_eq.execute.assert_called_once()
         mock_pool.get_connection.assert_called_once()
     
+    @staticmethod
+    def _mock_search_tables(mock_client, rows):
+        """Route users lookups and one content table search to separate mocks"""
+        users = MagicMock()
+        users.select.return_value.eq.return_value.execute.return_value.data = [
+            {"id": "user-uuid", "user_id": "test-user"}
+        ]
+        content = MagicMock()
+        search = content.select.return_value.eq.return_value
+        search.or_.return_value.order.return_value.limit.return_value.execute.return_value.data = rows
+        mock_client.table.side_effect = lambda name: users if name == "users" else content
+        return users, content
+    
     @pytest.mark.asyncio
     async def test_search_content_across_tables(self, mock_adapter):
-        """
-        RED: Test search_content specialized operation
-        Should search across multiple content tables
-        """
-        # Arrange
+        """Search filters on the internal user UUID and ranks rows by weighted matches"""
         adapter, mock_client, mock_pool, mock_conn = mock_adapter
-        query = "fantasy adventure"
-        content_type = ContentType.PLOT
-        user_id = "test-user"
-        
-        # Expected results from multiple tables
-        expected_results = [
-            {"id": str(uuid.uuid4()), "title": "Fantasy Adventure", "type": "plot"},
-            {"id": str(uuid.uuid4()), "title": "Adventure Chronicles", "type": "plot"}
+        rows = [
+            {"id": "w1", "world_name": "Ashvale", "overview": "A quiet dragon valley"},
+            {"id": "w2", "world_name": "Dragon Reach", "overview": "Dragon roosts"},
         ]
+        users, content = self._mock_search_tables(mock_client, rows)
         
-        # Mock table operations for plots table
-        mock_table = MagicMock()
-        mock_select = MagicMock()
-        mock_eq = MagicMock()
-        mock_ilike = MagicMock()
-        mock_execute = MagicMock()
-        mock_execute.data = expected_results
+        result = await adapter.search_content("dragon", ContentType.WORLD_BUILDING, "test-user", limit=5)
         
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.ilike.return_value = mock_ilike
-        mock_ilike.execute.return_value = mock_execute
+        users.select.return_value.eq.assert_called_once_with("user_id", "test-user")
+        mock_client.table.assert_called_with("world_building")
+        content.select.return_value.eq.assert_called_once_with("user_id", "user-uuid")
+        content.select.return_value.eq.return_value.or_.assert_called_once_with(
+            "world_name.ilike.%dragon%,overview.ilike.%dragon%"
+        )
+        assert [row["id"] for row in result] == ["w2", "w1"]
+        assert result[0]["relevance_score"] == 13.0
+        assert result[1]["relevance_score"] == 3.0
+    
+    @pytest.mark.asyncio
+    async def test_search_content_unknown_user_or_table(self, mock_adapter):
+        """Unknown tables and unresolvable users return no rows instead of failing"""
+        adapter, mock_client, mock_pool, mock_conn = mock_adapter
         
-        # Act
-        result = await adapter.search_content(query, content_type, user_id)
+        assert await adapter.search_content("dragon", "unknown_table", "test-user") == []
         
-        # Assert
-        assert result == expected_results
-        mock_client.table.assert_called_with("plots")  # Should search plots table for PLOT content type
-        mock_table.select.assert_called_once_with("*")
-        mock_select.eq.assert_called_with("user_id", user_id)
-        mock_pool.get_connection.assert_called_once()
+        with patch.object(adapter, '_create_or_get_user', AsyncMock(return_value={"user_id": "test-user"})):
+            assert await adapter.search_content("dragon", ContentType.PLOT, "test-user") == []
+        mock_client.table.assert_not_called()
 
 
 class TestSupabaseAdapterErrorHandling:
@@ -1153,6 +1209,49 @@ class TestSupabaseAdapterConnectionPooling:
         assert mock_conn_context.__aenter__.call_count == 5
         assert mock_conn_context.__aexit__.call_count == 5
     
+    @pytest.mark.asyncio
+    async def test_blocking_execute_runs_off_event_loop(self, mock_adapter_with_detailed_pool):
+        """
+        Test blocking PostgREST round-trips run on the I/O executor
+        Should keep the event loop responsive and overlap concurrent requests
+        """
+        # Arrange
+        import threading
+        import time
+        adapter, mock_client, mock_pool, mock_conn, mock_conn_context = mock_adapter_with_detailed_pool
+        loop_thread = threading.get_ident()
+        execute_threads = []
+        
+        def slow_execute():
+            execute_threads.append(threading.get_ident())
+            time.sleep(0.1)  # Blocking HTTP round-trip
+            response = MagicMock()
+            response.data = [{"id": str(uuid.uuid4())}]
+            return response
+        
+        mock_client.table.return_value.select.return_value.eq.return_value.execute.side_effect = slow_execute
+        
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        # Act
+        tick_task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        results = await asyncio.gather(*[adapter.get_by_id("plots", str(i)) for i in range(4)])
+        elapsed = time.perf_counter() - started
+        tick_task.cancel()
+        
+        # Assert
+        assert all(results)
+        assert loop_thread not in execute_threads
+        assert elapsed < 0.3
+        assert ticks >= 5
+    
     @pytest.mark.asyncio
     async def test_connection_pool_health_check(self, mock_adapter_with_detailed_pool):
         """
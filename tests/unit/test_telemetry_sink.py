@@ -0,0 +1,173 @@
+"""
+Tests for the write-behind telemetry sink and its AgentTracker integration.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from src.core.agent_tracker import AgentTracker
+from src.database.sqlite.adapter import SQLiteAdapter
+from src.core.telemetry_sink import TelemetrySink
+
+
+class RecordingDatabase:
+    """Records batch_insert/insert calls; optionally rejects some records"""
+
+    def __init__(self, reject=None, delay=0.0):
+        self.batches = []
+        self.inserts = []
+        self.reject = reject or (lambda record: False)
+        self.delay = delay
+
+    async def batch_insert(self, table, records):
+        await asyncio.sleep(self.delay)
+        if any(self.reject(record) for record in records):
+            raise ValueError("constraint failed")
+        self.batches.append((table, list(records)))
+        return [str(i) for i in range(len(records))]
+
+    async def insert(self, table, record):
+        if self.reject(record):
+            raise ValueError("constraint failed")
+        self.inserts.append((table, record))
+        return {"id": "1"}
+
+
+class TestTelemetrySink:
+    """Bounded queue flushed in batches"""
+
+    async def test_flush_batches_per_table(self):
+        database = RecordingDatabase()
+        sink = TelemetrySink(database, batch_size=3)
+        for i in range(4):
+            sink.submit("performance_metrics", {"metric_value": i})
+        sink.submit("agent_invocations", {"invocation_id": "a"})
+
+        assert await sink.flush() == 5
+        assert [(table, len(records)) for table, records in database.batches] == [
+            ("performance_metrics", 3), ("performance_metrics", 1), ("agent_invocations", 1)
+        ]
+        assert sink.get_stats()["flushes"] == 2
+        assert len(sink) == 0
+
+    async def test_drop_oldest_when_full(self):
+        sink = TelemetrySink(RecordingDatabase(), max_queue_size=2)
+
+        assert all(sink.submit("performance_metrics", {"metric_value": i}) for i in range(3))
+        await sink.flush()
+
+        assert [record["metric_value"] for record in sink._database.batches[0][1]] == [1, 2]
+        assert sink.get_stats()["dropped"] == 1
+
+    async def test_drop_newest_when_full(self):
+        sink = TelemetrySink(RecordingDatabase(), max_queue_size=2, drop_policy=TelemetrySink.DROP_NEWEST)
+
+        accepted = [sink.submit("performance_metrics", {"metric_value": i}) for i in range(3)]
+        await sink.flush()
+
+        assert accepted == [True, True, False]
+        assert [record["metric_value"] for record in sink._database.batches[0][1]] == [0, 1]
+
+    async def test_unknown_drop_policy(self):
+        with pytest.raises(ValueError):
+            TelemetrySink(RecordingDatabase(), drop_policy="block_forever")
+
+    async def test_failed_batch_salvages_good_records(self):
+        database = RecordingDatabase(reject=lambda record: record["metric_value"] == 1)
+        sink = TelemetrySink(database)
+        for i in range(3):
+            sink.submit("performance_metrics", {"metric_value": i})
+
+        assert await sink.flush() == 2
+        stats = sink.get_stats()
+        assert (stats["flushed"], stats["failed"]) == (2, 1)
+        assert "constraint failed" in stats["last_error"]
+
+    async def test_background_flush_on_size_and_stop(self):
+        database = RecordingDatabase()
+        sink = TelemetrySink(database, batch_size=2, flush_interval=60)
+        await sink.start()
+
+        sink.submit("performance_metrics", {"metric_value": 0})
+        sink.submit("performance_metrics", {"metric_value": 1})
+        await asyncio.sleep(0.05)
+        assert len(database.batches) == 1
+
+        sink.submit("performance_metrics", {"metric_value": 2})
+        await sink.stop()
+        assert len(database.batches) == 2
+        assert not sink.running
+
+    async def test_put_waits_for_room(self):
+        database = RecordingDatabase(delay=0.01)
+        sink = TelemetrySink(database, max_queue_size=1, flush_interval=60)
+        await sink.start()
+
+        sink.submit("performance_metrics", {"metric_value": 0})
+        assert await sink.put("performance_metrics", {"metric_value": 1}, timeout=1)
+        await sink.stop()
+
+        assert sink.get_stats()["dropped"] == 0
+        assert sum(len(records) for _, records in database.batches) == 2
+
+
+class TestAgentTrackerSink:
+    """AgentTracker queues completed invocations and metrics instead of writing them"""
+
+    async def test_completed_invocation_is_queued(self):
+        database = RecordingDatabase()
+        tracker = AgentTracker(sink=TelemetrySink(database))
+
+        tracker.start_invocation("inv-1", "plot_generator", "user-1", "session-1", "Write a plot")
+        tracker.record_llm_interaction("inv-1", "gemini-1.5-flash", "prompt", "response",
+                                       prompt_tokens=10, completion_tokens=20, latency_ms=50.0)
+        tracker.complete_invocation("inv-1", success=True, response_content="ok")
+
+        assert database.batches == []
+        await tracker.sink.flush()
+
+        tables = {table: records for table, records in database.batches}
+        assert tables["agent_invocations"][0]["invocation_id"] == "inv-1"
+        assert tables["agent_invocations"][0]["raw_response"] == "response"
+        assert {record["metric_name"] for record in tables["performance_metrics"]} == {
+            "llm_latency_ms", "llm_tokens_total", "llm_cost_usd", "agent_duration_ms"
+        }
+        assert tracker.get_telemetry_stats()["flushed"] == 5
+
+    async def test_external_ids_do_not_break_foreign_keys(self):
+        """Invocations for users/sessions with no row persist on a real adapter with FKs on"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            adapter = SQLiteAdapter(os.path.join(tmp_dir, "telemetry.db"))
+            try:
+                tracker = AgentTracker(sink=TelemetrySink(adapter))
+                tracker.start_invocation("inv-1", "plot_generator", "external-user", "external-session",
+                                         "Write a plot", {"genre": "fantasy"})
+                tracker.record_llm_interaction("inv-1", "gemini-1.5-flash", "prompt", "response",
+                                               prompt_tokens=10, completion_tokens=20, latency_ms=50.0)
+                tracker.complete_invocation("inv-1", success=True, response_content="ok")
+
+                assert await tracker.sink.flush() == 5
+                stats = tracker.get_telemetry_stats()
+                assert stats["failed"] == 0
+                assert stats["batches"] == 2  # no row-by-row retries
+
+                invocation = (await adapter.select("agent_invocations", {"invocation_id": "inv-1"}))[0]
+                assert invocation["user_id"] is None and invocation["session_id"] is None
+                assert invocation["request_context"] == {
+                    "genre": "fantasy", "external_user_id": "external-user", "external_session_id": "external-session"
+                }
+                metrics = await adapter.select("performance_metrics", {"metric_name": "agent_duration_ms"})
+                assert metrics[0]["tags"]["external_session_id"] == "external-session"
+            finally:
+                await adapter.close()
+
+    def test_without_sink(self):
+        tracker = AgentTracker()
+
+        tracker.start_invocation("inv-1", "plot_generator", "user-1", "session-1", "Write a plot")
+        tracker.complete_invocation("inv-1")
+
+        assert tracker.get_telemetry_stats() is None
@@ -0,0 +1,96 @@
+"""
+Tests for VertexRAGService corpus lookups and bulk chunk import.
+
+The rag module is replaced with the local fake in tests/mocks/vertex_rag.py.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from tests.mocks.vertex_rag import MockRag
+from src.services.vertex_rag_service import VertexRAGService
+
+
+@pytest.fixture
+def fake_rag():
+    return MockRag()
+
+
+@pytest.fixture
+def service(fake_rag):
+    config = MagicMock()
+    config.google_cloud_config = {'project_id': 'test-project', 'location': 'us-central1'}
+    with patch('src.services.vertex_rag_service.vertexai', MagicMock()), \
+         patch('src.services.vertex_rag_service.rag', fake_rag):
+        yield VertexRAGService(config)
+
+
+def make_chunks(count):
+    return [{'text': f"Chunk {i} about House Vale.", 'metadata': {'chunk_order': i}} for i in range(count)]
+
+
+class TestBulkChunkImport:
+    """Chunks are packed into text files and imported in one call"""
+
+    @pytest.mark.asyncio
+    async def test_import_packs_chunks_into_one_call(self, service, fake_rag):
+        corpus_name = await service.create_corpus_for_plot("plot-1")
+
+        assert await service.import_chunks_to_corpus(corpus_name, make_chunks(250)) is True
+
+        assert fake_rag.calls['import_files'] == 1
+        assert 'list_corpora' not in fake_rag.calls
+        # Ingested as text and re-chunked: every chunk is retrievable as plain prose
+        documents = [document['text'] for document in fake_rag.corpora[corpus_name].documents]
+        assert all(any(chunk['text'] in document for document in documents) for chunk in make_chunks(250))
+        assert not any(document.lstrip().startswith('{') for document in documents)
+
+    @pytest.mark.asyncio
+    async def test_imported_text_is_queryable_unescaped(self, service, fake_rag):
+        corpus_name = await service.create_corpus_for_plot("plot-1")
+        chunks = [{'text': "The Élan of Ashvale guards the ford.", 'metadata': {}}]
+
+        assert await service.import_chunks_to_corpus(corpus_name, chunks) is True
+        results = await service.query_corpus(corpus_name, "Élan")
+
+        assert [result['text'] for result in results] == ["The Élan of Ashvale guards the ford."]
+
+    @pytest.mark.asyncio
+    async def test_import_splits_paths_across_concurrent_calls(self, service, fake_rag):
+        service.CHUNKS_PER_IMPORT_FILE = 2
+        service.MAX_PATHS_PER_IMPORT = 3
+        corpus_name = await service.create_corpus_for_plot("plot-1")
+
+        assert await service.import_chunks_to_corpus(corpus_name, make_chunks(13)) is True
+
+        # 7 files of at most 2 chunks, at most 3 files per call
+        assert fake_rag.calls['import_files'] == 3
+        # Each two-chunk file fits in one re-chunked window
+        assert len(fake_rag.corpora[corpus_name].documents) == 7
+
+    @pytest.mark.asyncio
+    async def test_import_to_unknown_corpus_fails(self, service, fake_rag):
+        assert await service.import_chunks_to_corpus("corpus-book-missing", make_chunks(3)) is False
+        assert 'import_files' not in fake_rag.calls
+
+
+class TestCorpusLookupCache:
+    """Display name lookups list corpora only on a cache miss"""
+
+    @pytest.mark.asyncio
+    async def test_existing_corpus_is_listed_once(self, service, fake_rag):
+        fake_rag.create_corpus(display_name="corpus-book-plot-2")
+
+        assert await service.corpus_exists("plot-2") is True
+        assert await service.corpus_exists("plot-2") is True
+        assert await service.import_chunks_to_corpus("corpus-book-plot-2", make_chunks(3)) is True
+
+        assert fake_rag.calls['list_corpora'] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_corpus_forgets_cached_name(self, service, fake_rag):
+        await service.create_corpus_for_plot("plot-3")
+
+        assert await service.delete_corpus("plot-3") is True
+        assert await service.corpus_exists("plot-3") is False
+        assert fake_rag.corpora == {}
@@ -0,0 +1,129 @@
+"""
+Tests for the ConnectionManager broadcast fan-out.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.websocket import connection_manager as connection_manager_module
+from src.websocket.connection_manager import ConnectionManager
+
+
+class RecordingSocket:
+    """Accepts frames after `delay`; `hang` never completes a send"""
+
+    def __init__(self, delay=0.0, hang=False, fail=False):
+        self.frames = []
+        self.delay = delay
+        self.hang = hang
+        self.fail = fail
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.hang:
+            await asyncio.Event().wait()
+        await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(text))
+
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+
+
+@pytest.fixture
+async def manager_factory():
+    managers = []
+
+    def create(**kwargs):
+        manager = ConnectionManager(**kwargs)
+        managers.append(manager)
+        return manager
+
+    yield create
+    for manager in managers:
+        manager.shutdown()
+
+
+class TestBroadcastFanout:
+    """Encode once, per-client queues, laggard handling"""
+
+    async def test_broadcast_encodes_once_and_preserves_order(self, manager_factory):
+        manager = manager_factory()
+        sockets = [RecordingSocket() for _ in range(3)]
+        for i, socket in enumerate(sockets):
+            await manager.connect(socket, f"client{i}")
+
+        with patch.object(connection_manager_module, "encode_json",
+                          wraps=connection_manager_module.encode_json) as encode:
+            for step in range(3):
+                assert await manager.broadcast_json({"type": "progress", "step": step}) == 3
+        await manager.send_json({"type": "done"}, "client1")
+        assert await manager.flush(timeout=1)
+
+        assert encode.call_count == 3
+        assert [frame["step"] for frame in sockets[0].frames] == [0, 1, 2]
+        assert sockets[1].frames[-1] == {"type": "done"}
+        assert manager.get_send_stats()["clients"]["client0"]["sent"] == 3
+        assert manager.get_send_stats()["latency_ms"]["count"] == 10
+
+    async def test_slow_client_does_not_block_others(self, manager_factory):
+        manager = manager_factory(send_timeout=5)
+        fast, slow = RecordingSocket(), RecordingSocket(delay=0.2)
+        await manager.connect(fast, "fast")
+        await manager.connect(slow, "slow")
+
+        await manager.broadcast_json({"type": "progress"})
+        assert await manager.flush("fast", timeout=0.05)
+        assert len(fast.frames) == 1 and slow.frames == []
+
+    async def test_drop_oldest_when_queue_full(self, manager_factory):
+        manager = manager_factory(send_queue_size=2)
+        socket = RecordingSocket(delay=0.01)
+        await manager.connect(socket, "client")
+
+        await manager.broadcast_json({"step": 0})
+        await asyncio.sleep(0)
+        for step in range(1, 5):
+            await manager.broadcast_json({"step": step})
+        await manager.flush(timeout=1)
+
+        # The first frame was already being sent when the queue overflowed
+        assert [frame["step"] for frame in socket.frames] == [0, 3, 4]
+        assert manager.get_send_stats()["clients"]["client"]["dropped"] == 2
+
+    async def test_disconnect_policy_drops_laggard(self, manager_factory):
+        manager = manager_factory(send_queue_size=1, laggard_policy="disconnect")
+        socket = RecordingSocket(hang=True)
+        await manager.connect(socket, "laggard")
+
+        await manager.broadcast_json({"step": 0})
+        await asyncio.sleep(0)
+        await manager.broadcast_json({"step": 1})
+        assert await manager.broadcast_json({"step": 2}) == 0
+        await asyncio.sleep(0.01)
+
+        assert not manager.is_connected("laggard")
+        assert manager.laggards_disconnected == 1
+        assert socket.closed_with == 1013
+
+    async def test_send_timeout_and_failure_disconnect(self, manager_factory):
+        manager = manager_factory(send_timeout=0.01)
+        await manager.connect(RecordingSocket(hang=True), "stalled")
+        await manager.connect(RecordingSocket(fail=True), "dead")
+
+        await manager.broadcast_json({"type": "progress"})
+        await asyncio.sleep(0.05)
+
+        assert manager.get_connected_clients() == []
+        assert manager.laggards_disconnected == 2
+
+    async def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            ConnectionManager(laggard_policy="block")
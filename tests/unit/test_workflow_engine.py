@@ -0,0 +1,124 @@
+"""
+Tests for the dependency-aware multi-agent workflow engine.
+"""
+
+import pytest
+import asyncio
+
+from src.core.workflow_engine import WorkflowEngine, AgentDependencies, workflow_results_key
+from src.tools.agent_tools import TTLCache
+
+
+class FakeInvoker:
+    """invoke_agent stand-in that tracks concurrency and the contexts it was given"""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.running = 0
+        self.max_running = 0
+        self.calls = []
+
+    async def __call__(self, agent_name, message, context=None, workflow_id=None):
+        self.calls.append((agent_name, dict(context or {})))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+
+        if agent_name in self.fail:
+            return {"success": False, "error": f"{agent_name} broke"}
+        entity = agent_name.replace("_generator", "")
+        return {
+            "success": True,
+            "agent_name": agent_name,
+            "response": f"{agent_name} output",
+            "metadata": {f"{entity}_id": f"{entity}-1"}
+        }
+
+
+class TestWorkflowEngine:
+    """Tests for WorkflowEngine planning and execution"""
+
+    @pytest.fixture
+    def contexts(self):
+        cache = TTLCache(ttl_seconds=60)
+        yield cache
+        cache.cleanup()
+
+    def test_plan_groups_independent_agents(self, contexts):
+        """Test independent agents share a stage and dependents follow their producers"""
+        engine = WorkflowEngine(FakeInvoker(), contexts)
+
+        assert engine.plan(["plot_generator", "author_generator", "world_building", "characters"]) == [
+            ["plot_generator", "author_generator"], ["world_building"], ["characters"]
+        ]
+        assert engine.plan(["critique", "enhancement", "scoring"]) == [
+            ["critique", "scoring"], ["enhancement"]
+        ]
+        # world_building_id supplied by the request context adds no edge
+        assert engine.plan(["characters"]) == [["characters"]]
+
+    def test_plan_rejects_cycles(self, contexts):
+        """Test circular dependency declarations are reported"""
+        engine = WorkflowEngine(FakeInvoker(), contexts, dependencies={
+            "a": AgentDependencies(requires=("b_out",), produces=("a_out",)),
+            "b": AgentDependencies(requires=("a_out",), produces=("b_out",)),
+        })
+
+        with pytest.raises(ValueError):
+            engine.plan(["a", "b"])
+
+    @pytest.mark.asyncio
+    async def test_run_passes_outputs_and_records_results(self, contexts):
+        """Test dependents receive upstream IDs and results land in the workflow context"""
+        invoker = FakeInvoker()
+        engine = WorkflowEngine(invoker, contexts)
+
+        result = await engine.run(
+            ["plot_generator", "world_building", "characters"], "Write a book",
+            context={"genre": "fantasy"}, workflow_id="wf-1"
+        )
+
+        assert result.success is True
+        calls = dict(invoker.calls)
+        assert calls["world_building"] == {"plot_id": "plot-1"}
+        assert calls["characters"] == {"plot_id": "plot-1", "world_building_id": "world_building-1"}
+        assert contexts.get("wf-1")["genre"] == "fantasy"
+        assert contexts.get("wf-1")["world_building_id"] == "world_building-1"
+
+        recorded = contexts.get(workflow_results_key("wf-1"))
+        assert recorded["success"] is True
+        assert recorded["stages"] == [["plot_generator"], ["world_building"], ["characters"]]
+        assert recorded["steps"]["characters"]["depends_on"] == ["plot_generator", "world_building"]
+
+    @pytest.mark.asyncio
+    async def test_run_is_concurrent_within_the_cap(self, contexts):
+        """Test independent agents overlap but never exceed max_concurrency"""
+        invoker = FakeInvoker(delay=0.1)
+        engine = WorkflowEngine(invoker, contexts, max_concurrency=2)
+        agents = ["author_generator", "plot_generator", "critique", "scoring"]
+
+        started = asyncio.get_running_loop().time()
+        result = await engine.run(agents, "Do everything", workflow_id="wf-2")
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert result.success is True
+        assert invoker.max_running == 2
+        assert elapsed < 0.1 * len(agents) * 0.75
+
+    @pytest.mark.asyncio
+    async def test_failed_dependency_skips_dependents(self, contexts):
+        """Test a failed agent skips agents that need its output but not independent ones"""
+        invoker = FakeInvoker(fail={"critique"})
+        engine = WorkflowEngine(invoker, contexts)
+
+        result = await engine.run(["critique", "enhancement", "scoring"], "Improve this", workflow_id="wf-3")
+
+        assert result.success is False
+        assert result.steps["critique"].error == "critique broke"
+        assert result.steps["enhancement"].skipped is True
+        assert result.steps["scoring"].success is True
+        assert [name for name, _ in invoker.calls] == ["critique", "scoring"]
@@ -0,0 +1,110 @@
+"""
+Tests for the async persistence API behind the writing tools.
+"""
+
+import uuid
+from contextvars import ContextVar
+from unittest.mock import MagicMock, patch
+
+from src.services.content_saving_service import ContentSavingService
+from src.tools import writing_tools
+
+
+class TestContentSavingServiceAsyncPath:
+    """The service awaits its own repositories without the sync tool wrappers"""
+
+    async def test_saves_await_injected_repositories(self, mock_plot_repository, mock_author_repository,
+                                                     mock_world_building_repository, mock_characters_repository,
+                                                     mock_session_repository, mock_iterative_repository):
+        service = ContentSavingService(
+            mock_plot_repository, mock_author_repository, mock_world_building_repository,
+            mock_characters_repository, mock_session_repository, mock_iterative_repository
+        )
+        session_id, user_id = str(uuid.uuid4()), str(uuid.uuid4())
+
+        with patch.object(writing_tools, "run_async_safe") as run_async_safe:
+            plot = await service.save_agent_response(
+                "plot_generator", {"title": "Dune", "plot_summary": "Spice", "genre": "Sci-Fi"},
+                session_id, user_id, {"author_id": "author-1"}
+            )
+            author = await service.save_agent_response(
+                "author_generator", {"author_name": "Frank", "biography": "Bio"}, session_id, user_id
+            )
+            world = await service.save_agent_response(
+                "world_building", {"world_name": "Arrakis", "world_content": "Desert"},
+                session_id, user_id, {"plot_id": "plot-1"}
+            )
+            characters = await service.save_agent_response(
+                "characters", {"characters": [{"name": "Paul"}]},
+                session_id, user_id, {"plot_id": "plot-1", "world_id": "world-1"}
+            )
+
+        run_async_safe.assert_not_called()
+        assert plot["success"] and plot["plot_id"] == mock_plot_repository.create.return_value
+        assert author["author_id"] == mock_author_repository.create.return_value
+        assert world["world_building_id"] == mock_world_building_repository.create.return_value
+        assert characters["character_count"] == 1
+
+        mock_session_repository.ensure_session_exists.assert_awaited_once_with(session_id, user_id)
+        plot_entity = mock_plot_repository.create.await_args.args[0]
+        assert (plot_entity.author_id, plot_entity.metadata["genre"]) == ("author-1", "Sci-Fi")
+        assert mock_characters_repository.create.await_args.args[0].world_id == "world-1"
+
+    async def test_repository_error_returns_failure(self, mock_plot_repository, mock_session_repository):
+        mock_plot_repository.create.side_effect = RuntimeError("disk full")
+
+        result = await writing_tools.save_plot_async(
+            "Dune", "Spice", session_id="s1", user_id="u1",
+            plot_repository=mock_plot_repository, session_repository=mock_session_repository
+        )
+
+        assert result == {"success": False, "error": "disk full", "message": "Failed to save plot"}
+
+    async def test_author_ids_replaced_when_not_uuids(self, mock_author_repository):
+        await writing_tools.save_author_async("Frank", "Bio", "Sparse", session_id="not-a-uuid",
+                                              user_id="u1", author_repository=mock_author_repository)
+
+        author_entity = mock_author_repository.create.await_args.args[0]
+        uuid.UUID(author_entity.session_id)
+        uuid.UUID(author_entity.user_id)
+
+
+class TestSyncToolShims:
+    """The ADK tools run the async implementation via run_async_safe"""
+
+    def test_save_plot_uses_container_repositories(self, mock_plot_repository, mock_session_repository):
+        container = MagicMock()
+        container.plot_repository.return_value = mock_plot_repository
+        container.session_repository.return_value = mock_session_repository
+
+        with patch.object(writing_tools, "get_container", return_value=container):
+            result = writing_tools.save_plot("Dune", "Spice", session_id="s1", user_id="u1")
+
+        assert result["plot_id"] == mock_plot_repository.create.return_value
+        mock_session_repository.ensure_session_exists.assert_awaited_once_with("s1", "u1")
+
+    async def test_save_plot_on_loop_uses_context_session(self, mock_plot_repository, mock_session_repository):
+        session_context = ContextVar("session_context", default=(None, None))
+        container = MagicMock()
+        container.plot_repository.return_value = mock_plot_repository
+        container.session_repository.return_value = mock_session_repository
+        container.get_current_session_id.side_effect = lambda: session_context.get()[0]
+        container.get_current_user_id.side_effect = lambda: session_context.get()[1]
+        session_context.set(("session-ctx", "user-ctx"))
+
+        # Called on the event-loop thread, as ADK does; the coroutine runs on a runner thread
+        with patch.object(writing_tools, "get_container", return_value=container):
+            result = writing_tools.save_plot("Dune", "Spice")
+
+        assert result["success"] is True
+        mock_session_repository.ensure_session_exists.assert_awaited_once_with("session-ctx", "user-ctx")
+        plot_entity = mock_plot_repository.create.await_args.args[0]
+        assert (plot_entity.session_id, plot_entity.user_id) == ("session-ctx", "user-ctx")
+
+    def test_runner_failure_returns_failure(self):
+        with patch.object(writing_tools, "run_async_safe", side_effect=TimeoutError("timed out")) as runner:
+            result = writing_tools.save_characters("plot-1", "world-1", [], session_id="s1", user_id="u1")
+            runner.call_args.args[0].close()
+
+        assert result["success"] is False
+        assert result["message"] == "Failed to save characters"